@@ -0,0 +1,10 @@
+import os
+import sys
+
+# Ajouter le répertoire racine au path
+sys.path.insert(0, os.path.abspath(os.path.dirname(__file__)))
+
+from src.services.daemon import main
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -66,9 +66,13 @@ CREATE TABLE IF NOT EXISTS orders (
     fk_exchange_id INTEGER NOT NULL,
     product_id TEXT NOT NULL,
     type TEXT NOT NULL,
+    order_type TEXT,
+    prix_limite REAL,
     prix_execution REAL,
     quantite REAL,
     montant_usdc REAL,
+    quantite_executee REAL,
+    montant_execute REAL,
     frais REAL,
     status TEXT NOT NULL,
     order_id_exchange TEXT,
@@ -1,33 +1,80 @@
+import argparse
 import sys
 from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).parent))
 
 from src.utils.db_connection import get_db_connection
+from src.utils.query_profiler import STATS_PATH, load_stats, top_statements
 
-conn = get_db_connection()
-cursor = conn.cursor()
+# Constantes - Rapport
+REPORT_SORTS = ('total', 'p99', 'count', 'rows')
+REPORT_SQL_WIDTH = 90
 
-# Récupérer la structure de la table accounts
-cursor.execute("PRAGMA table_info(accounts)")
-columns = cursor.fetchall()
 
-print("Structure de la table 'accounts':")
-print("-" * 60)
-for col in columns:
-    print(f"Colonne: {col[1]}, Type: {col[2]}, Obligatoire: {col[3]}, Défaut: {col[4]}")
+def show_accounts():
+    """Affiche la structure et le contenu de la table accounts"""
+    conn = get_db_connection()
+    cursor = conn.cursor()
 
-print("\n" + "=" * 60)
-print("Tous les comptes:")
-print("=" * 60)
+    # Récupérer la structure de la table accounts
+    cursor.execute("PRAGMA table_info(accounts)")
+    columns = cursor.fetchall()
 
-cursor.execute("SELECT * FROM accounts")
-accounts = cursor.fetchall()
+    print("Structure de la table 'accounts':")
+    print("-" * 60)
+    for col in columns:
+        print(f"Colonne: {col[1]}, Type: {col[2]}, Obligatoire: {col[3]}, Défaut: {col[4]}")
 
-if accounts:
-    for row in accounts:
-        print(row)
-else:
-    print("Aucun compte trouvé")
+    print("\n" + "=" * 60)
+    print("Tous les comptes:")
+    print("=" * 60)
 
-conn.close()
+    cursor.execute("SELECT * FROM accounts")
+    accounts = cursor.fetchall()
+
+    if accounts:
+        for row in accounts:
+            print(row)
+    else:
+        print("Aucun compte trouvé")
+
+    conn.close()
+
+
+def show_report(path=STATS_PATH, limit=10, sort='total'):
+    """Affiche les requêtes les plus coûteuses relevées par le profileur"""
+    stats = load_stats(path)
+    if not stats:
+        print(f"Aucune statistique dans {path} (activer \"query_profiling\" dans configs/app_config.json)")
+        return
+
+    print(f"Requêtes les plus coûteuses (tri: {sort}, {len(stats)} empreintes)")
+    print("=" * 100)
+    print(f"{'Empreinte':<14}{'Nombre':>9}{'Total ms':>12}{'p50 ms':>10}{'p99 ms':>10}{'Lignes':>10}{'Lentes':>8}")
+    print("-" * 100)
+    for row in top_statements(stats, limit, sort):
+        print(f"{row['fingerprint']:<14}{row['count']:>9}{row['total'] * 1000:>12.1f}"
+              f"{row['p50'] * 1000:>10.2f}{row['p99'] * 1000:>10.2f}{row['rows']:>10}{row['slow']:>8}")
+        sql = row['sql']
+        print(f"    {sql[:REPORT_SQL_WIDTH]}{'…' if len(sql) > REPORT_SQL_WIDTH else ''}")
+        for line in row['plan'] or []:
+            print(f"    PLAN {line}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Inspection de la base CoinTrader")
+    parser.add_argument('--report', action='store_true', help="Requêtes les plus coûteuses (profileur)")
+    parser.add_argument('--top', type=int, default=10, help="Nombre de requêtes du rapport")
+    parser.add_argument('--sort', choices=REPORT_SORTS, default='total', help="Critère de tri du rapport")
+    parser.add_argument('--stats', default=STATS_PATH, help="Fichier de statistiques du profileur")
+    args = parser.parse_args(argv)
+
+    if args.report:
+        show_report(args.stats, args.top, args.sort)
+    else:
+        show_accounts()
+
+
+if __name__ == "__main__":
+    main()
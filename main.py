@@ -237,6 +237,16 @@ def main():
     print(f"🚀 Démarrage de {APP_NAME} v{APP_VERSION}")
     print("=" * 60)
     
+    # Métriques et traces (désactivées sauf COINTRADER_METRICS* / COINTRADER_TRACE*)
+    from src.utils.metrics import configure_from_env
+    from src.utils import tracing
+    configure_from_env()
+    tracing.configure_from_env()
+    
+    # Les appels d'exchange faits depuis la boucle Tk n'attendent jamais le limiteur de débit
+    from src.models.exchanges.registry import set_ui_thread
+    set_ui_thread(threading.current_thread())
+    
     # Créer la fenêtre du loader
     loader_root = tk.Tk()
     
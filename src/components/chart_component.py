@@ -0,0 +1,236 @@
+"""
+Graphiques légers sur Canvas Tk (sparklines temps réel)
+
+Les séries sont réduites à la largeur en pixels du graphique avant le
+tracé : au-delà d'un point par pixel, les points supplémentaires ne sont
+pas visibles mais coûtent cher à Tk. Le tracé réutilise les mêmes items
+Canvas (mise à jour des coordonnées) au lieu de recréer des widgets.
+"""
+import tkinter as tk
+from collections import deque
+
+FONT_FAMILY = "Segoe UI"
+
+# Constantes - Sparkline
+DEFAULT_CAPACITY = 600
+DEFAULT_WIDTH = 220
+DEFAULT_HEIGHT = 56
+PADDING = 4
+
+COLOR_UP = '#26A69A'
+COLOR_DOWN = '#EF5350'
+
+
+def downsample_minmax(values, buckets):
+    """
+    Réduit une série en conservant le min et le max de chaque seau
+
+    Préserve les pics (utile pour des prix bruités) en 2 points par seau.
+
+    Args:
+        values (list): Valeurs de la série (abscisses implicites 0..n-1)
+        buckets (int): Nombre de seaux (typiquement largeur en pixels / 2)
+
+    Returns:
+        list: Tuples (index, valeur) triés par index
+    """
+    n = len(values)
+    if n <= buckets * 2:
+        return list(enumerate(values))
+
+    points = []
+    size = n / buckets
+    for b in range(buckets):
+        start = int(b * size)
+        end = min(n, int((b + 1) * size))
+        if start >= end:
+            continue
+        lo_i = hi_i = start
+        lo = hi = values[start]
+        for i in range(start + 1, end):
+            v = values[i]
+            if v < lo:
+                lo, lo_i = v, i
+            elif v > hi:
+                hi, hi_i = v, i
+        if lo_i < hi_i:
+            points.append((lo_i, lo))
+            points.append((hi_i, hi))
+        elif hi_i < lo_i:
+            points.append((hi_i, hi))
+            points.append((lo_i, lo))
+        else:
+            points.append((lo_i, lo))
+    return points
+
+
+def downsample_lttb(values, threshold):
+    """
+    Réduit une série par Largest-Triangle-Three-Buckets
+
+    Conserve la forme visuelle de la courbe avec `threshold` points.
+
+    Args:
+        values (list): Valeurs de la série (abscisses implicites 0..n-1)
+        threshold (int): Nombre de points à conserver (>= 3)
+
+    Returns:
+        list: Tuples (index, valeur) triés par index
+    """
+    n = len(values)
+    if threshold >= n or threshold < 3:
+        return list(enumerate(values))
+
+    points = [(0, values[0])]
+    size = (n - 2) / (threshold - 2)
+    a = 0
+
+    for b in range(threshold - 2):
+        # Moyenne du seau suivant (troisième sommet du triangle)
+        next_start = int((b + 1) * size) + 1
+        next_end = min(n, int((b + 2) * size) + 1)
+        count = next_end - next_start
+        avg_x = (next_start + next_end - 1) / 2.0
+        avg_y = sum(values[next_start:next_end]) / count if count > 0 else values[-1]
+
+        start = int(b * size) + 1
+        end = int((b + 1) * size) + 1
+        ax, ay = a, values[a]
+        best_area = -1.0
+        best = start
+        for i in range(start, end):
+            area = abs((ax - avg_x) * (values[i] - ay) - (ax - i) * (avg_y - ay))
+            if area > best_area:
+                best_area, best = area, i
+        points.append((best, values[best]))
+        a = best
+
+    points.append((n - 1, values[-1]))
+    return points
+
+
+class Sparkline:
+    """Mini-graphique de prix alimenté en continu"""
+
+    def __init__(self, parent, theme, title="", width=DEFAULT_WIDTH, height=DEFAULT_HEIGHT,
+                 capacity=DEFAULT_CAPACITY, method='minmax'):
+        """
+        Args:
+            parent: Widget parent
+            theme (dict): Thème de l'application
+            title (str): Libellé affiché en haut à gauche (ex: 'BTC-USDC')
+            width (int): Largeur en pixels
+            height (int): Hauteur en pixels
+            capacity (int): Nombre de valeurs conservées
+            method (str): 'minmax' ou 'lttb'
+        """
+        self.theme = theme
+        self.width = width
+        self.height = height
+        self.method = method
+        self.values = deque(maxlen=capacity)
+        self.dirty = False
+
+        self.canvas = tk.Canvas(
+            parent,
+            width=width,
+            height=height,
+            bg=theme['bg_secondary'],
+            highlightthickness=0
+        )
+        # Items créés une seule fois, puis déplacés/reconfigurés
+        self._line = self.canvas.create_line(0, 0, 0, 0, fill=theme['accent'], width=1.5)
+        self._title = self.canvas.create_text(
+            PADDING, PADDING, text=title, anchor='nw',
+            font=(FONT_FAMILY, 8, 'bold'), fill=theme['text_secondary']
+        )
+        self._last = self.canvas.create_text(
+            width - PADDING, PADDING, text="—", anchor='ne',
+            font=(FONT_FAMILY, 9, 'bold'), fill=theme['text_primary']
+        )
+        self._last_text = None
+        self._color = None
+
+    def pack(self, **kwargs):
+        self.canvas.pack(**kwargs)
+        return self.canvas
+
+    def grid(self, **kwargs):
+        self.canvas.grid(**kwargs)
+        return self.canvas
+
+    def push(self, value):
+        """Ajoute une valeur (le tracé est différé jusqu'au prochain redraw())"""
+        self.values.append(value)
+        self.dirty = True
+
+    def extend(self, values):
+        self.values.extend(values)
+        self.dirty = True
+
+    def _points(self):
+        values = list(self.values)
+        usable = self.width - 2 * PADDING
+        if self.method == 'lttb':
+            return downsample_lttb(values, usable)
+        return downsample_minmax(values, usable // 2)
+
+    def compute_coords(self):
+        """
+        Calcule les coordonnées à tracer (sans toucher au Canvas)
+
+        Returns:
+            list: Coordonnées aplaties [x0, y0, x1, y1, ...]
+        """
+        if len(self.values) < 2:
+            return []
+
+        points = self._points()
+        n = len(self.values)
+        lo = min(v for _, v in points)
+        hi = max(v for _, v in points)
+        span = (hi - lo) or 1.0
+
+        top = PADDING + 14
+        plot_height = self.height - top - PADDING
+        plot_width = self.width - 2 * PADDING
+        x_scale = plot_width / (n - 1)
+        y_scale = plot_height / span
+
+        coords = []
+        for i, v in points:
+            coords.append(PADDING + i * x_scale)
+            coords.append(top + (hi - v) * y_scale)
+        return coords
+
+    def redraw(self):
+        """
+        Met à jour le tracé si de nouvelles valeurs sont arrivées
+
+        Returns:
+            bool: True si le Canvas a été modifié
+        """
+        if not self.dirty:
+            return False
+        self.dirty = False
+
+        coords = self.compute_coords()
+        if coords:
+            self.canvas.coords(self._line, *coords)
+            color = COLOR_UP if self.values[-1] >= self.values[0] else COLOR_DOWN
+            if color != self._color:
+                self.canvas.itemconfigure(self._line, fill=color)
+                self._color = color
+
+        last_text = f"{self.values[-1]:,.6g}" if self.values else "—"
+        if last_text != self._last_text:
+            self.canvas.itemconfigure(self._last, text=last_text)
+            self._last_text = last_text
+        return True
+
+    def apply_theme(self, theme):
+        """Applique un nouveau thème sans recréer le Canvas"""
+        self.theme = theme
+        self.canvas.configure(bg=theme['bg_secondary'])
+        self.canvas.itemconfigure(self._title, fill=theme['text_secondary'])
+        self.canvas.itemconfigure(self._last, fill=theme['text_primary'])
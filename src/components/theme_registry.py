@@ -0,0 +1,146 @@
+"""
+Registre des rôles de couleur des widgets
+
+Chaque widget déclare à sa création les clés de thème qu'il utilise pour
+ses options (ex: bg='bg_secondary', fg='text_primary'). Les widgets sont
+regroupés par signature de rôles : au changement de thème, les options
+d'un groupe sont résolues une seule fois, puis toutes les reconfigurations
+sont envoyées à Tcl en un seul script, sans parcourir l'arbre des widgets
+ni relire leurs couleurs actuelles.
+
+Les vues enregistrent aussi leurs widgets construits avec des couleurs
+directes (themed(tk.Label(..., bg=theme['...']), {'bg': '...'})) : un
+widget non enregistré garde ses couleurs au changement de thème.
+"""
+import threading
+import weakref
+
+# Constantes - Messages de log
+LOG_APPLY_ERROR = "✗ Erreur application du thème: {error}"
+
+
+def _tcl_quote(value):
+    return '{' + str(value) + '}'
+
+
+class ThemeRegistry:
+    """Widgets enregistrés, groupés par rôles de couleur"""
+
+    def __init__(self):
+        # {((option, clé de thème), ...): WeakSet de widgets}
+        self._groups = {}
+        self._lock = threading.Lock()
+        # Nombre total d'enregistrements (compte des widgets créés, voir ViewCache)
+        self.registrations = 0
+
+    def register(self, widget, **roles):
+        """
+        Enregistre les rôles de couleur d'un widget
+
+        Args:
+            widget: Widget Tk
+            **roles: option → clé de thème (ex: bg='accent', fg='button_text')
+
+        Returns:
+            widget: Le widget (permet l'enregistrement en ligne)
+        """
+        signature = tuple(sorted(roles.items()))
+        with self._lock:
+            self.registrations += 1
+            if not roles:
+                return widget
+            group = self._groups.get(signature)
+            if group is None:
+                group = self._groups[signature] = weakref.WeakSet()
+            group.add(widget)
+        return widget
+
+    def register_config(self, widget, roles, overrides=None):
+        """
+        Enregistre les rôles d'un widget créé par une fabrique de ui_component
+
+        Les options fournies explicitement par l'appelant (overrides) ne
+        suivent plus le thème et sont donc exclues.
+
+        Args:
+            widget: Widget Tk
+            roles (dict): option → clé de thème par défaut de la fabrique
+            overrides (dict, optional): Options passées par l'appelant
+        """
+        overrides = overrides or {}
+        return self.register(widget, **{
+            option: key for option, key in roles.items() if option not in overrides
+        })
+
+    def unregister(self, widget):
+        with self._lock:
+            for group in self._groups.values():
+                group.discard(widget)
+
+    def __len__(self):
+        with self._lock:
+            return sum(len(group) for group in self._groups.values())
+
+    def build_script(self, theme):
+        """
+        Construit le script Tcl de reconfiguration pour un thème
+
+        Args:
+            theme (dict): Thème à appliquer
+
+        Returns:
+            tuple: (interpréteur Tk ou None, script str, nombre de widgets)
+        """
+        lines = []
+        interp = None
+        with self._lock:
+            groups = [(signature, list(group)) for signature, group in self._groups.items()]
+
+        for signature, widgets in groups:
+            if not widgets:
+                continue
+            options = ' '.join(
+                f"-{option} {_tcl_quote(theme[key])}" for option, key in signature if key in theme
+            )
+            if not options:
+                continue
+            for widget in widgets:
+                if interp is None:
+                    interp = widget.tk
+                # catch : un widget détruit n'interrompt pas le reste du script
+                lines.append(f"catch {{{widget._w} configure {options}}}")
+        return interp, '\n'.join(lines), len(lines)
+
+    def apply(self, theme):
+        """
+        Applique un thème à tous les widgets enregistrés (un seul appel Tcl)
+
+        Args:
+            theme (dict): Thème à appliquer
+
+        Returns:
+            int: Nombre de widgets reconfigurés
+        """
+        interp, script, count = self.build_script(theme)
+        if interp is None or not script:
+            return 0
+        try:
+            interp.eval(script)
+        except Exception as e:
+            print(LOG_APPLY_ERROR.format(error=e))
+            return 0
+        return count
+
+
+_registry = None
+_registry_lock = threading.Lock()
+
+
+def get_theme_registry():
+    """Retourne le registre de thème partagé par l'application"""
+    global _registry
+    if _registry is None:
+        with _registry_lock:
+            if _registry is None:
+                _registry = ThemeRegistry()
+    return _registry
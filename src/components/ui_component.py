@@ -3,9 +3,31 @@ Composants UI réutilisables pour l'application CoinTrader
 """
 import tkinter as tk
 from tkinter import ttk
+from src.components.theme_registry import get_theme_registry
 
 FONT_FAMILY = "Segoe UI"
 
+# Rôles de couleur (option → clé de thème) suivis lors d'un changement de thème
+ROLES_BUTTON_PRIMARY = {'bg': 'accent', 'fg': 'button_text', 'activebackground': 'accent'}
+ROLES_BUTTON_SECONDARY = {'bg': 'bg_secondary', 'fg': 'text_primary', 'activebackground': 'bg_primary'}
+ROLES_INPUT = {'bg': 'input_bg', 'fg': 'text_primary', 'insertbackground': 'text_primary'}
+ROLES_CARD = {'bg': 'bg_secondary', 'highlightbackground': 'border'}
+
+
+def themed(widget, roles, overrides=None):
+    """
+    Enregistre les rôles de couleur d'un widget dans le registre de thème
+
+    Args:
+        widget: Widget Tk
+        roles (dict): option → clé de thème (ex: {'bg': 'bg_secondary'})
+        overrides (dict, optional): Options imposées par l'appelant (non suivies)
+
+    Returns:
+        widget: Le widget
+    """
+    return get_theme_registry().register_config(widget, roles, overrides)
+
 
 def center_window(root, width=None, height=None):
     """
@@ -65,7 +87,7 @@ class Button:
         
         config = {**default_config, **kwargs}
         btn = tk.Button(parent, text=text, command=command, **config)
-        return btn
+        return themed(btn, ROLES_BUTTON_PRIMARY, kwargs)
     
     @staticmethod
     def secondary(parent, text, command, theme, **kwargs):
@@ -93,7 +115,7 @@ class Button:
         
         config = {**default_config, **kwargs}
         btn = tk.Button(parent, text=text, command=command, **config)
-        return btn
+        return themed(btn, ROLES_BUTTON_SECONDARY, kwargs)
     
     @staticmethod
     def danger(parent, text, command, theme, **kwargs):
@@ -174,7 +196,7 @@ class Button:
         
         config = {**default_config, **kwargs}
         btn = tk.Button(parent, text=text, command=command, **config)
-        return btn
+        return themed(btn, ROLES_BUTTON_SECONDARY, kwargs)
 
 
 class ButtonGroup:
@@ -189,7 +211,7 @@ class ButtonGroup:
             theme (dict): Thème de l'application
             orientation (str): 'horizontal' ou 'vertical'
         """
-        self.frame = tk.Frame(parent, bg=theme['bg_secondary'])
+        self.frame = themed(tk.Frame(parent, bg=theme['bg_secondary']), {'bg': 'bg_secondary'})
         self.theme = theme
         self.orientation = orientation
         self.buttons = []
@@ -257,7 +279,7 @@ class Input:
         }
         
         config = {**default_config, **kwargs}
-        entry = tk.Entry(parent, **config)
+        entry = themed(tk.Entry(parent, **config), ROLES_INPUT, kwargs)
         
         if placeholder:
             entry.insert(0, placeholder)
@@ -290,7 +312,8 @@ class Label:
         }
         
         config = {**default_config, **kwargs}
-        return tk.Label(parent, text=text, **config)
+        return themed(tk.Label(parent, text=text, **config),
+                      {'bg': 'bg_primary', 'fg': 'text_primary'}, kwargs)
     
     @staticmethod
     def subtitle(parent, text, theme, **kwargs):
@@ -302,7 +325,8 @@ class Label:
         }
         
         config = {**default_config, **kwargs}
-        return tk.Label(parent, text=text, **config)
+        return themed(tk.Label(parent, text=text, **config),
+                      {'bg': 'bg_secondary', 'fg': 'text_primary'}, kwargs)
     
     @staticmethod
     def field_label(parent, text, theme, icon="", **kwargs):
@@ -316,17 +340,17 @@ class Label:
             icon (str): Icône optionnelle
             **kwargs: Arguments supplémentaires
         """
-        frame = tk.Frame(parent, bg=theme['bg_secondary'])
+        frame = themed(tk.Frame(parent, bg=theme['bg_secondary']), {'bg': 'bg_secondary'})
         
         # Icône si fournie
         if icon:
-            tk.Label(
+            themed(tk.Label(
                 frame,
                 text=icon,
                 font=(FONT_FAMILY, 11),
                 bg=theme['bg_secondary'],
                 fg=theme['accent']
-            ).pack(side='left', padx=(0, 8))
+            ), {'bg': 'bg_secondary', 'fg': 'accent'}).pack(side='left', padx=(0, 8))
         
         # Séparer le texte et l'astérisque
         if text.endswith(' *'):
@@ -346,18 +370,19 @@ class Label:
         config = {**default_config, **kwargs}
         
         # Label principal
-        tk.Label(frame, text=text_without_star, **config).pack(side='left')
+        themed(tk.Label(frame, text=text_without_star, **config),
+               {'bg': 'bg_secondary', 'fg': 'text_primary'}, kwargs).pack(side='left')
         
         # Astérisque en rouge
         if has_star:
-            tk.Label(
+            themed(tk.Label(
                 frame,
                 text=" *",
                 font=(FONT_FAMILY, 10, 'bold'),
                 bg=theme['bg_secondary'],
                 fg='#F44336',
                 anchor='w'
-            ).pack(side='left')
+            ), {'bg': 'bg_secondary'}).pack(side='left')
         
         return frame
     
@@ -372,7 +397,7 @@ class Label:
         }
         
         config = {**default_config, **kwargs}
-        return tk.Label(parent, text="", **config)
+        return themed(tk.Label(parent, text="", **config), {'bg': 'bg_secondary'}, kwargs)
     
     @staticmethod
     def help_text(parent, text, theme, **kwargs):
@@ -385,7 +410,8 @@ class Label:
         }
         
         config = {**default_config, **kwargs}
-        return tk.Label(parent, text=text, **config)
+        return themed(tk.Label(parent, text=text, **config),
+                      {'bg': 'bg_secondary', 'fg': 'text_secondary'}, kwargs)
 
 
 class Card:
@@ -408,7 +434,7 @@ class Card:
         }
         
         config = {**default_config, **kwargs}
-        self.frame = tk.Frame(parent, **config)
+        self.frame = themed(tk.Frame(parent, **config), ROLES_CARD, kwargs)
         self.theme = theme
     
     def pack(self, **kwargs):
@@ -434,7 +460,7 @@ class Separator:
         }
         
         config = {**default_config, **kwargs}
-        return tk.Frame(parent, **config)
+        return themed(tk.Frame(parent, **config), {'bg': 'border'}, kwargs)
 
 
 class FormField:
@@ -452,7 +478,7 @@ class FormField:
             help_text (str): Texte d'aide optionnel
             input_type (str): 'text' ou 'password'
         """
-        self.container = tk.Frame(parent, bg=theme['bg_secondary'])
+        self.container = themed(tk.Frame(parent, bg=theme['bg_secondary']), {'bg': 'bg_secondary'})
         self.theme = theme
         
         # Label avec astérisque rouge automatique
@@ -460,7 +486,8 @@ class FormField:
         label_frame.pack(fill='x', pady=(0, 8))
         
         # Input avec frame pour la bordure
-        input_frame = tk.Frame(self.container, bg=theme['input_bg'], relief='solid', borderwidth=1)
+        input_frame = themed(tk.Frame(self.container, bg=theme['input_bg'], relief='solid', borderwidth=1),
+                             {'bg': 'input_bg'})
         input_frame.pack(fill='x')
         
         if input_type == "password":
@@ -0,0 +1,119 @@
+"""
+Cache LRU des vues de la zone de contenu
+
+Chaque vue est construite dans son propre cadre hôte. Quitter une page
+masque ce cadre (pack_forget) au lieu de détruire ses widgets ; y revenir
+le réaffiche et demande seulement à la vue de rafraîchir ses données.
+La mémoire est bornée par un nombre de vues et un nombre total de widgets :
+les vues les moins récemment affichées sont détruites en premier. Le
+nombre de widgets d'une vue est compté une fois, à sa construction, par
+les enregistrements du registre de thème (themed) : aucun parcours de
+l'arbre Tk.
+
+Une vue peut définir, facultativement :
+    on_hide()  : suspendre ses boucles (after, threads, écouteurs)
+    on_show()  : reprendre et rafraîchir ce qui a changé
+    apply_theme(theme) : recolorer ce que le registre de thème ne couvre
+                         pas (items de Canvas), sans reconstruire la vue
+"""
+from collections import OrderedDict
+
+# Constantes - Limites du cache
+MAX_VIEWS = 4
+MAX_WIDGETS = 4000
+
+
+class CachedView:
+    """Vue conservée avec son cadre hôte"""
+
+    __slots__ = ('key', 'host', 'view', 'widgets')
+
+    def __init__(self, key, host, view, widgets):
+        self.key = key
+        self.host = host
+        self.view = view
+        self.widgets = widgets
+
+
+class ViewCache:
+    """Vues récemment utilisées, de la moins à la plus récente"""
+
+    def __init__(self, max_views=MAX_VIEWS, max_widgets=MAX_WIDGETS):
+        """
+        Args:
+            max_views (int): Nombre maximum de vues conservées
+            max_widgets (int): Nombre maximum de widgets (toutes vues confondues)
+        """
+        self.max_views = max_views
+        self.max_widgets = max_widgets
+        self._entries = OrderedDict()
+
+    def __contains__(self, key):
+        return key in self._entries
+
+    def __len__(self):
+        return len(self._entries)
+
+    def is_host(self, widget):
+        """Indique si un widget est le cadre hôte d'une vue en cache"""
+        return any(entry.host is widget for entry in self._entries.values())
+
+    def views(self):
+        """Retourne les vues en cache, de la moins à la plus récente"""
+        return [entry.view for entry in self._entries.values()]
+
+    @property
+    def total_widgets(self):
+        return sum(entry.widgets for entry in self._entries.values())
+
+    def get(self, key):
+        """
+        Retourne une vue en cache et la marque comme la plus récente
+
+        Returns:
+            CachedView or None
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if not entry.host.winfo_exists():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return entry
+
+    def put(self, key, host, view, widgets):
+        """
+        Ajoute une vue puis libère les plus anciennes au-delà des limites
+
+        La vue ajoutée n'est jamais libérée, même si elle dépasse seule la limite.
+
+        Args:
+            key (str): Identifiant de la page
+            host: Cadre hôte de la vue
+            view: Instance de la vue
+            widgets (int): Nombre de widgets, compté à la construction
+
+        Returns:
+            CachedView: Entrée ajoutée
+        """
+        self.evict(key)
+        entry = CachedView(key, host, view, widgets)
+        self._entries[key] = entry
+
+        while len(self._entries) > 1 and (
+                len(self._entries) > self.max_views or self.total_widgets > self.max_widgets):
+            oldest = next(iter(self._entries))
+            self.evict(oldest)
+        return entry
+
+    def evict(self, key):
+        """Détruit une vue en cache"""
+        entry = self._entries.pop(key, None)
+        if entry is not None and entry.host.winfo_exists():
+            entry.host.destroy()
+
+    def clear(self):
+        """Détruit toutes les vues (ex: déconnexion)"""
+        for key in list(self._entries):
+            self.evict(key)
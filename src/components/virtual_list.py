@@ -0,0 +1,337 @@
+"""
+Liste virtualisée sur Canvas Tk
+
+Seules les lignes visibles sont dessinées : un petit nombre d'emplacements
+(slots) d'items Canvas est créé une fois, puis réaffecté aux lignes de
+données lors du défilement. Les mises à jour de données sont des diffs :
+seules les cellules dont le texte ou la couleur change sont reconfigurées,
+et uniquement si la ligne est visible.
+"""
+import tkinter as tk
+
+FONT_FAMILY = "Segoe UI"
+
+# Constantes - Géométrie
+ROW_HEIGHT = 40
+HEADER_HEIGHT = 30
+CELL_PADDING = 12
+WHEEL_ROWS = 3
+
+
+class _Slot:
+    """Emplacement d'affichage d'une ligne (items Canvas réutilisés)"""
+
+    __slots__ = ('background', 'cells', 'key', 'texts', 'colors')
+
+    def __init__(self, background, cells):
+        self.background = background
+        self.cells = cells
+        self.key = None
+        self.texts = [None] * len(cells)
+        self.colors = [None] * len(cells)
+
+
+class VirtualList:
+    """Tableau à défilement virtuel avec mises à jour de lignes sur place"""
+
+    def __init__(self, parent, theme, columns, row_height=ROW_HEIGHT, on_click=None):
+        """
+        Args:
+            parent: Widget parent
+            theme (dict): Thème de l'application
+            columns (list): Colonnes [{'key', 'title', 'weight', 'anchor', 'format', 'color'}]
+                'format' (callable, optional): valeur → texte
+                'color' (callable, optional): ligne → couleur du texte ou None
+            row_height (int): Hauteur d'une ligne en pixels
+            on_click (callable, optional): on_click(row_key, column_key)
+        """
+        self.theme = theme
+        self.columns = columns
+        self.row_height = row_height
+        self.on_click = on_click
+
+        self.keys = []          # ordre d'affichage
+        self.rows = {}          # {clé: dict de valeurs}
+        self._index = {}        # {clé: position}
+        self._slots = []
+        self._visible = {}      # {clé: _Slot}
+        self._offset = 0
+        self._width = 1
+        self._height = 1
+        self._x = []            # abscisses de début de colonne
+
+        self.frame = tk.Frame(parent, bg=theme['bg_primary'])
+
+        self.header = tk.Canvas(
+            self.frame, height=HEADER_HEIGHT, bg=theme['bg_header'], highlightthickness=0
+        )
+        self.header.pack(fill='x')
+
+        body = tk.Frame(self.frame, bg=theme['bg_primary'])
+        body.pack(fill='both', expand=True)
+
+        self.canvas = tk.Canvas(body, bg=theme['bg_secondary'], highlightthickness=0)
+        self.scrollbar = tk.Scrollbar(body, orient='vertical', command=self.yview)
+        self.canvas.pack(side='left', fill='both', expand=True)
+
+        self.canvas.bind('<Configure>', self._on_configure)
+        self.canvas.bind('<MouseWheel>', self._on_mousewheel)
+        self.canvas.bind('<Button-1>', self._on_button)
+
+    def pack(self, **kwargs):
+        self.frame.pack(**kwargs)
+        return self.frame
+
+    def grid(self, **kwargs):
+        self.frame.grid(**kwargs)
+        return self.frame
+
+    # ============================================
+    # DONNÉES
+    # ============================================
+
+    def set_rows(self, rows, key='id'):
+        """
+        Remplace le contenu (diff : les lignes inchangées ne sont pas redessinées)
+
+        Args:
+            rows (list): Lignes (dicts) dans l'ordre d'affichage
+            key (str): Champ identifiant une ligne
+        """
+        self.keys = [row[key] for row in rows]
+        self.rows = {row[key]: dict(row) for row in rows}
+        self._index = {k: i for i, k in enumerate(self.keys)}
+        self._clamp_offset()
+        self._layout()
+
+    def update_row(self, key, changes):
+        """
+        Fusionne des changements dans une ligne et redessine ses cellules modifiées
+
+        Args:
+            key: Identifiant de la ligne
+            changes (dict): Champs modifiés
+
+        Returns:
+            bool: True si la ligne existe
+        """
+        row = self.rows.get(key)
+        if row is None:
+            return False
+        row.update(changes)
+        slot = self._visible.get(key)
+        if slot is not None:
+            self._paint(slot, row)
+        return True
+
+    def insert_row(self, row, key='id', position=None):
+        """Ajoute une ligne (en fin de liste par défaut)"""
+        row_key = row[key]
+        self.rows[row_key] = dict(row)
+        if position is None:
+            self.keys.append(row_key)
+        else:
+            self.keys.insert(position, row_key)
+        self._index = {k: i for i, k in enumerate(self.keys)}
+        self._layout()
+
+    def remove_row(self, key):
+        if self.rows.pop(key, None) is None:
+            return
+        self.keys.remove(key)
+        self._index = {k: i for i, k in enumerate(self.keys)}
+        self._clamp_offset()
+        self._layout()
+
+    @property
+    def row_count(self):
+        return len(self.keys)
+
+    # ============================================
+    # DÉFILEMENT
+    # ============================================
+
+    def _content_height(self):
+        return len(self.keys) * self.row_height
+
+    def _clamp_offset(self):
+        max_offset = max(0, self._content_height() - self._height)
+        self._offset = max(0, min(self._offset, max_offset))
+
+    def yview(self, *args):
+        """Interface de défilement compatible tk.Scrollbar"""
+        if not args:
+            return
+        if args[0] == 'moveto':
+            self._offset = int(float(args[1]) * self._content_height())
+        elif args[0] == 'scroll':
+            amount = int(args[1])
+            step = self._height if args[2] == 'pages' else self.row_height
+            self._offset += amount * step
+        self._clamp_offset()
+        self._layout()
+
+    def scroll_to(self, key):
+        """Fait défiler jusqu'à rendre une ligne visible"""
+        index = self._index.get(key)
+        if index is None:
+            return
+        top = index * self.row_height
+        if top < self._offset:
+            self._offset = top
+        elif top + self.row_height > self._offset + self._height:
+            self._offset = top + self.row_height - self._height
+        self._clamp_offset()
+        self._layout()
+
+    def _on_mousewheel(self, event):
+        self.yview('scroll', int(-1 * (event.delta / 120)) * WHEEL_ROWS, 'units')
+
+    def _update_scrollbar(self):
+        total = self._content_height()
+        if total <= self._height:
+            self.scrollbar.pack_forget()
+            return
+        first = self._offset / total
+        last = min(1.0, (self._offset + self._height) / total)
+        self.scrollbar.pack(side='right', fill='y', before=self.canvas)
+        self.scrollbar.set(first, last)
+
+    # ============================================
+    # DESSIN
+    # ============================================
+
+    def _on_configure(self, event):
+        resized = event.width != self._width
+        self._width, self._height = event.width, event.height
+        self._compute_columns()
+        if resized:
+            self._draw_header()
+        self._ensure_slots()
+        self._clamp_offset()
+        self._layout(force=resized)
+
+    def _compute_columns(self):
+        total_weight = sum(column.get('weight', 1) for column in self.columns)
+        x = 0.0
+        self._x = []
+        for column in self.columns:
+            self._x.append(x)
+            x += self._width * column.get('weight', 1) / total_weight
+
+    def _text_x(self, index):
+        column = self.columns[index]
+        start = self._x[index]
+        end = self._x[index + 1] if index + 1 < len(self._x) else self._width
+        anchor = column.get('anchor', 'w')
+        if anchor == 'e':
+            return end - CELL_PADDING
+        if anchor == 'center':
+            return (start + end) / 2
+        return start + CELL_PADDING
+
+    def _draw_header(self):
+        self.header.delete('all')
+        for index, column in enumerate(self.columns):
+            self.header.create_text(
+                self._text_x(index), HEADER_HEIGHT / 2, text=column.get('title', ''),
+                anchor=column.get('anchor', 'w'), font=(FONT_FAMILY, 9, 'bold'),
+                fill=self.theme['text_secondary']
+            )
+
+    def _ensure_slots(self):
+        """Crée les emplacements nécessaires pour remplir la hauteur visible (jamais plus)"""
+        needed = self._height // self.row_height + 2
+        while len(self._slots) < needed:
+            background = self.canvas.create_rectangle(
+                0, 0, 0, 0, fill=self.theme['bg_secondary'], outline=self.theme['border'], state='hidden'
+            )
+            cells = [
+                self.canvas.create_text(
+                    0, 0, text='', anchor=column.get('anchor', 'w'),
+                    font=(FONT_FAMILY, 10), fill=self.theme['text_primary'], state='hidden'
+                )
+                for column in self.columns
+            ]
+            self._slots.append(_Slot(background, cells))
+
+    def _layout(self, force=False):
+        """Affecte les emplacements aux lignes visibles"""
+        if not self._slots:
+            return
+        first = self._offset // self.row_height
+        shift = self._offset % self.row_height
+        visible = {}
+
+        for position, slot in enumerate(self._slots):
+            index = first + position
+            y = position * self.row_height - shift
+            if index >= len(self.keys) or y >= self._height:
+                if slot.key is not None or force:
+                    self.canvas.itemconfigure(slot.background, state='hidden')
+                    for cell in slot.cells:
+                        self.canvas.itemconfigure(cell, state='hidden')
+                    slot.key = None
+                continue
+
+            key = self.keys[index]
+            self.canvas.coords(slot.background, 0, y, self._width, y + self.row_height)
+            for column_index, cell in enumerate(slot.cells):
+                self.canvas.coords(cell, self._text_x(column_index), y + self.row_height / 2)
+            if slot.key is None:
+                self.canvas.itemconfigure(slot.background, state='normal')
+                for cell in slot.cells:
+                    self.canvas.itemconfigure(cell, state='normal')
+            if slot.key != key:
+                # Nouvelle ligne dans cet emplacement : tout repeindre
+                slot.texts = [None] * len(slot.cells)
+                slot.colors = [None] * len(slot.cells)
+                slot.key = key
+            self._paint(slot, self.rows[key])
+            visible[key] = slot
+
+        self._visible = visible
+        self._update_scrollbar()
+
+    def _paint(self, slot, row):
+        """Reconfigure uniquement les cellules dont le texte ou la couleur a changé"""
+        default_color = self.theme['text_primary']
+        for index, column in enumerate(self.columns):
+            value = row.get(column['key'])
+            formatter = column.get('format')
+            text = formatter(value) if formatter else ('' if value is None else str(value))
+            color_fn = column.get('color')
+            color = (color_fn(row) if color_fn else None) or default_color
+
+            if text != slot.texts[index]:
+                self.canvas.itemconfigure(slot.cells[index], text=text)
+                slot.texts[index] = text
+            if color != slot.colors[index]:
+                self.canvas.itemconfigure(slot.cells[index], fill=color)
+                slot.colors[index] = color
+
+    def _on_button(self, event):
+        if self.on_click is None:
+            return
+        index = (self._offset + event.y) // self.row_height
+        if index >= len(self.keys):
+            return
+        column_key = None
+        for column_index in range(len(self.columns) - 1, -1, -1):
+            if event.x >= self._x[column_index]:
+                column_key = self.columns[column_index]['key']
+                break
+        self.on_click(self.keys[index], column_key)
+
+    def apply_theme(self, theme):
+        """Applique un nouveau thème sans recréer les items"""
+        self.theme = theme
+        self.frame.configure(bg=theme['bg_primary'])
+        self.header.configure(bg=theme['bg_header'])
+        self.canvas.configure(bg=theme['bg_secondary'])
+        for slot in self._slots:
+            self.canvas.itemconfigure(slot.background, fill=theme['bg_secondary'], outline=theme['border'])
+            slot.colors = [None] * len(slot.cells)
+        self._draw_header()
+        for key, slot in self._visible.items():
+            self._paint(slot, self.rows[key])
@@ -1,11 +1,13 @@
 from src.models.bot_model import BotModel
+from src.utils.tracing import get_tracer, CATEGORY_CONTROLLER
 
 class BotController:
     """Contrôleur pour la gestion des bots de trading"""
     
-    def __init__(self):
-        self.bot_model = BotModel()
+    def __init__(self, bot_model=None):
+        self.bot_model = bot_model if bot_model else BotModel()
     
+    @get_tracer().traced(CATEGORY_CONTROLLER)
     def create_bot(self, user_id, exchange, product_id, crypto_source, 
                    crypto_target, prix_achat, pourcentage_gain, 
                    montant_trade, type_ordre):
@@ -157,7 +159,7 @@ class BotController:
             dict: Données formatées
         """
         return {
-            'id': bot['id'],
+            'id': bot['bot_id'],
             'pair': bot['product_id'],
             'exchange': bot['exchange_name'],
             'source': bot['crypto_source'],
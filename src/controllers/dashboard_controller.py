@@ -0,0 +1,134 @@
+from src.models.database_model import DatabaseModel
+from src.models.bot_model import BotModel
+from src.models.exchange_model import ExchangeModel
+from src.models.order_model import OrderModel
+from src.models.pnl_model import PnlModel
+from src.models.product_catalog import get_catalog
+from src.services.async_runtime import get_async_runtime
+from src.services.price_aggregator import PriceAggregator
+
+# Nombre maximum de produits suivis par le tableau de bord
+MAX_WATCHED_PRODUCTS = 50
+DEFAULT_QUOTE = 'USDC'
+DEFAULT_EXCHANGE = 'coinbase'
+
+
+class DashboardController:
+    """Contrôleur du tableau de bord (résumé du compte et flux de prix)"""
+
+    def __init__(self, account_id):
+        self.account_id = account_id
+        # Connexion utilisée depuis le thread base de données du runtime (voir request_summary)
+        db = DatabaseModel(check_same_thread=False)
+        self.exchange_model = ExchangeModel(db)
+        self.bot_model = BotModel(db)
+        self.order_model = OrderModel(db)
+        self.pnl_model = PnlModel(db)
+
+    def get_summary(self):
+        """
+        Résumé du compte : bots, ordres ouverts et positions
+
+        Returns:
+            dict: {'bots_total', 'bots_active', 'bot_products', 'open_orders', 'positions'}
+        """
+        bots = self.bot_model.get_bot_summary(self.account_id)
+        # Positions précalculées par le moteur de PnL ; calcul sur les ordres tant qu'il n'a jamais tourné
+        positions = self.pnl_model.get_positions(self.account_id)
+        if positions is None:
+            positions = self.order_model.get_positions(self.account_id)
+        return {
+            'bots_total': bots['total'],
+            'bots_active': bots['active'],
+            'bot_products': bots['active_products'],
+            'open_orders': self.order_model.count_active_orders(self.account_id),
+            'positions': positions
+        }
+
+    def request_summary(self):
+        """
+        Calcule get_summary() hors du thread Tk (thread base de données du runtime)
+
+        Returns:
+            concurrent.futures.Future: Résultat de get_summary()
+        """
+        return get_async_runtime().call_blocking(self.get_summary, kind='db')
+
+    def get_watched_products(self, summary=None, limit=MAX_WATCHED_PRODUCTS):
+        """
+        Produits affichés : bots actifs, positions, puis produits du catalogue
+
+        Les positions cotées hors USDC ajoutent la paire de conversion de
+        leur devise de cotation (ex: BTC-USDC pour ETH-BTC), nécessaire à
+        portfolio_value().
+
+        Returns:
+            list: product_ids (au plus `limit`)
+        """
+        summary = summary or self.get_summary()
+        conversions = [
+            f"{quote}-{DEFAULT_QUOTE}" for quote in
+            (p['product_id'].split('-')[1] for p in summary['positions']) if quote != DEFAULT_QUOTE
+        ]
+        products = []
+        for product_id in summary['bot_products'] + [p['product_id'] for p in summary['positions']] + conversions:
+            if product_id not in products:
+                products.append(product_id)
+
+        for product in get_catalog().get_products(DEFAULT_EXCHANGE, tradable_only=True):
+            if len(products) >= limit:
+                break
+            if product.quote == DEFAULT_QUOTE and product.product_id not in products:
+                products.append(product.product_id)
+        return products[:limit]
+
+    def create_price_feed(self, product_ids, poll_interval=2.0):
+        """
+        Crée l'agrégateur de prix sur les exchanges actifs du compte
+
+        Lit la table exchanges : à appeler hors du thread Tk (voir request_price_feed).
+
+        Returns:
+            PriceAggregator: Agrégateur non démarré
+        """
+        aggregator = PriceAggregator(self.account_id, product_ids, poll_interval=poll_interval,
+                                     runtime=get_async_runtime())
+        if not aggregator.load_venues(self.exchange_model):
+            aggregator.add_venue(DEFAULT_EXCHANGE)
+        return aggregator
+
+    def request_price_feed(self, product_ids, poll_interval=2.0):
+        """
+        Crée l'agrégateur hors du thread Tk (thread base de données du runtime)
+
+        Returns:
+            concurrent.futures.Future: PriceAggregator non démarré
+        """
+        return get_async_runtime().call_blocking(self.create_price_feed, product_ids, poll_interval, kind='db')
+
+    @staticmethod
+    def portfolio_value(positions, prices):
+        """
+        Valorise les positions en USDC aux derniers prix connus
+
+        Valeur et coût d'une paire cotée dans une autre devise (ex: ETH-BTC)
+        sont convertis au prix de QUOTE-USDC ; sans ce prix, la position est
+        ignorée.
+
+        Args:
+            positions (list): Résultat de get_summary()['positions']
+            prices (dict): {product_id: dernier prix}
+
+        Returns:
+            tuple: (valeur: float, coût: float) des positions valorisables, en USDC
+        """
+        value = cost = 0.0
+        for position in positions:
+            quote = position['product_id'].split('-')[1]
+            rate = 1.0 if quote == DEFAULT_QUOTE else prices.get(f"{quote}-{DEFAULT_QUOTE}")
+            price = prices.get(position['product_id'])
+            if price is None or rate is None:
+                continue
+            value += position['quantite'] * price * rate
+            cost += position['cout_usdc'] * rate
+        return value, cost
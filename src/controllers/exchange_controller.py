@@ -122,7 +122,7 @@ class ExchangeController:
         """
         return self.apikey_model.get_api_keys_for_user(user_id)
     
-    def add_api_key(self, account_id, exchange_id, api_key, api_secret, label=None):
+    def add_api_key(self, account_id, exchange_id, api_key, api_secret, label=None, api_passphrase=None):
         """
         Ajoute une clé API
         
@@ -132,15 +132,16 @@ class ExchangeController:
             api_key (str): Clé API
             api_secret (str): Secret API
             label (str): Label optionnel
+            api_passphrase (str): Passphrase optionnelle (Coinbase)
             
         Returns:
             tuple: (success: bool, message: str)
         """
         return self.apikey_model.add_api_key(
-            account_id, exchange_id, api_key, api_secret, label
+            account_id, exchange_id, api_key, api_secret, label, api_passphrase
         )
     
-    def update_api_key(self, api_key_id, api_key, api_secret, label=None):
+    def update_api_key(self, api_key_id, api_key, api_secret, label=None, api_passphrase=None):
         """
         Met à jour une clé API
         
@@ -149,12 +150,13 @@ class ExchangeController:
             api_key (str): Nouvelle clé
             api_secret (str): Nouveau secret
             label (str): Nouveau label
+            api_passphrase (str): Nouvelle passphrase (Coinbase)
             
         Returns:
             tuple: (success: bool, message: str)
         """
         return self.apikey_model.update_api_key(
-            api_key_id, api_key, api_secret, label
+            api_key_id, api_key, api_secret, label, api_passphrase
         )
     
     def delete_api_key(self, api_key_id):
@@ -1,6 +1,10 @@
 import bcrypt
 from src.utils.db_connection import get_db_context, DB_PATH
 from src.models.database_model import DatabaseModel
+from src.utils.metrics import get_metrics
+
+metrics = get_metrics()
+metrics.describe('bcrypt_seconds', "Durée des hachages et vérifications bcrypt")
 
 class AccountModel:
     """Modèle pour gérer les comptes utilisateurs en base de données"""
@@ -8,11 +12,13 @@ class AccountModel:
     def __init__(self):
         self.db_path = DB_PATH
     
+    @metrics.timed('bcrypt_seconds', op='hash')
     def _hash_password(self, password):
         """Hash le mot de passe avec bcrypt"""
         password_hash = bcrypt.hashpw(password.encode('utf-8'), bcrypt.gensalt())
         return password_hash.decode('utf-8')
     
+    @metrics.timed('bcrypt_seconds', op='verify')
     def _verify_password(self, password, stored_hash):
         """Vérifie le mot de passe avec bcrypt"""
         return bcrypt.checkpw(password.encode('utf-8'), stored_hash.encode('utf-8'))
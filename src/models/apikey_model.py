@@ -42,6 +42,22 @@ class ApiKeyModel:
             return False, str(e)
 
     # API keys
+    def _key_owner(self, api_key_id):
+        """Compte et nom d'exchange d'une clé API (None si inconnue)"""
+        self.db.cursor.execute(
+            "SELECT ak.fk_account_id, e.name FROM api_keys ak "
+            "JOIN exchanges e ON ak.fk_exchange_id = e.exchange_id WHERE ak.api_key_id = ?",
+            (api_key_id,)
+        )
+        return self.db.cursor.fetchone()
+
+    def _forget_credentials(self, account_id, exchange_name):
+        """Invalide les identifiants gardés en cache par l'adapter (singleton du processus)"""
+        if account_id is None or not exchange_name:
+            return
+        from src.models.exchanges.registry import get_registry
+        get_registry().clear_credentials(exchange_name, account_id)
+
     def get_api_keys_for_user(self, user_id):
         try:
             query = """
@@ -73,16 +89,55 @@ class ApiKeyModel:
             self.db.logger.log_error(f"Erreur récupération api keys: {e}")
             return []
 
-    def add_api_key(self, account_id, exchange_id, api_key, api_secret, label=None):
+    def get_credentials(self, account_id, exchange_name):
+        """
+        Récupère les identifiants API actifs (déchiffrés) d'un utilisateur pour un exchange
+
+        Args:
+            account_id (int): ID du compte utilisateur
+            exchange_name (str): Nom technique de l'exchange (ex: 'coinbase')
+
+        Returns:
+            dict or None: {'api_key', 'api_secret', 'api_passphrase'} ou None
+        """
         try:
-            # Chiffrer le secret avant stockage
+            query = """
+                SELECT ak.api_key, ak.api_secret, ak.api_passphrase
+                FROM api_keys ak
+                JOIN exchanges e ON ak.fk_exchange_id = e.exchange_id
+                WHERE ak.fk_account_id = ? AND e.name = ? AND ak.is_active = 1
+                ORDER BY ak.created_at DESC
+                LIMIT 1
+            """
+            self.db.cursor.execute(query, (account_id, exchange_name.lower()))
+            row = self.db.cursor.fetchone()
+            if not row or not row[1]:
+                return None
+            return {
+                "api_key": row[0],
+                "api_secret": decrypt_secret(row[1]),
+                "api_passphrase": decrypt_secret(row[2]) if row[2] else ''
+            }
+        except Exception as e:
+            self.db.logger.log_error(f"Erreur récupération credentials: {e}")
+            return None
+
+    def add_api_key(self, account_id, exchange_id, api_key, api_secret, label=None, api_passphrase=None):
+        try:
+            # Chiffrer le secret et la passphrase avant stockage
             secret_encrypted = encrypt_secret(api_secret) if api_secret else ''
+            passphrase_encrypted = encrypt_secret(api_passphrase) if api_passphrase else None
             self.db.cursor.execute(
-                "INSERT INTO api_keys (fk_account_id, fk_exchange_id, api_key, api_secret, label, created_at) VALUES (?, ?, ?, ?, ?, ?)",
-                (account_id, exchange_id, api_key, secret_encrypted, label, datetime.now())
+                "INSERT INTO api_keys (fk_account_id, fk_exchange_id, api_key, api_secret, api_passphrase, label, created_at) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (account_id, exchange_id, api_key, secret_encrypted, passphrase_encrypted, label, datetime.now())
             )
             self.db.connection.commit()
             self.db.logger.log_query(f"Clé API ajoutée: account={account_id}, exchange={exchange_id}, label={label}")
+            # La clé la plus récente remplace celle éventuellement en cache
+            self.db.cursor.execute("SELECT name FROM exchanges WHERE exchange_id = ?", (exchange_id,))
+            row = self.db.cursor.fetchone()
+            if row:
+                self._forget_credentials(account_id, row[0])
             return True, "Clé API ajoutée"
         except Exception as e:
             self.db.logger.log_error(f"Erreur ajout api key: {e}")
@@ -90,23 +145,30 @@ class ApiKeyModel:
 
     def delete_api_key(self, api_key_id):
         try:
+            owner = self._key_owner(api_key_id)
             self.db.cursor.execute("DELETE FROM api_keys WHERE api_key_id = ?", (api_key_id,))
             self.db.connection.commit()
+            if owner:
+                self._forget_credentials(owner[0], owner[1])
             return True, "Clé API supprimée"
         except Exception as e:
             self.db.logger.log_error(f"Erreur suppression api key: {e}")
             return False, str(e)
 
-    def update_api_key(self, api_key_id, api_key, api_secret, label=None):
+    def update_api_key(self, api_key_id, api_key, api_secret, label=None, api_passphrase=None):
         try:
-            # Chiffrer le secret avant stockage
+            # Chiffrer le secret et la passphrase avant stockage
             secret_encrypted = encrypt_secret(api_secret) if api_secret else ''
+            passphrase_encrypted = encrypt_secret(api_passphrase) if api_passphrase else None
             self.db.cursor.execute(
-                "UPDATE api_keys SET api_key = ?, api_secret = ?, label = ? WHERE api_key_id = ?",
-                (api_key, secret_encrypted, label, api_key_id)
+                "UPDATE api_keys SET api_key = ?, api_secret = ?, api_passphrase = COALESCE(?, api_passphrase), label = ? WHERE api_key_id = ?",
+                (api_key, secret_encrypted, passphrase_encrypted, label, api_key_id)
             )
             self.db.connection.commit()
             self.db.logger.log_query(f"Clé API modifiée: api_key_id={api_key_id}, label={label}")
+            owner = self._key_owner(api_key_id)
+            if owner:
+                self._forget_credentials(owner[0], owner[1])
             return True, "Clé API modifiée"
         except Exception as e:
             self.db.logger.log_error(f"Erreur modification api key: {e}")
@@ -1,6 +1,26 @@
 import sqlite3
 from datetime import datetime
 from src.models.database_model import DatabaseModel
+from src.models.records import Bot
+from src.utils.data_access import Query
+from src.utils.tracing import get_tracer, CATEGORY_MODEL
+
+# Requêtes - Lecture des bots
+QUERY_USER_BOTS = Query(
+    """
+    SELECT
+        b.bot_id, b.crypto_source, b.crypto_target, b.product_id,
+        b.prix_achat_cible, b.pourcentage_gain, b.montant_trade,
+        b.type_ordre, b.is_active, b.created_at,
+        e.display_name as exchange_name, b.fk_exchange_id, e.name
+    FROM bots b
+    JOIN exchanges e ON b.fk_exchange_id = e.exchange_id
+    WHERE b.fk_account_id = ?
+    ORDER BY b.created_at DESC
+    """,
+    rename={'fk_exchange_id': 'exchange_id', 'name': 'exchange'},
+    record=Bot
+)
 
 class BotModel:
     """Gestion des bots de trading"""
@@ -8,9 +28,10 @@ class BotModel:
     def __init__(self, db_model=None):
         self.db = db_model if db_model else DatabaseModel()
     
+    @get_tracer().traced(CATEGORY_MODEL)
     def create_bot(self, account_id, exchange_name, crypto_source, crypto_target, 
                    pourcentage_gain, montant_trade, type_ordre, 
-                   prix_achat_cible=None):
+                   prix_achat_cible=None, product_id=None):
         """
         Crée un nouveau bot de trading
         
@@ -23,15 +44,21 @@ class BotModel:
             montant_trade (float): Montant du trade en USDC
             type_ordre (str): Type d'ordre ('Market' ou 'Limit')
             prix_achat_cible (float, optional): Prix d'achat cible
+            product_id (str, optional): Paire de trading (générée si absente)
             
         Returns:
             tuple: (success: bool, message: str, bot_id: int or None)
         """
         try:
-            # Récupérer l'exchange_id
+            # Récupérer l'exchange_id (celui du compte en priorité)
             self.db.cursor.execute(
-                "SELECT exchange_id FROM exchanges WHERE name = ?",
-                (exchange_name.lower(),)
+                """
+                SELECT exchange_id FROM exchanges
+                WHERE name = ? AND (fk_account_id = ? OR fk_account_id IS NULL)
+                ORDER BY fk_account_id IS NULL
+                LIMIT 1
+                """,
+                (exchange_name.lower(), account_id)
             )
             exchange_result = self.db.cursor.fetchone()
             
@@ -41,12 +68,13 @@ class BotModel:
             exchange_id = exchange_result[0]
             
             # Générer automatiquement le product_id
-            product_id = f"{crypto_source}-{crypto_target}"
+            if not product_id:
+                product_id = f"{crypto_source}-{crypto_target}"
             
             # Insérer le bot (créer désactivé par défaut)
             query = """
                 INSERT INTO bots (
-                    account_id, exchange_id, crypto_source, crypto_target, 
+                    fk_account_id, fk_exchange_id, crypto_source, crypto_target, 
                     product_id, prix_achat_cible, pourcentage_gain, 
                     montant_trade, type_ordre, is_active
                 )
@@ -73,49 +101,19 @@ class BotModel:
             self.db.logger.log_error(error_msg)
             return False, "Erreur lors de la création du bot", None
     
-    def get_user_bots(self, account_id):
+    def get_user_bots(self, account_id, records=False):
         """
         Récupère tous les bots d'un utilisateur
         
         Args:
             account_id (int): ID du compte utilisateur
+            records (bool): Objets Bot (__slots__) plutôt que des dicts
             
         Returns:
             list: Liste des bots avec leurs informations
         """
         try:
-            query = """
-                SELECT 
-                    b.id, b.crypto_source, b.crypto_target, b.product_id,
-                    b.prix_achat_cible, b.pourcentage_gain, b.montant_trade,
-                    b.type_ordre, b.is_active, b.created_at,
-                    e.display_name as exchange_name
-                FROM bots b
-                JOIN exchanges e ON b.fk_exchange_id = e.exchange_id
-                WHERE b.account_id = ?
-                ORDER BY b.created_at DESC
-            """
-            
-            self.db.cursor.execute(query, (account_id,))
-            rows = self.db.cursor.fetchall()
-            
-            bots = []
-            for row in rows:
-                bots.append({
-                    'bot_id': row[0],
-                    'crypto_source': row[1],
-                    'crypto_target': row[2],
-                    'product_id': row[3],
-                    'prix_achat_cible': row[4],
-                    'pourcentage_gain': row[5],
-                    'montant_trade': row[6],
-                    'type_ordre': row[7],
-                    'is_active': row[8],
-                    'created_at': row[9],
-                    'exchange_name': row[10]
-                })
-            
-            return bots
+            return QUERY_USER_BOTS.all(self.db.connection, (account_id,), records)
             
         except sqlite3.Error as e:
             error_msg = f"Erreur récupération bots: {e}"
@@ -137,7 +135,7 @@ class BotModel:
             query = """
                 UPDATE bots 
                 SET is_active = ?, updated_at = ?
-                WHERE botid = ?
+                WHERE bot_id = ?
             """
             
             self.db.cursor.execute(
@@ -167,7 +165,7 @@ class BotModel:
             tuple: (success: bool, message: str)
         """
         try:
-            query = "DELETE FROM bots WHERE id = ?"
+            query = "DELETE FROM bots WHERE bot_id = ?"
             self.db.cursor.execute(query, (bot_id,))
             self.db.connection.commit()
             
@@ -178,4 +176,38 @@ class BotModel:
         except sqlite3.Error as e:
             error_msg = f"Erreur suppression bot: {e}"
             self.db.logger.log_error(error_msg)
-            return False, "Erreur lors de la suppression"
\ No newline at end of file
+            return False, "Erreur lors de la suppression"
+    
+    def get_bot_summary(self, account_id):
+        """
+        Récupère le nombre de bots et les produits des bots actifs
+        
+        Args:
+            account_id (int): ID du compte utilisateur
+            
+        Returns:
+            dict: {'total': int, 'active': int, 'active_products': list}
+        """
+        try:
+            self.db.cursor.execute(
+                """
+                SELECT COUNT(*), COALESCE(SUM(CASE WHEN is_active = 1 THEN 1 ELSE 0 END), 0)
+                FROM bots
+                WHERE fk_account_id = ?
+                """,
+                (account_id,)
+            )
+            total, active = self.db.cursor.fetchone()
+            
+            self.db.cursor.execute(
+                "SELECT DISTINCT product_id FROM bots WHERE fk_account_id = ? AND is_active = 1",
+                (account_id,)
+            )
+            products = [row[0] for row in self.db.cursor.fetchall()]
+            
+            return {'total': total, 'active': active, 'active_products': products}
+            
+        except sqlite3.Error as e:
+            error_msg = f"Erreur résumé bots: {e}"
+            self.db.logger.log_error(error_msg)
+            return {'total': 0, 'active': 0, 'active_products': []}
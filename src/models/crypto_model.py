@@ -1,78 +1,63 @@
-import json
-import os
+from src.models.product_catalog import get_catalog
+from src.models.exchanges.registry import get_registry
+from src.utils.shm_price_table import get_price_table
 
 class CryptoModel:
-    """Modèle pour gérer les cryptomonnaies disponibles depuis les fichiers JSON"""
+    """Modèle pour gérer les cryptomonnaies disponibles (via le catalogue de produits)"""
     
-    def __init__(self):
-        # Obtenir le chemin racine du projet (2 niveaux au-dessus de ce fichier)
-        current_dir = os.path.dirname(os.path.abspath(__file__))
-        project_root = os.path.dirname(os.path.dirname(current_dir))
-        self.base_path = os.path.join(project_root, 'datas')
+    def __init__(self, exchange_name='coinbase'):
+        self.exchange_name = exchange_name.lower()
+        self.catalog = get_catalog()
         
         self.cryptos = []
         self.crypto_details = {}  # {symbol: {name, product_id}}
         self.load_cryptos()
-        
-        # Cache pour les modèles d'exchange
-        self._exchange_models = {}
     
     def load_cryptos(self):
-        """Charge les cryptos depuis les fichiers JSON"""
+        """Charge les cryptos depuis le catalogue (chargé une seule fois par processus)"""
         try:
-            # Chercher le fichier JSON des cryptos
-            json_file = os.path.join(self.base_path, 'coinbase_cryptos_list.json')
-            
-            if not os.path.exists(json_file):
-                print(f"⚠ Fichier {json_file} introuvable")
-                self.cryptos = []
-                return
-            
-            # Lire le fichier JSON
-            with open(json_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            self.cryptos = self.catalog.get_symbols(self.exchange_name)
             
-            # Extraire les cryptos
-            if 'cryptos' in data and isinstance(data['cryptos'], list):
-                for crypto in data['cryptos']:
-                    symbol = crypto.get('symbol', '').upper()
-                    name = crypto.get('name', symbol)
-                    product_id = crypto.get('product_id', '')
-                    
-                    if symbol:
-                        self.cryptos.append(symbol)
-                        self.crypto_details[symbol] = {
-                            'name': name,
-                            'product_id': product_id
-                        }
+            # product_id par défaut : paire contre USDC si elle existe
+            quote_pairs = {}
+            for product in self.catalog.get_products(self.exchange_name):
+                if product.base not in quote_pairs or product.quote == 'USDC':
+                    quote_pairs[product.base] = product.product_id
             
-            # Trier les symboles
-            self.cryptos = sorted(self.cryptos)
-            
-            print(f"✓ {len(self.cryptos)} cryptomonnaies chargées depuis {json_file}")
+            self.crypto_details = {
+                symbol: {
+                    'name': self.catalog.get_name(symbol, self.exchange_name),
+                    'product_id': quote_pairs.get(symbol, '')
+                }
+                for symbol in self.cryptos
+            }
         
         except Exception as e:
             print(f"✗ Erreur chargement cryptos: {e}")
             self.cryptos = []
             self.crypto_details = {}
     
+    def search_symbols(self, query, limit=20):
+        """Recherche de symboles (préfixe puis approximative) pour l'autocomplétion"""
+        return self.catalog.search(query, self.exchange_name, limit)
+    
+    def refresh_catalog_in_background(self):
+        """Démarre le rafraîchissement périodique du catalogue de l'exchange"""
+        exchange_model = self._get_exchange_model(self.exchange_name)
+        if exchange_model is not None:
+            self.catalog.start_background_refresh(self.exchange_name, exchange_model)
+    
     def _get_exchange_model(self, exchange_name):
-        """Récupère ou crée une instance du modèle d'exchange"""
-        exchange_name = exchange_name.lower()
-        
-        if exchange_name not in self._exchange_models:
-            if exchange_name == 'coinbase':
-                from src.models.exchanges.coinbase_model import CoinbaseModel
-                self._exchange_models[exchange_name] = CoinbaseModel()
-            else:
-                print(f"⚠ Exchange '{exchange_name}' non supporté")
-                return None
-        
-        return self._exchange_models.get(exchange_name)
+        """Récupère l'adapter partagé de l'exchange (registre du processus)"""
+        return get_registry().get(exchange_name)
     
     def get_crypto_price(self, symbol, exchange_name='coinbase', quote_currency='USDC'):
         """
-        Récupère le prix actuel d'une crypto depuis un exchange
+        Récupère le prix actuel d'une crypto
+        
+        La table de prix partagée (publiée par le démon) est consultée en
+        premier ; l'exchange n'est interrogé que si le prix y est absent ou
+        trop ancien.
         
         Args:
             symbol (str): Symbole de la crypto (ex: 'BTC')
@@ -83,6 +68,12 @@ class CryptoModel:
             float: Prix actuel ou None si erreur
         """
         try:
+            price_table = get_price_table()
+            if price_table is not None:
+                price = price_table.get_price(exchange_name, f"{symbol}-{quote_currency}")
+                if price is not None:
+                    return price
+            
             exchange_model = self._get_exchange_model(exchange_name)
             
             if exchange_model is None:
@@ -148,7 +139,6 @@ class CryptoModel:
         return symbol.upper() in self.cryptos
     
     def reload_cryptos(self):
-        """Recharge les cryptos depuis les fichiers JSON"""
-        self.cryptos = []
-        self.crypto_details = {}
+        """Resynchronise le catalogue depuis l'exchange puis recharge les cryptos"""
+        self.catalog.sync(self.exchange_name, self._get_exchange_model(self.exchange_name))
         self.load_cryptos()
\ No newline at end of file
@@ -1,20 +1,77 @@
 import sqlite3
 import os
 from src.utils.db_logger import DbLogger
+from src.models.records import ActivityLog
+from src.utils.data_access import STATEMENT_CACHE_SIZE, Query
+from src.utils.db_connection import connection_factory
+from src.utils.tracing import get_tracer, CATEGORY_DB
+
+tracer = get_tracer()
+
+# Requêtes - Historique d'activité
+_ACTIVITY_COLUMNS = "SELECT log_id, action_type, description, created_at FROM activity_logs "
+QUERY_ACTIVITY_LOGS = Query(_ACTIVITY_COLUMNS + "WHERE fk_account_id = ? ORDER BY created_at DESC",
+                            record=ActivityLog)
+QUERY_ACTIVITY_LOGS_BY_TYPE = Query(
+    _ACTIVITY_COLUMNS + "WHERE fk_account_id = ? AND action_type = ? ORDER BY created_at DESC",
+    record=ActivityLog
+)
+
+# Colonnes ajoutées à orders après le schéma initial (demandé / exécuté séparés)
+ORDERS_ADDED_COLUMNS = (
+    ('order_type', 'TEXT'),
+    ('prix_limite', 'REAL'),
+    ('quantite_executee', 'REAL'),
+    ('montant_execute', 'REAL'),
+)
+
+
+def migrate_orders_columns(cursor, schema='main'):
+    """
+    Ajoute à une table orders les colonnes manquantes de ORDERS_ADDED_COLUMNS
+
+    Avant la séparation, quantite et montant_usdc portaient l'exécuté des ordres
+    ayant un prix d'exécution : ces valeurs sont recopiées dans les nouvelles colonnes.
+
+    Args:
+        cursor: Curseur SQLite
+        schema (str): Schéma de la table ('main' ou une base attachée)
+
+    Returns:
+        list: Noms des colonnes ajoutées
+    """
+    existing = {row[1] for row in cursor.execute(f"PRAGMA {schema}.table_info(orders)").fetchall()}
+    if not existing:
+        return []
+    added = [name for name, _ in ORDERS_ADDED_COLUMNS if name not in existing]
+    for name, kind in ORDERS_ADDED_COLUMNS:
+        if name in added:
+            cursor.execute(f"ALTER TABLE {schema}.orders ADD COLUMN {name} {kind}")
+    if 'quantite_executee' in added:
+        cursor.execute(
+            f"UPDATE {schema}.orders SET quantite_executee = quantite, montant_execute = montant_usdc "
+            "WHERE prix_execution IS NOT NULL"
+        )
+    return added
 
 class DatabaseModel:
     """Gestion de la connexion et initialisation de la base de données SQLite"""
 
     _activity_logs_ready = False
+    _orders_migrated = set()
 
-    def __init__(self, db_path="datas/cointrader.db"):
+    @tracer.traced(CATEGORY_DB)
+    def __init__(self, db_path="datas/cointrader.db", check_same_thread=True):
         """
         Initialise la connexion à la base de données
 
         Args:
             db_path (str): Chemin vers le fichier de base de données
+            check_same_thread (bool): False pour partager la connexion entre threads
+                (l'appelant doit alors sérialiser les accès)
         """
         self.db_path = db_path
+        self.check_same_thread = check_same_thread
         self.connection = None
         self.cursor = None
         self.logger = DbLogger()
@@ -26,6 +83,7 @@ class DatabaseModel:
         if is_new:
             self.init_database()
         self._ensure_activity_logs_table()
+        self._ensure_orders_columns()
 
     def _ensure_activity_logs_table(self):
         """Crée la table activity_logs si elle n'existe pas (une seule fois par session)"""
@@ -47,6 +105,21 @@ class DatabaseModel:
         except Exception as e:
             self.logger.log_error(f"Erreur création table activity_logs: {e}")
 
+    def _ensure_orders_columns(self):
+        """Migre la table orders d'une base existante (une seule fois par fichier et par session)"""
+        if self.db_path in DatabaseModel._orders_migrated:
+            return
+        try:
+            added = migrate_orders_columns(self.cursor)
+            self.connection.commit()
+            if added:
+                self.logger.log_query(f"Colonnes ajoutées à orders: {', '.join(added)}")
+            DatabaseModel._orders_migrated.add(self.db_path)
+        except sqlite3.Error as e:
+            self.connection.rollback()
+            self.logger.log_error(f"Erreur migration table orders: {e}")
+
+    @tracer.traced(CATEGORY_DB)
     def log_activity(self, account_id, action_type, description):
         """Enregistre une action utilisateur dans activity_logs"""
         try:
@@ -58,24 +131,12 @@ class DatabaseModel:
         except Exception as e:
             self.logger.log_error(f"Erreur log_activity: {e}")
 
-    def get_activity_logs(self, account_id, action_type=None):
-        """Récupère les logs d'activité d'un utilisateur, avec filtre optionnel"""
+    def get_activity_logs(self, account_id, action_type=None, records=False):
+        """Récupère les logs d'activité d'un utilisateur, avec filtre optionnel (objets ActivityLog si records)"""
         try:
-            where = "WHERE fk_account_id = ?"
-            params = [account_id]
             if action_type:
-                where += " AND action_type = ?"
-                params.append(action_type)
-            self.cursor.execute(
-                f"SELECT log_id, action_type, description, created_at FROM activity_logs "
-                f"{where} ORDER BY created_at DESC",
-                tuple(params)
-            )
-            rows = self.cursor.fetchall()
-            return [
-                {"log_id": r[0], "action_type": r[1], "description": r[2], "created_at": r[3]}
-                for r in rows
-            ]
+                return QUERY_ACTIVITY_LOGS_BY_TYPE.all(self.connection, (account_id, action_type), records)
+            return QUERY_ACTIVITY_LOGS.all(self.connection, (account_id,), records)
         except Exception as e:
             self.logger.log_error(f"Erreur get_activity_logs: {e}")
             return []
@@ -83,7 +144,9 @@ class DatabaseModel:
     def _connect(self):
         """Établit la connexion à la base de données"""
         try:
-            self.connection = sqlite3.connect(self.db_path)
+            self.connection = sqlite3.connect(self.db_path, check_same_thread=self.check_same_thread,
+                                              factory=connection_factory(),
+                                              cached_statements=STATEMENT_CACHE_SIZE)
             self.connection.row_factory = sqlite3.Row
             self.cursor = self.connection.cursor()
             self.logger.log_connection(self.db_path)
@@ -149,6 +212,8 @@ class DatabaseModel:
     def close(self):
         """Ferme la connexion à la base de données"""
         if self.connection:
+            if self.cursor:
+                self.cursor.close()
             self.connection.close()
             self.logger.log_disconnection()
     
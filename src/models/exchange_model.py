@@ -1,47 +1,43 @@
 from src.models.database_model import DatabaseModel
+from src.utils.data_access import Query
 from datetime import datetime
 
+# Requêtes - Lecture des exchanges
+_EXCHANGE_COLUMNS = """
+    SELECT exchange_id, fk_account_id, name, display_name, logo, endpoint_url, is_active, created_at, updated_at
+    FROM exchanges
+"""
+_EXCHANGE_MAPPING = {
+    'rename': {'fk_account_id': 'account_id'},
+    'defaults': {'logo': '💱'},
+    'record': 'Exchange'
+}
+QUERY_EXCHANGES_BY_ACCOUNT = Query(_EXCHANGE_COLUMNS + "WHERE fk_account_id = ? ORDER BY display_name",
+                                   **_EXCHANGE_MAPPING)
+QUERY_EXCHANGE_BY_ID = Query(_EXCHANGE_COLUMNS + "WHERE exchange_id = ? AND fk_account_id = ?",
+                             **_EXCHANGE_MAPPING)
+QUERY_EXCHANGE_BY_NAME = Query(_EXCHANGE_COLUMNS + "WHERE name = ? AND fk_account_id = ?",
+                               **_EXCHANGE_MAPPING)
+
 class ExchangeModel:
     """Modèle pour gérer les plateformes d'échange (exchanges) par utilisateur"""
     
     def __init__(self, db_model=None):
         self.db = db_model if db_model else DatabaseModel()
     
-    def get_all_exchanges(self, account_id):
+    def get_all_exchanges(self, account_id, records=False):
         """
         Récupère toutes les plateformes d'un utilisateur
         
         Args:
             account_id (int): ID de l'utilisateur
+            records (bool): Enregistrements compacts (__slots__) plutôt que des dicts
             
         Returns:
             list: Liste des exchanges de l'utilisateur
         """
         try:
-            query = """
-                SELECT exchange_id, fk_account_id, name, display_name, logo, endpoint_url, is_active, created_at, updated_at
-                FROM exchanges 
-                WHERE fk_account_id = ?
-                ORDER BY display_name
-            """
-            self.db.cursor.execute(query, (account_id,))
-            rows = self.db.cursor.fetchall()
-            
-            exchanges = []
-            for row in rows:
-                exchanges.append({
-                    'exchange_id': row[0],
-                    'account_id': row[1],
-                    'name': row[2],
-                    'display_name': row[3],
-                    'logo': row[4] or '💱',
-                    'endpoint_url': row[5],
-                    'is_active': row[6],
-                    'created_at': row[7],
-                    'updated_at': row[8]
-                })
-            
-            return exchanges
+            return QUERY_EXCHANGES_BY_ACCOUNT.all(self.db.connection, (account_id,), records)
             
         except Exception as e:
             self.db.logger.log_error(f"Erreur récupération exchanges pour user {account_id}: {e}")
@@ -59,28 +55,7 @@ class ExchangeModel:
             dict or None: Informations de l'exchange ou None
         """
         try:
-            query = """
-                SELECT exchange_id, fk_account_id, name, display_name, logo, endpoint_url, is_active, created_at, updated_at
-                FROM exchanges 
-                WHERE exchange_id = ? AND fk_account_id = ?
-            """
-            self.db.cursor.execute(query, (exchange_id, account_id))
-            row = self.db.cursor.fetchone()
-            
-            if row:
-                return {
-                    'exchange_id': row[0],
-                    'account_id': row[1],
-                    'name': row[2],
-                    'display_name': row[3],
-                    'logo': row[4] or '💱',
-                    'endpoint_url': row[5],
-                    'is_active': row[6],
-                    'created_at': row[7],
-                    'updated_at': row[8]
-                }
-            
-            return None
+            return QUERY_EXCHANGE_BY_ID.one(self.db.connection, (exchange_id, account_id))
             
         except Exception as e:
             self.db.logger.log_error(f"Erreur récupération exchange {exchange_id}: {e}")
@@ -98,28 +73,7 @@ class ExchangeModel:
             dict or None: Informations de l'exchange ou None
         """
         try:
-            query = """
-                SELECT exchange_id, fk_account_id, name, display_name, logo, endpoint_url, is_active, created_at, updated_at
-                FROM exchanges 
-                WHERE name = ? AND fk_account_id = ?
-            """
-            self.db.cursor.execute(query, (name.lower(), account_id))
-            row = self.db.cursor.fetchone()
-            
-            if row:
-                return {
-                    'exchange_id': row[0],
-                    'account_id': row[1],
-                    'name': row[2],
-                    'display_name': row[3],
-                    'logo': row[4] or '💱',
-                    'endpoint_url': row[5],
-                    'is_active': row[6],
-                    'created_at': row[7],
-                    'updated_at': row[8]
-                }
-            
-            return None
+            return QUERY_EXCHANGE_BY_NAME.one(self.db.connection, (name.lower(), account_id))
             
         except Exception as e:
             self.db.logger.log_error(f"Erreur récupération exchange par nom {name}: {e}")
@@ -0,0 +1,250 @@
+import asyncio
+import json
+import threading
+from src.models.exchanges.exchange_base import ExchangeBase
+from src.utils.async_http import get_async_transport
+from src.utils.http_session import get_http_session
+
+# Constantes - URLs API
+BINANCE_BASE_URL = "https://api.binance.com"
+
+# Constantes - Timeouts
+REQUEST_TIMEOUT = 5
+
+# Devises de cotation connues, pour découper un symbole sans exchangeInfo (plus longues d'abord)
+KNOWN_QUOTES = ('FDUSD', 'USDC', 'USDT', 'TUSD', 'BUSD', 'EUR', 'GBP', 'TRY', 'BTC', 'ETH', 'BNB')
+
+# Constantes - Messages de log
+LOG_API_ERROR = "✗ Erreur API Binance ({status_code}) sur {path}"
+LOG_REQUEST_EXCEPTION = "✗ Erreur requête Binance {path}: {error}"
+LOG_PRICE_UNKNOWN = "✗ Aucun prix Binance pour {product_id}"
+LOG_BALANCE_UNSUPPORTED = "⚠ Solde non supporté par Binance (données publiques uniquement)"
+
+
+class BinanceModel(ExchangeBase):
+    """Données de marché publiques Binance (endpoints multi-symboles)"""
+
+    def __init__(self, base_url=BINANCE_BASE_URL, session=None):
+        super().__init__()
+        self.name = "Binance"
+        self.base_url = base_url
+        self.session = session if session else get_http_session()
+        self.transport = None       # AsyncHttpTransport (partagé si None)
+
+        # Correspondance symbole Binance ↔ product_id (chargée une fois via exchangeInfo)
+        self._product_ids = {}      # {'BTCUSDC': 'BTC-USDC'}
+        self._symbols = {}          # {'BTC-USDC': 'BTCUSDC'}
+        self._exchange_info = None
+        self._symbols_lock = threading.Lock()
+
+    # ============================================
+    # REQUÊTES
+    # ============================================
+
+    def _get(self, path, params=None):
+        """
+        Exécute une requête publique GET
+
+        Returns:
+            dict or list: Réponse JSON ou None si erreur
+        """
+        try:
+            response = self.session.get(f"{self.base_url}{path}", params=params, timeout=REQUEST_TIMEOUT)
+            if response.status_code != 200:
+                print(LOG_API_ERROR.format(status_code=response.status_code, path=path))
+                return None
+            return response.json()
+
+        except Exception as e:
+            print(LOG_REQUEST_EXCEPTION.format(path=path, error=e))
+            return None
+
+    def _load_symbols(self):
+        """Charge exchangeInfo une seule fois (correspondance des symboles et règles de trading)"""
+        if self._exchange_info is not None:
+            return self._exchange_info
+
+        with self._symbols_lock:
+            if self._exchange_info is None:
+                data = self._get("/api/v3/exchangeInfo")
+                if data is None:
+                    return None
+                for entry in data.get('symbols', []):
+                    product_id = f"{entry['baseAsset']}-{entry['quoteAsset']}"
+                    self._product_ids[entry['symbol']] = product_id
+                    self._symbols[product_id] = entry['symbol']
+                self._exchange_info = data
+        return self._exchange_info
+
+    def to_product_id(self, symbol):
+        """
+        Convertit un symbole Binance au format BASE-QUOTE
+
+        Args:
+            symbol (str): Symbole Binance (ex: 'BTCUSDC')
+
+        Returns:
+            str or None: product_id (ex: 'BTC-USDC') ou None si indécoupable
+        """
+        product_id = self._product_ids.get(symbol)
+        if product_id:
+            return product_id
+        for quote in KNOWN_QUOTES:
+            if symbol.endswith(quote) and len(symbol) > len(quote):
+                return f"{symbol[:-len(quote)]}-{quote}"
+        return None
+
+    def to_symbol(self, product_id):
+        """Convertit un product_id BASE-QUOTE en symbole Binance (ex: 'BTCUSDC')"""
+        return self._symbols.get(product_id) or product_id.replace('-', '')
+
+    # ============================================
+    # DONNÉES PUBLIQUES
+    # ============================================
+
+    def _format_ticker(self, product_id, data):
+        return {
+            'product_id': product_id,
+            'price': float(data.get('lastPrice') or 0.0),
+            'bid': float(data.get('bidPrice') or 0.0),
+            'ask': float(data.get('askPrice') or 0.0),
+            'volume': float(data.get('volume') or 0.0),
+            'time': data.get('closeTime', '')
+        }
+
+    def _listed(self, product_ids):
+        """
+        Retire les produits absents d'exchangeInfo
+
+        Un seul symbole inconnu fait rejeter (HTTP 400) toute la requête
+        multi-symboles. Sans exchangeInfo, la liste est gardée telle quelle.
+        """
+        if product_ids is None or not self._symbols:
+            return product_ids
+        return [product_id for product_id in product_ids if product_id in self._symbols]
+
+    def _tickers_params(self, product_ids):
+        if product_ids is None:
+            return None
+        symbols = [self.to_symbol(product_id) for product_id in product_ids]
+        return {'symbols': json.dumps(symbols, separators=(',', ':'))}
+
+    def _parse_tickers(self, data):
+        if isinstance(data, dict):
+            data = [data]
+        tickers = {}
+        for entry in data:
+            product_id = self.to_product_id(entry.get('symbol', ''))
+            if product_id:
+                tickers[product_id] = self._format_ticker(product_id, entry)
+        return tickers
+
+    def get_tickers(self, product_ids=None):
+        """
+        Récupère les tickers 24h en une seule requête
+
+        Args:
+            product_ids (list, optional): Produits BASE-QUOTE (tous si None)
+
+        Returns:
+            dict: {product_id: ticker} ou None si erreur
+        """
+        # Découpage exact des symboles si exchangeInfo est disponible (sinon KNOWN_QUOTES)
+        self._load_symbols()
+        product_ids = self._listed(product_ids)
+        if product_ids is not None and not product_ids:
+            return {}
+
+        data = self._get("/api/v3/ticker/24hr", self._tickers_params(product_ids))
+        if data is None:
+            return None
+        return self._parse_tickers(data)
+
+    async def aget_tickers(self, product_ids=None):
+        """Variante asynchrone de get_tickers() (transport HTTP asynchrone)"""
+        if self._exchange_info is None:
+            await asyncio.get_running_loop().run_in_executor(None, self._load_symbols)
+        product_ids = self._listed(product_ids)
+        if product_ids is not None and not product_ids:
+            return {}
+
+        transport = self.transport or get_async_transport()
+        data = await transport.get_json(f"{self.base_url}/api/v3/ticker/24hr", self._tickers_params(product_ids))
+        if data is None:
+            return None
+        return self._parse_tickers(data)
+
+    def get_product_ticker(self, product_id):
+        """
+        Récupère le ticker d'un produit
+
+        Args:
+            product_id (str): ID du produit (ex: 'BTC-USDC')
+
+        Returns:
+            dict: Informations du ticker ou None si erreur
+        """
+        data = self._get("/api/v3/ticker/24hr", {'symbol': self.to_symbol(product_id)})
+        if data is None:
+            return None
+        return self._format_ticker(product_id, data)
+
+    def get_crypto_price(self, symbol, quote_currency='USDC'):
+        """
+        Récupère le prix actuel d'une crypto depuis Binance
+
+        Args:
+            symbol (str): Symbole de la crypto (ex: 'BTC')
+            quote_currency (str): Devise de cotation (ex: 'USDC')
+
+        Returns:
+            float: Prix actuel ou None si erreur
+        """
+        if symbol == quote_currency:
+            return 1.0
+
+        product_id = f"{symbol}-{quote_currency}"
+        data = self._get("/api/v3/ticker/price", {'symbol': self.to_symbol(product_id)})
+        if data is None:
+            return None
+        try:
+            price = float(data.get('price', 0.0))
+        except (TypeError, ValueError):
+            price = 0.0
+        if price <= 0:
+            print(LOG_PRICE_UNKNOWN.format(product_id=product_id))
+            return None
+        return price
+
+    def get_available_balance(self, symbol, account_id=None):
+        print(LOG_BALANCE_UNSUPPORTED)
+        return None
+
+    def get_products(self):
+        """
+        Récupère la liste des paires Binance (exchangeInfo)
+
+        Returns:
+            list: Produits normalisés ou None si erreur
+        """
+        data = self._load_symbols()
+        if data is None:
+            return None
+
+        products = []
+        for entry in data.get('symbols', []):
+            filters = {f.get('filterType'): f for f in entry.get('filters', [])}
+            lot_size = filters.get('LOT_SIZE', {})
+            price_filter = filters.get('PRICE_FILTER', {})
+            notional = filters.get('NOTIONAL') or filters.get('MIN_NOTIONAL') or {}
+            products.append({
+                'product_id': self._product_ids[entry['symbol']],
+                'base': entry['baseAsset'],
+                'quote': entry['quoteAsset'],
+                'base_increment': float(lot_size.get('stepSize') or 0.0),
+                'quote_increment': float(price_filter.get('tickSize') or 0.0),
+                'base_min_size': float(lot_size.get('minQty') or 0.0),
+                'min_market_funds': float(notional.get('minNotional') or 0.0),
+                'status': 'online' if entry.get('status') == 'TRADING' else 'disabled'
+            })
+        return products
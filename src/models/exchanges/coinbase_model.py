@@ -1,5 +1,12 @@
+import base64
+import hashlib
+import hmac
+import json
+import time
+from urllib.parse import urlencode
 import requests
 from src.models.exchanges.exchange_base import ExchangeBase
+from src.utils.http_session import get_http_session
 
 # Constantes - URLs API
 COINBASE_BASE_URL = "https://api.coinbase.com/v2"
@@ -18,21 +25,81 @@ LOG_CONNECTION_ERROR = "✗ Erreur de connexion à l'API Coinbase pour {symbol}"
 LOG_NETWORK_ERROR = "✗ Erreur réseau Coinbase pour {symbol}: {error}"
 LOG_CONVERSION_ERROR = "✗ Erreur de conversion du prix pour {symbol}: {error}"
 LOG_UNEXPECTED_ERROR = "✗ Erreur inattendue lors de la récupération du prix {symbol}: {error}"
-LOG_BALANCE_NOT_IMPLEMENTED = "⚠ get_available_balance non implémenté pour {symbol}"
-LOG_BALANCE_AUTH_REQUIRED = "   Nécessite l'authentification API Coinbase"
 LOG_TICKER_ERROR = "✗ Erreur API ticker ({status_code}) pour {product_id}"
 LOG_TICKER_EXCEPTION = "✗ Erreur récupération ticker {product_id}: {error}"
 LOG_STATS_ERROR = "✗ Erreur API stats ({status_code}) pour {product_id}"
 LOG_STATS_EXCEPTION = "✗ Erreur récupération stats {product_id}: {error}"
+LOG_AUTH_MISSING = "⚠ Aucune clé API Coinbase pour le compte {account_id}"
+LOG_AUTH_INVALID = "✗ Secret API Coinbase invalide: {error}"
+LOG_PRIVATE_ERROR = "✗ Erreur API Coinbase ({status_code}) sur {method} {path}"
+LOG_PRIVATE_EXCEPTION = "✗ Erreur requête Coinbase {method} {path}: {error}"
+LOG_ORDER_PLACED = "✓ Ordre {side} {product_id} placé (ID: {order_id})"
+LOG_ORDER_CANCELLED = "✓ Ordre {order_id} annulé"
+LOG_PRODUCTS_ERROR = "✗ Erreur API produits Coinbase ({status_code})"
+LOG_PRODUCTS_EXCEPTION = "✗ Erreur récupération produits Coinbase: {error}"
+LOG_BALANCE_UNKNOWN = "⚠ Aucun compte Coinbase pour la devise {symbol}"
+
+
+class CoinbaseAuth:
+    """
+    Signature HMAC des requêtes privées Coinbase Exchange
+
+    Le secret est décodé et la clé HMAC préparée une seule fois par
+    identifiant : chaque requête ne fait qu'une copie de l'état HMAC.
+    """
+
+    def __init__(self, api_key, api_secret, api_passphrase):
+        """
+        Args:
+            api_key (str): Clé API
+            api_secret (str): Secret API (base64, tel que fourni par Coinbase)
+            api_passphrase (str): Passphrase de la clé
+        """
+        self.api_key = api_key
+        self.api_passphrase = api_passphrase or ''
+        self._hmac = hmac.new(base64.b64decode(api_secret), digestmod=hashlib.sha256)
+
+    def sign(self, timestamp, method, request_path, body=''):
+        """
+        Calcule la signature d'une requête
+
+        Args:
+            timestamp (str): Timestamp en secondes
+            method (str): Méthode HTTP en majuscules
+            request_path (str): Chemin avec query string (ex: '/orders?status=open')
+            body (str): Corps JSON de la requête
+
+        Returns:
+            str: Signature base64
+        """
+        mac = self._hmac.copy()
+        mac.update(f"{timestamp}{method}{request_path}{body}".encode('utf-8'))
+        return base64.b64encode(mac.digest()).decode('utf-8')
+
+    def headers(self, method, request_path, body=''):
+        """Retourne les en-têtes d'authentification d'une requête"""
+        timestamp = str(time.time())
+        return {
+            'CB-ACCESS-KEY': self.api_key,
+            'CB-ACCESS-SIGN': self.sign(timestamp, method, request_path, body),
+            'CB-ACCESS-TIMESTAMP': timestamp,
+            'CB-ACCESS-PASSPHRASE': self.api_passphrase,
+            'Content-Type': 'application/json'
+        }
+
 
 class CoinbaseModel(ExchangeBase):
     """Modèle pour interagir avec l'API Coinbase"""
     
-    def __init__(self):
+    def __init__(self, pro_base_url=COINBASE_PRO_BASE_URL, session=None):
         super().__init__()
         self.name = "Coinbase"
         self.base_url = COINBASE_BASE_URL
-        self.pro_base_url = COINBASE_PRO_BASE_URL
+        self.pro_base_url = pro_base_url
+        self.session = session if session else get_http_session()
+        
+        # Cache des signatures par compte utilisateur {account_id: CoinbaseAuth}
+        self._auth_cache = {}
     
     def get_crypto_price(self, symbol, quote_currency='USDC'):
         """
@@ -56,7 +123,7 @@ class CoinbaseModel(ExchangeBase):
             # Appel à l'API publique Coinbase Pro
             url = f"{self.pro_base_url}/products/{product_id}/ticker"
             
-            response = requests.get(url, timeout=REQUEST_TIMEOUT)
+            response = self.session.get(url, timeout=REQUEST_TIMEOUT)
             
             if response.status_code == 200:
                 data = response.json()
@@ -89,13 +156,134 @@ class CoinbaseModel(ExchangeBase):
             print(LOG_UNEXPECTED_ERROR.format(symbol=symbol, error=e))
             return None
     
+    # ============================================
+    # AUTHENTIFICATION
+    # ============================================
+    
+    def set_credentials(self, api_key, api_secret, api_passphrase, account_id=None):
+        """
+        Enregistre directement des identifiants API pour un compte
+        
+        Args:
+            api_key (str): Clé API
+            api_secret (str): Secret API (base64)
+            api_passphrase (str): Passphrase
+            account_id: Identifiant du compte utilisateur
+            
+        Returns:
+            bool: True si les identifiants sont utilisables
+        """
+        try:
+            self._auth_cache[account_id] = CoinbaseAuth(api_key, api_secret, api_passphrase)
+            return True
+        except (ValueError, TypeError) as e:
+            print(LOG_AUTH_INVALID.format(error=e))
+            return False
+    
+    def clear_credentials(self, account_id=None):
+        """Oublie les identifiants en cache (ex: après modification de la clé)"""
+        self._auth_cache.pop(account_id, None)
+    
+    def _get_auth(self, account_id):
+        """Récupère (et met en cache) la signature du compte depuis la BDD"""
+        auth = self._auth_cache.get(account_id)
+        if auth is not None:
+            return auth
+        
+        if account_id is None:
+            print(LOG_AUTH_MISSING.format(account_id=account_id))
+            return None
+        
+        from src.models.apikey_model import ApiKeyModel
+        credentials = ApiKeyModel().get_credentials(account_id, 'coinbase')
+        if not credentials:
+            print(LOG_AUTH_MISSING.format(account_id=account_id))
+            return None
+        
+        if not self.set_credentials(credentials['api_key'], credentials['api_secret'],
+                                    credentials['api_passphrase'], account_id):
+            return None
+        return self._auth_cache[account_id]
+    
+    def _private_request(self, method, path, account_id=None, params=None, payload=None):
+        """
+        Exécute une requête signée sur l'API Coinbase Exchange
+        
+        Args:
+            method (str): 'GET', 'POST' ou 'DELETE'
+            path (str): Chemin de l'endpoint (ex: '/accounts')
+            account_id: Identifiant du compte utilisateur
+            params (dict, optional): Paramètres de query string
+            payload (dict, optional): Corps JSON
+            
+        Returns:
+            dict|list: Réponse JSON ou None si erreur
+        """
+        auth = self._get_auth(account_id)
+        if auth is None:
+            return None
+        
+        request_path = path
+        if params:
+            # Chaîne signée = chaîne envoyée : valeurs encodées (espaces, '&', '=' ...)
+            query = urlencode({k: v for k, v in params.items() if v is not None})
+            if query:
+                request_path = f"{path}?{query}"
+        body = json.dumps(payload, separators=(',', ':')) if payload is not None else ''
+        
+        try:
+            response = self.session.request(
+                method,
+                f"{self.pro_base_url}{request_path}",
+                data=body or None,
+                headers=auth.headers(method, request_path, body),
+                timeout=REQUEST_TIMEOUT
+            )
+            
+            if response.status_code == 200:
+                return response.json()
+            
+            print(LOG_PRIVATE_ERROR.format(status_code=response.status_code, method=method, path=path))
+            print(LOG_API_RESPONSE.format(response=response.text[:200]))
+            return None
+        
+        except (requests.exceptions.RequestException, ValueError) as e:
+            print(LOG_PRIVATE_EXCEPTION.format(method=method, path=path, error=e))
+            return None
+    
+    # ============================================
+    # COMPTES ET SOLDES
+    # ============================================
+    
+    def get_accounts(self, account_id=None):
+        """
+        Récupère les comptes (un par devise) de l'utilisateur
+        
+        Args:
+            account_id: Identifiant du compte utilisateur
+            
+        Returns:
+            list: [{'id', 'currency', 'balance', 'available', 'hold'}] ou None si erreur
+        """
+        data = self._private_request('GET', '/accounts', account_id)
+        if data is None:
+            return None
+        
+        return [
+            {
+                'id': acc.get('id'),
+                'currency': acc.get('currency', ''),
+                'balance': float(acc.get('balance', 0.0)),
+                'available': float(acc.get('available', 0.0)),
+                'hold': float(acc.get('hold', 0.0))
+            }
+            for acc in data
+        ]
+    
     def get_available_balance(self, symbol, account_id=None):
         """
         Récupère le solde disponible d'une crypto
         
-        NOTE: Cette méthode nécessite une authentification API.
-        Pour l'instant, retourne None (non implémenté).
-        
         Args:
             symbol (str): Symbole de la crypto (ex: 'USDC')
             account_id: Identifiant du compte utilisateur
@@ -103,12 +291,148 @@ class CoinbaseModel(ExchangeBase):
         Returns:
             float: Solde disponible ou None si erreur
         """
-        # TODO: Implémenter l'authentification et l'appel à l'API
-        # Nécessite les clés API de l'utilisateur stockées en BDD
+        accounts = self.get_accounts(account_id)
+        if accounts is None:
+            return None
+        
+        symbol = symbol.upper()
+        for acc in accounts:
+            if acc['currency'].upper() == symbol:
+                return acc['available']
         
-        print(LOG_BALANCE_NOT_IMPLEMENTED.format(symbol=symbol))
-        print(LOG_BALANCE_AUTH_REQUIRED)
-        return None
+        print(LOG_BALANCE_UNKNOWN.format(symbol=symbol))
+        return 0.0
+    
+    # ============================================
+    # ORDRES
+    # ============================================
+    
+    def _format_order(self, data):
+        """Normalise un ordre renvoyé par l'API"""
+        return {
+            'id': data.get('id'),
+            'product_id': data.get('product_id'),
+            'side': data.get('side'),
+            'type': data.get('type'),
+            'status': data.get('status'),
+            'price': float(data.get('price') or 0.0),
+            'size': float(data.get('size') or 0.0),
+            'filled_size': float(data.get('filled_size') or 0.0),
+            'executed_value': float(data.get('executed_value') or 0.0),
+            'fill_fees': float(data.get('fill_fees') or 0.0),
+            'settled': bool(data.get('settled', False)),
+            'created_at': data.get('created_at'),
+            'done_at': data.get('done_at'),
+            'done_reason': data.get('done_reason')
+        }
+    
+    def place_order(self, product_id, side, order_type='market', size=None, funds=None,
+                    price=None, client_oid=None, account_id=None):
+        """
+        Place un ordre Market ou Limit
+        
+        Args:
+            product_id (str): ID du produit (ex: 'BTC-USDC')
+            side (str): 'buy' ou 'sell'
+            order_type (str): 'market' ou 'limit'
+            size (float, optional): Quantité de crypto
+            funds (float, optional): Montant en devise de cotation (market uniquement)
+            price (float, optional): Prix limite (limit uniquement)
+            client_oid (str, optional): Identifiant client de l'ordre
+            account_id: Identifiant du compte utilisateur
+            
+        Returns:
+            dict: Ordre créé ou None si erreur
+        """
+        payload = {
+            'product_id': product_id,
+            'side': side.lower(),
+            'type': order_type.lower()
+        }
+        if size is not None:
+            payload['size'] = f"{size:.8f}"
+        if funds is not None:
+            payload['funds'] = f"{funds:.8f}"
+        if price is not None:
+            payload['price'] = f"{price:.8f}"
+        if client_oid:
+            payload['client_oid'] = client_oid
+        
+        data = self._private_request('POST', '/orders', account_id, payload=payload)
+        if data is None:
+            return None
+        
+        order = self._format_order(data)
+        print(LOG_ORDER_PLACED.format(side=order['side'], product_id=product_id, order_id=order['id']))
+        return order
+    
+    def cancel_order(self, order_id_exchange, account_id=None):
+        """
+        Annule un ordre ouvert
+        
+        Args:
+            order_id_exchange (str): ID de l'ordre côté Coinbase
+            account_id: Identifiant du compte utilisateur
+            
+        Returns:
+            bool: True si l'annulation est acceptée
+        """
+        data = self._private_request('DELETE', f"/orders/{order_id_exchange}", account_id)
+        if data is None:
+            return False
+        
+        print(LOG_ORDER_CANCELLED.format(order_id=order_id_exchange))
+        return True
+    
+    def get_order(self, order_id_exchange, account_id=None):
+        """
+        Récupère l'état d'un ordre
+        
+        Args:
+            order_id_exchange (str): ID de l'ordre côté Coinbase
+            account_id: Identifiant du compte utilisateur
+            
+        Returns:
+            dict: Ordre ou None si erreur
+        """
+        data = self._private_request('GET', f"/orders/{order_id_exchange}", account_id)
+        return self._format_order(data) if data is not None else None
+    
+    def get_fills(self, product_id=None, order_id_exchange=None, account_id=None):
+        """
+        Récupère les exécutions d'un produit ou d'un ordre
+        
+        Args:
+            product_id (str, optional): Filtre par produit
+            order_id_exchange (str, optional): Filtre par ordre
+            account_id: Identifiant du compte utilisateur
+            
+        Returns:
+            list: [{'trade_id', 'order_id', 'product_id', 'side', 'price', 'size', 'fee', 'created_at'}] ou None
+        """
+        params = {'product_id': product_id, 'order_id': order_id_exchange}
+        data = self._private_request('GET', '/fills', account_id, params=params)
+        if data is None:
+            return None
+        
+        return [
+            {
+                'trade_id': fill.get('trade_id'),
+                'order_id': fill.get('order_id'),
+                'product_id': fill.get('product_id'),
+                'side': fill.get('side'),
+                'price': float(fill.get('price', 0.0)),
+                'size': float(fill.get('size', 0.0)),
+                'fee': float(fill.get('fee', 0.0)),
+                'liquidity': fill.get('liquidity'),
+                'created_at': fill.get('created_at')
+            }
+            for fill in data
+        ]
+    
+    # ============================================
+    # DONNÉES PUBLIQUES
+    # ============================================
     
     def get_product_ticker(self, product_id):
         """
@@ -122,7 +446,7 @@ class CoinbaseModel(ExchangeBase):
         """
         try:
             url = f"{self.pro_base_url}/products/{product_id}/ticker"
-            response = requests.get(url, timeout=REQUEST_TIMEOUT)
+            response = self.session.get(url, timeout=REQUEST_TIMEOUT)
             
             if response.status_code == 200:
                 data = response.json()
@@ -153,7 +477,7 @@ class CoinbaseModel(ExchangeBase):
         """
         try:
             url = f"{self.pro_base_url}/products/{product_id}/stats"
-            response = requests.get(url, timeout=REQUEST_TIMEOUT)
+            response = self.session.get(url, timeout=REQUEST_TIMEOUT)
             
             if response.status_code == 200:
                 data = response.json()
@@ -171,4 +495,40 @@ class CoinbaseModel(ExchangeBase):
                 
         except Exception as e:
             print(LOG_STATS_EXCEPTION.format(product_id=product_id, error=e))
-            return None
\ No newline at end of file
+            return None
+    
+    def get_products(self):
+        """
+        Récupère la liste complète des produits Coinbase
+        
+        Returns:
+            list: Produits normalisés ou None si erreur
+        """
+        try:
+            url = f"{self.pro_base_url}/products"
+            response = self.session.get(url, timeout=REQUEST_TIMEOUT)
+            
+            if response.status_code != 200:
+                print(LOG_PRODUCTS_ERROR.format(status_code=response.status_code))
+                return None
+            
+            products = []
+            for data in response.json():
+                status = data.get('status', 'online')
+                if data.get('trading_disabled'):
+                    status = 'disabled'
+                products.append({
+                    'product_id': data.get('id'),
+                    'base': data.get('base_currency', ''),
+                    'quote': data.get('quote_currency', ''),
+                    'base_increment': float(data.get('base_increment') or 0.0),
+                    'quote_increment': float(data.get('quote_increment') or 0.0),
+                    'base_min_size': float(data.get('base_min_size') or 0.0),
+                    'min_market_funds': float(data.get('min_market_funds') or 0.0),
+                    'status': status
+                })
+            return products
+        
+        except Exception as e:
+            print(LOG_PRODUCTS_EXCEPTION.format(error=e))
+            return None
@@ -1,3 +1,4 @@
+import asyncio
 from abc import ABC, abstractmethod
 
 class ExchangeBase(ABC):
@@ -45,4 +46,130 @@ class ExchangeBase(ABC):
         Returns:
             dict: Informations du ticker ou None si erreur
         """
-        pass
\ No newline at end of file
+        pass
+
+    def get_tickers(self, product_ids=None):
+        """
+        Récupère les tickers de plusieurs produits
+
+        Implémentation par défaut : un appel get_product_ticker par produit.
+        Les exchanges disposant d'un endpoint multi-symboles la surchargent
+        pour tout récupérer en une seule requête.
+
+        Args:
+            product_ids (list, optional): IDs des produits (tous si None et si supporté)
+
+        Returns:
+            dict: {product_id: ticker} (produits en erreur absents) ou None si erreur
+        """
+        if product_ids is None:
+            return None
+        tickers = {}
+        for product_id in product_ids:
+            ticker = self.get_product_ticker(product_id)
+            if ticker is not None:
+                tickers[product_id] = ticker
+        return tickers
+
+    async def aget_tickers(self, product_ids=None):
+        """
+        Variante asynchrone de get_tickers()
+
+        Implémentation par défaut : get_tickers() exécuté hors de la boucle
+        asyncio. Les exchanges disposant du transport HTTP asynchrone la
+        surchargent.
+        """
+        return await asyncio.get_running_loop().run_in_executor(None, self.get_tickers, product_ids)
+
+    def get_products(self):
+        """
+        Récupère la liste complète des produits (paires) de l'exchange
+
+        Returns:
+            list: [{'product_id', 'base', 'quote', 'base_increment', 'quote_increment',
+                    'base_min_size', 'min_market_funds', 'status'}] ou None si non supporté
+        """
+        return None
+
+    # ============================================
+    # TRADING (authentification requise)
+    # ============================================
+    # Implémentations par défaut : les exchanges publics seulement
+    # (sans clés API) n'ont pas à les surcharger.
+
+    def get_accounts(self, account_id=None):
+        """
+        Récupère les comptes (portefeuilles) de l'utilisateur sur l'exchange
+
+        Args:
+            account_id: Identifiant du compte utilisateur
+
+        Returns:
+            list: Liste des comptes ou None si non supporté
+        """
+        print(f"⚠ get_accounts non supporté par {self.name}")
+        return None
+
+    def place_order(self, product_id, side, order_type='market', size=None, funds=None,
+                    price=None, client_oid=None, account_id=None):
+        """
+        Place un ordre sur l'exchange
+
+        Args:
+            product_id (str): ID du produit (ex: 'BTC-USDC')
+            side (str): 'buy' ou 'sell'
+            order_type (str): 'market' ou 'limit'
+            size (float, optional): Quantité de crypto
+            funds (float, optional): Montant en devise de cotation (market uniquement)
+            price (float, optional): Prix limite (limit uniquement)
+            client_oid (str, optional): Identifiant client de l'ordre
+            account_id: Identifiant du compte utilisateur
+
+        Returns:
+            dict: Ordre créé ou None si erreur
+        """
+        print(f"⚠ place_order non supporté par {self.name}")
+        return None
+
+    def cancel_order(self, order_id_exchange, account_id=None):
+        """
+        Annule un ordre
+
+        Args:
+            order_id_exchange (str): ID de l'ordre côté exchange
+            account_id: Identifiant du compte utilisateur
+
+        Returns:
+            bool: True si l'annulation est acceptée
+        """
+        print(f"⚠ cancel_order non supporté par {self.name}")
+        return False
+
+    def get_order(self, order_id_exchange, account_id=None):
+        """
+        Récupère l'état d'un ordre
+
+        Args:
+            order_id_exchange (str): ID de l'ordre côté exchange
+            account_id: Identifiant du compte utilisateur
+
+        Returns:
+            dict: Ordre ou None si erreur
+        """
+        print(f"⚠ get_order non supporté par {self.name}")
+        return None
+
+    def get_fills(self, product_id=None, order_id_exchange=None, account_id=None):
+        """
+        Récupère les exécutions (fills)
+
+        Args:
+            product_id (str, optional): Filtre par produit
+            order_id_exchange (str, optional): Filtre par ordre
+            account_id: Identifiant du compte utilisateur
+
+        Returns:
+            list: Liste des fills ou None si erreur
+        """
+        print(f"⚠ get_fills non supporté par {self.name}")
+        return None
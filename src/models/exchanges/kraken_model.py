@@ -0,0 +1,257 @@
+import asyncio
+import threading
+from src.models.exchanges.exchange_base import ExchangeBase
+from src.utils.async_http import get_async_transport
+from src.utils.http_session import get_http_session
+
+# Constantes - URLs API
+KRAKEN_BASE_URL = "https://api.kraken.com"
+
+# Constantes - Timeouts
+REQUEST_TIMEOUT = 5
+
+# Codes d'actifs Kraken différents des symboles usuels
+ASSET_ALIASES = {
+    'XBT': 'BTC',
+    'XDG': 'DOGE'
+}
+
+# Constantes - Messages de log
+LOG_API_ERROR = "✗ Erreur API Kraken ({status_code}) sur {path}"
+LOG_API_MESSAGES = "✗ Erreur API Kraken sur {path}: {errors}"
+LOG_REQUEST_EXCEPTION = "✗ Erreur requête Kraken {path}: {error}"
+LOG_PRICE_UNKNOWN = "✗ Aucun prix Kraken pour {product_id}"
+LOG_BALANCE_UNSUPPORTED = "⚠ Solde non supporté par Kraken (données publiques uniquement)"
+
+
+def _normalize_asset(asset):
+    return ASSET_ALIASES.get(asset, asset)
+
+
+class KrakenModel(ExchangeBase):
+    """Données de marché publiques Kraken (endpoints multi-paires)"""
+
+    def __init__(self, base_url=KRAKEN_BASE_URL, session=None):
+        super().__init__()
+        self.name = "Kraken"
+        self.base_url = base_url
+        self.session = session if session else get_http_session()
+        self.transport = None       # AsyncHttpTransport (partagé si None)
+
+        # Correspondance paire Kraken ↔ product_id (chargée une fois via AssetPairs)
+        self._product_ids = {}      # {'XXBTZUSD': 'BTC-USD', 'XBTUSD': 'BTC-USD'}
+        self._pairs = {}            # {'BTC-USD': 'XBTUSD'}
+        self._asset_pairs = None
+        self._pairs_lock = threading.Lock()
+
+    # ============================================
+    # REQUÊTES
+    # ============================================
+
+    def _get(self, path, params=None):
+        """
+        Exécute une requête publique GET
+
+        Returns:
+            dict: Champ 'result' de la réponse ou None si erreur
+        """
+        try:
+            response = self.session.get(f"{self.base_url}{path}", params=params, timeout=REQUEST_TIMEOUT)
+            if response.status_code != 200:
+                print(LOG_API_ERROR.format(status_code=response.status_code, path=path))
+                return None
+
+            return self._unwrap(path, response.json())
+
+        except Exception as e:
+            print(LOG_REQUEST_EXCEPTION.format(path=path, error=e))
+            return None
+
+    @staticmethod
+    def _unwrap(path, data):
+        """Extrait le champ 'result' d'une réponse Kraken (None si l'API signale une erreur)"""
+        if data.get('error'):
+            print(LOG_API_MESSAGES.format(path=path, errors=', '.join(data['error'])))
+            return None
+        return data.get('result', {})
+
+    def _load_pairs(self):
+        """Charge AssetPairs une seule fois (les noms de paires Kraken ne se découpent pas)"""
+        if self._asset_pairs is not None:
+            return self._asset_pairs
+
+        with self._pairs_lock:
+            if self._asset_pairs is None:
+                result = self._get("/0/public/AssetPairs")
+                if result is None:
+                    return None
+                for pair_name, entry in result.items():
+                    wsname = entry.get('wsname')
+                    if not wsname or '/' not in wsname:
+                        continue
+                    base, quote = wsname.split('/', 1)
+                    product_id = f"{_normalize_asset(base)}-{_normalize_asset(quote)}"
+                    self._product_ids[pair_name] = product_id
+                    self._product_ids[entry.get('altname', pair_name)] = product_id
+                    self._pairs[product_id] = entry.get('altname', pair_name)
+                self._asset_pairs = result
+        return self._asset_pairs
+
+    def to_product_id(self, pair_name):
+        """
+        Convertit un nom de paire Kraken au format BASE-QUOTE
+
+        Args:
+            pair_name (str): Paire Kraken (ex: 'XXBTZUSD' ou 'XBTUSD')
+
+        Returns:
+            str or None: product_id (ex: 'BTC-USD') ou None si paire inconnue
+        """
+        if self._load_pairs() is None:
+            return None
+        return self._product_ids.get(pair_name)
+
+    def to_pair(self, product_id):
+        """Convertit un product_id BASE-QUOTE en paire Kraken (ex: 'XBTUSD')"""
+        self._load_pairs()
+        return self._pairs.get(product_id)
+
+    # ============================================
+    # DONNÉES PUBLIQUES
+    # ============================================
+
+    def _format_ticker(self, product_id, data):
+        return {
+            'product_id': product_id,
+            'price': float(data.get('c', [0.0])[0]),
+            'bid': float(data.get('b', [0.0])[0]),
+            'ask': float(data.get('a', [0.0])[0]),
+            'volume': float(data.get('v', [0.0, 0.0])[-1]),
+            'time': ''
+        }
+
+    def _tickers_params(self, product_ids):
+        """Paramètres de la requête Ticker (None : tous les produits, {} : aucun produit connu)"""
+        if product_ids is None:
+            return None
+        pairs = [pair for pair in (self._pairs.get(p) for p in product_ids) if pair]
+        return {'pair': ','.join(pairs)} if pairs else {}
+
+    def _parse_tickers(self, result):
+        tickers = {}
+        for pair_name, entry in result.items():
+            product_id = self._product_ids.get(pair_name)
+            if product_id:
+                tickers[product_id] = self._format_ticker(product_id, entry)
+        return tickers
+
+    def get_tickers(self, product_ids=None):
+        """
+        Récupère les tickers en une seule requête
+
+        Args:
+            product_ids (list, optional): Produits BASE-QUOTE (tous si None)
+
+        Returns:
+            dict: {product_id: ticker} ou None si erreur
+        """
+        if self._load_pairs() is None:
+            return None
+
+        params = self._tickers_params(product_ids)
+        if params == {}:
+            return {}
+
+        result = self._get("/0/public/Ticker", params)
+        if result is None:
+            return None
+        return self._parse_tickers(result)
+
+    async def aget_tickers(self, product_ids=None):
+        """Variante asynchrone de get_tickers() (transport HTTP asynchrone)"""
+        if self._asset_pairs is None:
+            pairs = await asyncio.get_running_loop().run_in_executor(None, self._load_pairs)
+            if pairs is None:
+                return None
+
+        params = self._tickers_params(product_ids)
+        if params == {}:
+            return {}
+
+        transport = self.transport or get_async_transport()
+        data = await transport.get_json(f"{self.base_url}/0/public/Ticker", params)
+        if data is None:
+            return None
+        result = self._unwrap("/0/public/Ticker", data)
+        if result is None:
+            return None
+        return self._parse_tickers(result)
+
+    def get_product_ticker(self, product_id):
+        """
+        Récupère le ticker d'un produit
+
+        Args:
+            product_id (str): ID du produit (ex: 'BTC-USD')
+
+        Returns:
+            dict: Informations du ticker ou None si erreur
+        """
+        tickers = self.get_tickers([product_id])
+        if not tickers:
+            return None
+        return tickers.get(product_id)
+
+    def get_crypto_price(self, symbol, quote_currency='USDC'):
+        """
+        Récupère le prix actuel d'une crypto depuis Kraken
+
+        Args:
+            symbol (str): Symbole de la crypto (ex: 'BTC')
+            quote_currency (str): Devise de cotation (ex: 'USDC')
+
+        Returns:
+            float: Prix actuel ou None si erreur
+        """
+        if symbol == quote_currency:
+            return 1.0
+
+        product_id = f"{symbol}-{quote_currency}"
+        ticker = self.get_product_ticker(product_id)
+        if not ticker or ticker['price'] <= 0:
+            print(LOG_PRICE_UNKNOWN.format(product_id=product_id))
+            return None
+        return ticker['price']
+
+    def get_available_balance(self, symbol, account_id=None):
+        print(LOG_BALANCE_UNSUPPORTED)
+        return None
+
+    def get_products(self):
+        """
+        Récupère la liste des paires Kraken (AssetPairs)
+
+        Returns:
+            list: Produits normalisés ou None si erreur
+        """
+        pairs = self._load_pairs()
+        if pairs is None:
+            return None
+
+        products = []
+        for pair_name, entry in pairs.items():
+            product_id = self._product_ids.get(pair_name)
+            if not product_id:
+                continue
+            base, quote = product_id.split('-', 1)
+            products.append({
+                'product_id': product_id,
+                'base': base,
+                'quote': quote,
+                'base_increment': 10 ** -int(entry.get('lot_decimals', 8)),
+                'quote_increment': float(entry.get('tick_size') or 10 ** -int(entry.get('pair_decimals', 8))),
+                'base_min_size': float(entry.get('ordermin') or 0.0),
+                'min_market_funds': float(entry.get('costmin') or 0.0),
+                'status': 'online' if entry.get('status', 'online') == 'online' else 'disabled'
+            })
+        return products
@@ -0,0 +1,444 @@
+import heapq
+import itertools
+import threading
+import time
+from collections import deque
+from src.models.exchanges.exchange_base import ExchangeBase
+
+# Constantes - Paramètres de simulation par défaut
+DEFAULT_TAKER_FEE = 0.006
+DEFAULT_MAKER_FEE = 0.004
+DEFAULT_SLIPPAGE_BPS = 5.0
+DEFAULT_SPREAD_BPS = 2.0
+DEFAULT_BALANCES = {'USDC': 10000.0}
+MAX_FILLS_KEPT = 100000
+MAX_DONE_ORDERS_KEPT = 10000
+PRICE_SOURCE_EXCHANGE = 'coinbase'
+PRICE_SOURCE_REFRESH = 1.0
+
+# Constantes - Messages de log
+LOG_NO_PRICE = "⚠ Paper: aucun prix connu pour {product_id}"
+LOG_INSUFFICIENT_FUNDS = "⚠ Paper: solde {currency} insuffisant ({available:.8f} < {required:.8f})"
+LOG_INVALID_ORDER = "✗ Paper: ordre invalide ({reason})"
+
+
+class PaperOrder:
+    """Ordre simulé (représentation compacte)"""
+
+    __slots__ = (
+        'id', 'account_id', 'product_id', 'base', 'quote', 'side', 'type', 'price',
+        'size', 'filled_size', 'executed_value', 'fill_fees', 'status', 'done_reason',
+        'created_at', 'done_at', 'hold'
+    )
+
+    def to_dict(self):
+        return {
+            'id': self.id,
+            'product_id': self.product_id,
+            'side': self.side,
+            'type': self.type,
+            'status': self.status,
+            'price': self.price or 0.0,
+            'size': self.size,
+            'filled_size': self.filled_size,
+            'executed_value': self.executed_value,
+            'fill_fees': self.fill_fees,
+            'settled': self.status == 'done',
+            'created_at': self.created_at,
+            'done_at': self.done_at,
+            'done_reason': self.done_reason
+        }
+
+
+class PaperExchangeModel(ExchangeBase):
+    """
+    Exchange simulé localement (paper trading)
+
+    Moteur d'appariement en mémoire : les ordres Market sont exécutés au
+    meilleur prix courant (avec spread et slippage), les ordres Limit
+    reposent dans un carnet par produit et sont exécutés quand le flux de
+    prix les croise. Aucun appel réseau, aucun risque.
+    """
+
+    def __init__(self, price_source=None, balances=None, taker_fee=DEFAULT_TAKER_FEE,
+                 maker_fee=DEFAULT_MAKER_FEE, slippage_bps=DEFAULT_SLIPPAGE_BPS,
+                 spread_bps=DEFAULT_SPREAD_BPS):
+        """
+        Args:
+            price_source (callable, optional): product_id → prix, utilisé quand
+                aucun prix n'a été poussé (ex: cache de prix live)
+            balances (dict, optional): Soldes initiaux {devise: montant} de chaque compte
+            taker_fee (float): Frais des ordres exécutés immédiatement
+            maker_fee (float): Frais des ordres limit exécutés depuis le carnet
+            slippage_bps (float): Glissement appliqué aux ordres market (points de base)
+            spread_bps (float): Demi-écart bid/ask simulé autour du dernier prix
+        """
+        super().__init__()
+        self.name = "Paper"
+        self.price_source = price_source
+        self.initial_balances = dict(balances or DEFAULT_BALANCES)
+        self.taker_fee = taker_fee
+        self.maker_fee = maker_fee
+        self.slippage = slippage_bps / 10000.0
+        self.half_spread = spread_bps / 10000.0
+
+        self._lock = threading.RLock()
+        self._ids = itertools.count(1)
+        self._prices = {}              # {product_id: (price, bid, ask, time)}
+        self._fed = set()              # produits alimentés par feed_price/replay_candles
+        self._balances = {}            # {account_id: {devise: disponible}}
+        self._orders = {}              # {order_id: PaperOrder}
+        self._done = deque()           # IDs des ordres terminés, du plus ancien au plus récent
+        self._holds = {}               # {account_id: {devise: montant réservé}}
+        self._bids = {}                # {product_id: [(-prix, seq, order_id)]}
+        self._asks = {}                # {product_id: [(prix, seq, order_id)]}
+        self._fills = deque(maxlen=MAX_FILLS_KEPT)
+        self._trade_ids = itertools.count(1)
+
+    # ============================================
+    # FLUX DE PRIX
+    # ============================================
+
+    def feed_price(self, product_id, price, bid=None, ask=None, timestamp=None):
+        """
+        Pousse un nouveau prix et exécute les ordres limit croisés
+
+        Args:
+            product_id (str): ID du produit (ex: 'BTC-USDC')
+            price (float): Dernier prix
+            bid (float, optional): Meilleur acheteur (dérivé du spread sinon)
+            ask (float, optional): Meilleur vendeur (dérivé du spread sinon)
+            timestamp (float, optional): Horodatage du tick
+        """
+        if bid is None:
+            bid = price * (1 - self.half_spread)
+        if ask is None:
+            ask = price * (1 + self.half_spread)
+        with self._lock:
+            self._fed.add(product_id)
+            self._prices[product_id] = (price, bid, ask, timestamp or time.time())
+            self._match(product_id, bid, ask)
+
+    def replay_candles(self, product_id, candles):
+        """
+        Rejoue des bougies enregistrées : chaque bougie croise les ordres sur
+        son plus bas puis son plus haut, et laisse la clôture comme prix courant
+
+        Args:
+            product_id (str): ID du produit
+            candles (iterable): (time, low, high, open, close, volume) au format Coinbase
+        """
+        for ts, low, high, _open, close, _volume in candles:
+            with self._lock:
+                self._fed.add(product_id)
+                self._match(product_id, high, low)
+                self._prices[product_id] = (
+                    close, close * (1 - self.half_spread), close * (1 + self.half_spread), ts
+                )
+
+    def _quote(self, product_id):
+        """
+        Dernier prix d'un produit : poussé (feed_price), sinon relu depuis
+        price_source au plus toutes les PRICE_SOURCE_REFRESH secondes, en
+        exécutant les ordres limit que le nouveau prix croise
+        """
+        quote = self._prices.get(product_id)
+        if self.price_source is None or product_id in self._fed:
+            return quote
+        if quote is None or time.time() - quote[3] >= PRICE_SOURCE_REFRESH:
+            price = self.price_source(product_id)
+            if price:
+                bid, ask = price * (1 - self.half_spread), price * (1 + self.half_spread)
+                quote = (price, bid, ask, time.time())
+                self._prices[product_id] = quote
+                self._match(product_id, bid, ask)
+        return quote
+
+    # ============================================
+    # APPARIEMENT
+    # ============================================
+
+    def _match(self, product_id, bid, ask):
+        """Exécute les ordres limit du carnet croisés par le nouveau bid/ask"""
+        bids = self._bids.get(product_id)
+        while bids and -bids[0][0] >= ask:
+            _, _, order_id = heapq.heappop(bids)
+            order = self._orders.get(order_id)
+            if order is not None and order.status == 'open':
+                self._execute(order, order.price, self.maker_fee, reserved=True)
+
+        asks = self._asks.get(product_id)
+        while asks and asks[0][0] <= bid:
+            _, _, order_id = heapq.heappop(asks)
+            order = self._orders.get(order_id)
+            if order is not None and order.status == 'open':
+                self._execute(order, order.price, self.maker_fee, reserved=True)
+
+    def _execute(self, order, price, fee_rate, reserved=False):
+        """Exécute la totalité restante d'un ordre au prix donné"""
+        size = order.size - order.filled_size
+        value = price * size
+        fee = value * fee_rate
+        balances = self._account(order.account_id)
+
+        if order.side == 'buy':
+            # Les fonds réservés (limit) incluent déjà prix limite + frais
+            if not reserved:
+                balances[order.quote] = balances.get(order.quote, 0.0) - value - fee
+            balances[order.base] = balances.get(order.base, 0.0) + size
+        else:
+            if not reserved:
+                balances[order.base] = balances.get(order.base, 0.0) - size
+            balances[order.quote] = balances.get(order.quote, 0.0) + value - fee
+
+        order.filled_size += size
+        order.executed_value += value
+        order.fill_fees += fee
+        self._finish(order, 'filled')
+
+        self._fills.append({
+            'trade_id': next(self._trade_ids),
+            'order_id': order.id,
+            'product_id': order.product_id,
+            'side': order.side,
+            'price': price,
+            'size': size,
+            'fee': fee,
+            'liquidity': 'M' if reserved else 'T',
+            'created_at': order.done_at
+        })
+
+    def _finish(self, order, reason):
+        """Termine un ordre : libère sa réservation et borne l'historique des ordres terminés"""
+        if order.hold:
+            currency = order.quote if order.side == 'buy' else order.base
+            holds = self._holds[order.account_id]
+            holds[currency] -= order.hold
+            order.hold = 0.0
+        order.status = 'done'
+        order.done_reason = reason
+        order.done_at = time.time()
+
+        self._done.append(order.id)
+        while len(self._done) > MAX_DONE_ORDERS_KEPT:
+            self._orders.pop(self._done.popleft(), None)
+
+    def _account(self, account_id):
+        balances = self._balances.get(account_id)
+        if balances is None:
+            balances = dict(self.initial_balances)
+            self._balances[account_id] = balances
+        return balances
+
+    # ============================================
+    # INTERFACE ExchangeBase
+    # ============================================
+
+    def get_crypto_price(self, symbol, quote_currency='USDC'):
+        """Retourne le dernier prix simulé (ou None si inconnu)"""
+        if symbol == quote_currency:
+            return 1.0
+        with self._lock:
+            quote = self._quote(f"{symbol}-{quote_currency}")
+        return quote[0] if quote else None
+
+    def get_product_ticker(self, product_id):
+        with self._lock:
+            quote = self._quote(product_id)
+        if quote is None:
+            return None
+        price, bid, ask, ts = quote
+        return {'price': price, 'bid': bid, 'ask': ask, 'volume': 0.0, 'time': ts}
+
+    def get_products(self):
+        """Produits connus du simulateur (ceux pour lesquels un prix existe)"""
+        with self._lock:
+            product_ids = list(self._prices)
+        products = []
+        for product_id in product_ids:
+            base, quote_currency = product_id.split('-')
+            products.append({
+                'product_id': product_id, 'base': base, 'quote': quote_currency,
+                'base_increment': 1e-8, 'quote_increment': 1e-8, 'base_min_size': 0.0,
+                'min_market_funds': 0.0, 'status': 'online'
+            })
+        return products
+
+    def get_available_balance(self, symbol, account_id=None):
+        with self._lock:
+            return self._account(account_id).get(symbol.upper(), 0.0)
+
+    def get_accounts(self, account_id=None):
+        """Soldes par devise : disponible, réservé par les ordres limit ouverts (hold) et total"""
+        with self._lock:
+            balances = self._account(account_id)
+            holds = self._holds.get(account_id, {})
+            return [
+                {'id': f"paper-{currency}", 'currency': currency,
+                 'balance': balances.get(currency, 0.0) + holds.get(currency, 0.0),
+                 'available': balances.get(currency, 0.0), 'hold': holds.get(currency, 0.0)}
+                for currency in sorted(set(balances) | {c for c, amount in holds.items() if amount > 1e-12})
+            ]
+
+    def place_order(self, product_id, side, order_type='market', size=None, funds=None,
+                    price=None, client_oid=None, account_id=None):
+        """
+        Place un ordre simulé
+
+        Returns:
+            dict: Ordre au format normalisé (comme CoinbaseModel) ou None si rejeté
+        """
+        side = side.lower()
+        order_type = order_type.lower()
+        if side not in ('buy', 'sell') or order_type not in ('market', 'limit'):
+            print(LOG_INVALID_ORDER.format(reason=f"{side}/{order_type}"))
+            return None
+        if order_type == 'limit' and (not price or not size):
+            print(LOG_INVALID_ORDER.format(reason="limit sans prix ou quantité"))
+            return None
+
+        base, quote_currency = product_id.split('-')
+
+        with self._lock:
+            quote = self._quote(product_id)
+            if quote is None and order_type == 'market':
+                print(LOG_NO_PRICE.format(product_id=product_id))
+                return None
+
+            # Limit croisée à la pose : exécution taker au meilleur prix du carnet,
+            # min(limite, ask) à l'achat et max(limite, bid) à la vente
+            crosses = order_type == 'limit' and quote is not None and (
+                (side == 'buy' and quote[2] <= price) or (side == 'sell' and quote[1] >= price))
+            if order_type == 'market':
+                _, bid, ask, _ = quote
+                exec_price = ask * (1 + self.slippage) if side == 'buy' else bid * (1 - self.slippage)
+                if size is None:
+                    if not funds:
+                        print(LOG_INVALID_ORDER.format(reason="market sans quantité ni montant"))
+                        return None
+                    size = funds / (exec_price * (1 + self.taker_fee))
+            elif crosses:
+                exec_price = min(price, quote[2]) if side == 'buy' else max(price, quote[1])
+            else:
+                exec_price = price
+
+            balances = self._account(account_id)
+            if side == 'buy':
+                # Fonds vérifiés au coût réel : frais taker si l'ordre s'exécute immédiatement
+                fee_rate = self.maker_fee if order_type == 'limit' and not crosses else self.taker_fee
+                currency, required = quote_currency, size * exec_price * (1 + fee_rate)
+            else:
+                currency, required = base, size
+            available = balances.get(currency, 0.0)
+            if available + 1e-12 < required:
+                print(LOG_INSUFFICIENT_FUNDS.format(currency=currency, available=available, required=required))
+                return None
+
+            order = PaperOrder()
+            order.id = f"paper-{next(self._ids)}"
+            order.account_id = account_id
+            order.product_id = product_id
+            order.base = base
+            order.quote = quote_currency
+            order.side = side
+            order.type = order_type
+            order.price = price
+            order.size = size
+            order.filled_size = 0.0
+            order.executed_value = 0.0
+            order.fill_fees = 0.0
+            order.status = 'open'
+            order.done_reason = None
+            order.created_at = time.time()
+            order.done_at = None
+            order.hold = 0.0
+            self._orders[order.id] = order
+
+            if order_type == 'market' or crosses:
+                self._execute(order, exec_price, self.taker_fee)
+            else:
+                # Ordre au carnet : les fonds restent réservés jusqu'à exécution ou annulation
+                balances[currency] = available - required
+                order.hold = required
+                holds = self._holds.setdefault(account_id, {})
+                holds[currency] = holds.get(currency, 0.0) + required
+                seq = next(self._ids)
+                if side == 'buy':
+                    heapq.heappush(self._bids.setdefault(product_id, []), (-price, seq, order.id))
+                else:
+                    heapq.heappush(self._asks.setdefault(product_id, []), (price, seq, order.id))
+
+            return order.to_dict()
+
+    def cancel_order(self, order_id_exchange, account_id=None):
+        """Annule un ordre limit ouvert et libère les fonds réservés"""
+        with self._lock:
+            order = self._orders.get(order_id_exchange)
+            if order is None or order.status != 'open':
+                return False
+
+            balances = self._account(order.account_id)
+            currency = order.quote if order.side == 'buy' else order.base
+            balances[currency] = balances.get(currency, 0.0) + order.hold
+
+            # Retrait paresseux du carnet : l'entrée est ignorée à l'appariement
+            self._finish(order, 'canceled')
+            return True
+
+    def get_order(self, order_id_exchange, account_id=None):
+        with self._lock:
+            order = self._orders.get(order_id_exchange)
+            return order.to_dict() if order else None
+
+    def get_fills(self, product_id=None, order_id_exchange=None, account_id=None):
+        with self._lock:
+            return [
+                dict(fill) for fill in self._fills
+                if (product_id is None or fill['product_id'] == product_id)
+                and (order_id_exchange is None or fill['order_id'] == order_id_exchange)
+            ]
+
+    def reset(self):
+        """Réinitialise soldes, ordres et carnets"""
+        with self._lock:
+            self._balances.clear()
+            self._orders.clear()
+            self._done.clear()
+            self._holds.clear()
+            self._bids.clear()
+            self._asks.clear()
+            self._fills.clear()
+
+
+def live_price(product_id, exchange=PRICE_SOURCE_EXCHANGE):
+    """
+    Prix live d'un produit pour le simulateur
+
+    La table de prix partagée (publiée par le démon) est lue en premier ;
+    sans elle, l'exchange de référence est interrogé (réponse en cache).
+
+    Args:
+        product_id (str): Produit BASE-QUOTE
+        exchange (str): Exchange dont les prix sont simulés
+
+    Returns:
+        float or None: Dernier prix, None si inconnu
+    """
+    from src.models.exchanges.registry import get_registry
+    from src.utils.shm_price_table import get_price_table
+
+    price_table = get_price_table()
+    if price_table is not None:
+        price = price_table.get_price(exchange, product_id)
+        if price is not None:
+            return price
+    handle = get_registry().get(exchange)
+    if handle is None:
+        return None
+    base, quote_currency = product_id.split('-')
+    return handle.get_crypto_price(base, quote_currency)
+
+
+def create_live_paper_exchange():
+    """Simulateur du registre : ordres exécutés contre les prix live (voir live_price)"""
+    return PaperExchangeModel(price_source=live_price)
@@ -0,0 +1,424 @@
+"""
+Registre des adapters d'exchange (un seul par processus)
+
+Les adapters sont déclarés par nom puis instanciés paresseusement au
+premier usage, une seule fois pour tout le processus. Ils partagent la
+session HTTP, un cache de réponses publiques et un limiteur de débit par
+exchange. Chaque appel est chronométré pour produire des statistiques
+de santé (latences p50/p95/p99, taux d'erreur).
+
+Le thread de l'interface (voir set_ui_thread) n'attend jamais le
+limiteur : sans jeton disponible, l'appel échoue aussitôt (None).
+Les réponses en cache sont copiées : un appelant qui modifie le résultat
+n'altère pas celui des autres.
+
+Sources d'adapters, dans l'ordre :
+    1. adapters intégrés (BUILTIN_ADAPTERS)
+    2. entry points du groupe `cointrader.exchanges` (paquets installés)
+    3. modules du dossier `plugins/exchanges/` exposant `register(registry)`
+"""
+import importlib
+import importlib.util
+import inspect
+import os
+import threading
+import time
+from collections import deque
+from importlib import metadata
+from src.utils.http_session import get_http_session
+from src.utils.metrics import get_metrics
+from src.utils.tracing import get_tracer, CATEGORY_EXCHANGE
+from src.utils.rate_limiter import RateLimiter
+from src.utils.ttl_cache import TTLCache
+
+# Constantes - Sources d'adapters
+ENTRY_POINT_GROUP = 'cointrader.exchanges'
+_PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+PLUGIN_DIR = os.path.join(_PROJECT_ROOT, 'plugins', 'exchanges')
+
+# nom → (chemin 'module:Classe', requêtes/s autorisées ou None, cache des réponses publiques)
+BUILTIN_ADAPTERS = {
+    'coinbase': ('src.models.exchanges.coinbase_model:CoinbaseModel', 10, True),
+    'binance': ('src.models.exchanges.binance_model:BinanceModel', 20, True),
+    'kraken': ('src.models.exchanges.kraken_model:KrakenModel', 1, True),
+    # Prix live de la table partagée (ou de l'exchange de référence) : pas de quota ni de cache
+    'paper': ('src.models.exchanges.paper_model:create_live_paper_exchange', None, False)
+}
+
+# Méthodes dont le résultat est mis en cache (durée de vie en secondes)
+CACHED_METHODS = {
+    'get_crypto_price': 1.0,
+    'get_product_ticker': 1.0,
+    'get_tickers': 1.0,
+    'aget_tickers': 1.0,
+    'get_product_stats': 30.0,
+    'get_products': 300.0
+}
+
+# Méthodes de trading : jamais en cache
+UNCACHED_METHODS = {
+    'get_available_balance', 'get_accounts', 'place_order', 'cancel_order',
+    'get_order', 'get_fills'
+}
+
+STATS_WINDOW = 1024
+
+metrics = get_metrics()
+tracer = get_tracer()
+metrics.describe('exchange_call_seconds', "Durée des appels aux adapters d'exchange")
+metrics.describe('exchange_call_errors_total', "Appels d'exchange en erreur")
+metrics.describe('exchange_cache_hits_total', "Appels d'exchange servis par le cache")
+metrics.describe('exchange_call_throttled_total', "Appels d'exchange refusés sur le thread de l'interface (quota)")
+
+# Constantes - Messages de log
+LOG_UNKNOWN_EXCHANGE = "⚠ Exchange '{name}' non supporté"
+LOG_CREATE_ERROR = "✗ Erreur création adapter {name}: {error}"
+LOG_PLUGIN_ERROR = "✗ Erreur chargement plugin exchange {source}: {error}"
+LOG_PLUGIN_LOADED = "✓ Plugin exchange chargé: {source}"
+LOG_UI_THROTTLED = "⚠ {exchange}.{method}: quota de requêtes atteint, appel ignoré (thread interface)"
+
+# Thread de l'interface Tk (jamais bloqué par un limiteur)
+_ui_thread_id = None
+
+
+def set_ui_thread(thread):
+    """
+    Déclare le thread de l'interface : ses appels n'attendent jamais le limiteur
+
+    Args:
+        thread (threading.Thread or None): Thread de la boucle Tk (None pour oublier)
+    """
+    global _ui_thread_id
+    _ui_thread_id = thread.ident if thread is not None else None
+
+
+def _freeze(value):
+    """Rend une liste d'arguments hashable (clé de cache)"""
+    if isinstance(value, (list, tuple, set)):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+
+def _copy_result(value):
+    """Copie les listes et dicts d'une réponse (les scalaires sont partagés)"""
+    if isinstance(value, dict):
+        return {key: _copy_result(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_copy_result(item) for item in value]
+    return value
+
+
+class AdapterStats:
+    """Statistiques de santé d'un adapter (fenêtre glissante des derniers appels)"""
+
+    def __init__(self, window=STATS_WINDOW):
+        self.calls = 0
+        self.errors = 0
+        self.cache_hits = 0
+        self.latencies = deque(maxlen=window)
+        self.recent_errors = deque(maxlen=window)
+        self._lock = threading.Lock()
+
+    def record(self, latency, error):
+        with self._lock:
+            self.calls += 1
+            self.latencies.append(latency)
+            self.recent_errors.append(1 if error else 0)
+            if error:
+                self.errors += 1
+
+    def record_cache_hit(self):
+        with self._lock:
+            self.cache_hits += 1
+
+    def snapshot(self):
+        """
+        Returns:
+            dict: {'calls', 'errors', 'cache_hits', 'error_rate', 'p50_ms', 'p95_ms', 'p99_ms'}
+        """
+        with self._lock:
+            latencies = sorted(self.latencies)
+            recent = list(self.recent_errors)
+            result = {'calls': self.calls, 'errors': self.errors, 'cache_hits': self.cache_hits}
+
+        result['error_rate'] = sum(recent) / len(recent) if recent else 0.0
+        for label, q in (('p50_ms', 0.50), ('p95_ms', 0.95), ('p99_ms', 0.99)):
+            if latencies:
+                index = min(len(latencies) - 1, int(q * len(latencies)))
+                result[label] = latencies[index] * 1000.0
+            else:
+                result[label] = None
+        return result
+
+
+class AdapterHandle:
+    """
+    Enveloppe d'un adapter : limiteur de débit, cache partagé et statistiques
+
+    S'utilise exactement comme l'adapter (mêmes méthodes). L'adapter brut
+    reste accessible via `handle.adapter`.
+    """
+
+    def __init__(self, name, adapter, cache=None, rate_limiter=None):
+        self.name = name
+        self.adapter = adapter
+        self.cache = cache
+        self.rate_limiter = rate_limiter
+        self.stats = AdapterStats()
+        self._wrapped = {}
+
+    def _wrap(self, method_name, method):
+        ttl = CACHED_METHODS.get(method_name) if self.cache is not None else None
+        stats = self.stats
+        limiter = self.rate_limiter
+        cache = self.cache
+        exchange = self.name
+        span_name = f"{exchange}.{method_name}"
+
+        def _record(latency, error):
+            stats.record(latency, error)
+            metrics.observe('exchange_call_seconds', latency, exchange=exchange, method=method_name)
+            if error:
+                metrics.inc('exchange_call_errors_total', exchange=exchange, method=method_name)
+
+        def call(*args, **kwargs):
+            if ttl is not None:
+                key = (exchange, method_name, _freeze(args), _freeze(sorted(kwargs.items())))
+                cached = cache.get(key)
+                if cached is not None:
+                    stats.record_cache_hit()
+                    metrics.inc('exchange_cache_hits_total', exchange=exchange, method=method_name)
+                    return _copy_result(cached)
+
+            if limiter is not None:
+                if threading.get_ident() == _ui_thread_id:
+                    # Interface : pas d'attente, l'appel échoue comme une erreur d'adapter
+                    if not limiter.try_acquire():
+                        metrics.inc('exchange_call_throttled_total', exchange=exchange, method=method_name)
+                        print(LOG_UI_THROTTLED.format(exchange=exchange, method=method_name))
+                        return None
+                else:
+                    limiter.acquire()
+
+            start = time.perf_counter()
+            error = False
+            try:
+                with tracer.span(span_name, CATEGORY_EXCHANGE):
+                    result = method(*args, **kwargs)
+                # Les adapters signalent leurs erreurs par None (ou False pour les annulations)
+                error = result is None or result is False
+                return result
+            except Exception:
+                error = True
+                raise
+            finally:
+                _record(time.perf_counter() - start, error)
+                if ttl is not None and not error:
+                    cache.set(key, _copy_result(result), ttl)
+
+        async def acall(*args, **kwargs):
+            # Variante coroutine : le limiteur attend sans bloquer la boucle asyncio
+            if ttl is not None:
+                key = (exchange, method_name, _freeze(args), _freeze(sorted(kwargs.items())))
+                cached = cache.get(key)
+                if cached is not None:
+                    stats.record_cache_hit()
+                    metrics.inc('exchange_cache_hits_total', exchange=exchange, method=method_name)
+                    return _copy_result(cached)
+
+            if limiter is not None:
+                await limiter.acquire_async()
+
+            start = time.perf_counter()
+            error = False
+            try:
+                with tracer.span(span_name, CATEGORY_EXCHANGE):
+                    result = await method(*args, **kwargs)
+                error = result is None or result is False
+                return result
+            except Exception:
+                error = True
+                raise
+            finally:
+                _record(time.perf_counter() - start, error)
+                if ttl is not None and not error:
+                    cache.set(key, _copy_result(result), ttl)
+
+        if inspect.iscoroutinefunction(method):
+            call = acall
+        call.__name__ = method_name
+        call.__doc__ = method.__doc__
+        return call
+
+    def __getattr__(self, attr):
+        value = getattr(self.adapter, attr)
+        if attr.startswith('_') or not callable(value):
+            return value
+        if attr not in CACHED_METHODS and attr not in UNCACHED_METHODS:
+            return value
+        wrapped = self._wrapped.get(attr)
+        if wrapped is None:
+            wrapped = self._wrap(attr, value)
+            self._wrapped[attr] = wrapped
+        return wrapped
+
+
+class ExchangeRegistry:
+    """Registre des adapters d'exchange du processus (voir get_registry())"""
+
+    def __init__(self, plugin_dir=PLUGIN_DIR):
+        self.plugin_dir = plugin_dir
+        self.cache = TTLCache()
+        self._factories = {}        # {nom: (factory, requêtes/s, cache)}
+        self._handles = {}          # {nom: AdapterHandle}
+        self._lock = threading.RLock()
+        self._discovered = False
+
+        for name, (target, rate, cached) in BUILTIN_ADAPTERS.items():
+            self.register(name, target, rate_limit=rate, cache=cached)
+
+    # ============================================
+    # ENREGISTREMENT
+    # ============================================
+
+    def register(self, name, factory, rate_limit=None, cache=True):
+        """
+        Déclare un adapter
+
+        Args:
+            name (str): Nom technique de l'exchange (colonne exchanges.name)
+            factory: Classe ExchangeBase, callable sans argument, ou chemin 'module:Classe'
+            rate_limit (float, optional): Requêtes par seconde autorisées
+            cache (bool): Mettre en cache les réponses publiques (prix, tickers, produits)
+        """
+        with self._lock:
+            self._factories[name.lower()] = (factory, rate_limit, cache)
+
+    def discover(self):
+        """Charge les adapters des entry points et du dossier de plugins (une seule fois)"""
+        with self._lock:
+            if self._discovered:
+                return
+            self._discovered = True
+
+            try:
+                entry_points = metadata.entry_points(group=ENTRY_POINT_GROUP)
+            except TypeError:
+                entry_points = metadata.entry_points().get(ENTRY_POINT_GROUP, [])
+            for entry_point in entry_points:
+                try:
+                    self.register(entry_point.name, entry_point.load())
+                    print(LOG_PLUGIN_LOADED.format(source=entry_point.value))
+                except Exception as e:
+                    print(LOG_PLUGIN_ERROR.format(source=entry_point.value, error=e))
+
+            if not os.path.isdir(self.plugin_dir):
+                return
+            for filename in sorted(os.listdir(self.plugin_dir)):
+                if not filename.endswith('.py') or filename.startswith('_'):
+                    continue
+                path = os.path.join(self.plugin_dir, filename)
+                try:
+                    spec = importlib.util.spec_from_file_location(
+                        f"cointrader_plugin_{filename[:-3]}", path
+                    )
+                    module = importlib.util.module_from_spec(spec)
+                    spec.loader.exec_module(module)
+                    module.register(self)
+                    print(LOG_PLUGIN_LOADED.format(source=path))
+                except Exception as e:
+                    print(LOG_PLUGIN_ERROR.format(source=path, error=e))
+
+    def available(self):
+        """Noms des exchanges déclarés"""
+        self.discover()
+        return sorted(self._factories)
+
+    # ============================================
+    # INSTANCES
+    # ============================================
+
+    def _create(self, name, factory, rate_limit, cached):
+        if isinstance(factory, str):
+            module_name, class_name = factory.split(':')
+            factory = getattr(importlib.import_module(module_name), class_name)
+        adapter = factory()
+
+        # Transport partagé
+        if hasattr(adapter, 'session'):
+            adapter.session = get_http_session()
+
+        limiter = RateLimiter(rate_limit) if rate_limit else None
+        return AdapterHandle(name, adapter, self.cache if cached else None, limiter)
+
+    def get(self, name):
+        """
+        Retourne l'adapter d'un exchange (créé au premier appel)
+
+        Args:
+            name (str): Nom technique de l'exchange
+
+        Returns:
+            AdapterHandle or None: Adapter instrumenté ou None si inconnu
+        """
+        name = name.lower()
+        handle = self._handles.get(name)
+        if handle is not None:
+            return handle
+
+        with self._lock:
+            handle = self._handles.get(name)
+            if handle is not None:
+                return handle
+
+            if name not in self._factories:
+                self.discover()
+            if name not in self._factories:
+                print(LOG_UNKNOWN_EXCHANGE.format(name=name))
+                return None
+
+            factory, rate_limit, cached = self._factories[name]
+            try:
+                handle = self._create(name, factory, rate_limit, cached)
+            except Exception as e:
+                print(LOG_CREATE_ERROR.format(name=name, error=e))
+                return None
+            self._handles[name] = handle
+            return handle
+
+    def clear_credentials(self, name, account_id):
+        """
+        Oublie les identifiants en cache d'un compte (clé API modifiée ou supprimée)
+
+        Seul un adapter déjà instancié peut en avoir : aucun n'est créé ici.
+
+        Args:
+            name (str): Nom technique de l'exchange
+            account_id: Identifiant du compte utilisateur
+        """
+        handle = self._handles.get(name.lower())
+        if handle is not None and hasattr(handle.adapter, 'clear_credentials'):
+            handle.adapter.clear_credentials(account_id)
+
+    def health(self):
+        """
+        Statistiques de santé des adapters déjà instanciés
+
+        Returns:
+            dict: {nom: AdapterStats.snapshot()}
+        """
+        return {name: handle.stats.snapshot() for name, handle in self._handles.items()}
+
+
+_registry = None
+_registry_lock = threading.Lock()
+
+
+def get_registry():
+    """Retourne le registre partagé du processus"""
+    global _registry
+    if _registry is None:
+        with _registry_lock:
+            if _registry is None:
+                _registry = ExchangeRegistry()
+    return _registry
@@ -0,0 +1,228 @@
+import sqlite3
+from datetime import datetime
+from src.models.database_model import DatabaseModel
+from src.models.records import Order
+from src.utils.data_access import Query
+
+# Statuts d'un ordre (colonne orders.status)
+STATUS_PENDING = 'pending'
+STATUS_OPEN = 'open'
+STATUS_PARTIALLY_FILLED = 'partially_filled'
+STATUS_FILLED = 'filled'
+STATUS_CANCELLED = 'cancelled'
+STATUS_REJECTED = 'rejected'
+
+ACTIVE_STATUSES = (STATUS_PENDING, STATUS_OPEN, STATUS_PARTIALLY_FILLED)
+TERMINAL_STATUSES = (STATUS_FILLED, STATUS_CANCELLED, STATUS_REJECTED)
+
+# Requêtes - Lecture des ordres
+_ORDER_COLUMNS = """
+    SELECT o.order_id, o.bot_id, o.fk_account_id, o.fk_exchange_id, e.name,
+           o.product_id, o.type, o.order_type, o.prix_limite, o.prix_execution, o.quantite,
+           o.montant_usdc, o.quantite_executee, o.montant_execute, o.frais, o.status,
+           o.order_id_exchange, o.created_at, o.executed_at
+    FROM orders o
+    JOIN exchanges e ON o.fk_exchange_id = e.exchange_id
+"""
+_ORDER_MAPPING = {
+    'rename': {'fk_account_id': 'account_id', 'fk_exchange_id': 'exchange_id', 'name': 'exchange_name',
+               'type': 'side'},
+    'record': Order
+}
+QUERY_ACTIVE_ORDERS = Query(
+    _ORDER_COLUMNS + f"WHERE o.status IN ({', '.join('?' for _ in ACTIVE_STATUSES)}) ORDER BY o.order_id",
+    **_ORDER_MAPPING
+)
+QUERY_USER_ORDERS = Query(
+    _ORDER_COLUMNS + "WHERE o.fk_account_id = ? ORDER BY o.created_at DESC LIMIT ?", **_ORDER_MAPPING
+)
+QUERY_USER_ORDERS_BY_STATUS = Query(
+    _ORDER_COLUMNS + "WHERE o.fk_account_id = ? AND o.status = ? ORDER BY o.created_at DESC LIMIT ?",
+    **_ORDER_MAPPING
+)
+
+
+class OrderModel:
+    """Persistance des ordres de trading (table orders)"""
+
+    def __init__(self, db_model=None):
+        self.db = db_model if db_model else DatabaseModel()
+
+    def create_order(self, account_id, exchange_id, product_id, side, bot_id=None,
+                     montant_usdc=None, quantite=None, status=STATUS_PENDING,
+                     order_type='market', prix_limite=None):
+        """
+        Insère un nouvel ordre
+
+        Args:
+            account_id (int): ID du compte utilisateur
+            exchange_id (int): ID de l'exchange
+            product_id (str): Paire (ex: 'BTC-USDC')
+            side (str): 'buy' ou 'sell' (colonne type)
+            bot_id (int, optional): Bot à l'origine de l'ordre
+            montant_usdc (float, optional): Montant demandé
+            quantite (float, optional): Quantité demandée
+            status (str): Statut initial
+            order_type (str): 'market' ou 'limit'
+            prix_limite (float, optional): Prix limite (ordres limit)
+
+        Returns:
+            int or None: ID local de l'ordre
+        """
+        try:
+            self.db.cursor.execute(
+                """
+                INSERT INTO orders (
+                    bot_id, fk_account_id, fk_exchange_id, product_id, type, order_type,
+                    prix_limite, quantite, montant_usdc, status, created_at
+                )
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                """,
+                (bot_id, account_id, exchange_id, product_id, side, order_type,
+                 prix_limite, quantite, montant_usdc, status, datetime.now())
+            )
+            self.db.connection.commit()
+            order_id = self.db.cursor.lastrowid
+
+            self.db.logger.log_query(f"Ordre créé: {side} {product_id} (ID: {order_id})")
+            self.db.log_activity(account_id, 'ORDER_ADDED', f"Ordre {side} {product_id}")
+
+            return order_id
+
+        except sqlite3.Error as e:
+            self.db.logger.log_error(f"Erreur création ordre: {e}")
+            return None
+
+    def apply_transitions(self, updates):
+        """
+        Persiste un lot de transitions dans une seule transaction
+
+        La quantité et le montant demandés (quantite, montant_usdc) ne sont jamais
+        modifiés : la progression de l'exécution a ses propres colonnes.
+
+        Args:
+            updates (list): Tuples (status, order_id_exchange, prix_execution, quantite_executee,
+                montant_execute, frais, executed_at, order_id)
+
+        Returns:
+            bool: True si le lot a été écrit
+        """
+        if not updates:
+            return True
+
+        try:
+            self.db.cursor.executemany(
+                """
+                UPDATE orders
+                SET status = ?,
+                    order_id_exchange = COALESCE(?, order_id_exchange),
+                    prix_execution = ?,
+                    quantite_executee = ?,
+                    montant_execute = ?,
+                    frais = ?,
+                    executed_at = COALESCE(?, executed_at)
+                WHERE order_id = ?
+                """,
+                updates
+            )
+            self.db.connection.commit()
+            self.db.logger.log_query(f"Transitions d'ordres persistées: {len(updates)}")
+            return True
+
+        except sqlite3.Error as e:
+            self.db.connection.rollback()
+            self.db.logger.log_error(f"Erreur persistance transitions ordres: {e}")
+            return False
+
+    def get_active_orders(self, records=False):
+        """
+        Récupère les ordres non terminés (reprise après crash)
+
+        Args:
+            records (bool): Objets Order (__slots__) plutôt que des dicts
+
+        Returns:
+            list: Ordres actifs avec le nom technique de leur exchange
+        """
+        try:
+            return QUERY_ACTIVE_ORDERS.all(self.db.connection, ACTIVE_STATUSES, records)
+
+        except sqlite3.Error as e:
+            self.db.logger.log_error(f"Erreur récupération ordres actifs: {e}")
+            return []
+
+    def get_user_orders(self, account_id, status=None, limit=200, records=False):
+        """
+        Récupère les ordres d'un utilisateur (plus récents d'abord)
+
+        Args:
+            account_id (int): ID du compte utilisateur
+            status (str, optional): Filtre par statut
+            limit (int): Nombre maximum d'ordres
+            records (bool): Objets Order (__slots__) plutôt que des dicts
+
+        Returns:
+            list: Liste des ordres
+        """
+        try:
+            if status:
+                return QUERY_USER_ORDERS_BY_STATUS.all(self.db.connection, (account_id, status, limit), records)
+            return QUERY_USER_ORDERS.all(self.db.connection, (account_id, limit), records)
+
+        except sqlite3.Error as e:
+            self.db.logger.log_error(f"Erreur récupération ordres: {e}")
+            return []
+
+    def count_active_orders(self, account_id):
+        """
+        Compte les ordres non terminés d'un utilisateur
+
+        Args:
+            account_id (int): ID du compte utilisateur
+
+        Returns:
+            int: Nombre d'ordres en attente, ouverts ou partiellement exécutés
+        """
+        try:
+            placeholders = ', '.join('?' for _ in ACTIVE_STATUSES)
+            self.db.cursor.execute(
+                f"SELECT COUNT(*) FROM orders WHERE fk_account_id = ? AND status IN ({placeholders})",
+                (account_id, *ACTIVE_STATUSES)
+            )
+            return self.db.cursor.fetchone()[0]
+
+        except sqlite3.Error as e:
+            self.db.logger.log_error(f"Erreur comptage ordres actifs: {e}")
+            return 0
+
+    def get_positions(self, account_id):
+        """
+        Calcule les positions nettes à partir des quantités exécutées
+
+        Args:
+            account_id (int): ID du compte utilisateur
+
+        Returns:
+            list: [{'product_id', 'quantite', 'cout_usdc'}] (positions non nulles)
+        """
+        try:
+            self.db.cursor.execute(
+                """
+                SELECT product_id,
+                       SUM(CASE WHEN type = 'buy' THEN quantite_executee ELSE -quantite_executee END),
+                       SUM(CASE WHEN type = 'buy' THEN montant_execute ELSE -montant_execute END)
+                FROM orders
+                WHERE fk_account_id = ? AND quantite_executee > 0
+                GROUP BY product_id
+                """,
+                (account_id,)
+            )
+            return [
+                {'product_id': row[0], 'quantite': row[1], 'cout_usdc': row[2] or 0.0}
+                for row in self.db.cursor.fetchall()
+                if row[1] and abs(row[1]) > 1e-12
+            ]
+
+        except sqlite3.Error as e:
+            self.db.logger.log_error(f"Erreur calcul positions: {e}")
+            return []
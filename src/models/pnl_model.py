@@ -0,0 +1,288 @@
+import sqlite3
+from datetime import datetime
+from src.models.database_model import DatabaseModel
+from src.utils.data_access import Query
+
+# Périodes des agrégats matérialisés
+PERIOD_HOUR = 'hour'
+PERIOD_DAY = 'day'
+ROLLUP_TABLES = {PERIOD_HOUR: 'pnl_rollup_hourly', PERIOD_DAY: 'pnl_rollup_daily'}
+
+# Colonnes des agrégats (flux additionnés d'une exécution à l'autre)
+FLOW_COLUMNS = ('trades', 'buy_quantite', 'sell_quantite', 'buy_usdc', 'sell_usdc', 'realized_pnl', 'frais')
+# Colonnes de l'état des positions (bot_id 0 : ordres passés hors bot)
+POSITION_COLUMNS = ('fk_account_id', 'bot_id', 'product_id', 'exchange', 'quantite', 'cout',
+                    'realized_pnl', 'frais', 'last_price')
+
+STATE_REBUILT_AT = 'rebuilt_at'
+
+# Schéma
+PNL_SCHEMA = (
+    """
+    CREATE TABLE IF NOT EXISTS pnl_positions (
+        fk_account_id INTEGER NOT NULL,
+        bot_id INTEGER NOT NULL,
+        product_id TEXT NOT NULL,
+        exchange TEXT,
+        quantite REAL NOT NULL,
+        cout REAL NOT NULL,
+        realized_pnl REAL NOT NULL,
+        frais REAL NOT NULL,
+        last_price REAL,
+        updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        PRIMARY KEY (fk_account_id, bot_id, product_id)
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS pnl_state (
+        key TEXT PRIMARY KEY,
+        value TEXT
+    )
+    """,
+) + tuple(
+    f"""
+    CREATE TABLE IF NOT EXISTS {table} (
+        bucket TEXT NOT NULL,
+        fk_account_id INTEGER NOT NULL,
+        bot_id INTEGER NOT NULL,
+        product_id TEXT NOT NULL,
+        {', '.join(f'{column} REAL NOT NULL' for column in FLOW_COLUMNS)},
+        PRIMARY KEY (fk_account_id, bucket, bot_id, product_id)
+    )
+    """
+    for table in ROLLUP_TABLES.values()
+)
+
+# Requêtes - Écriture
+UPSERT_POSITION = f"""
+    INSERT INTO pnl_positions ({', '.join(POSITION_COLUMNS)}, updated_at)
+    VALUES ({', '.join('?' for _ in POSITION_COLUMNS)}, CURRENT_TIMESTAMP)
+    ON CONFLICT (fk_account_id, bot_id, product_id) DO UPDATE SET
+        {', '.join(f'{column} = excluded.{column}' for column in POSITION_COLUMNS[3:])},
+        updated_at = excluded.updated_at
+"""
+ADD_FLOWS = {
+    period: f"""
+    INSERT INTO {table} (bucket, fk_account_id, bot_id, product_id, {', '.join(FLOW_COLUMNS)})
+    VALUES (?, ?, ?, ?, {', '.join('?' for _ in FLOW_COLUMNS)})
+    ON CONFLICT (fk_account_id, bucket, bot_id, product_id) DO UPDATE SET
+        {', '.join(f'{column} = {column} + excluded.{column}' for column in FLOW_COLUMNS)}
+    """
+    for period, table in ROLLUP_TABLES.items()
+}
+
+# Requêtes - Lecture
+QUERY_ALL_POSITIONS = Query(f"SELECT {', '.join(POSITION_COLUMNS)} FROM pnl_positions")
+QUERY_ACCOUNT_POSITIONS = Query(
+    """
+    SELECT product_id, SUM(quantite) AS quantite, SUM(cout) AS cout_usdc, SUM(realized_pnl) AS realized_pnl,
+           SUM(frais) AS frais, MAX(last_price) AS last_price
+    FROM pnl_positions
+    WHERE fk_account_id = ?
+    GROUP BY product_id
+    ORDER BY product_id
+    """
+)
+QUERY_ROLLUPS = {
+    period: Query(
+        f"""
+        SELECT bucket, {', '.join(f'SUM({column}) AS {column}' for column in FLOW_COLUMNS)}
+        FROM {table}
+        WHERE fk_account_id = ? AND bucket >= ?
+        GROUP BY bucket
+        ORDER BY bucket
+        """
+    )
+    for period, table in ROLLUP_TABLES.items()
+}
+QUERY_ALL_ROLLUPS = {
+    period: Query(f"SELECT bucket, fk_account_id, bot_id, product_id, {', '.join(FLOW_COLUMNS)} FROM {table}")
+    for period, table in ROLLUP_TABLES.items()
+}
+
+
+def bucket_of(timestamp, period):
+    """
+    Clé d'agrégat d'un horodatage (datetime ou texte SQLite)
+
+    Returns:
+        str: 'AAAA-MM-JJ HH:00' (heure) ou 'AAAA-MM-JJ' (jour)
+    """
+    text = str(timestamp).replace('T', ' ')
+    return f"{text[:13]}:00" if period == PERIOD_HOUR else text[:10]
+
+
+class PnlModel:
+    """Persistance des positions et agrégats de PnL (tables pnl_*)"""
+
+    _schema_ready = set()
+
+    def __init__(self, db_model=None):
+        self.db = db_model if db_model else DatabaseModel()
+        self._ensure_schema()
+
+    def _ensure_schema(self):
+        """Crée les tables pnl_* si elles n'existent pas (une seule fois par base et par session)"""
+        if self.db.db_path in PnlModel._schema_ready:
+            return
+        try:
+            for statement in PNL_SCHEMA:
+                self.db.cursor.execute(statement)
+            self.db.connection.commit()
+            PnlModel._schema_ready.add(self.db.db_path)
+        except sqlite3.Error as e:
+            self.db.logger.log_error(f"Erreur création tables PnL: {e}")
+
+    # ============================================
+    # ÉCRITURE
+    # ============================================
+
+    def save(self, positions, flows):
+        """
+        Écrit un lot incrémental dans une seule transaction
+
+        Args:
+            positions (list): Tuples dans l'ordre de POSITION_COLUMNS
+            flows (dict): {période: [(bucket, account_id, bot_id, product_id, *FLOW_COLUMNS)]}
+
+        Returns:
+            bool: True si le lot a été écrit
+        """
+        try:
+            if positions:
+                self.db.cursor.executemany(UPSERT_POSITION, positions)
+            for period, rows in flows.items():
+                if rows:
+                    self.db.cursor.executemany(ADD_FLOWS[period], rows)
+            self.db.connection.commit()
+            return True
+
+        except sqlite3.Error as e:
+            self.db.connection.rollback()
+            self.db.logger.log_error(f"Erreur écriture PnL: {e}")
+            return False
+
+    def replace_all(self, positions, flows):
+        """
+        Remplace positions et agrégats (reconstruction complète) dans une seule transaction
+
+        Returns:
+            bool: True si l'état a été remplacé
+        """
+        try:
+            self.db.cursor.execute("DELETE FROM pnl_positions")
+            for table in ROLLUP_TABLES.values():
+                self.db.cursor.execute(f"DELETE FROM {table}")
+            self.db.cursor.execute(
+                "INSERT OR REPLACE INTO pnl_state (key, value) VALUES (?, ?)",
+                (STATE_REBUILT_AT, datetime.now().strftime('%Y-%m-%d %H:%M:%S'))
+            )
+            return self.save(positions, flows)
+
+        except sqlite3.Error as e:
+            self.db.connection.rollback()
+            self.db.logger.log_error(f"Erreur reconstruction PnL: {e}")
+            return False
+
+    # ============================================
+    # LECTURE
+    # ============================================
+
+    def is_built(self):
+        """True si les tables ont été reconstruites au moins une fois (sinon elles sont incomplètes)"""
+        try:
+            self.db.cursor.execute("SELECT 1 FROM pnl_state WHERE key = ?", (STATE_REBUILT_AT,))
+            return self.db.cursor.fetchone() is not None
+        except sqlite3.Error:
+            return False
+
+    def load_positions(self):
+        """
+        Returns:
+            list: Positions de tous les comptes (dicts aux clés de POSITION_COLUMNS)
+        """
+        try:
+            return QUERY_ALL_POSITIONS.all(self.db.connection)
+        except sqlite3.Error as e:
+            self.db.logger.log_error(f"Erreur lecture positions PnL: {e}")
+            return []
+
+    def load_rollups(self, period):
+        """
+        Returns:
+            dict: {(bucket, account_id, bot_id, product_id): (flux dans l'ordre de FLOW_COLUMNS)}
+        """
+        try:
+            return {
+                (row['bucket'], row['fk_account_id'], row['bot_id'], row['product_id']):
+                    tuple(row[column] for column in FLOW_COLUMNS)
+                for row in QUERY_ALL_ROLLUPS[period].all(self.db.connection)
+            }
+        except sqlite3.Error as e:
+            self.db.logger.log_error(f"Erreur lecture agrégats PnL: {e}")
+            return {}
+
+    def get_positions(self, account_id):
+        """
+        Positions d'un compte par produit (tous bots confondus)
+
+        Args:
+            account_id (int): ID du compte utilisateur
+
+        Returns:
+            list or None: [{'product_id', 'quantite', 'cout_usdc', 'realized_pnl', 'frais', 'last_price'}]
+                (positions non nulles), None si les tables n'ont jamais été construites
+        """
+        if not self.is_built():
+            return None
+        try:
+            return [
+                row for row in QUERY_ACCOUNT_POSITIONS.all(self.db.connection, (account_id,))
+                if row['quantite'] and abs(row['quantite']) > 1e-12
+            ]
+        except sqlite3.Error as e:
+            self.db.logger.log_error(f"Erreur lecture positions PnL: {e}")
+            return None
+
+    def get_account_pnl(self, account_id):
+        """
+        Totaux du compte : PnL réalisé, latent, frais et exposition
+
+        Returns:
+            dict: {'realized_pnl', 'unrealized_pnl', 'frais', 'exposure'}
+                (PnL latent et exposition sur les positions dont le prix est connu)
+        """
+        totals = {'realized_pnl': 0.0, 'unrealized_pnl': 0.0, 'frais': 0.0, 'exposure': 0.0}
+        try:
+            self.db.cursor.execute(
+                """
+                SELECT COALESCE(SUM(realized_pnl), 0), COALESCE(SUM(frais), 0),
+                       COALESCE(SUM(quantite * last_price - cout), 0), COALESCE(SUM(quantite * last_price), 0)
+                FROM pnl_positions
+                WHERE fk_account_id = ?
+                """,
+                (account_id,)
+            )
+            row = self.db.cursor.fetchone()
+            totals.update(realized_pnl=row[0], frais=row[1], unrealized_pnl=row[2], exposure=row[3])
+        except sqlite3.Error as e:
+            self.db.logger.log_error(f"Erreur lecture PnL du compte: {e}")
+        return totals
+
+    def get_rollups(self, account_id, period=PERIOD_DAY, since=''):
+        """
+        Agrégats matérialisés d'un compte (tous bots et produits confondus)
+
+        Args:
+            account_id (int): ID du compte utilisateur
+            period (str): PERIOD_HOUR ou PERIOD_DAY
+            since (str): Premier bucket inclus ('AAAA-MM-JJ' ...)
+
+        Returns:
+            list: [{'bucket', 'trades', 'buy_quantite', ..., 'realized_pnl', 'frais'}]
+        """
+        try:
+            return QUERY_ROLLUPS[period].all(self.db.connection, (account_id, since))
+        except sqlite3.Error as e:
+            self.db.logger.log_error(f"Erreur lecture agrégats PnL: {e}")
+            return []
@@ -0,0 +1,390 @@
+"""
+Catalogue des produits (paires) par exchange
+
+Le catalogue est chargé une seule fois par processus depuis un index local
+compact (`datas/catalog/<exchange>.json`), synchronisé depuis l'API de
+l'exchange et rafraîchi en arrière-plan. Les mises à jour sont
+incrémentales : seuls les produits ajoutés, modifiés ou retirés sont
+appliqués, et l'index n'est réécrit que s'il a changé.
+"""
+import bisect
+import difflib
+import json
+import os
+import threading
+import time
+
+# Constantes - Chemins
+_PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+CATALOG_DIR = os.path.join(_PROJECT_ROOT, 'datas', 'catalog')
+SEED_FILE = os.path.join(_PROJECT_ROOT, 'datas', 'coinbase_cryptos_list.json')
+
+# Constantes - Format de l'index
+INDEX_VERSION = 1
+INDEX_FIELDS = (
+    'product_id', 'base', 'quote', 'base_increment', 'quote_increment',
+    'base_min_size', 'min_market_funds', 'status'
+)
+
+# Constantes - Rafraîchissement
+DEFAULT_REFRESH_INTERVAL = 3600
+DEFAULT_SEARCH_LIMIT = 20
+
+# Constantes - Messages de log
+LOG_INDEX_LOADED = "✓ Catalogue {exchange}: {count} produits chargés depuis l'index"
+LOG_INDEX_ERROR = "✗ Erreur lecture index catalogue {exchange}: {error}"
+LOG_SEED_LOADED = "✓ Catalogue {exchange}: {count} produits chargés depuis {path}"
+LOG_SYNC_DONE = "✓ Catalogue {exchange} synchronisé: +{added} ~{changed} -{removed}"
+LOG_SYNC_FAILED = "⚠ Synchronisation du catalogue {exchange} impossible"
+LOG_WRITE_ERROR = "✗ Erreur écriture index catalogue {exchange}: {error}"
+
+# Noms usuels des devises (complétés par le fichier seed)
+CURRENCY_NAMES = {
+    'BTC': 'Bitcoin', 'ETH': 'Ethereum', 'USDC': 'USD Coin', 'USDT': 'Tether',
+    'USD': 'US Dollar', 'EUR': 'Euro', 'SOL': 'Solana', 'ADA': 'Cardano',
+    'XRP': 'XRP', 'DOGE': 'Dogecoin', 'DOT': 'Polkadot', 'LTC': 'Litecoin',
+    'LINK': 'Chainlink', 'AVAX': 'Avalanche', 'MATIC': 'Polygon', 'ATOM': 'Cosmos'
+}
+
+
+class Product:
+    """Produit (paire) d'un exchange"""
+
+    __slots__ = INDEX_FIELDS
+
+    def __init__(self, product_id, base, quote, base_increment=0.0, quote_increment=0.0,
+                 base_min_size=0.0, min_market_funds=0.0, status='online'):
+        self.product_id = product_id
+        self.base = base
+        self.quote = quote
+        self.base_increment = base_increment
+        self.quote_increment = quote_increment
+        self.base_min_size = base_min_size
+        self.min_market_funds = min_market_funds
+        self.status = status
+
+    @classmethod
+    def from_dict(cls, data):
+        return cls(*(data.get(field) for field in INDEX_FIELDS))
+
+    def to_row(self):
+        return [getattr(self, field) for field in INDEX_FIELDS]
+
+    def to_dict(self):
+        return dict(zip(INDEX_FIELDS, self.to_row()))
+
+    @property
+    def is_tradable(self):
+        return self.status == 'online'
+
+
+class _ExchangeCatalog:
+    """Produits d'un exchange + index de recherche"""
+
+    def __init__(self, exchange_name):
+        self.exchange_name = exchange_name
+        self.products = {}          # {product_id: Product}
+        self.names = {}             # {symbole: nom complet}
+        self.synced_at = None
+        self._search_keys = []      # [(clé minuscule, symbole)] triée
+        self._symbols = []
+
+    def rebuild_index(self):
+        symbols = set()
+        for product in self.products.values():
+            symbols.add(product.base)
+            symbols.add(product.quote)
+        self._symbols = sorted(symbols)
+
+        keys = []
+        for symbol in self._symbols:
+            keys.append((symbol.lower(), symbol))
+            name = self.names.get(symbol) or CURRENCY_NAMES.get(symbol)
+            if name and name.lower() != symbol.lower():
+                keys.append((name.lower(), symbol))
+        keys.sort()
+        self._search_keys = keys
+
+    @property
+    def symbols(self):
+        return self._symbols
+
+    def prefix_search(self, prefix, limit):
+        prefix = prefix.lower()
+        start = bisect.bisect_left(self._search_keys, (prefix, ''))
+        results = []
+        seen = set()
+        for key, symbol in self._search_keys[start:]:
+            if not key.startswith(prefix):
+                break
+            if symbol not in seen:
+                seen.add(symbol)
+                results.append(symbol)
+                if len(results) >= limit:
+                    break
+        return results
+
+
+def _is_subsequence(needle, haystack):
+    it = iter(haystack)
+    return all(char in it for char in needle)
+
+
+class ProductCatalog:
+    """Catalogue de produits partagé par tout le processus (voir get_catalog())"""
+
+    def __init__(self, catalog_dir=CATALOG_DIR):
+        self.catalog_dir = catalog_dir
+        self._catalogs = {}
+        self._lock = threading.RLock()
+        self._refresh_threads = {}
+        self._stop_event = threading.Event()
+
+    # ============================================
+    # CHARGEMENT
+    # ============================================
+
+    def _index_path(self, exchange_name):
+        return os.path.join(self.catalog_dir, f"{exchange_name}.json")
+
+    def _get(self, exchange_name):
+        """Retourne le catalogue d'un exchange, chargé au premier accès"""
+        exchange_name = exchange_name.lower()
+        catalog = self._catalogs.get(exchange_name)
+        if catalog is not None:
+            return catalog
+
+        with self._lock:
+            catalog = self._catalogs.get(exchange_name)
+            if catalog is None:
+                catalog = _ExchangeCatalog(exchange_name)
+                if not self._load_index(catalog):
+                    self._load_seed(catalog)
+                catalog.rebuild_index()
+                self._catalogs[exchange_name] = catalog
+        return catalog
+
+    def _load_index(self, catalog):
+        path = self._index_path(catalog.exchange_name)
+        if not os.path.exists(path):
+            return False
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            if data.get('version') != INDEX_VERSION:
+                return False
+            fields = data['fields']
+            for row in data['rows']:
+                product = Product.from_dict(dict(zip(fields, row)))
+                catalog.products[product.product_id] = product
+            catalog.names = data.get('names', {})
+            catalog.synced_at = data.get('synced_at')
+            print(LOG_INDEX_LOADED.format(exchange=catalog.exchange_name, count=len(catalog.products)))
+            return True
+        except (IOError, ValueError, KeyError, TypeError) as e:
+            print(LOG_INDEX_ERROR.format(exchange=catalog.exchange_name, error=e))
+            catalog.products = {}
+            return False
+
+    def _load_seed(self, catalog):
+        """Charge le fichier statique historique (avant la première synchronisation)"""
+        if not os.path.exists(SEED_FILE):
+            return
+        try:
+            with open(SEED_FILE, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            if data.get('exchange', 'coinbase') != catalog.exchange_name:
+                return
+            for crypto in data.get('cryptos', []):
+                symbol = crypto.get('symbol', '').upper()
+                product_id = crypto.get('product_id', '')
+                if not symbol or '-' not in product_id:
+                    continue
+                base, quote = product_id.split('-', 1)
+                catalog.products[product_id] = Product(product_id, base, quote)
+                catalog.names[symbol] = crypto.get('name', symbol)
+            print(LOG_SEED_LOADED.format(exchange=catalog.exchange_name,
+                                         count=len(catalog.products), path=SEED_FILE))
+        except (IOError, ValueError) as e:
+            print(LOG_INDEX_ERROR.format(exchange=catalog.exchange_name, error=e))
+
+    def _write_index(self, catalog):
+        """Écrit l'index de façon atomique (fichier temporaire puis remplacement)"""
+        path = self._index_path(catalog.exchange_name)
+        tmp_path = path + '.tmp'
+        try:
+            os.makedirs(self.catalog_dir, exist_ok=True)
+            data = {
+                'version': INDEX_VERSION,
+                'exchange': catalog.exchange_name,
+                'synced_at': catalog.synced_at,
+                'fields': list(INDEX_FIELDS),
+                'names': catalog.names,
+                'rows': [catalog.products[pid].to_row() for pid in sorted(catalog.products)]
+            }
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(data, f, separators=(',', ':'))
+            os.replace(tmp_path, path)
+        except (IOError, OSError) as e:
+            print(LOG_WRITE_ERROR.format(exchange=catalog.exchange_name, error=e))
+
+    # ============================================
+    # SYNCHRONISATION
+    # ============================================
+
+    def sync(self, exchange_name, exchange_model):
+        """
+        Synchronise le catalogue depuis l'API de l'exchange (diff incrémental)
+
+        Args:
+            exchange_name (str): Nom technique de l'exchange
+            exchange_model (ExchangeBase): Adapter fournissant get_products()
+
+        Returns:
+            dict or None: {'added', 'changed', 'removed'} ou None si échec
+        """
+        remote = exchange_model.get_products() if exchange_model else None
+        if not remote:
+            print(LOG_SYNC_FAILED.format(exchange=exchange_name))
+            return None
+
+        catalog = self._get(exchange_name)
+        incoming = {}
+        for data in remote:
+            if data.get('product_id'):
+                incoming[data['product_id']] = Product.from_dict(data)
+
+        with self._lock:
+            current = catalog.products
+            added = [pid for pid in incoming if pid not in current]
+            removed = [pid for pid in current if pid not in incoming]
+            changed = [
+                pid for pid, product in incoming.items()
+                if pid in current and current[pid].to_row() != product.to_row()
+            ]
+
+            if added or removed or changed:
+                products = dict(current)
+                for pid in removed:
+                    del products[pid]
+                for pid in added + changed:
+                    products[pid] = incoming[pid]
+                # Remplacement atomique : les lecteurs voient l'ancien ou le nouveau dict
+                catalog.products = products
+                catalog.rebuild_index()
+
+            catalog.synced_at = time.time()
+            if added or removed or changed or not os.path.exists(self._index_path(catalog.exchange_name)):
+                self._write_index(catalog)
+
+        print(LOG_SYNC_DONE.format(exchange=exchange_name, added=len(added),
+                                   changed=len(changed), removed=len(removed)))
+        return {'added': added, 'changed': changed, 'removed': removed}
+
+    def start_background_refresh(self, exchange_name, exchange_model, interval=DEFAULT_REFRESH_INTERVAL):
+        """
+        Lance (une seule fois par exchange) un thread de rafraîchissement périodique
+
+        Le premier rafraîchissement est immédiat si l'index n'a jamais été
+        synchronisé ou s'il est plus ancien que `interval`.
+        """
+        exchange_name = exchange_name.lower()
+        with self._lock:
+            thread = self._refresh_threads.get(exchange_name)
+            if thread is not None and thread.is_alive():
+                return
+
+            def _loop():
+                catalog = self._get(exchange_name)
+                age = time.time() - (catalog.synced_at or 0)
+                delay = 0 if age >= interval else interval - age
+                while not self._stop_event.wait(delay):
+                    self.sync(exchange_name, exchange_model)
+                    delay = interval
+
+            thread = threading.Thread(target=_loop, daemon=True, name=f"catalog-refresh-{exchange_name}")
+            self._refresh_threads[exchange_name] = thread
+            thread.start()
+
+    def stop(self):
+        self._stop_event.set()
+
+    # ============================================
+    # LECTURE / RECHERCHE
+    # ============================================
+
+    def get_symbols(self, exchange_name='coinbase'):
+        """Liste triée des devises (bases et cotations) de l'exchange"""
+        return list(self._get(exchange_name).symbols)
+
+    def get_products(self, exchange_name='coinbase', tradable_only=False):
+        products = self._get(exchange_name).products.values()
+        return [p for p in products if p.is_tradable] if tradable_only else list(products)
+
+    def get_product(self, product_id, exchange_name='coinbase'):
+        return self._get(exchange_name).products.get(product_id)
+
+    def get_name(self, symbol, exchange_name='coinbase'):
+        symbol = symbol.upper()
+        return self._get(exchange_name).names.get(symbol) or CURRENCY_NAMES.get(symbol, symbol)
+
+    def find_product(self, base, quote, exchange_name='coinbase'):
+        return self._get(exchange_name).products.get(f"{base.upper()}-{quote.upper()}")
+
+    def search(self, query, exchange_name='coinbase', limit=DEFAULT_SEARCH_LIMIT):
+        """
+        Recherche de devises pour l'autocomplétion
+
+        Les correspondances par préfixe (symbole ou nom) viennent en premier,
+        puis les correspondances approximatives (sous-séquence, puis similarité).
+
+        Args:
+            query (str): Texte saisi
+            exchange_name (str): Nom technique de l'exchange
+            limit (int): Nombre maximum de résultats
+
+        Returns:
+            list: Symboles correspondants
+        """
+        catalog = self._get(exchange_name)
+        query = (query or '').strip()
+        if not query:
+            return catalog.symbols[:limit]
+
+        results = catalog.prefix_search(query, limit)
+        if len(results) >= limit:
+            return results
+
+        seen = set(results)
+        needle = query.lower()
+        for key, symbol in catalog._search_keys:
+            if symbol not in seen and _is_subsequence(needle, key):
+                seen.add(symbol)
+                results.append(symbol)
+                if len(results) >= limit:
+                    return results
+
+        keys = [key for key, _ in catalog._search_keys]
+        key_to_symbol = dict(catalog._search_keys)
+        for key in difflib.get_close_matches(needle, keys, n=limit, cutoff=0.6):
+            symbol = key_to_symbol[key]
+            if symbol not in seen:
+                seen.add(symbol)
+                results.append(symbol)
+                if len(results) >= limit:
+                    break
+        return results
+
+
+_catalog = None
+_catalog_lock = threading.Lock()
+
+
+def get_catalog():
+    """Retourne le catalogue partagé du processus"""
+    global _catalog
+    if _catalog is None:
+        with _catalog_lock:
+            if _catalog is None:
+                _catalog = ProductCatalog()
+    return _catalog
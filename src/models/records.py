@@ -0,0 +1,154 @@
+"""
+Enregistrements compacts du domaine : Bot, Order, Ticker, Candle, ActivityLog
+
+Des classes à __slots__ plutôt que des dicts : pas de dictionnaire par
+instance (mémoire divisée par 2 à 4 selon le nombre de champs) et un accès
+aux attributs par descripteur. Elles restent lisibles comme des dicts
+(bot['product_id'], bot.get(...)) : vues et contrôleurs acceptent
+indifféremment l'un ou l'autre.
+
+Conversions :
+    Cls.from_row(row)    ligne SQLite / tuple dans l'ordre des champs
+    Cls.from_dict(d)     dict (clés absentes : valeur par défaut, clés en trop ignorées)
+    obj.to_row()         tuple dans l'ordre des champs
+    obj.to_dict()        dict
+    obj.to_json() / Cls.from_json(text)
+"""
+import json
+from src.utils.data_access import RecordBase
+
+
+class DomainRecord(RecordBase):
+    """Base des enregistrements du domaine (conversions lignes, dicts, JSON)"""
+
+    __slots__ = ()
+
+    @classmethod
+    def from_row(cls, row):
+        return cls(*row)
+
+    @classmethod
+    def from_dict(cls, data):
+        return cls(**{field: data[field] for field in cls._fields if field in data})
+
+    @classmethod
+    def from_json(cls, text):
+        return cls.from_dict(json.loads(text))
+
+    def to_row(self):
+        return tuple(getattr(self, field) for field in self._fields)
+
+    def to_json(self):
+        # Dates SQLite (datetime) sérialisées en texte ISO
+        return json.dumps(self.to_dict(), default=str)
+
+
+class Bot(DomainRecord):
+    """Bot de trading (format BotModel.get_user_bots)"""
+
+    __slots__ = _fields = (
+        'bot_id', 'crypto_source', 'crypto_target', 'product_id', 'prix_achat_cible',
+        'pourcentage_gain', 'montant_trade', 'type_ordre', 'is_active', 'created_at',
+        'exchange_name', 'exchange_id', 'exchange'
+    )
+
+    def __init__(self, bot_id: int, crypto_source: str = None, crypto_target: str = None,
+                 product_id: str = None, prix_achat_cible: float = None, pourcentage_gain: float = 0.0,
+                 montant_trade: float = 0.0, type_ordre: str = 'Market', is_active: int = 0,
+                 created_at=None, exchange_name: str = None, exchange_id: int = None, exchange: str = None):
+        self.bot_id = bot_id
+        self.crypto_source = crypto_source
+        self.crypto_target = crypto_target
+        self.product_id = product_id
+        self.prix_achat_cible = prix_achat_cible
+        self.pourcentage_gain = pourcentage_gain
+        self.montant_trade = montant_trade
+        self.type_ordre = type_ordre
+        self.is_active = is_active
+        self.created_at = created_at
+        self.exchange_name = exchange_name
+        self.exchange_id = exchange_id
+        self.exchange = exchange
+
+
+class Order(DomainRecord):
+    """Ordre persisté (format OrderModel.get_user_orders)"""
+
+    __slots__ = _fields = (
+        'order_id', 'bot_id', 'account_id', 'exchange_id', 'exchange_name', 'product_id', 'side',
+        'order_type', 'prix_limite', 'prix_execution', 'quantite', 'montant_usdc', 'quantite_executee',
+        'montant_execute', 'frais', 'status', 'order_id_exchange', 'created_at', 'executed_at'
+    )
+
+    def __init__(self, order_id: int, bot_id: int = None, account_id: int = None, exchange_id: int = None,
+                 exchange_name: str = None, product_id: str = None, side: str = None,
+                 order_type: str = None, prix_limite: float = None, prix_execution: float = None,
+                 quantite: float = None, montant_usdc: float = None, quantite_executee: float = None,
+                 montant_execute: float = None, frais: float = None, status: str = None,
+                 order_id_exchange: str = None, created_at=None, executed_at=None):
+        self.order_id = order_id
+        self.bot_id = bot_id
+        self.account_id = account_id
+        self.exchange_id = exchange_id
+        self.exchange_name = exchange_name
+        self.product_id = product_id
+        self.side = side
+        self.order_type = order_type
+        self.prix_limite = prix_limite
+        self.prix_execution = prix_execution
+        self.quantite = quantite
+        self.montant_usdc = montant_usdc
+        self.quantite_executee = quantite_executee
+        self.montant_execute = montant_execute
+        self.frais = frais
+        self.status = status
+        self.order_id_exchange = order_id_exchange
+        self.created_at = created_at
+        self.executed_at = executed_at
+
+
+class Ticker(DomainRecord):
+    """Dernier prix d'un produit (format get_product_ticker, plus le produit)"""
+
+    __slots__ = _fields = ('product_id', 'price', 'bid', 'ask', 'volume', 'time')
+
+    def __init__(self, product_id: str, price: float = None, bid: float = None, ask: float = None,
+                 volume: float = None, time=None):
+        self.product_id = product_id
+        self.price = price
+        self.bid = bid
+        self.ask = ask
+        self.volume = volume
+        self.time = time
+
+    @classmethod
+    def from_ticker(cls, product_id, ticker):
+        """Convertit un ticker d'adapter {price, bid, ask, volume, time}"""
+        return cls(product_id, ticker.get('price'), ticker.get('bid'), ticker.get('ask'),
+                   ticker.get('volume'), ticker.get('time'))
+
+
+class Candle(DomainRecord):
+    """Bougie OHLCV (ordre des champs de l'API Coinbase : time, low, high, open, close, volume)"""
+
+    __slots__ = _fields = ('time', 'low', 'high', 'open', 'close', 'volume')
+
+    def __init__(self, time: float, low: float, high: float, open: float, close: float, volume: float = 0.0):
+        self.time = time
+        self.low = low
+        self.high = high
+        self.open = open
+        self.close = close
+        self.volume = volume
+
+
+class ActivityLog(DomainRecord):
+    """Entrée de l'historique d'activité (format DatabaseModel.get_activity_logs)"""
+
+    __slots__ = _fields = ('log_id', 'action_type', 'description', 'created_at')
+
+    def __init__(self, log_id: int, action_type: str = None, description: str = None, created_at=None):
+        self.log_id = log_id
+        self.action_type = action_type
+        self.description = description
+        self.created_at = created_at
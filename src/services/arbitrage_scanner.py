@@ -0,0 +1,298 @@
+"""
+Détection d'opportunités d'arbitrage
+
+Deux familles de cycles sont surveillées :
+    - triangulaires, à l'intérieur d'un exchange
+      (ex: USDC → BTC → ETH → USDC via BTC-USDC, ETH-BTC, ETH-USDC)
+    - inter-exchanges : acheter un produit sur une venue et le revendre sur
+      une autre, frais compris
+
+Les cycles sont énumérés une seule fois à partir du catalogue de produits
+puis indexés par (exchange, product_id) : un tick ne réévalue que les
+cycles qui contiennent le produit qui vient de bouger.
+"""
+import threading
+from src.services.price_aggregator import DEFAULT_TAKER_FEES
+
+# Constantes - Seuils
+MIN_PROFIT = 0.001
+
+# Types d'opportunités
+TYPE_TRIANGULAR = 'triangular'
+TYPE_CROSS = 'cross_exchange'
+
+# Constantes - Messages de log
+LOG_CYCLES_BUILT = "✓ Arbitrage {exchange}: {products} produits, {cycles} cycles triangulaires"
+LOG_LISTENER_ERROR = "✗ Erreur écouteur arbitrage: {error}"
+
+
+class Cycle:
+    """Cycle triangulaire précompilé (jambes prêtes à évaluer)"""
+
+    __slots__ = ('exchange', 'currencies', 'legs')
+
+    def __init__(self, exchange, currencies, legs):
+        self.exchange = exchange
+        self.currencies = currencies    # ('USDC', 'BTC', 'ETH')
+        self.legs = legs                # ((clé prix, achat ?, multiplicateur de frais), ...)
+
+    def describe(self):
+        return [
+            {'product_id': key[1], 'side': 'buy' if is_buy else 'sell'}
+            for key, is_buy, _ in self.legs
+        ]
+
+
+class ArbitrageScanner:
+    """Scanner incrémental de cycles d'arbitrage"""
+
+    def __init__(self, taker_fees=None, min_profit=MIN_PROFIT):
+        """
+        Args:
+            taker_fees (dict, optional): {exchange: frais taker}
+            min_profit (float): Rendement minimum d'un cycle (0.001 = 0.1 %)
+        """
+        self.taker_fees = dict(DEFAULT_TAKER_FEES)
+        if taker_fees:
+            self.taker_fees.update(taker_fees)
+        self.min_profit = min_profit
+
+        self._prices = {}               # {(exchange, product_id): (bid, ask)}
+        self._products = {}             # {exchange: {product_id: (base, quote)}}
+        self._cycles_by_key = {}        # {(exchange, product_id): [Cycle]}
+        self._venues = {}               # {product_id: set(exchange)}
+        self._listeners = []
+        self._lock = threading.Lock()
+
+    # ============================================
+    # CONSTRUCTION DU GRAPHE
+    # ============================================
+
+    def load_from_catalog(self, exchange_name, catalog=None):
+        """
+        Charge les produits tradables d'un exchange depuis le catalogue
+
+        Returns:
+            int: Nombre de cycles triangulaires indexés
+        """
+        if catalog is None:
+            from src.models.product_catalog import get_catalog
+            catalog = get_catalog()
+        products = catalog.get_products(exchange_name, tradable_only=True)
+        return self.set_products(exchange_name, [(p.product_id, p.base, p.quote) for p in products])
+
+    def set_products(self, exchange, products):
+        """
+        Définit les produits d'un exchange et (ré)indexe ses cycles
+
+        Args:
+            exchange (str): Nom de l'exchange
+            products (list): Tuples (product_id, base, quote)
+
+        Returns:
+            int: Nombre de cycles triangulaires indexés
+        """
+        exchange = exchange.lower()
+        with self._lock:
+            for product_id in self._products.get(exchange, {}):
+                self._cycles_by_key.pop((exchange, product_id), None)
+                venues = self._venues.get(product_id)
+                if venues:
+                    venues.discard(exchange)
+
+            self._products[exchange] = {product_id: (base, quote) for product_id, base, quote in products}
+            for product_id in self._products[exchange]:
+                self._venues.setdefault(product_id, set()).add(exchange)
+
+            cycles = self._build_triangles(exchange)
+            for cycle in cycles:
+                for key, _, _ in cycle.legs:
+                    self._cycles_by_key.setdefault(key, []).append(cycle)
+
+        print(LOG_CYCLES_BUILT.format(exchange=exchange, products=len(products), cycles=len(cycles)))
+        return len(cycles)
+
+    def _build_triangles(self, exchange):
+        """Énumère les triangles de devises et leurs deux sens de parcours"""
+        fee_multiplier = 1.0 - self.taker_fees.get(exchange, 0.0)
+        pairs = {}          # {(devise, devise): product_id}
+        neighbours = {}     # {devise: set(devise)}
+        for product_id, (base, quote) in self._products[exchange].items():
+            pairs[(base, quote)] = product_id
+            pairs[(quote, base)] = product_id
+            neighbours.setdefault(base, set()).add(quote)
+            neighbours.setdefault(quote, set()).add(base)
+
+        def leg(source, target):
+            product_id = pairs[(source, target)]
+            base, _ = self._products[exchange][product_id]
+            # Obtenir la devise de base = acheter (au ask), sinon vendre (au bid)
+            return ((exchange, product_id), base == target, fee_multiplier)
+
+        cycles = []
+        for a in sorted(neighbours):
+            for b in neighbours[a]:
+                if b <= a:
+                    continue
+                for c in neighbours[a] & neighbours[b]:
+                    if c <= b:
+                        continue
+                    for path in ((a, b, c), (a, c, b)):
+                        legs = (leg(path[0], path[1]), leg(path[1], path[2]), leg(path[2], path[0]))
+                        cycles.append(Cycle(exchange, path, legs))
+        return cycles
+
+    def add_listener(self, callback):
+        """
+        Abonne un écouteur aux opportunités détectées
+
+        Args:
+            callback (callable): callback(opportunity)
+        """
+        self._listeners.append(callback)
+
+    def attach(self, aggregator):
+        """Branche le scanner sur les ticks d'un PriceAggregator"""
+        aggregator.add_listener(
+            lambda product_id, exchange, bid, ask: self.on_tick(exchange, product_id, bid, ask)
+        )
+
+    # ============================================
+    # ÉVALUATION INCRÉMENTALE
+    # ============================================
+
+    def _cycle_rate(self, cycle):
+        """Multiplicateur obtenu en parcourant le cycle (None si un prix manque)"""
+        prices = self._prices
+        rate = 1.0
+        for key, is_buy, fee_multiplier in cycle.legs:
+            quote = prices.get(key)
+            if quote is None:
+                return None
+            if is_buy:
+                ask = quote[1]
+                if not ask:
+                    return None
+                rate *= fee_multiplier / ask
+            else:
+                bid = quote[0]
+                if not bid:
+                    return None
+                rate *= bid * fee_multiplier
+        return rate
+
+    def _cross_opportunities(self, exchange, product_id, bid, ask):
+        opportunities = []
+        fee = self.taker_fees.get(exchange, 0.0)
+        for other in self._venues.get(product_id, ()):
+            if other == exchange:
+                continue
+            quote = self._prices.get((other, product_id))
+            if quote is None:
+                continue
+            other_bid, other_ask = quote
+            other_fee = self.taker_fees.get(other, 0.0)
+
+            # Acheter ici, vendre là-bas ; puis l'inverse
+            for buy_on, buy_price, buy_fee, sell_on, sell_price, sell_fee in (
+                (exchange, ask, fee, other, other_bid, other_fee),
+                (other, other_ask, other_fee, exchange, bid, fee)
+            ):
+                if not buy_price or not sell_price:
+                    continue
+                profit = sell_price * (1 - sell_fee) / (buy_price * (1 + buy_fee)) - 1
+                if profit > self.min_profit:
+                    opportunities.append({
+                        'type': TYPE_CROSS,
+                        'product_id': product_id,
+                        'buy_exchange': buy_on,
+                        'buy_price': buy_price,
+                        'sell_exchange': sell_on,
+                        'sell_price': sell_price,
+                        'profit': profit
+                    })
+        return opportunities
+
+    def on_tick(self, exchange, product_id, bid, ask):
+        """
+        Met à jour un prix et réévalue uniquement les cycles concernés
+
+        Args:
+            exchange (str): Nom de l'exchange
+            product_id (str): Produit BASE-QUOTE
+            bid (float): Meilleur prix acheteur
+            ask (float): Meilleur prix vendeur
+
+        Returns:
+            list: Opportunités rentables détectées par ce tick
+        """
+        key = (exchange, product_id)
+        threshold = 1.0 + self.min_profit
+        opportunities = []
+
+        with self._lock:
+            if key not in self._prices:
+                self._venues.setdefault(product_id, set()).add(exchange)
+            self._prices[key] = (bid, ask)
+
+            for cycle in self._cycles_by_key.get(key, ()):
+                rate = self._cycle_rate(cycle)
+                if rate is not None and rate > threshold:
+                    opportunities.append({
+                        'type': TYPE_TRIANGULAR,
+                        'exchange': cycle.exchange,
+                        'currencies': cycle.currencies,
+                        'legs': cycle.describe(),
+                        'profit': rate - 1.0
+                    })
+
+            if len(self._venues.get(product_id, ())) > 1:
+                opportunities.extend(self._cross_opportunities(exchange, product_id, bid, ask))
+
+        for opportunity in opportunities:
+            for callback in self._listeners:
+                try:
+                    callback(opportunity)
+                except Exception as e:
+                    print(LOG_LISTENER_ERROR.format(error=e))
+        return opportunities
+
+    def scan_all(self):
+        """
+        Évalue tous les cycles (vérification complète, hors chemin critique)
+
+        Returns:
+            list: Opportunités rentables, meilleures d'abord
+        """
+        opportunities = []
+        threshold = 1.0 + self.min_profit
+        with self._lock:
+            seen = set()
+            for cycles in self._cycles_by_key.values():
+                for cycle in cycles:
+                    if id(cycle) in seen:
+                        continue
+                    seen.add(id(cycle))
+                    rate = self._cycle_rate(cycle)
+                    if rate is not None and rate > threshold:
+                        opportunities.append({
+                            'type': TYPE_TRIANGULAR,
+                            'exchange': cycle.exchange,
+                            'currencies': cycle.currencies,
+                            'legs': cycle.describe(),
+                            'profit': rate - 1.0
+                        })
+            for (exchange, product_id), (bid, ask) in self._prices.items():
+                if len(self._venues.get(product_id, ())) > 1:
+                    # Chaque paire de venues est vue deux fois : ne garder qu'un sens par exchange source
+                    opportunities.extend(
+                        o for o in self._cross_opportunities(exchange, product_id, bid, ask)
+                        if o['buy_exchange'] == exchange
+                    )
+
+        opportunities.sort(key=lambda o: o['profit'], reverse=True)
+        return opportunities
+
+    def cycle_count(self):
+        """Nombre de cycles triangulaires indexés"""
+        return len({id(cycle) for cycles in self._cycles_by_key.values() for cycle in cycles})
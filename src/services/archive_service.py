@@ -0,0 +1,492 @@
+"""
+Cycle de vie des données : archivage mensuel des ordres et de l'historique d'activité
+
+Les lignes plus anciennes que la rétention (ordres terminés uniquement,
+tout l'historique d'activité) quittent la base principale pour une base
+de partition par mois, rangée à côté d'elle :
+datas/archives/cointrader_AAAA_MM.db. La base principale garde :
+    - les lignes récentes (et les ordres encore actifs, quel que soit leur âge)
+    - archive_partitions       catalogue des partitions et de leurs volumes
+    - orders_rollup_monthly    agrégats mensuels des ordres archivés
+    - activity_rollup_monthly  agrégats mensuels de l'historique archivé
+
+Chaque mois est déplacé dans une transaction unique (copie, agrégats,
+suppression) avec la partition attachée (ATTACH) ; les lectures
+d'historique attachent à la demande les partitions nécessaires, de la plus
+récente à la plus ancienne, et s'arrêtent dès que la limite demandée est
+atteinte.
+
+Usage:
+    python -m src.services.archive_service [--days 90] [--vacuum] [--db datas/cointrader.db]
+"""
+import argparse
+import os
+import sqlite3
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+from src.models.database_model import DatabaseModel, migrate_orders_columns
+from src.models.order_model import TERMINAL_STATUSES
+from src.models.records import ActivityLog, Order
+from src.utils.data_access import Query
+
+# Constantes - Archivage
+DEFAULT_RETENTION_DAYS = 90
+ARCHIVE_DIR_NAME = 'archives'
+PARTITION_FILE = 'cointrader_{year}_{month}.db'
+ARCHIVE_SCHEMA = 'archive'
+ARCHIVE_INTERVAL = 24 * 3600.0
+
+# Constantes - Messages de log
+LOG_MONTH_ARCHIVED = "✓ Archivage {month}: {orders} ordres, {logs} entrées d'activité"
+LOG_NOTHING_TO_ARCHIVE = "✓ Archivage : aucune ligne de plus de {days} jours"
+LOG_ARCHIVE_ERROR = "✗ Erreur archivage {month}: {error}"
+LOG_VACUUM = "✓ Base principale compactée ({before:,} → {after:,} octets)"
+
+# Colonnes copiées telles quelles dans les partitions
+ORDER_COLUMNS = ('order_id, bot_id, fk_account_id, fk_exchange_id, product_id, type, order_type, prix_limite, '
+                 'prix_execution, quantite, montant_usdc, quantite_executee, montant_execute, frais, status, '
+                 'order_id_exchange, created_at, executed_at')
+ACTIVITY_COLUMNS = 'log_id, fk_account_id, action_type, description, created_at'
+
+# Schéma - Base principale
+MAIN_SCHEMA = (
+    "CREATE INDEX IF NOT EXISTS idx_orders_created_at ON orders(created_at)",
+    "CREATE INDEX IF NOT EXISTS idx_activity_logs_created_at ON activity_logs(created_at)",
+    """
+    CREATE TABLE IF NOT EXISTS archive_partitions (
+        month TEXT PRIMARY KEY,
+        file_name TEXT NOT NULL,
+        orders INTEGER NOT NULL DEFAULT 0,
+        activity_logs INTEGER NOT NULL DEFAULT 0,
+        archived_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS orders_rollup_monthly (
+        month TEXT NOT NULL,
+        fk_account_id INTEGER NOT NULL,
+        product_id TEXT NOT NULL,
+        type TEXT NOT NULL,
+        status TEXT NOT NULL,
+        order_count INTEGER NOT NULL,
+        quantite REAL NOT NULL,
+        montant_usdc REAL NOT NULL,
+        frais REAL NOT NULL,
+        PRIMARY KEY (month, fk_account_id, product_id, type, status)
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS activity_rollup_monthly (
+        month TEXT NOT NULL,
+        fk_account_id INTEGER NOT NULL,
+        action_type TEXT NOT NULL,
+        log_count INTEGER NOT NULL,
+        PRIMARY KEY (month, fk_account_id, action_type)
+    )
+    """,
+)
+
+# Schéma - Partition (mêmes colonnes, sans clés étrangères)
+PARTITION_SCHEMA = (
+    """
+    CREATE TABLE IF NOT EXISTS {schema}.orders (
+        order_id INTEGER PRIMARY KEY,
+        bot_id INTEGER,
+        fk_account_id INTEGER NOT NULL,
+        fk_exchange_id INTEGER NOT NULL,
+        product_id TEXT NOT NULL,
+        type TEXT NOT NULL,
+        order_type TEXT,
+        prix_limite REAL,
+        prix_execution REAL,
+        quantite REAL,
+        montant_usdc REAL,
+        quantite_executee REAL,
+        montant_execute REAL,
+        frais REAL,
+        status TEXT NOT NULL,
+        order_id_exchange TEXT,
+        created_at TIMESTAMP,
+        executed_at TIMESTAMP
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS {schema}.activity_logs (
+        log_id INTEGER PRIMARY KEY,
+        fk_account_id INTEGER NOT NULL,
+        action_type TEXT NOT NULL,
+        description TEXT NOT NULL,
+        created_at TIMESTAMP
+    )
+    """,
+    "CREATE INDEX IF NOT EXISTS {schema}.idx_orders_account ON orders(fk_account_id, created_at)",
+    "CREATE INDEX IF NOT EXISTS {schema}.idx_activity_logs_account ON activity_logs(fk_account_id, created_at)",
+)
+
+# Requêtes - Déplacement d'un mois (bornes : début du mois, début du mois suivant, date limite)
+_MONTH_RANGE = "created_at >= :start AND created_at < :end AND created_at < :cutoff"
+_TERMINAL = f"status IN ({', '.join(repr(status) for status in TERMINAL_STATUSES)})"
+MOVE_ORDERS = (
+    f"INSERT OR REPLACE INTO {ARCHIVE_SCHEMA}.orders ({ORDER_COLUMNS}) "
+    f"SELECT {ORDER_COLUMNS} FROM main.orders WHERE {_MONTH_RANGE} AND {_TERMINAL}",
+    f"""
+    INSERT INTO main.orders_rollup_monthly
+        (month, fk_account_id, product_id, type, status, order_count, quantite, montant_usdc, frais)
+    SELECT :month, fk_account_id, product_id, type, status, COUNT(*),
+           COALESCE(SUM(quantite_executee), 0), COALESCE(SUM(montant_execute), 0), COALESCE(SUM(frais), 0)
+    FROM main.orders WHERE {_MONTH_RANGE} AND {_TERMINAL}
+    GROUP BY fk_account_id, product_id, type, status
+    ON CONFLICT (month, fk_account_id, product_id, type, status) DO UPDATE SET
+        order_count = order_count + excluded.order_count,
+        quantite = quantite + excluded.quantite,
+        montant_usdc = montant_usdc + excluded.montant_usdc,
+        frais = frais + excluded.frais
+    """,
+    f"DELETE FROM main.orders WHERE {_MONTH_RANGE} AND {_TERMINAL}",
+)
+MOVE_ACTIVITY = (
+    f"INSERT OR REPLACE INTO {ARCHIVE_SCHEMA}.activity_logs ({ACTIVITY_COLUMNS}) "
+    f"SELECT {ACTIVITY_COLUMNS} FROM main.activity_logs WHERE {_MONTH_RANGE}",
+    f"""
+    INSERT INTO main.activity_rollup_monthly (month, fk_account_id, action_type, log_count)
+    SELECT :month, fk_account_id, action_type, COUNT(*)
+    FROM main.activity_logs WHERE {_MONTH_RANGE}
+    GROUP BY fk_account_id, action_type
+    ON CONFLICT (month, fk_account_id, action_type) DO UPDATE SET
+        log_count = log_count + excluded.log_count
+    """,
+    f"DELETE FROM main.activity_logs WHERE {_MONTH_RANGE}",
+)
+REGISTER_PARTITION = """
+    INSERT INTO archive_partitions (month, file_name, orders, activity_logs, archived_at)
+    VALUES (?, ?, ?, ?, CURRENT_TIMESTAMP)
+    ON CONFLICT (month) DO UPDATE SET
+        orders = orders + excluded.orders,
+        activity_logs = activity_logs + excluded.activity_logs,
+        archived_at = excluded.archived_at
+"""
+ARCHIVABLE_MONTHS = f"""
+    SELECT strftime('%Y-%m', created_at) AS month FROM orders WHERE created_at < :cutoff AND {_TERMINAL}
+    UNION
+    SELECT strftime('%Y-%m', created_at) FROM activity_logs WHERE created_at < :cutoff
+    ORDER BY month
+"""
+
+
+def _history_queries(schema):
+    """Requêtes de lecture de l'historique pour un schéma (main ou partition attachée)"""
+    order_columns = f"""
+        SELECT o.order_id, o.bot_id, o.fk_account_id, o.fk_exchange_id, e.name,
+               o.product_id, o.type, o.order_type, o.prix_limite, o.prix_execution, o.quantite,
+               o.montant_usdc, o.quantite_executee, o.montant_execute, o.frais, o.status,
+               o.order_id_exchange, o.created_at, o.executed_at
+        FROM {schema}.orders o
+        JOIN main.exchanges e ON o.fk_exchange_id = e.exchange_id
+    """
+    order_mapping = {
+        'rename': {'fk_account_id': 'account_id', 'fk_exchange_id': 'exchange_id', 'name': 'exchange_name',
+                   'type': 'side'},
+        'record': Order
+    }
+    activity_columns = (f"SELECT log_id, action_type, description, created_at "
+                        f"FROM {schema}.activity_logs WHERE fk_account_id = ?")
+    return {
+        'orders': Query(order_columns + "WHERE o.fk_account_id = ? ORDER BY o.created_at DESC LIMIT ?",
+                        **order_mapping),
+        'orders_by_status': Query(
+            order_columns + "WHERE o.fk_account_id = ? AND o.status = ? ORDER BY o.created_at DESC LIMIT ?",
+            **order_mapping
+        ),
+        'activity': Query(activity_columns + " ORDER BY created_at DESC LIMIT ?", record=ActivityLog),
+        'activity_by_type': Query(activity_columns + " AND action_type = ? ORDER BY created_at DESC LIMIT ?",
+                                  record=ActivityLog),
+    }
+
+
+HISTORY_QUERIES = {'main': _history_queries('main'), ARCHIVE_SCHEMA: _history_queries(ARCHIVE_SCHEMA)}
+
+
+def month_bounds(month):
+    """
+    Returns:
+        tuple: ('AAAA-MM-01', 'AAAA-MM-01' du mois suivant) pour un mois 'AAAA-MM'
+    """
+    year, number = (int(part) for part in month.split('-'))
+    next_year, next_number = (year + 1, 1) if number == 12 else (year, number + 1)
+    return f"{year:04d}-{number:02d}-01", f"{next_year:04d}-{next_number:02d}-01"
+
+
+class ArchiveService:
+    """Archivage par partitions mensuelles et lecture transparente de l'historique"""
+
+    def __init__(self, db_model=None, archive_dir=None):
+        """
+        Args:
+            db_model (DatabaseModel, optional): Base principale
+            archive_dir (str, optional): Dossier des bases de partition (défaut : 'archives' à côté de la base)
+        """
+        self.db = db_model if db_model else DatabaseModel()
+        self.archive_dir = archive_dir or os.path.join(os.path.dirname(self.db.db_path), ARCHIVE_DIR_NAME)
+        self._ensure_schema()
+
+    def _ensure_schema(self):
+        try:
+            for statement in MAIN_SCHEMA:
+                self.db.cursor.execute(statement)
+            self.db.connection.commit()
+        except sqlite3.Error as e:
+            self.db.logger.log_error(f"Erreur création schéma d'archivage: {e}")
+
+    def partition_path(self, month):
+        year, number = month.split('-')
+        return os.path.join(self.archive_dir, PARTITION_FILE.format(year=year, month=number))
+
+    @contextmanager
+    def _attached(self, month, create=False):
+        """Attache la partition d'un mois sous le schéma 'archive' le temps d'un bloc"""
+        path = self.partition_path(month)
+        if create:
+            os.makedirs(self.archive_dir, exist_ok=True)
+        elif not os.path.exists(path):
+            raise FileNotFoundError(path)
+        connection = self.db.connection
+        connection.execute(f"ATTACH DATABASE ? AS {ARCHIVE_SCHEMA}", (path,))
+        try:
+            if create:
+                for statement in PARTITION_SCHEMA:
+                    connection.execute(statement.format(schema=ARCHIVE_SCHEMA))
+            # Partitions écrites avant l'ajout des colonnes d'exécution
+            if migrate_orders_columns(connection.cursor(), ARCHIVE_SCHEMA):
+                connection.commit()
+            yield
+        finally:
+            connection.execute(f"DETACH DATABASE {ARCHIVE_SCHEMA}")
+
+    def partitions(self):
+        """
+        Returns:
+            list: [{'month', 'file_name', 'orders', 'activity_logs', 'archived_at'}] du plus récent au plus ancien
+        """
+        try:
+            self.db.cursor.execute(
+                "SELECT month, file_name, orders, activity_logs, archived_at FROM archive_partitions "
+                "ORDER BY month DESC"
+            )
+            return [
+                {'month': r[0], 'file_name': r[1], 'orders': r[2], 'activity_logs': r[3], 'archived_at': r[4]}
+                for r in self.db.cursor.fetchall()
+            ]
+        except sqlite3.Error as e:
+            self.db.logger.log_error(f"Erreur lecture des partitions: {e}")
+            return []
+
+    def iter_sources(self):
+        """
+        Parcourt toutes les données dans l'ordre chronologique : partitions de la
+        plus ancienne à la plus récente (attachées tour à tour), puis la base principale
+
+        Yields:
+            str: Schéma à interroger ('archive' ou 'main') ; les curseurs ouverts
+                sur une partition doivent être fermés avant de passer à la suivante
+        """
+        for partition in reversed(self.partitions()):
+            try:
+                with self._attached(partition['month']):
+                    yield ARCHIVE_SCHEMA
+            except FileNotFoundError:
+                self.db.logger.log_error(f"Partition introuvable: {partition['file_name']}")
+        yield 'main'
+
+    # ============================================
+    # ARCHIVAGE
+    # ============================================
+
+    def archive(self, retention_days=DEFAULT_RETENTION_DAYS, now=None):
+        """
+        Déplace les lignes plus anciennes que la rétention vers leurs partitions mensuelles
+
+        Args:
+            retention_days (int): Âge minimum (jours) des lignes archivées
+            now (datetime, optional): Date de référence
+
+        Returns:
+            dict: {mois 'AAAA-MM': (ordres, entrées d'activité)} déplacés
+        """
+        cutoff = ((now or datetime.now()) - timedelta(days=retention_days)).strftime('%Y-%m-%d %H:%M:%S')
+        connection = self.db.connection
+        try:
+            months = [row[0] for row in connection.execute(ARCHIVABLE_MONTHS, {'cutoff': cutoff}).fetchall()
+                      if row[0]]
+        except sqlite3.Error as e:
+            self.db.logger.log_error(f"Erreur recherche des lignes à archiver: {e}")
+            return {}
+
+        moved = {}
+        for month in months:
+            try:
+                moved[month] = self._archive_month(month, cutoff)
+                print(LOG_MONTH_ARCHIVED.format(month=month, orders=moved[month][0], logs=moved[month][1]))
+            except (sqlite3.Error, OSError) as e:
+                print(LOG_ARCHIVE_ERROR.format(month=month, error=e))
+                self.db.logger.log_error(LOG_ARCHIVE_ERROR.format(month=month, error=e))
+        if not months:
+            print(LOG_NOTHING_TO_ARCHIVE.format(days=retention_days))
+        return moved
+
+    def _archive_month(self, month, cutoff):
+        start, end = month_bounds(month)
+        params = {'month': month, 'start': start, 'end': end, 'cutoff': cutoff}
+        connection = self.db.connection
+        if connection.in_transaction:
+            connection.commit()
+        with self._attached(month, create=True):
+            # Copie, agrégats et suppression : tout ou rien (les deux fichiers, journal de rollback)
+            connection.execute("BEGIN IMMEDIATE")
+            try:
+                counts = []
+                for copy, rollup, delete in (MOVE_ORDERS, MOVE_ACTIVITY):
+                    connection.execute(copy, params)
+                    connection.execute(rollup, params)
+                    counts.append(connection.execute(delete, params).rowcount)
+                connection.execute(REGISTER_PARTITION, (month, os.path.basename(self.partition_path(month)),
+                                                        counts[0], counts[1]))
+                connection.commit()
+            except sqlite3.Error:
+                connection.rollback()
+                raise
+        return tuple(counts)
+
+    def vacuum(self):
+        """
+        Compacte la base principale après archivage
+
+        Returns:
+            tuple: (taille avant, taille après) en octets
+        """
+        before = os.path.getsize(self.db.db_path)
+        if self.db.connection.in_transaction:
+            self.db.connection.commit()
+        self.db.connection.execute("VACUUM")
+        after = os.path.getsize(self.db.db_path)
+        print(LOG_VACUUM.format(before=before, after=after))
+        return before, after
+
+    # ============================================
+    # LECTURE DE L'HISTORIQUE
+    # ============================================
+
+    def _read_history(self, name, params, limit, records):
+        """Lit une requête d'historique dans la base principale puis dans les partitions nécessaires"""
+        connection = self.db.connection
+        rows = HISTORY_QUERIES['main'][name].all(connection, params + (limit,), records)
+        for partition in self.partitions():
+            if len(rows) >= limit:
+                rows.sort(key=lambda row: str(row['created_at']), reverse=True)
+                del rows[limit:]
+                # Partition entièrement plus ancienne que la dernière ligne retenue
+                if str(rows[-1]['created_at']) >= month_bounds(partition['month'])[1]:
+                    break
+            try:
+                with self._attached(partition['month']):
+                    rows += HISTORY_QUERIES[ARCHIVE_SCHEMA][name].all(connection, params + (limit,), records)
+            except FileNotFoundError:
+                self.db.logger.log_error(f"Partition introuvable: {partition['file_name']}")
+        rows.sort(key=lambda row: str(row['created_at']), reverse=True)
+        return rows[:limit]
+
+    def get_activity_logs(self, account_id, action_type=None, limit=1000, records=False):
+        """
+        Historique d'activité d'un utilisateur, base principale et partitions confondues
+
+        Args:
+            account_id (int): ID du compte utilisateur
+            action_type (str, optional): Filtre par type d'action
+            limit (int): Nombre maximum d'entrées (plus récentes d'abord)
+            records (bool): Objets ActivityLog plutôt que des dicts
+
+        Returns:
+            list: Entrées d'activité
+        """
+        try:
+            if action_type:
+                return self._read_history('activity_by_type', (account_id, action_type), limit, records)
+            return self._read_history('activity', (account_id,), limit, records)
+        except sqlite3.Error as e:
+            self.db.logger.log_error(f"Erreur lecture historique d'activité: {e}")
+            return []
+
+    def get_orders(self, account_id, status=None, limit=1000, records=False):
+        """
+        Ordres d'un utilisateur, base principale et partitions confondues
+
+        Args:
+            account_id (int): ID du compte utilisateur
+            status (str, optional): Filtre par statut
+            limit (int): Nombre maximum d'ordres (plus récents d'abord)
+            records (bool): Objets Order plutôt que des dicts
+
+        Returns:
+            list: Ordres
+        """
+        try:
+            if status:
+                return self._read_history('orders_by_status', (account_id, status), limit, records)
+            return self._read_history('orders', (account_id,), limit, records)
+        except sqlite3.Error as e:
+            self.db.logger.log_error(f"Erreur lecture historique des ordres: {e}")
+            return []
+
+    def get_monthly_order_summary(self, account_id):
+        """
+        Volumes mensuels exécutés des ordres terminés : agrégats des mois archivés et lignes encore en base
+
+        Returns:
+            list: [{'month', 'product_id', 'side', 'status', 'orders', 'quantite', 'montant_usdc', 'frais'}]
+        """
+        try:
+            self.db.cursor.execute(
+                f"""
+                SELECT month, product_id, type, status, SUM(order_count), SUM(quantite),
+                       SUM(montant_usdc), SUM(frais)
+                FROM (
+                    SELECT month, product_id, type, status, order_count, quantite, montant_usdc, frais
+                    FROM orders_rollup_monthly WHERE fk_account_id = ?
+                    UNION ALL
+                    SELECT strftime('%Y-%m', created_at), product_id, type, status, 1,
+                           COALESCE(quantite_executee, 0), COALESCE(montant_execute, 0), COALESCE(frais, 0)
+                    FROM orders WHERE fk_account_id = ? AND {_TERMINAL}
+                )
+                GROUP BY month, product_id, type, status
+                ORDER BY month DESC, product_id
+                """,
+                (account_id, account_id)
+            )
+            return [
+                {'month': r[0], 'product_id': r[1], 'side': r[2], 'status': r[3], 'orders': r[4],
+                 'quantite': r[5], 'montant_usdc': r[6], 'frais': r[7]}
+                for r in self.db.cursor.fetchall()
+            ]
+        except sqlite3.Error as e:
+            self.db.logger.log_error(f"Erreur résumé mensuel des ordres: {e}")
+            return []
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Archivage mensuel des ordres et de l'historique CoinTrader")
+    parser.add_argument('--days', type=int, default=DEFAULT_RETENTION_DAYS, help="Rétention en jours")
+    parser.add_argument('--db', default="datas/cointrader.db", help="Base principale")
+    parser.add_argument('--archive-dir', default=None, help="Dossier des partitions (défaut : à côté de la base)")
+    parser.add_argument('--vacuum', action='store_true', help="Compacter la base principale ensuite")
+    args = parser.parse_args(argv)
+
+    db = DatabaseModel(db_path=args.db)
+    try:
+        service = ArchiveService(db, archive_dir=args.archive_dir)
+        if service.archive(args.days) and args.vacuum:
+            service.vacuum()
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
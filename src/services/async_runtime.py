@@ -0,0 +1,181 @@
+"""
+Runtime asyncio du cœur de l'application
+
+Une boucle asyncio tourne dans son propre thread, à côté de la boucle Tk.
+Elle porte les requêtes réseau (transport HTTP asynchrone), les flux de
+prix et le cadencement des moteurs de bots : des milliers de requêtes en
+vol ne coûtent pas un thread chacune. Les appels bloquants restants sont
+déportés vers des exécuteurs dédiés :
+    - SQLite : un seul thread (accès sérialisés, pas de verrou de base)
+    - bcrypt et autres calculs : un petit pool
+
+Depuis un autre thread (Tk, autres services), submit() planifie une
+coroutine et retourne un concurrent.futures.Future.
+"""
+import asyncio
+import contextvars
+import functools
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+# Constantes - Exécuteurs
+CPU_WORKERS = 2
+START_TIMEOUT = 5.0
+
+# Constantes - Messages de log
+LOG_TASK_ERROR = "✗ Erreur tâche planifiée '{name}': {error}"
+
+
+def _in_context(func):
+    """Lie func au contexte courant (span de trace) : run_in_executor ne le propage pas"""
+    return functools.partial(contextvars.copy_context().run, func)
+
+
+class AsyncRuntime:
+    """Boucle asyncio dans un thread dédié, avec ponts vers le code bloquant"""
+
+    def __init__(self, cpu_workers=CPU_WORKERS):
+        """
+        Args:
+            cpu_workers (int): Threads pour les calculs bloquants (bcrypt)
+        """
+        self.loop = None
+        self._thread = None
+        self._ready = threading.Event()
+        self._db_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='async-db')
+        self._cpu_executor = ThreadPoolExecutor(max_workers=cpu_workers, thread_name_prefix='async-cpu')
+        self._lock = threading.Lock()
+
+    # ============================================
+    # CYCLE DE VIE
+    # ============================================
+
+    def start(self):
+        """Démarre la boucle dans son thread (sans effet si déjà démarrée)"""
+        with self._lock:
+            if self._thread is not None and self._thread.is_alive():
+                return
+            self._ready.clear()
+            self._thread = threading.Thread(target=self._run, name='async-runtime', daemon=True)
+            self._thread.start()
+        self._ready.wait(START_TIMEOUT)
+
+    def _run(self):
+        self.loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self.loop)
+        self._ready.set()
+        try:
+            self.loop.run_forever()
+        finally:
+            pending = asyncio.all_tasks(self.loop)
+            for task in pending:
+                task.cancel()
+            if pending:
+                self.loop.run_until_complete(asyncio.gather(*pending, return_exceptions=True))
+            self.loop.close()
+
+    @property
+    def is_running(self):
+        return self.loop is not None and self.loop.is_running()
+
+    def in_loop(self):
+        """True si l'appelant s'exécute dans le thread de la boucle"""
+        return self._thread is threading.current_thread()
+
+    def stop(self):
+        """Annule les tâches en cours puis arrête la boucle"""
+        if self.loop is not None and self.loop.is_running():
+            self.loop.call_soon_threadsafe(self.loop.stop)
+            if self._thread is not None and not self.in_loop():
+                self._thread.join(timeout=START_TIMEOUT)
+        self._thread = None
+
+    # ============================================
+    # PLANIFICATION
+    # ============================================
+
+    def submit(self, coro):
+        """
+        Planifie une coroutine depuis n'importe quel thread
+
+        Returns:
+            concurrent.futures.Future: Résultat de la coroutine
+        """
+        self.start()
+        return asyncio.run_coroutine_threadsafe(coro, self.loop)
+
+    def every(self, interval, coro_func, name=None):
+        """
+        Exécute coro_func() périodiquement (intervalle mesuré entre deux débuts)
+
+        Une erreur est journalisée sans interrompre la planification.
+
+        Args:
+            interval (float): Période en secondes
+            coro_func (callable): Fonction retournant une coroutine
+            name (str, optional): Nom de la tâche (logs)
+
+        Returns:
+            concurrent.futures.Future: Annuler ce future arrête la tâche
+        """
+        name = name or getattr(coro_func, '__qualname__', 'tâche')
+
+        async def _periodic():
+            loop = asyncio.get_running_loop()
+            while True:
+                started = loop.time()
+                try:
+                    await coro_func()
+                except asyncio.CancelledError:
+                    raise
+                except Exception as e:
+                    print(LOG_TASK_ERROR.format(name=name, error=e))
+                await asyncio.sleep(max(0.0, interval - (loop.time() - started)))
+
+        return self.submit(_periodic())
+
+    # ============================================
+    # PONTS VERS LE CODE BLOQUANT
+    # ============================================
+
+    async def run_db(self, func, *args):
+        """Exécute un accès SQLite dans le thread dédié à la base"""
+        return await asyncio.get_running_loop().run_in_executor(self._db_executor, _in_context(func), *args)
+
+    async def run_cpu(self, func, *args):
+        """Exécute un calcul bloquant (bcrypt...) dans le pool de calcul"""
+        return await asyncio.get_running_loop().run_in_executor(self._cpu_executor, _in_context(func), *args)
+
+    async def run_io(self, func, *args):
+        """Exécute un appel réseau bloquant (adapter sans variante asynchrone)"""
+        return await asyncio.get_running_loop().run_in_executor(None, _in_context(func), *args)
+
+    def call_blocking(self, func, *args, kind='cpu'):
+        """
+        Déporte un appel bloquant depuis un thread hors boucle (ex: Tk)
+
+        Args:
+            func (callable): Fonction bloquante
+            kind (str): 'cpu', 'db' ou 'io'
+
+        Returns:
+            concurrent.futures.Future: Résultat de func(*args)
+        """
+        bridge = {'cpu': self.run_cpu, 'db': self.run_db, 'io': self.run_io}[kind]
+        return self.submit(bridge(func, *args))
+
+
+_runtime = None
+_runtime_lock = threading.Lock()
+
+
+def get_async_runtime():
+    """Retourne le runtime asyncio partagé du processus (démarré au premier appel)"""
+    global _runtime
+    if _runtime is None:
+        with _runtime_lock:
+            if _runtime is None:
+                runtime = AsyncRuntime()
+                runtime.start()
+                _runtime = runtime
+    return _runtime
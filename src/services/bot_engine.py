@@ -0,0 +1,525 @@
+"""
+Moteur d'exécution des bots de trading
+
+Chaque bot actif suit un cycle simple :
+    waiting  → achat quand le prix atteint prix_achat_cible (ou au marché)
+    holding  → vente quand le gain atteint pourcentage_gain
+puis revient en attente. L'état d'exécution (dernier prix, PnL latent,
+statut) vit en mémoire ; les écouteurs ne reçoivent que les champs qui
+ont changé, ce qui permet aux vues de se mettre à jour sur place.
+
+Sans OrderManager, les ordres sont simulés (exécution immédiate au prix
+courant) : aucun ordre réel n'est jamais envoyé par défaut.
+"""
+import asyncio
+import threading
+import time
+from src.models.order_model import STATUS_FILLED, STATUS_CANCELLED, STATUS_REJECTED
+from src.utils.tracing import get_tracer, CATEGORY_ENGINE
+
+# Constantes - Rafraîchissement
+TICK_INTERVAL = 2.0
+
+# États d'exécution d'un bot
+STATE_INACTIVE = 'inactive'
+STATE_WAITING = 'waiting'
+STATE_BUYING = 'buying'
+STATE_HOLDING = 'holding'
+STATE_SELLING = 'selling'
+
+STATE_LABELS = {
+    STATE_INACTIVE: "Inactif",
+    STATE_WAITING: "En attente",
+    STATE_BUYING: "Achat en cours",
+    STATE_HOLDING: "Position ouverte",
+    STATE_SELLING: "Vente en cours"
+}
+
+# Paramètres modifiables depuis le formulaire, repris par load() sans redémarrage
+CONFIG_FIELDS = ('order_type', 'target_price', 'gain_pct', 'amount')
+
+# Champs transmis aux écouteurs
+WATCHED_FIELDS = ('state', 'is_active', 'last_price', 'entry_price', 'quantity',
+                  'unrealized_pnl', 'realized_pnl', 'trades')
+
+# Constantes - Messages de log
+LOG_BOT_BUY = "✓ Bot {bot_id}: achat {product_id} à {price:,.8g}"
+LOG_BOT_SELL = "✓ Bot {bot_id}: vente {product_id} à {price:,.8g} (PnL {pnl:+,.2f})"
+LOG_ORDER_FAILED = "✗ Bot {bot_id}: ordre {side} refusé"
+LOG_TICK_ERROR = "✗ Erreur tick moteur ({exchange}): {error}"
+LOG_LISTENER_ERROR = "✗ Erreur écouteur moteur: {error}"
+
+tracer = get_tracer()
+
+
+class BotRuntime:
+    """État d'exécution en mémoire d'un bot"""
+
+    __slots__ = (
+        'bot_id', 'account_id', 'exchange_id', 'exchange', 'product_id', 'order_type',
+        'target_price', 'gain_pct', 'amount', 'is_active', 'state', 'last_price',
+        'entry_price', 'quantity', 'unrealized_pnl', 'realized_pnl', 'trades',
+        'pending_order_id', 'updated_at'
+    )
+
+    def __init__(self, bot, account_id=None):
+        self.bot_id = bot['bot_id']
+        self.account_id = account_id
+        self.exchange_id = bot.get('exchange_id')
+        self.exchange = (bot.get('exchange') or 'coinbase').lower()
+        self.product_id = bot['product_id']
+        self.order_type = (bot.get('type_ordre') or 'market').lower()
+        self.target_price = bot.get('prix_achat_cible')
+        self.gain_pct = bot.get('pourcentage_gain') or 0.0
+        self.amount = bot.get('montant_trade') or 0.0
+        self.is_active = bool(bot.get('is_active'))
+        self.state = STATE_WAITING if self.is_active else STATE_INACTIVE
+        self.last_price = None
+        self.entry_price = None
+        self.quantity = 0.0
+        self.unrealized_pnl = 0.0
+        self.realized_pnl = 0.0
+        self.trades = 0
+        self.pending_order_id = None
+        self.updated_at = None
+
+    def snapshot(self):
+        return {field: getattr(self, field) for field in WATCHED_FIELDS}
+
+    def to_dict(self):
+        return {field: getattr(self, field) for field in self.__slots__}
+
+    @classmethod
+    def from_state(cls, state):
+        """Recrée un bot à partir de to_dict() (transfert entre processus)"""
+        runtime = cls.__new__(cls)
+        for field in cls.__slots__:
+            setattr(runtime, field, state.get(field))
+        return runtime
+
+
+class BotEngine:
+    """Évalue les bots à chaque prix reçu et notifie les changements d'état"""
+
+    def __init__(self, account_id=None, order_manager=None, exchange_resolver=None,
+                 tick_interval=TICK_INTERVAL, runtime=None, price_table=None):
+        """
+        Args:
+            account_id (int, optional): Compte dont les bots sont exécutés
+            order_manager (OrderManager, optional): Envoi des ordres réels (simulation si None)
+            exchange_resolver (callable, optional): nom d'exchange → adapter ExchangeBase
+            tick_interval (float): Intervalle de rafraîchissement des prix en secondes
+            runtime (AsyncRuntime, optional): Cadencement sur la boucle asyncio (sinon un thread)
+            price_table (PriceTableWriter, optional): Publication des prix reçus aux autres processus
+        """
+        self.account_id = account_id
+        self.order_manager = order_manager
+        self.exchange_resolver = exchange_resolver or self._default_resolver
+        self.tick_interval = tick_interval
+        self.runtime = runtime
+        self.price_table = price_table
+        self._task = None
+
+        self.bots = {}                  # {bot_id: BotRuntime}
+        self._by_product = {}           # {product_id: {bot_id: BotRuntime}}
+        self._by_order = {}             # {order_id: BotRuntime}
+        self._listeners = []
+        self._lock = threading.RLock()
+        self._stop_event = threading.Event()
+        self._thread = None
+
+        if order_manager is not None:
+            order_manager.add_listener(self._on_order_update)
+
+    @staticmethod
+    def _default_resolver(exchange_name):
+        from src.models.exchanges.registry import get_registry
+        return get_registry().get(exchange_name)
+
+    # ============================================
+    # BOTS
+    # ============================================
+
+    def load(self, bots):
+        """
+        Charge (ou recharge) les bots à exécuter
+
+        Un bot déjà chargé garde son état d'exécution et reprend ses
+        paramètres modifiés (voir _refresh).
+
+        Args:
+            bots (list): Bots au format BotModel.get_user_bots()
+        """
+        added = []
+        with self._lock:
+            known = set(self.bots)
+            for bot in bots:
+                runtime = self.bots.get(bot['bot_id'])
+                if runtime is None:
+                    runtime = BotRuntime(bot, self.account_id)
+                    self._add(runtime)
+                    added.append(runtime)
+                else:
+                    known.discard(bot['bot_id'])
+                    self._refresh(runtime, bot)
+                    self.set_active(bot['bot_id'], bool(bot.get('is_active')))
+            for bot_id in known:
+                self.remove_bot(bot_id)
+        for runtime in added:
+            self._notify(runtime, {field: None for field in WATCHED_FIELDS})
+
+    def load_from_db(self, bot_model=None):
+        """Charge les bots du compte depuis la base"""
+        if bot_model is None:
+            from src.models.bot_model import BotModel
+            bot_model = BotModel()
+        self.load(bot_model.get_user_bots(self.account_id, records=True))
+
+    def _add(self, runtime):
+        self.bots[runtime.bot_id] = runtime
+        self._by_product.setdefault(runtime.product_id, {})[runtime.bot_id] = runtime
+
+    def _refresh(self, runtime, bot):
+        """
+        Applique à un bot chargé sa configuration éditée (appelé sous le verrou)
+
+        Prix cible, gain, montant et type d'ordre valent dès la prochaine
+        décision. Un changement de produit ou d'exchange n'est appliqué que
+        sans position ni ordre en cours : sinon la vente porterait sur le
+        mauvais produit ; il le sera au rechargement suivant.
+        """
+        fresh = BotRuntime(bot, self.account_id)
+        for field in CONFIG_FIELDS:
+            setattr(runtime, field, getattr(fresh, field))
+
+        moved = (fresh.exchange_id, fresh.exchange, fresh.product_id) != (
+            runtime.exchange_id, runtime.exchange, runtime.product_id)
+        if not moved or runtime.state not in (STATE_WAITING, STATE_INACTIVE):
+            return
+        before = runtime.snapshot()
+        self._by_product.get(runtime.product_id, {}).pop(runtime.bot_id, None)
+        runtime.exchange_id = fresh.exchange_id
+        runtime.exchange = fresh.exchange
+        runtime.product_id = fresh.product_id
+        runtime.last_price = None
+        self._add(runtime)
+        self._notify(runtime, before)
+
+    def add_bot(self, bot):
+        """Ajoute un bot (format BotModel.get_user_bots())"""
+        with self._lock:
+            runtime = BotRuntime(bot, self.account_id)
+            self._add(runtime)
+        self._notify(runtime, {field: None for field in WATCHED_FIELDS})
+
+    def remove_bot(self, bot_id):
+        with self._lock:
+            runtime = self.bots.pop(bot_id, None)
+            if runtime is not None:
+                self._by_product.get(runtime.product_id, {}).pop(bot_id, None)
+
+    def set_active(self, bot_id, is_active):
+        """Active ou met en pause un bot (une position ouverte reste suivie)"""
+        with self._lock:
+            runtime = self.bots.get(bot_id)
+            if runtime is None or runtime.is_active == is_active:
+                return
+            before = runtime.snapshot()
+            runtime.is_active = is_active
+            if not is_active and runtime.state == STATE_WAITING:
+                runtime.state = STATE_INACTIVE
+            elif is_active and runtime.state == STATE_INACTIVE:
+                runtime.state = STATE_WAITING
+        self._notify(runtime, before)
+
+    def get_state(self, bot_id):
+        runtime = self.bots.get(bot_id)
+        return runtime.to_dict() if runtime else None
+
+    def get_states(self):
+        with self._lock:
+            return {bot_id: runtime.to_dict() for bot_id, runtime in self.bots.items()}
+
+    def product_ids(self):
+        """Produits suivis, regroupés par exchange {exchange: set(product_id)}"""
+        with self._lock:
+            grouped = {}
+            for runtime in self.bots.values():
+                grouped.setdefault(runtime.exchange, set()).add(runtime.product_id)
+            return grouped
+
+    # ============================================
+    # ÉCOUTEURS
+    # ============================================
+
+    def add_listener(self, callback):
+        """
+        Abonne un écouteur aux changements d'état
+
+        Args:
+            callback (callable): callback(bot_id, changes) où changes ne contient que les champs modifiés
+        """
+        self._listeners.append(callback)
+
+    def remove_listener(self, callback):
+        if callback in self._listeners:
+            self._listeners.remove(callback)
+
+    def _notify(self, runtime, before):
+        after = runtime.snapshot()
+        changes = {field: value for field, value in after.items() if before.get(field) != value}
+        if not changes:
+            return
+        runtime.updated_at = time.time()
+        for callback in list(self._listeners):
+            try:
+                callback(runtime.bot_id, changes)
+            except Exception as e:
+                print(LOG_LISTENER_ERROR.format(error=e))
+
+    # ============================================
+    # ÉVALUATION
+    # ============================================
+
+    def on_price(self, product_id, price, exchange=None):
+        """
+        Évalue les bots d'un produit au nouveau prix
+
+        Args:
+            product_id (str): Produit BASE-QUOTE
+            price (float): Dernier prix
+            exchange (str, optional): Exchange d'origine (tous si None)
+        """
+        if not price:
+            return
+        with self._lock:
+            runtimes = [
+                r for r in self._by_product.get(product_id, {}).values()
+                if exchange is None or r.exchange == exchange
+            ]
+        for runtime in runtimes:
+            with self._lock:
+                before = runtime.snapshot()
+                runtime.last_price = price
+                if runtime.quantity:
+                    runtime.unrealized_pnl = (price - runtime.entry_price) * runtime.quantity
+                params = self._decide(runtime, price)
+            self._notify(runtime, before)
+            if params is not None:
+                self._submit(runtime, params)
+
+    def _decide(self, runtime, price):
+        """
+        Fait avancer un bot au prix reçu (appelé sous verrou)
+
+        Returns:
+            dict or None: Paramètres de l'ordre à envoyer hors verrou
+        """
+        if runtime.state == STATE_WAITING:
+            if runtime.target_price is None or price <= runtime.target_price:
+                return self._prepare(runtime, 'buy', price)
+        elif runtime.state == STATE_HOLDING:
+            if price >= runtime.entry_price * (1 + runtime.gain_pct / 100.0):
+                return self._prepare(runtime, 'sell', price)
+        return None
+
+    def _prepare(self, runtime, side, price):
+        if self.order_manager is None:
+            # Simulation : exécution immédiate au prix courant
+            size = runtime.amount / price if side == 'buy' else runtime.quantity
+            self._complete(runtime, side, price, size)
+            return None
+
+        # État intermédiaire posé sous verrou : un second prix ne renvoie pas l'ordre
+        runtime.state = STATE_BUYING if side == 'buy' else STATE_SELLING
+        limit = runtime.order_type == 'limit'
+        if side == 'buy':
+            size = runtime.amount / price if limit else None
+            funds = None if limit else runtime.amount
+        else:
+            size, funds = runtime.quantity, None
+        return {
+            'account_id': runtime.account_id, 'exchange_id': runtime.exchange_id,
+            'exchange_name': runtime.exchange, 'product_id': runtime.product_id, 'side': side,
+            'order_type': 'limit' if limit else 'market', 'size': size, 'funds': funds,
+            'price': price if limit else None, 'bot_id': runtime.bot_id
+        }
+
+    @tracer.traced(CATEGORY_ENGINE)
+    def _submit(self, runtime, params):
+        # Envoi hors verrou (I/O réseau) : une transition terminale notifiée avant
+        # l'enregistrement ne trouve pas l'ordre, son état est donc rejoué ensuite
+        order = self.order_manager.submit_order(**params)
+        side = params['side']
+        with self._lock:
+            before = runtime.snapshot()
+            if order is None:
+                print(LOG_ORDER_FAILED.format(bot_id=runtime.bot_id, side=side))
+                runtime.state = STATE_WAITING if side == 'buy' else STATE_HOLDING
+                replay = False
+            else:
+                runtime.pending_order_id = order.order_id
+                self._by_order[order.order_id] = runtime
+                replay = order.is_terminal
+        self._notify(runtime, before)
+        if replay:
+            # _on_order_update retire l'entrée : jamais appliqué deux fois
+            self._on_order_update(order, None)
+
+    def _complete(self, runtime, side, price, size):
+        if side == 'buy':
+            runtime.entry_price = price
+            runtime.quantity = size
+            runtime.unrealized_pnl = 0.0
+            runtime.state = STATE_HOLDING
+            print(LOG_BOT_BUY.format(bot_id=runtime.bot_id, product_id=runtime.product_id, price=price))
+        else:
+            pnl = (price - runtime.entry_price) * size
+            runtime.realized_pnl += pnl
+            runtime.trades += 1
+            runtime.entry_price = None
+            runtime.quantity = 0.0
+            runtime.unrealized_pnl = 0.0
+            runtime.state = STATE_WAITING if runtime.is_active else STATE_INACTIVE
+            print(LOG_BOT_SELL.format(bot_id=runtime.bot_id, product_id=runtime.product_id,
+                                      price=price, pnl=pnl))
+
+    def _on_order_update(self, order, old_status):
+        """Écouteur OrderManager : fait avancer le bot quand son ordre se termine"""
+        with self._lock:
+            runtime = self._by_order.get(order.order_id)
+            if runtime is None or not order.is_terminal:
+                return
+            del self._by_order[order.order_id]
+            runtime.pending_order_id = None
+            before = runtime.snapshot()
+
+            if order.status == STATUS_FILLED and order.filled_size:
+                self._complete(runtime, order.side, order.average_price, order.filled_size)
+            elif order.status in (STATUS_CANCELLED, STATUS_REJECTED):
+                runtime.state = STATE_WAITING if order.side == 'buy' else STATE_HOLDING
+        self._notify(runtime, before)
+
+    # ============================================
+    # BOUCLE
+    # ============================================
+
+    @tracer.traced(CATEGORY_ENGINE)
+    def tick(self):
+        """Récupère les prix des produits suivis (une requête groupée par exchange)"""
+        for exchange, product_ids in self.product_ids().items():
+            adapter = self.exchange_resolver(exchange)
+            if adapter is None:
+                continue
+            try:
+                tickers = adapter.get_tickers(sorted(product_ids)) or {}
+            except Exception as e:
+                print(LOG_TICK_ERROR.format(exchange=exchange, error=e))
+                continue
+            self._apply_tickers([(exchange, tickers)])
+
+    async def _afetch(self, exchange, product_ids):
+        adapter = self.exchange_resolver(exchange)
+        if adapter is None:
+            return exchange, {}
+        try:
+            return exchange, await adapter.aget_tickers(sorted(product_ids)) or {}
+        except Exception as e:
+            print(LOG_TICK_ERROR.format(exchange=exchange, error=e))
+            return exchange, {}
+
+    @tracer.traced(CATEGORY_ENGINE)
+    def _apply_tickers(self, results):
+        for exchange, tickers in results:
+            if self.price_table is not None:
+                self.price_table.update_tickers(exchange, tickers)
+            for product_id, ticker in tickers.items():
+                self.on_price(product_id, ticker.get('price'), exchange)
+
+    async def atick(self):
+        """Variante asynchrone de tick() : tous les exchanges sont interrogés en parallèle"""
+        with tracer.span('BotEngine.atick', CATEGORY_ENGINE):
+            results = await asyncio.gather(*(
+                self._afetch(exchange, product_ids) for exchange, product_ids in self.product_ids().items()
+            ))
+            if self.order_manager is not None:
+                # L'envoi d'ordres réels est bloquant : hors de la boucle asyncio
+                await self.runtime.run_io(self._apply_tickers, results)
+            else:
+                self._apply_tickers(results)
+
+    def _run(self):
+        while not self._stop_event.is_set():
+            self.tick()
+            self._stop_event.wait(self.tick_interval)
+
+    def start(self):
+        """Démarre le rafraîchissement (tâche asyncio si un runtime est fourni, sinon un thread)"""
+        if self.runtime is not None:
+            if self._task is None or self._task.done():
+                self._task = self.runtime.every(self.tick_interval, self.atick,
+                                                name=f"bot-engine-{self.account_id}")
+            return
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._run, name='bot-engine', daemon=True)
+        self._thread.start()
+
+    def stop(self, wait=True):
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+        self._stop_event.set()
+        if self._thread is not None:
+            if wait:
+                self._thread.join(timeout=self.tick_interval + 1)
+            self._thread = None
+
+
+_engines = {}
+_engines_lock = threading.Lock()
+
+
+def get_bot_engine(account_id, allow_remote=True):
+    """
+    Retourne le moteur partagé d'un compte (bots chargés et boucle démarrée au premier appel)
+
+    Si un démon CoinTrader est à l'écoute, l'interface s'y connecte au lieu
+    d'exécuter les bots dans son propre processus. Si le démon s'arrête, le
+    moteur distant est remplacé (reconnexion à un démon relancé, sinon
+    moteur local) et ses écouteurs sont reportés sur le remplaçant.
+
+    Args:
+        account_id (int): ID du compte utilisateur
+        allow_remote (bool): Utiliser le démon s'il est disponible
+
+    Returns:
+        BotEngine or RemoteBotEngine: Moteur du compte
+    """
+    engine = _engines.get(account_id)
+    if engine is None or not getattr(engine, 'connected', True):
+        with _engines_lock:
+            engine = _engines.get(account_id)
+            stale = None
+            if engine is not None and not getattr(engine, 'connected', True):
+                stale, engine = engine, None
+                stale.client.remove_event_listener(stale._on_event)
+            if engine is None:
+                if allow_remote:
+                    from src.services.daemon_client import connect_remote_engine
+                    engine = connect_remote_engine(account_id)
+                    if engine is not None:
+                        engine.client.add_disconnect_listener(
+                            lambda: get_bot_engine(account_id, allow_remote)
+                        )
+                if engine is None:
+                    from src.services.async_runtime import get_async_runtime
+                    engine = BotEngine(account_id, runtime=get_async_runtime())
+                    engine.load_from_db()
+                    engine.start()
+                if stale is not None:
+                    for callback in list(stale._listeners):
+                        engine.add_listener(callback)
+                _engines[account_id] = engine
+    return engine
@@ -0,0 +1,462 @@
+"""
+Démon CoinTrader (mode sans interface)
+
+Exécute les moteurs de bots, leurs flux de prix et le gestionnaire d'ordres
+dans un processus indépendant de la fenêtre Tk. Les prix récupérés sont
+publiés dans la table de prix partagée (lecture directe par les autres
+processus locaux). Les interfaces s'y
+connectent par une socket Unix locale pour recevoir les changements d'état
+des bots et envoyer des commandes ; plusieurs interfaces partagent ainsi le
+même moteur (et donc les mêmes requêtes de prix).
+
+Protocole : un objet JSON par ligne.
+    requête   {"id": 1, "cmd": "toggle_bot", "account_id": 1, "bot_id": 3, "is_active": true}
+    réponse   {"id": 1, "ok": true, "result": ...}  ou  {"id": 1, "ok": false, "error": "..."}
+    événement {"event": "bot_changed", "account_id": 1, "bot_id": 3, "changes": {...}}
+
+Lancement : python daemon.py [--socket PATH] [--db PATH] [--live] [--workers N] [--archive-days N]
+"""
+import argparse
+import json
+import os
+import queue
+import socket
+import socketserver
+import tempfile
+import threading
+from contextlib import contextmanager
+
+# Constantes - IPC
+SOCKET_NAME = "cointrader.sock"
+CLIENT_QUEUE_SIZE = 10000
+PROBE_TIMEOUT = 1.0
+ENCODING = "utf-8"
+
+# Constantes - Erreurs renvoyées aux interfaces
+ERROR_BOT_NOT_OWNED = "Bot {bot_id} introuvable pour ce compte"
+
+# Constantes - Messages de log
+LOG_DAEMON_STARTED = "✓ Démon CoinTrader à l'écoute sur {path}"
+LOG_DAEMON_STOPPED = "✓ Démon CoinTrader arrêté"
+LOG_LIVE_MODE = "⚠ Mode réel : les bots envoient de vrais ordres aux exchanges"
+LOG_SIMULATION_MODE = "✓ Mode simulation : aucun ordre n'est envoyé aux exchanges"
+LOG_CLIENT_CONNECTED = "✓ Interface connectée ({count} au total)"
+LOG_CLIENT_DROPPED = "⚠ Interface trop lente, déconnectée"
+LOG_UNIX_SOCKET_UNSUPPORTED = "✗ Sockets Unix non supportées sur cette plateforme"
+LOG_ALREADY_RUNNING = "✗ Un démon CoinTrader est déjà à l'écoute sur {path}"
+LOG_STALE_SOCKET = "⚠ Socket orpheline supprimée ({path})"
+LOG_COMMAND_ERROR = "✗ Erreur commande démon '{cmd}': {error}"
+
+
+def default_socket_path():
+    """Chemin de la socket du démon (surchargeable par COINTRADER_SOCKET)"""
+    return os.environ.get('COINTRADER_SOCKET') or os.path.join(tempfile.gettempdir(), SOCKET_NAME)
+
+
+def encode_message(message):
+    return (json.dumps(message, default=str) + "\n").encode(ENCODING)
+
+
+def socket_is_live(path, timeout=PROBE_TIMEOUT):
+    """
+    Indique si un processus accepte les connexions sur une socket Unix
+
+    Returns:
+        bool: False si la socket est absente ou orpheline (démon arrêté sans nettoyage)
+    """
+    if not os.path.exists(path):
+        return False
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    sock.settimeout(timeout)
+    try:
+        sock.connect(path)
+        return True
+    except OSError:
+        return False
+    finally:
+        sock.close()
+
+
+class _ClientConnection:
+    """Interface connectée : file d'envoi propre pour ne jamais bloquer le moteur"""
+
+    def __init__(self, sock):
+        self.sock = sock
+        self.accounts = set()
+        self.outbox = queue.Queue(maxsize=CLIENT_QUEUE_SIZE)
+        self.closed = threading.Event()
+        self.writer = threading.Thread(target=self._write_loop, name='daemon-client-writer', daemon=True)
+        self.writer.start()
+
+    def send(self, message):
+        """Met un message en file (False si le client ne suit pas)"""
+        if self.closed.is_set():
+            return False
+        try:
+            self.outbox.put_nowait(message)
+            return True
+        except queue.Full:
+            print(LOG_CLIENT_DROPPED)
+            self.close()
+            return False
+
+    def _write_loop(self):
+        while not self.closed.is_set():
+            message = self.outbox.get()
+            if message is None:
+                break
+            try:
+                self.sock.sendall(encode_message(message))
+            except OSError:
+                break
+        self.close()
+
+    def close(self):
+        if self.closed.is_set():
+            return
+        self.closed.set()
+        try:
+            self.outbox.put_nowait(None)
+        except queue.Full:
+            pass
+        try:
+            self.sock.shutdown(socket.SHUT_RDWR)
+        except OSError:
+            pass
+
+
+class _RequestHandler(socketserver.StreamRequestHandler):
+    """Lit les requêtes d'une interface et répond dans sa file d'envoi"""
+
+    def handle(self):
+        daemon = self.server.bot_daemon
+        client = _ClientConnection(self.connection)
+        daemon.attach(client)
+        try:
+            for line in self.rfile:
+                if not line.strip():
+                    continue
+                try:
+                    request = json.loads(line.decode(ENCODING))
+                except ValueError:
+                    client.send({'id': None, 'ok': False, 'error': "JSON invalide"})
+                    continue
+                client.send(daemon.handle_request(client, request))
+        except OSError:
+            pass
+        finally:
+            daemon.detach(client)
+            client.close()
+
+
+class _UnixServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+    allow_reuse_address = True
+
+
+class BotDaemon:
+    """Héberge les moteurs de bots et diffuse leurs changements aux interfaces"""
+
+    def __init__(self, socket_path=None, live=False, db_path="datas/cointrader.db", workers=0, archive_days=None):
+        """
+        Args:
+            socket_path (str, optional): Chemin de la socket Unix
+            live (bool): Envoyer de vrais ordres (sinon les bots sont simulés)
+            db_path (str): Chemin de la base de données
+            workers (int): Processus workers par compte (0 : bots évalués dans le démon)
+            archive_days (int, optional): Rétention avant archivage quotidien (None : pas d'archivage)
+        """
+        self.socket_path = socket_path or default_socket_path()
+        self.live = live
+        self.workers = workers
+        self.db_path = db_path
+        self.archive_days = archive_days
+        self._archive_task = None
+
+        self.order_manager = None
+        self.pnl_engine = None
+        self.price_table = None
+        self.engines = {}              # {account_id: BotEngine}
+        self.clients = set()
+        self._lock = threading.Lock()
+        self._engines_lock = threading.Lock()
+        self._server = None
+
+        self.commands = {
+            'ping': self._cmd_ping,
+            'subscribe': self._cmd_subscribe,
+            'unsubscribe': self._cmd_unsubscribe,
+            'get_states': self._cmd_get_states,
+            'reload': self._cmd_reload,
+            'set_active': self._cmd_set_active,
+            'toggle_bot': self._cmd_toggle_bot,
+            'create_bot': self._cmd_create_bot
+        }
+
+    # ============================================
+    # MOTEURS
+    # ============================================
+
+    @contextmanager
+    def _database(self):
+        """Connexion dédiée à la base du démon (les commandes s'exécutent chacune dans leur thread)"""
+        from src.models.database_model import DatabaseModel
+        db = DatabaseModel(db_path=self.db_path)
+        try:
+            yield db
+        finally:
+            db.close()
+
+    def _load_bots(self, engine):
+        from src.models.bot_model import BotModel
+        with self._database() as db:
+            engine.load_from_db(BotModel(db))
+
+    def get_engine(self, account_id):
+        """Moteur du compte, créé et démarré à la première demande"""
+        from src.services.async_runtime import get_async_runtime
+        from src.services.bot_engine import BotEngine
+
+        engine = self.engines.get(account_id)
+        if engine is None:
+            with self._engines_lock:
+                engine = self.engines.get(account_id)
+                if engine is None:
+                    order_manager = self.order_manager if self.live else None
+                    if self.workers:
+                        from src.services.sharded_engine import ShardedBotEngine
+                        engine = ShardedBotEngine(account_id, workers=self.workers, order_manager=order_manager,
+                                                  runtime=get_async_runtime(), price_table=self.price_table)
+                    else:
+                        engine = BotEngine(account_id, order_manager=order_manager, runtime=get_async_runtime(),
+                                           price_table=self.price_table)
+                    self._load_bots(engine)
+                    engine.start()
+                    engine.add_listener(
+                        lambda bot_id, changes, account_id=account_id:
+                            self.broadcast(account_id, bot_id, changes)
+                    )
+                    self.engines[account_id] = engine
+        return engine
+
+    def broadcast(self, account_id, bot_id, changes):
+        """Envoie un changement d'état aux interfaces abonnées au compte"""
+        event = {'event': 'bot_changed', 'account_id': account_id, 'bot_id': bot_id, 'changes': changes}
+        with self._lock:
+            subscribers = [client for client in self.clients if account_id in client.accounts]
+        for client in subscribers:
+            client.send(event)
+
+    # ============================================
+    # CLIENTS
+    # ============================================
+
+    def attach(self, client):
+        with self._lock:
+            self.clients.add(client)
+            count = len(self.clients)
+        print(LOG_CLIENT_CONNECTED.format(count=count))
+
+    def detach(self, client):
+        with self._lock:
+            self.clients.discard(client)
+
+    def handle_request(self, client, request):
+        """
+        Exécute une commande
+
+        Returns:
+            dict: Réponse {'id', 'ok', 'result'} ou {'id', 'ok', 'error'}
+        """
+        request_id = request.get('id')
+        cmd = request.get('cmd')
+        handler = self.commands.get(cmd)
+        if handler is None:
+            return {'id': request_id, 'ok': False, 'error': f"Commande inconnue: {cmd}"}
+        try:
+            return {'id': request_id, 'ok': True, 'result': handler(client, request)}
+        except Exception as e:
+            print(LOG_COMMAND_ERROR.format(cmd=cmd, error=e))
+            return {'id': request_id, 'ok': False, 'error': str(e)}
+
+    # ============================================
+    # COMMANDES
+    # ============================================
+
+    def _cmd_ping(self, client, request):
+        return 'pong'
+
+    def _cmd_subscribe(self, client, request):
+        account_id = request['account_id']
+        engine = self.get_engine(account_id)
+        client.accounts.add(account_id)
+        return engine.get_states()
+
+    def _cmd_unsubscribe(self, client, request):
+        client.accounts.discard(request['account_id'])
+        return True
+
+    def _cmd_get_states(self, client, request):
+        return self.get_engine(request['account_id']).get_states()
+
+    def _cmd_reload(self, client, request):
+        self._load_bots(self.get_engine(request['account_id']))
+        return True
+
+    def _cmd_set_active(self, client, request):
+        self.get_engine(request['account_id']).set_active(request['bot_id'], bool(request['is_active']))
+        return True
+
+    def _cmd_toggle_bot(self, client, request):
+        from src.controllers.bot_controller import BotController
+        from src.models.bot_model import BotModel
+
+        account_id = request['account_id']
+        bot_id = request['bot_id']
+        engine = self.get_engine(account_id)
+        is_active = bool(request['is_active'])
+        with self._database() as db:
+            bot_model = BotModel(db)
+            # Un client ne modifie que les bots du compte qu'il annonce
+            if not any(bot['bot_id'] == bot_id for bot in bot_model.get_user_bots(account_id)):
+                return {'success': False, 'message': ERROR_BOT_NOT_OWNED.format(bot_id=bot_id)}
+            result = BotController(bot_model).toggle_bot(bot_id, is_active)
+        if result['success']:
+            engine.set_active(bot_id, is_active)
+        return result
+
+    def _cmd_create_bot(self, client, request):
+        from src.controllers.bot_controller import BotController
+        from src.models.bot_model import BotModel
+
+        account_id = request['account_id']
+        with self._database() as db:
+            result = BotController(BotModel(db)).create_bot(account_id, **request['bot'])
+        if result['success']:
+            self._load_bots(self.get_engine(account_id))
+        return result
+
+    # ============================================
+    # CYCLE DE VIE
+    # ============================================
+
+    def start(self):
+        """Démarre le gestionnaire d'ordres, publie la table de prix partagée et ouvre la socket"""
+        from src.services.order_manager import OrderManager
+        from src.services.pnl_engine import PnlEngine
+        from src.utils.shm_price_table import PriceTableReader, PriceTableWriter
+
+        if not hasattr(socket, 'AF_UNIX'):
+            raise OSError(LOG_UNIX_SOCKET_UNSUPPORTED)
+        # Ne jamais prendre la place d'un démon vivant : seule une socket orpheline est supprimée
+        if socket_is_live(self.socket_path):
+            raise OSError(LOG_ALREADY_RUNNING.format(path=self.socket_path))
+        if os.path.exists(self.socket_path):
+            os.unlink(self.socket_path)
+            print(LOG_STALE_SOCKET.format(path=self.socket_path))
+
+        # Refuse de démarrer si un autre écrivain publie encore la table de prix
+        self.price_table = PriceTableWriter()
+        self.order_manager = OrderManager(db_path=self.db_path)
+        # PnL reconstruit avant la reprise des ordres : aucune exécution n'échappe à l'écouteur
+        self.pnl_engine = PnlEngine(db_path=self.db_path,
+                                    price_lookup=PriceTableReader(self.price_table.name, untrack=False).get_price)
+        self.pnl_engine.start()
+        self.order_manager.add_listener(self.pnl_engine.on_order)
+        self.order_manager.start()
+        print(LOG_LIVE_MODE if self.live else LOG_SIMULATION_MODE)
+
+        # Socket créée d'emblée en 0600 : aucune fenêtre où un autre utilisateur peut s'y connecter
+        previous_umask = os.umask(0o077)
+        try:
+            self._server = _UnixServer(self.socket_path, _RequestHandler)
+        finally:
+            os.umask(previous_umask)
+        self._server.bot_daemon = self
+        os.chmod(self.socket_path, 0o600)
+        print(LOG_DAEMON_STARTED.format(path=self.socket_path))
+
+        if self.archive_days is not None:
+            from src.services.archive_service import ARCHIVE_INTERVAL
+            from src.services.async_runtime import get_async_runtime
+            self._archive_task = get_async_runtime().every(ARCHIVE_INTERVAL, self._archive, name='archivage')
+
+    async def _archive(self):
+        from src.services.async_runtime import get_async_runtime
+        await get_async_runtime().run_db(self._archive_now)
+
+    def _archive_now(self):
+        """Archive les lignes anciennes (connexion dédiée, thread base de données du runtime)"""
+        from src.services.archive_service import ArchiveService
+        with self._database() as db:
+            return ArchiveService(db).archive(self.archive_days)
+
+    def serve_forever(self):
+        self._server.serve_forever()
+
+    def stop(self):
+        """Ferme les connexions, arrête les moteurs puis le gestionnaire d'ordres"""
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+        if self._archive_task is not None:
+            self._archive_task.cancel()
+            self._archive_task = None
+        with self._lock:
+            clients = list(self.clients)
+        for client in clients:
+            client.close()
+        for engine in self.engines.values():
+            engine.stop()
+        if self.order_manager is not None:
+            self.order_manager.stop()
+        if self.pnl_engine is not None:
+            self.pnl_engine.stop()
+        from src.services.async_runtime import get_async_runtime
+        get_async_runtime().stop()
+        if self.price_table is not None:
+            self.price_table.close()
+            self.price_table = None
+        if os.path.exists(self.socket_path):
+            os.unlink(self.socket_path)
+        print(LOG_DAEMON_STOPPED)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Démon CoinTrader (bots sans interface)")
+    parser.add_argument('--socket', default=None, help="Chemin de la socket Unix")
+    parser.add_argument('--db', default="datas/cointrader.db", help="Chemin de la base de données")
+    parser.add_argument('--live', action='store_true', help="Envoyer de vrais ordres aux exchanges")
+    parser.add_argument('--account', type=int, action='append', default=[],
+                        help="Compte dont les bots démarrent immédiatement (répétable)")
+    parser.add_argument('--workers', type=int, default=0,
+                        help="Répartir les bots de chaque compte sur N processus")
+    parser.add_argument('--archive-days', type=int, default=None,
+                        help="Archiver chaque jour les ordres terminés et l'historique de plus de N jours")
+    args = parser.parse_args(argv)
+
+    from src.utils.metrics import configure_from_env
+    from src.utils import tracing
+    configure_from_env()
+    tracing.configure_from_env()
+
+    daemon = BotDaemon(socket_path=args.socket, live=args.live, db_path=args.db, workers=args.workers,
+                       archive_days=args.archive_days)
+    try:
+        daemon.start()
+    except OSError as e:
+        print(e)
+        return 1
+    for account_id in args.account:
+        daemon.get_engine(account_id)
+    try:
+        daemon.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        daemon.stop()
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
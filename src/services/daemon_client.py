@@ -0,0 +1,293 @@
+"""
+Client du démon CoinTrader
+
+Connexion de l'interface Tk au démon (socket Unix) : requêtes synchrones
+(toggle_bot, create_bot, ...) et réception en arrière-plan des changements
+d'état des bots. RemoteBotEngine expose la même interface que BotEngine
+pour les vues, qui n'ont pas à savoir où tournent les bots.
+"""
+import itertools
+import json
+import os
+import socket
+import threading
+from src.services.daemon import default_socket_path, encode_message, ENCODING
+
+# Constantes - Connexion
+CONNECT_TIMEOUT = 1.0
+REQUEST_TIMEOUT = 10.0
+
+# Constantes - Messages de log
+LOG_CONNECTED = "✓ Connecté au démon CoinTrader ({path})"
+LOG_DISCONNECTED = "⚠ Connexion au démon CoinTrader perdue"
+LOG_LISTENER_ERROR = "✗ Erreur écouteur démon: {error}"
+ERROR_DISCONNECTED = "Connexion au démon perdue"
+
+
+class DaemonClient:
+    """Connexion à un démon CoinTrader"""
+
+    def __init__(self, socket_path=None):
+        self.socket_path = socket_path or default_socket_path()
+        self.sock = None
+        self.connected = False
+
+        self._ids = itertools.count(1)
+        self._pending = {}              # {id: [threading.Event, réponse]}
+        self._event_listeners = []      # callback(message)
+        self._disconnect_listeners = []  # callback()
+        self._send_lock = threading.Lock()
+        self._pending_lock = threading.Lock()
+        self._reader = None
+
+    @staticmethod
+    def is_supported():
+        return hasattr(socket, 'AF_UNIX')
+
+    def connect(self, timeout=CONNECT_TIMEOUT):
+        """
+        Se connecte au démon
+
+        Returns:
+            bool: True si le démon a répondu
+        """
+        if not self.is_supported() or not os.path.exists(self.socket_path):
+            return False
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        sock.settimeout(timeout)
+        try:
+            sock.connect(self.socket_path)
+        except OSError:
+            sock.close()
+            return False
+        sock.settimeout(None)
+
+        self.sock = sock
+        self.connected = True
+        self._reader = threading.Thread(target=self._read_loop, name='daemon-client-reader', daemon=True)
+        self._reader.start()
+
+        success, _ = self.call('ping', timeout=timeout)
+        if not success:
+            self.close()
+            return False
+        print(LOG_CONNECTED.format(path=self.socket_path))
+        return True
+
+    def close(self):
+        self.connected = False
+        if self.sock is not None:
+            try:
+                self.sock.shutdown(socket.SHUT_RDWR)
+            except OSError:
+                pass
+            self.sock.close()
+            self.sock = None
+
+    def add_event_listener(self, callback):
+        """Enregistre un callback(message) appelé (thread de lecture) pour chaque événement"""
+        self._event_listeners.append(callback)
+
+    def remove_event_listener(self, callback):
+        if callback in self._event_listeners:
+            self._event_listeners.remove(callback)
+
+    def add_disconnect_listener(self, callback):
+        """Enregistre un callback() appelé (thread de lecture) quand la connexion est perdue"""
+        self._disconnect_listeners.append(callback)
+
+    def call(self, cmd, timeout=REQUEST_TIMEOUT, **params):
+        """
+        Envoie une commande et attend sa réponse
+
+        Args:
+            cmd (str): Nom de la commande
+            timeout (float): Délai maximum d'attente en secondes
+            **params: Paramètres de la commande
+
+        Returns:
+            tuple: (success: bool, result ou message d'erreur)
+        """
+        if not self.connected:
+            return False, "Démon non connecté"
+
+        request_id = next(self._ids)
+        slot = [threading.Event(), None]
+        with self._pending_lock:
+            self._pending[request_id] = slot
+        try:
+            if not self.connected:
+                # Déconnexion survenue avant l'enregistrement : personne ne répondra
+                return False, ERROR_DISCONNECTED
+            with self._send_lock:
+                self.sock.sendall(encode_message({'id': request_id, 'cmd': cmd, **params}))
+            if not slot[0].wait(timeout):
+                return False, f"Délai dépassé pour '{cmd}'"
+        except OSError as e:
+            return False, str(e)
+        finally:
+            with self._pending_lock:
+                self._pending.pop(request_id, None)
+
+        response = slot[1]
+        if not response.get('ok'):
+            return False, response.get('error')
+        return True, response.get('result')
+
+    def _read_loop(self):
+        try:
+            for line in self.sock.makefile('rb'):
+                try:
+                    message = json.loads(line.decode(ENCODING))
+                except ValueError:
+                    continue
+                if 'event' in message:
+                    for callback in list(self._event_listeners):
+                        try:
+                            callback(message)
+                        except Exception as e:
+                            print(LOG_LISTENER_ERROR.format(error=e))
+                    continue
+                with self._pending_lock:
+                    slot = self._pending.get(message.get('id'))
+                if slot is not None:
+                    slot[1] = message
+                    slot[0].set()
+        except (OSError, ValueError):
+            pass
+        if self.connected:
+            print(LOG_DISCONNECTED)
+        self.connected = False
+
+        # Les appels en attente échouent immédiatement au lieu d'attendre leur délai
+        with self._pending_lock:
+            slots = list(self._pending.values())
+        for slot in slots:
+            slot[1] = {'ok': False, 'error': ERROR_DISCONNECTED}
+            slot[0].set()
+        for callback in list(self._disconnect_listeners):
+            try:
+                callback()
+            except Exception as e:
+                print(LOG_LISTENER_ERROR.format(error=e))
+
+
+class RemoteBotEngine:
+    """Moteur de bots exécuté par le démon, vu depuis l'interface"""
+
+    def __init__(self, client, account_id):
+        self.client = client
+        self.account_id = account_id
+        self._states = {}
+        self._listeners = []
+        self._lock = threading.Lock()
+
+    def subscribe(self):
+        """
+        S'abonne aux changements du compte et récupère l'état initial
+
+        Returns:
+            bool: True si l'abonnement a réussi
+        """
+        self.client.add_event_listener(self._on_event)
+        success, states = self.client.call('subscribe', account_id=self.account_id)
+        if not success:
+            self.client.remove_event_listener(self._on_event)
+            return False
+        with self._lock:
+            # Les clés JSON sont des chaînes : retour aux bot_id entiers
+            self._states = {int(bot_id): state for bot_id, state in states.items()}
+        return True
+
+    @property
+    def connected(self):
+        return self.client.connected
+
+    def _on_event(self, message):
+        if message.get('event') != 'bot_changed' or message.get('account_id') != self.account_id:
+            return
+        bot_id = message['bot_id']
+        changes = message['changes']
+        with self._lock:
+            self._states.setdefault(bot_id, {'bot_id': bot_id}).update(changes)
+        for callback in list(self._listeners):
+            try:
+                callback(bot_id, changes)
+            except Exception as e:
+                print(LOG_LISTENER_ERROR.format(error=e))
+
+    # Interface BotEngine utilisée par les vues
+
+    def load(self, bots):
+        """Demande au démon de recharger les bots du compte depuis la base"""
+        self.client.call('reload', account_id=self.account_id)
+
+    def get_state(self, bot_id):
+        with self._lock:
+            state = self._states.get(bot_id)
+            return dict(state) if state else None
+
+    def get_states(self):
+        with self._lock:
+            return {bot_id: dict(state) for bot_id, state in self._states.items()}
+
+    def set_active(self, bot_id, is_active):
+        self.client.call('set_active', account_id=self.account_id, bot_id=bot_id, is_active=is_active)
+
+    def toggle_bot(self, bot_id, is_active):
+        """Active/désactive un bot en base et dans le moteur du démon"""
+        success, result = self.client.call('toggle_bot', account_id=self.account_id,
+                                           bot_id=bot_id, is_active=is_active)
+        return result if success else {'success': False, 'message': result}
+
+    def create_bot(self, **bot):
+        """Crée un bot (paramètres de BotController.create_bot, sans user_id)"""
+        success, result = self.client.call('create_bot', account_id=self.account_id, bot=bot)
+        return result if success else {'success': False, 'message': result, 'bot_id': None}
+
+    def add_listener(self, callback):
+        self._listeners.append(callback)
+
+    def remove_listener(self, callback):
+        if callback in self._listeners:
+            self._listeners.remove(callback)
+
+    def start(self):
+        pass
+
+    def stop(self, wait=True):
+        self.client.call('unsubscribe', account_id=self.account_id)
+        self.client.remove_event_listener(self._on_event)
+
+
+_client = None
+_client_lock = threading.Lock()
+
+
+def get_daemon_client(socket_path=None):
+    """
+    Retourne la connexion au démon partagée par le processus
+
+    Returns:
+        DaemonClient or None: None si aucun démon n'est à l'écoute
+    """
+    global _client
+    with _client_lock:
+        if _client is None or not _client.connected:
+            client = DaemonClient(socket_path)
+            _client = client if client.connect() else None
+        return _client
+
+
+def connect_remote_engine(account_id):
+    """
+    Moteur distant d'un compte si un démon est disponible
+
+    Returns:
+        RemoteBotEngine or None
+    """
+    client = get_daemon_client()
+    if client is None:
+        return None
+    engine = RemoteBotEngine(client, account_id)
+    return engine if engine.subscribe() else None
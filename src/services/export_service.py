@@ -0,0 +1,439 @@
+"""
+Export en flux des ordres et de l'historique d'activité (CSV, Parquet, colonnes compressées)
+
+Les lignes sont lues par lots de taille fixe, chaque lot étant une requête
+courte reprenant après la dernière clé lue (WHERE order_id > ? ORDER BY
+order_id LIMIT ?) : aucun verrou de lecture n'est tenu entre deux lots, le
+démon continue d'écrire pendant un export de plusieurs millions de lignes.
+Les partitions archivées sont lues d'abord (de la plus ancienne à la plus
+récente), puis la base principale.
+
+Formats :
+    csv       texte, une ligne d'en-tête
+    parquet   si pyarrow est installé (un groupe de lignes par lot)
+    columnar  sinon : format colonnes maison (.ccol), un bloc compressé (zlib)
+              par colonne et par lot ; read_columnar() le relit (un chemin
+              .parquet demandé sans pyarrow est écrit en .ccol)
+
+Mémoire constante : un seul lot en mémoire, fichier écrit sous un nom
+temporaire puis renommé à la fin (aucun fichier partiel en cas d'erreur ou
+d'annulation).
+
+Usage:
+    python -m src.services.export_service orders sortie.csv [--account 1] [--format parquet]
+    python -m src.services.export_service --convert export.ccol sortie.csv
+"""
+import argparse
+import csv
+import json
+import math
+import os
+import struct
+import sys
+import threading
+import zlib
+from array import array
+from datetime import datetime
+from src.models.database_model import DatabaseModel
+from src.services.archive_service import ArchiveService
+
+try:
+    import pyarrow
+    import pyarrow.parquet
+except ImportError:                     # dépendance optionnelle
+    pyarrow = None
+
+# Constantes - Export
+EXPORT_BATCH_SIZE = 10000
+EXPORT_DIR = 'datas/exports'
+FORMAT_CSV = 'csv'
+FORMAT_PARQUET = 'parquet'
+FORMAT_COLUMNAR = 'columnar'
+FORMAT_EXTENSIONS = {FORMAT_CSV: '.csv', FORMAT_PARQUET: '.parquet', FORMAT_COLUMNAR: '.ccol'}
+
+# Constantes - Format colonnes (.ccol)
+COLUMNAR_MAGIC = b'CTCOL1'
+COLUMNAR_FOOTER = struct.Struct('<Q6s')          # taille du pied JSON, magic
+COLUMNAR_BLOCK = struct.Struct('<I')             # taille d'un bloc de colonne compressé
+COLUMNAR_ROWS = struct.Struct('<I')              # lignes d'un lot
+NULL_LENGTH = 0xFFFFFFFF
+COMPRESSION_LEVEL = 6
+
+# Constantes - Messages de log
+LOG_EXPORT_DONE = "✓ Export {source}: {rows:,} lignes → {path}"
+LOG_EXPORT_CANCELLED = "⚠ Export {source} annulé après {rows:,} lignes"
+LOG_PARQUET_UNAVAILABLE = "⚠ pyarrow absent : export au format colonnes compressées (.ccol)"
+
+# Sources exportables : colonnes (nom, type) dans l'ordre du fichier
+SOURCES = {
+    'orders': {
+        'columns': (
+            ('order_id', 'int'), ('bot_id', 'int'), ('account_id', 'int'), ('exchange', 'str'),
+            ('product_id', 'str'), ('side', 'str'), ('order_type', 'str'), ('prix_limite', 'float'),
+            ('prix_execution', 'float'), ('quantite', 'float'), ('montant_usdc', 'float'),
+            ('quantite_executee', 'float'), ('montant_execute', 'float'), ('frais', 'float'), ('status', 'str'),
+            ('order_id_exchange', 'str'), ('created_at', 'str'), ('executed_at', 'str'),
+        ),
+        'select': """
+            SELECT o.order_id, o.bot_id, o.fk_account_id, e.name, o.product_id, o.type, o.order_type,
+                   o.prix_limite, o.prix_execution, o.quantite, o.montant_usdc, o.quantite_executee,
+                   o.montant_execute, o.frais, o.status, o.order_id_exchange, o.created_at, o.executed_at
+            FROM {schema}.orders o
+            LEFT JOIN main.exchanges e ON o.fk_exchange_id = e.exchange_id
+            WHERE o.order_id > :after {account}
+            ORDER BY o.order_id
+            LIMIT :limit
+        """,
+        'account': "AND o.fk_account_id = :account",
+        'count': "SELECT COUNT(*) FROM {schema}.orders o WHERE 1 {account}",
+    },
+    'activity_logs': {
+        'columns': (
+            ('log_id', 'int'), ('account_id', 'int'), ('action_type', 'str'), ('description', 'str'),
+            ('created_at', 'str'),
+        ),
+        'select': """
+            SELECT a.log_id, a.fk_account_id, a.action_type, a.description, a.created_at
+            FROM {schema}.activity_logs a
+            WHERE a.log_id > :after {account}
+            ORDER BY a.log_id
+            LIMIT :limit
+        """,
+        'account': "AND a.fk_account_id = :account",
+        'count': "SELECT COUNT(*) FROM {schema}.activity_logs a WHERE 1 {account}",
+    },
+}
+
+
+def _statements(schema):
+    """Textes SQL constants d'un schéma : {source: {(requête, par compte): sql}}"""
+    return {
+        source: {
+            (kind, by_account): spec[kind].format(schema=schema, account=spec['account'] if by_account else '')
+            for kind in ('select', 'count') for by_account in (False, True)
+        }
+        for source, spec in SOURCES.items()
+    }
+
+
+STATEMENTS = {'main': _statements('main'), 'archive': _statements('archive')}
+
+
+def resolve_format(fmt):
+    """
+    Format effectif : parquet sans pyarrow devient columnar
+
+    Returns:
+        str: FORMAT_CSV, FORMAT_PARQUET ou FORMAT_COLUMNAR
+    """
+    fmt = (fmt or FORMAT_CSV).lower()
+    if fmt not in FORMAT_EXTENSIONS:
+        raise ValueError(f"Format d'export inconnu: {fmt}")
+    if fmt == FORMAT_PARQUET and pyarrow is None:
+        print(LOG_PARQUET_UNAVAILABLE)
+        return FORMAT_COLUMNAR
+    return fmt
+
+
+def _with_extension(path, fmt):
+    """
+    Chemin demandé, extension corrigée quand parquet retombe sur columnar
+
+    Un fichier .parquet contenant du .ccol serait illisible par les outils
+    parquet : sortie.parquet devient sortie.ccol.
+    """
+    root, extension = os.path.splitext(path)
+    if fmt == FORMAT_COLUMNAR and extension.lower() == FORMAT_EXTENSIONS[FORMAT_PARQUET]:
+        return root + FORMAT_EXTENSIONS[FORMAT_COLUMNAR]
+    return path
+
+
+# ============================================
+# ÉCRIVAINS
+# ============================================
+
+class CsvWriter:
+    def __init__(self, path, columns):
+        self.file = open(path, 'w', newline='', encoding='utf-8')
+        self.writer = csv.writer(self.file)
+        self.writer.writerow([name for name, _ in columns])
+
+    def write(self, rows):
+        self.writer.writerows(rows)
+
+    def close(self):
+        self.file.close()
+
+
+class ParquetWriter:
+    TYPES = {'int': 'int64', 'float': 'float64', 'str': 'string'}
+
+    def __init__(self, path, columns):
+        self.schema = pyarrow.schema([(name, self.TYPES[kind]) for name, kind in columns])
+        self.writer = pyarrow.parquet.ParquetWriter(path, self.schema)
+
+    def write(self, rows):
+        columns = [pyarrow.array(values, type=field.type) for values, field in zip(zip(*rows), self.schema)]
+        self.writer.write_batch(pyarrow.RecordBatch.from_arrays(columns, schema=self.schema))
+
+    def close(self):
+        self.writer.close()
+
+
+def _encode_column(values, kind):
+    """Bloc d'une colonne : entiers/flottants en binaire petit-boutiste, textes longueurs + UTF-8"""
+    if kind == 'float':
+        data = array('d', (math.nan if v is None else v for v in values))
+        extra = b''
+    elif kind == 'int':
+        data = array('q', (0 if v is None else v for v in values))
+        extra = bytes(v is None for v in values)           # masque des valeurs nulles
+    else:
+        encoded = [None if v is None else str(v).encode('utf-8') for v in values]
+        data = array('I', (NULL_LENGTH if v is None else len(v) for v in encoded))
+        extra = b''.join(v for v in encoded if v)          # textes concaténés
+    if sys.byteorder == 'big':
+        data.byteswap()
+    return zlib.compress(data.tobytes() + extra, COMPRESSION_LEVEL)
+
+
+def _decode_column(block, kind, count):
+    raw = zlib.decompress(block)
+    typecode = {'float': 'd', 'int': 'q', 'str': 'I'}[kind]
+    data = array(typecode)
+    size = data.itemsize * count
+    data.frombytes(raw[:size])
+    if sys.byteorder == 'big':
+        data.byteswap()
+    rest = raw[size:]
+    if kind == 'float':
+        return [None if v != v else v for v in data]
+    if kind == 'int':
+        return [None if null else v for v, null in zip(data, rest)]
+    values, offset = [], 0
+    for length in data:
+        if length == NULL_LENGTH:
+            values.append(None)
+        else:
+            values.append(rest[offset:offset + length].decode('utf-8'))
+            offset += length
+    return values
+
+
+class ColumnarWriter:
+    """
+    Format .ccol :
+        CTCOL1 | lots [lignes, (taille, bloc zlib) par colonne] | pied JSON | taille du pied, CTCOL1
+    """
+
+    def __init__(self, path, columns):
+        self.columns = columns
+        self.file = open(path, 'wb')
+        self.file.write(COLUMNAR_MAGIC)
+        self.batches = []               # [(position, lignes)]
+        self.rows = 0
+
+    def write(self, rows):
+        self.batches.append((self.file.tell(), len(rows)))
+        self.rows += len(rows)
+        self.file.write(COLUMNAR_ROWS.pack(len(rows)))
+        for (_, kind), values in zip(self.columns, zip(*rows)):
+            block = _encode_column(values, kind)
+            self.file.write(COLUMNAR_BLOCK.pack(len(block)))
+            self.file.write(block)
+
+    def close(self):
+        footer = json.dumps({
+            'columns': self.columns, 'rows': self.rows, 'batches': self.batches
+        }).encode('utf-8')
+        self.file.write(footer)
+        self.file.write(COLUMNAR_FOOTER.pack(len(footer), COLUMNAR_MAGIC))
+        self.file.close()
+
+
+def _read_footer(f, path):
+    if f.read(len(COLUMNAR_MAGIC)) != COLUMNAR_MAGIC:
+        raise ValueError(f"{path} n'est pas un export .ccol")
+    f.seek(-COLUMNAR_FOOTER.size, os.SEEK_END)
+    footer_size, magic = COLUMNAR_FOOTER.unpack(f.read(COLUMNAR_FOOTER.size))
+    if magic != COLUMNAR_MAGIC:
+        raise ValueError(f"{path} est incomplet")
+    f.seek(-COLUMNAR_FOOTER.size - footer_size, os.SEEK_END)
+    return json.loads(f.read(footer_size))
+
+
+def columnar_names(path):
+    """
+    Noms des colonnes d'un fichier .ccol, même sans aucun lot (export de 0 ligne)
+
+    Returns:
+        list: Noms des colonnes dans l'ordre du fichier
+    """
+    with open(path, 'rb') as f:
+        return [name for name, _ in _read_footer(f, path)['columns']]
+
+
+def read_columnar(path):
+    """
+    Relit un fichier .ccol lot par lot
+
+    Yields:
+        tuple: (noms des colonnes, lignes du lot)
+    """
+    with open(path, 'rb') as f:
+        footer = _read_footer(f, path)
+        names = [name for name, _ in footer['columns']]
+
+        for position, _ in footer['batches']:
+            f.seek(position)
+            count = COLUMNAR_ROWS.unpack(f.read(COLUMNAR_ROWS.size))[0]
+            columns = []
+            for _, kind in footer['columns']:
+                size = COLUMNAR_BLOCK.unpack(f.read(COLUMNAR_BLOCK.size))[0]
+                columns.append(_decode_column(f.read(size), kind, count))
+            yield names, list(zip(*columns))
+
+
+WRITERS = {FORMAT_CSV: CsvWriter, FORMAT_PARQUET: ParquetWriter, FORMAT_COLUMNAR: ColumnarWriter}
+
+
+# ============================================
+# EXPORT
+# ============================================
+
+class ExportProgress:
+    """État partagé d'un export en cours (écrit par le thread d'export, lu par l'interface)"""
+
+    __slots__ = ('rows', 'total', 'cancel_event')
+
+    def __init__(self):
+        self.rows = 0
+        self.total = None
+        self.cancel_event = threading.Event()
+
+    def cancel(self):
+        self.cancel_event.set()
+
+    @property
+    def cancelled(self):
+        return self.cancel_event.is_set()
+
+    @property
+    def fraction(self):
+        return min(1.0, self.rows / self.total) if self.total else 0.0
+
+
+class ExportService:
+    """Export en flux d'une source (orders, activity_logs) vers un fichier"""
+
+    def __init__(self, db_path="datas/cointrader.db", batch_size=EXPORT_BATCH_SIZE):
+        """
+        Args:
+            db_path (str): Chemin de la base principale
+            batch_size (int): Lignes lues et écrites par lot
+        """
+        self.db_path = db_path
+        self.batch_size = batch_size
+
+    def default_path(self, source, account_id=None, fmt=FORMAT_CSV):
+        suffix = f"_{account_id}" if account_id is not None else ''
+        stamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+        return os.path.join(EXPORT_DIR, f"{source}{suffix}_{stamp}{FORMAT_EXTENSIONS[fmt]}")
+
+    def export(self, source, path=None, account_id=None, fmt=FORMAT_CSV, progress=None):
+        """
+        Exporte une source complète (partitions archivées comprises)
+
+        Connexion dédiée : peut s'exécuter dans n'importe quel thread.
+
+        Args:
+            source (str): 'orders' ou 'activity_logs'
+            path (str, optional): Fichier de sortie (défaut : datas/exports/...)
+            account_id (int, optional): Limiter à un compte
+            fmt (str): FORMAT_CSV, FORMAT_PARQUET ou FORMAT_COLUMNAR
+            progress (ExportProgress, optional): Progression et annulation
+
+        Returns:
+            tuple: (chemin: str or None si annulé, lignes écrites: int)
+        """
+        spec = SOURCES[source]
+        fmt = resolve_format(fmt)
+        path = _with_extension(path, fmt) if path else self.default_path(source, account_id, fmt)
+        progress = progress or ExportProgress()
+        by_account = account_id is not None
+        params = {'account': account_id, 'limit': self.batch_size}
+
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        tmp_path = f"{path}.tmp"
+        db = DatabaseModel(self.db_path)
+        writer = None
+        try:
+            archive = ArchiveService(db)
+            progress.total = sum(
+                db.connection.execute(STATEMENTS[schema][source][('count', by_account)], params).fetchone()[0]
+                for schema in archive.iter_sources()
+            )
+            writer = WRITERS[fmt](tmp_path, spec['columns'])
+            for schema in archive.iter_sources():
+                statement = STATEMENTS[schema][source][('select', by_account)]
+                params['after'] = -1
+                cursor = db.connection.cursor()
+                cursor.row_factory = None           # tuples : pas d'objet sqlite3.Row par ligne
+                try:
+                    while not progress.cancelled:
+                        # Lot indépendant : aucun verrou de lecture tenu entre deux lots
+                        rows = cursor.execute(statement, params).fetchall()
+                        if not rows:
+                            break
+                        writer.write(rows)
+                        progress.rows += len(rows)
+                        params['after'] = rows[-1][0]
+                finally:
+                    cursor.close()
+                if progress.cancelled:
+                    break
+            writer.close()
+            writer = None
+
+            if progress.cancelled:
+                os.remove(tmp_path)
+                print(LOG_EXPORT_CANCELLED.format(source=source, rows=progress.rows))
+                return None, progress.rows
+            os.replace(tmp_path, path)
+            print(LOG_EXPORT_DONE.format(source=source, rows=progress.rows, path=path))
+            return path, progress.rows
+
+        except BaseException:
+            if writer is not None:
+                writer.close()
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+        finally:
+            db.close()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Export CoinTrader des ordres et de l'historique d'activité")
+    parser.add_argument('source', nargs='?', choices=sorted(SOURCES), help="Table exportée")
+    parser.add_argument('path', nargs='?', default=None, help="Fichier de sortie")
+    parser.add_argument('--account', type=int, default=None, help="Limiter à un compte")
+    parser.add_argument('--format', default=FORMAT_CSV, choices=sorted(FORMAT_EXTENSIONS), help="Format du fichier")
+    parser.add_argument('--db', default="datas/cointrader.db", help="Base principale")
+    parser.add_argument('--convert', nargs=2, metavar=('CCOL', 'CSV'), help="Convertir un export .ccol en CSV")
+    args = parser.parse_args(argv)
+
+    if args.convert:
+        source, target = args.convert
+        csv_writer = CsvWriter(target, [(name, None) for name in columnar_names(source)])
+        for _, rows in read_columnar(source):
+            csv_writer.write(rows)
+        csv_writer.close()
+        return
+    if not args.source:
+        parser.error("source requise (orders ou activity_logs)")
+    ExportService(args.db).export(args.source, args.path, args.account, args.format)
+
+
+if __name__ == "__main__":
+    main()
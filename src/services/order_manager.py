@@ -0,0 +1,561 @@
+"""
+Gestionnaire du cycle de vie des ordres
+
+Chaque ordre suit la machine à états pending → open → partially_filled →
+filled/cancelled (ou rejected). L'état courant vit en mémoire ; les
+transitions sont accumulées puis écrites par lots dans la table orders.
+Au démarrage, `recover()` reconstruit l'état à partir des ordres non
+terminés de la table.
+
+Les quantités exécutées viennent de deux sources : les exécutions (fills,
+dédoublonnées par trade_id) et les totaux renvoyés par l'exchange
+(get_order). Chacune ne voit qu'une partie des exécutions réelles, jamais
+plus : l'ordre retient la plus avancée des deux, sans double comptage.
+"""
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from src.models.database_model import DatabaseModel
+from src.models.exchanges.exchange_base import ExchangeBase
+from src.models.order_model import (
+    OrderModel, STATUS_PENDING, STATUS_OPEN, STATUS_PARTIALLY_FILLED,
+    STATUS_FILLED, STATUS_CANCELLED, STATUS_REJECTED, TERMINAL_STATUSES
+)
+
+# Constantes - Persistance et réconciliation
+FLUSH_INTERVAL = 0.5
+FLUSH_BATCH_SIZE = 200
+POLL_INTERVAL = 5.0
+MAX_CONCURRENT_REQUESTS = 4
+
+# Transitions autorisées
+ALLOWED_TRANSITIONS = {
+    STATUS_PENDING: {STATUS_OPEN, STATUS_PARTIALLY_FILLED, STATUS_FILLED, STATUS_CANCELLED, STATUS_REJECTED},
+    STATUS_OPEN: {STATUS_PARTIALLY_FILLED, STATUS_FILLED, STATUS_CANCELLED},
+    STATUS_PARTIALLY_FILLED: {STATUS_PARTIALLY_FILLED, STATUS_FILLED, STATUS_CANCELLED},
+    STATUS_FILLED: set(),
+    STATUS_CANCELLED: set(),
+    STATUS_REJECTED: set()
+}
+
+# Constantes - Messages de log
+LOG_ORDER_SUBMIT_FAILED = "✗ Ordre {order_id} rejeté par {exchange}"
+LOG_INVALID_TRANSITION = "⚠ Transition invalide {old} → {new} pour l'ordre {order_id}"
+LOG_RECOVERED = "✓ {count} ordre(s) actif(s) restauré(s) depuis la base"
+LOG_RECONCILE_ERROR = "✗ Erreur réconciliation ordre {order_id}: {error}"
+LOG_NO_EXCHANGE = "⚠ Exchange '{exchange}' indisponible pour l'ordre {order_id}"
+
+
+class ManagedOrder:
+    """État en mémoire d'un ordre suivi par le gestionnaire"""
+
+    __slots__ = (
+        'order_id', 'bot_id', 'account_id', 'exchange_id', 'exchange_name',
+        'product_id', 'side', 'order_type', 'status', 'order_id_exchange',
+        'size', 'funds', 'price', 'filled_size', 'executed_value', 'fees',
+        'created_at', 'executed_at', 'trade_ids', 'streamed', 'reported'
+    )
+
+    def __init__(self, order_id, account_id, exchange_id, exchange_name, product_id, side,
+                 order_type='market', bot_id=None, size=None, funds=None, price=None,
+                 status=STATUS_PENDING, order_id_exchange=None):
+        self.order_id = order_id
+        self.bot_id = bot_id
+        self.account_id = account_id
+        self.exchange_id = exchange_id
+        self.exchange_name = exchange_name
+        self.product_id = product_id
+        self.side = side
+        self.order_type = order_type
+        self.status = status
+        self.order_id_exchange = order_id_exchange
+        self.size = size
+        self.funds = funds
+        self.price = price
+        self.filled_size = 0.0
+        self.executed_value = 0.0
+        self.fees = 0.0
+        self.created_at = datetime.now()
+        self.executed_at = None
+        self.trade_ids = set()              # fills déjà comptés
+        self.streamed = (0.0, 0.0, 0.0)     # (quantité, valeur, frais) cumulés des fills
+        self.reported = (0.0, 0.0, 0.0)     # derniers totaux renvoyés par l'exchange
+
+    @property
+    def totals(self):
+        """Totaux exécutés retenus : la source (fills ou exchange) la plus avancée"""
+        return self.streamed if self.streamed[0] >= self.reported[0] else self.reported
+
+    @property
+    def is_terminal(self):
+        return self.status in TERMINAL_STATUSES
+
+    @property
+    def average_price(self):
+        return self.executed_value / self.filled_size if self.filled_size else None
+
+    def to_dict(self):
+        return {name: getattr(self, name) for name in self.__slots__
+                if name not in ('trade_ids', 'streamed', 'reported')}
+
+
+def _parse_timestamp(value):
+    """Horodatage lu en base (texte SQLite) → datetime, comme pour les nouveaux ordres"""
+    if isinstance(value, str):
+        try:
+            return datetime.fromisoformat(value)
+        except ValueError:
+            return None
+    return value
+
+
+def _supports_fills(exchange):
+    """True si l'adapter (ou l'adapter enveloppé par le registre) implémente get_fills"""
+    adapter = getattr(exchange, 'adapter', exchange)
+    return getattr(type(adapter), 'get_fills', ExchangeBase.get_fills) is not ExchangeBase.get_fills
+
+
+def exchange_status_to_local(order):
+    """
+    Traduit un ordre normalisé par un adapter d'exchange en statut local
+
+    Args:
+        order (dict): Ordre renvoyé par ExchangeBase.get_order/place_order
+
+    Returns:
+        str: Statut local
+    """
+    status = (order.get('status') or '').lower()
+    filled = order.get('filled_size') or 0.0
+
+    if status in ('done', 'settled', 'filled'):
+        reason = (order.get('done_reason') or 'filled').lower()
+        return STATUS_CANCELLED if reason.startswith('cancel') else STATUS_FILLED
+    if status in ('rejected', 'failed'):
+        return STATUS_REJECTED
+    if status in ('cancelled', 'canceled'):
+        return STATUS_CANCELLED
+    if status == 'pending' and not filled:
+        return STATUS_PENDING
+    return STATUS_PARTIALLY_FILLED if filled else STATUS_OPEN
+
+
+class OrderManager:
+    """Suivi des ordres en mémoire, persistance par lots et réconciliation avec l'exchange"""
+
+    def __init__(self, exchange_resolver=None, db_path="datas/cointrader.db",
+                 flush_interval=FLUSH_INTERVAL, batch_size=FLUSH_BATCH_SIZE,
+                 poll_interval=POLL_INTERVAL, max_concurrency=MAX_CONCURRENT_REQUESTS):
+        """
+        Args:
+            exchange_resolver (callable, optional): nom d'exchange → adapter ExchangeBase
+            db_path (str): Chemin de la base de données
+            flush_interval (float): Délai maximum avant écriture d'un lot (s)
+            batch_size (int): Taille de lot déclenchant une écriture immédiate
+            poll_interval (float): Période de réconciliation (s)
+            max_concurrency (int): Requêtes simultanées maximum vers les exchanges
+        """
+        self.exchange_resolver = exchange_resolver or self._default_resolver
+        self.order_model = OrderModel(DatabaseModel(db_path, check_same_thread=False))
+        self.flush_interval = flush_interval
+        self.batch_size = batch_size
+        self.poll_interval = poll_interval
+
+        self.orders = {}               # {order_id: ManagedOrder} (ordres actifs)
+        self._by_exchange_id = {}      # {order_id_exchange: order_id}
+        self._dirty = {}               # {order_id: ManagedOrder} en attente d'écriture
+        self._listeners = []
+
+        self._lock = threading.RLock()
+        self._db_lock = threading.Lock()
+        self._flush_event = threading.Event()
+        self._stop_event = threading.Event()
+        self._threads = []
+        self._executor = ThreadPoolExecutor(max_workers=max_concurrency, thread_name_prefix='order-reconcile')
+
+    @staticmethod
+    def _default_resolver(exchange_name):
+        from src.models.exchanges.registry import get_registry
+        return get_registry().get(exchange_name)
+
+    # ============================================
+    # ÉCOUTEURS
+    # ============================================
+
+    def add_listener(self, callback):
+        """Enregistre un callback(order: ManagedOrder, old_status: str) appelé à chaque transition"""
+        self._listeners.append(callback)
+
+    def remove_listener(self, callback):
+        if callback in self._listeners:
+            self._listeners.remove(callback)
+
+    # ============================================
+    # MACHINE À ÉTATS
+    # ============================================
+
+    def transition(self, order_id, new_status, order_id_exchange=None, filled_size=None,
+                   executed_value=None, fees=None):
+        """
+        Applique une transition à un ordre suivi
+
+        Args:
+            order_id (int): ID local de l'ordre
+            new_status (str): Nouveau statut
+            order_id_exchange (str, optional): ID côté exchange
+            filled_size (float, optional): Quantité exécutée cumulée
+            executed_value (float, optional): Valeur exécutée cumulée
+            fees (float, optional): Frais cumulés
+
+        Returns:
+            bool: True si la transition est appliquée
+        """
+        with self._lock:
+            result = self._transition_locked(order_id, new_status, order_id_exchange, filled_size,
+                                             executed_value, fees)
+        return self._notify(result)
+
+    def _transition_locked(self, order_id, new_status, order_id_exchange=None, filled_size=None,
+                           executed_value=None, fees=None):
+        """
+        Corps de transition(), appelé sous self._lock
+
+        Returns:
+            tuple or None: (ordre, ancien statut) si la transition est appliquée
+        """
+        order = self.orders.get(order_id)
+        if order is None:
+            return None
+
+        old_status = order.status
+        unchanged = (
+            new_status == old_status
+            and (filled_size is None or filled_size == order.filled_size)
+        )
+        if unchanged and order_id_exchange in (None, order.order_id_exchange):
+            return None
+        if new_status != old_status and new_status not in ALLOWED_TRANSITIONS[old_status]:
+            print(LOG_INVALID_TRANSITION.format(old=old_status, new=new_status, order_id=order_id))
+            return None
+
+        order.status = new_status
+        if order_id_exchange:
+            order.order_id_exchange = order_id_exchange
+            self._by_exchange_id[order_id_exchange] = order_id
+        if filled_size is not None:
+            order.filled_size = filled_size
+        if executed_value is not None:
+            order.executed_value = executed_value
+        if fees is not None:
+            order.fees = fees
+        if new_status in (STATUS_FILLED, STATUS_PARTIALLY_FILLED) and order.executed_at is None:
+            order.executed_at = datetime.now()
+
+        self._dirty[order_id] = order
+        if order.is_terminal:
+            self.orders.pop(order_id, None)
+            self._by_exchange_id.pop(order.order_id_exchange, None)
+
+        if len(self._dirty) >= self.batch_size:
+            self._flush_event.set()
+        return order, old_status
+
+    def _notify(self, result):
+        """Appelle les écouteurs (hors verrou) ; result : retour de _transition_locked"""
+        if result is None:
+            return False
+        order, old_status = result
+        for callback in list(self._listeners):
+            try:
+                callback(order, old_status)
+            except Exception as e:
+                print(f"✗ Erreur listener ordre {order.order_id}: {e}")
+        return True
+
+    def _apply_exchange_order(self, order_id, data):
+        """
+        Applique l'état renvoyé par l'exchange à un ordre suivi
+
+        Les totaux de l'exchange ne remplacent ceux des fills que s'ils sont plus avancés.
+        """
+        with self._lock:
+            order = self.orders.get(order_id)
+            if order is None:
+                return False
+            filled_size = executed_value = fees = None
+            if data.get('filled_size') is not None:
+                reported = (data['filled_size'], data.get('executed_value') or 0.0, data.get('fill_fees') or 0.0)
+                if reported[0] >= order.reported[0]:
+                    order.reported = reported
+                filled_size, executed_value, fees = order.totals
+            result = self._transition_locked(
+                order_id,
+                exchange_status_to_local(data),
+                order_id_exchange=data.get('id'),
+                filled_size=filled_size,
+                executed_value=executed_value,
+                fees=fees
+            )
+        return self._notify(result)
+
+    # ============================================
+    # SOUMISSION / ANNULATION
+    # ============================================
+
+    def submit_order(self, account_id, exchange_id, exchange_name, product_id, side,
+                     order_type='market', size=None, funds=None, price=None, bot_id=None):
+        """
+        Crée un ordre (statut pending) puis l'envoie à l'exchange
+
+        Returns:
+            ManagedOrder or None: Ordre suivi, None si l'insertion a échoué
+        """
+        with self._db_lock:
+            order_id = self.order_model.create_order(
+                account_id, exchange_id, product_id, side, bot_id=bot_id,
+                montant_usdc=funds, quantite=size, order_type=order_type, prix_limite=price
+            )
+        if order_id is None:
+            return None
+
+        order = ManagedOrder(
+            order_id, account_id, exchange_id, exchange_name, product_id, side,
+            order_type=order_type, bot_id=bot_id, size=size, funds=funds, price=price
+        )
+        with self._lock:
+            self.orders[order_id] = order
+
+        exchange = self.exchange_resolver(exchange_name)
+        data = None
+        if exchange is not None:
+            data = exchange.place_order(
+                product_id, side, order_type, size=size, funds=funds, price=price,
+                client_oid=f"ct-{order_id}", account_id=account_id
+            )
+
+        if data is None:
+            print(LOG_ORDER_SUBMIT_FAILED.format(order_id=order_id, exchange=exchange_name))
+            self.transition(order_id, STATUS_REJECTED)
+        else:
+            self._apply_exchange_order(order_id, data)
+
+        return order
+
+    def cancel_order(self, order_id):
+        """
+        Demande l'annulation d'un ordre actif
+
+        Returns:
+            bool: True si l'exchange a accepté l'annulation
+        """
+        with self._lock:
+            order = self.orders.get(order_id)
+        if order is None:
+            return False
+
+        if order.order_id_exchange is None:
+            return self.transition(order_id, STATUS_CANCELLED)
+
+        exchange = self.exchange_resolver(order.exchange_name)
+        if exchange is None or not exchange.cancel_order(order.order_id_exchange, order.account_id):
+            return False
+        return self.transition(order_id, STATUS_CANCELLED)
+
+    # ============================================
+    # RÉCONCILIATION
+    # ============================================
+
+    def on_fill(self, fill):
+        """
+        Applique une exécution reçue d'un flux (websocket ou polling des fills)
+
+        Lecture, cumul et transition se font sous un seul verrou : deux fills
+        simultanés ne perdent aucune mise à jour. Un fill déjà compté
+        (même trade_id) est ignoré.
+
+        Args:
+            fill (dict): {'trade_id', 'order_id' (ID exchange), 'price', 'size', 'fee'}
+
+        Returns:
+            bool: True si la transition est appliquée
+        """
+        with self._lock:
+            order_id = self._by_exchange_id.get(fill.get('order_id'))
+            order = self.orders.get(order_id) if order_id is not None else None
+            if order is None:
+                return False
+            trade_id = fill.get('trade_id')
+            if trade_id is not None:
+                if trade_id in order.trade_ids:
+                    return False
+                order.trade_ids.add(trade_id)
+
+            size, value, fee = order.streamed
+            order.streamed = (size + fill['size'], value + fill['price'] * fill['size'],
+                              fee + (fill.get('fee') or 0.0))
+            filled_size, executed_value, fees = order.totals
+            target = order.size
+            if target is None and order.funds:
+                complete = executed_value + fees >= order.funds * 0.999
+            else:
+                complete = target is not None and filled_size >= target * 0.999999
+
+            result = self._transition_locked(
+                order_id,
+                STATUS_FILLED if complete else STATUS_PARTIALLY_FILLED,
+                filled_size=filled_size,
+                executed_value=executed_value,
+                fees=fees
+            )
+        return self._notify(result)
+
+    def _reconcile_one(self, order):
+        exchange = self.exchange_resolver(order.exchange_name)
+        if exchange is None:
+            print(LOG_NO_EXCHANGE.format(exchange=order.exchange_name, order_id=order.order_id))
+            return
+        try:
+            # Fills d'abord (dédoublonnés par trade_id), puis statut et totaux de l'ordre
+            if _supports_fills(exchange):
+                for fill in exchange.get_fills(order_id_exchange=order.order_id_exchange,
+                                               account_id=order.account_id) or []:
+                    self.on_fill(fill)
+            data = exchange.get_order(order.order_id_exchange, order.account_id)
+            if data is not None:
+                self._apply_exchange_order(order.order_id, data)
+        except Exception as e:
+            print(LOG_RECONCILE_ERROR.format(order_id=order.order_id, error=e))
+
+    def reconcile(self):
+        """
+        Interroge l'exchange pour chaque ordre actif (concurrence bornée par le pool)
+
+        Returns:
+            int: Nombre d'ordres interrogés
+        """
+        with self._lock:
+            pending = [o for o in self.orders.values() if o.order_id_exchange]
+
+        futures = [self._executor.submit(self._reconcile_one, order) for order in pending]
+        for future in futures:
+            future.result()
+        return len(pending)
+
+    # ============================================
+    # PERSISTANCE
+    # ============================================
+
+    def flush(self):
+        """
+        Écrit les transitions en attente en une seule transaction
+
+        Returns:
+            int: Nombre d'ordres écrits
+        """
+        with self._lock:
+            if not self._dirty:
+                return 0
+            batch = list(self._dirty.values())
+            self._dirty = {}
+            updates = [
+                (
+                    o.status,
+                    o.order_id_exchange,
+                    o.average_price,
+                    o.filled_size,
+                    o.executed_value,
+                    o.fees,
+                    o.executed_at,
+                    o.order_id
+                )
+                for o in batch
+            ]
+
+        with self._db_lock:
+            ok = self.order_model.apply_transitions(updates)
+
+        if not ok:
+            # Remettre le lot en file pour la prochaine écriture
+            with self._lock:
+                for o in batch:
+                    self._dirty.setdefault(o.order_id, o)
+            return 0
+        return len(updates)
+
+    def recover(self):
+        """
+        Reconstruit l'état en mémoire à partir des ordres non terminés en base
+
+        Returns:
+            int: Nombre d'ordres restaurés
+        """
+        with self._db_lock:
+            rows = self.order_model.get_active_orders()
+
+        with self._lock:
+            for row in rows:
+                order = ManagedOrder(
+                    row['order_id'], row['account_id'], row['exchange_id'], row['exchange_name'],
+                    row['product_id'], row['side'], order_type=row['order_type'] or 'market',
+                    bot_id=row['bot_id'], size=row['quantite'], funds=row['montant_usdc'],
+                    price=row['prix_limite'], status=row['status'],
+                    order_id_exchange=row['order_id_exchange']
+                )
+                order.filled_size = row['quantite_executee'] or 0.0
+                order.executed_value = row['montant_execute'] or 0.0
+                order.fees = row['frais'] or 0.0
+                # Les fills reçus après le redémarrage s'ajoutent à l'exécuté enregistré
+                order.streamed = (order.filled_size, order.executed_value, order.fees)
+                order.created_at = _parse_timestamp(row['created_at']) or order.created_at
+                order.executed_at = _parse_timestamp(row['executed_at'])
+                self.orders[order.order_id] = order
+                if order.order_id_exchange:
+                    self._by_exchange_id[order.order_id_exchange] = order.order_id
+
+        print(LOG_RECOVERED.format(count=len(rows)))
+        return len(rows)
+
+    # ============================================
+    # THREADS D'ARRIÈRE-PLAN
+    # ============================================
+
+    def _flush_loop(self):
+        while not self._stop_event.is_set():
+            self._flush_event.wait(self.flush_interval)
+            self._flush_event.clear()
+            self.flush()
+
+    def _poll_loop(self):
+        while not self._stop_event.wait(self.poll_interval):
+            self.reconcile()
+
+    def start(self, poll=True):
+        """Restaure l'état puis démarre l'écriture par lots et (optionnellement) le polling"""
+        self.recover()
+        self._stop_event.clear()
+        targets = [self._flush_loop] + ([self._poll_loop] if poll else [])
+        for target in targets:
+            thread = threading.Thread(target=target, daemon=True, name=f"order-manager-{target.__name__}")
+            thread.start()
+            self._threads.append(thread)
+
+    def stop(self):
+        """Arrête les threads et écrit les dernières transitions"""
+        self._stop_event.set()
+        self._flush_event.set()
+        for thread in self._threads:
+            thread.join(timeout=self.poll_interval + 1)
+        self._threads = []
+        self._executor.shutdown(wait=True)
+        self.flush()
+
+    def get_order(self, order_id):
+        with self._lock:
+            return self.orders.get(order_id)
+
+    def get_active_orders(self, account_id=None):
+        with self._lock:
+            return [
+                o for o in self.orders.values()
+                if account_id is None or o.account_id == account_id
+            ]
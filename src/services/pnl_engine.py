@@ -0,0 +1,457 @@
+"""
+Moteur de PnL : positions, PnL réalisé/latent, frais et exposition
+
+Tenue incrémentale :
+    - chaque transition d'ordre (écouteur de l'OrderManager) applique la part
+      nouvellement exécutée (quantité, valeur, frais cumulés moins ceux déjà vus)
+      à la position (compte, bot, produit) au coût moyen pondéré
+    - les prix (table de prix partagée, ou on_price) valorisent les positions :
+      PnL latent = quantité × prix - coût, exposition = quantité × prix
+    - les flux (volumes, PnL réalisé, frais) sont ajoutés en mémoire aux
+      agrégats horaires et journaliers du moment d'exécution de l'ordre, puis
+      écrits par lots (pnl_rollup_hourly, pnl_rollup_daily, pnl_positions)
+
+Reconstruction complète : un seul parcours ordonné des ordres exécutés
+(partitions archivées puis base principale, lus par lots) recalcule l'état
+et les agrégats. `verify()` la compare à l'état incrémental.
+
+Usage:
+    python -m src.services.pnl_engine --rebuild | --verify [--db datas/cointrader.db]
+"""
+import argparse
+import threading
+from src.models.database_model import DatabaseModel
+from src.models.order_model import STATUS_PARTIALLY_FILLED
+from src.models.pnl_model import (
+    PnlModel, FLOW_COLUMNS, PERIOD_DAY, PERIOD_HOUR, ROLLUP_TABLES, bucket_of
+)
+from src.services.archive_service import ArchiveService
+
+# Constantes - Persistance
+FLUSH_INTERVAL = 5.0
+REBUILD_BATCH_SIZE = 10000
+EPSILON = 1e-12
+VERIFY_TOLERANCE = 1e-6
+
+# Index des flux (ordre de FLOW_COLUMNS)
+_TRADES, _BUY_QTY, _SELL_QTY, _BUY_USDC, _SELL_USDC, _REALIZED, _FEES = range(len(FLOW_COLUMNS))
+
+# Requête - Ordres exécutés d'un schéma (main ou partition attachée), dans l'ordre d'exécution
+FILLED_ORDERS = """
+    SELECT o.order_id, o.fk_account_id, COALESCE(o.bot_id, 0), o.product_id, e.name, o.type,
+           o.quantite_executee, COALESCE(o.montant_execute, o.quantite_executee * o.prix_execution),
+           COALESCE(o.frais, 0),
+           COALESCE(o.executed_at, o.created_at)
+    FROM {schema}.orders o
+    LEFT JOIN main.exchanges e ON o.fk_exchange_id = e.exchange_id
+    WHERE o.prix_execution IS NOT NULL AND o.quantite_executee > 0
+    ORDER BY COALESCE(o.executed_at, o.created_at), o.order_id
+"""
+
+# Constantes - Messages de log
+LOG_REBUILT = "✓ PnL reconstruit : {orders:,} ordres, {positions} positions"
+LOG_VERIFY_OK = "✓ PnL incrémental conforme à la reconstruction"
+LOG_VERIFY_DIFF = "✗ {count} écart(s) entre le PnL incrémental et la reconstruction"
+LOG_FLUSH_ERROR = "✗ Erreur écriture PnL, lot conservé pour la prochaine écriture"
+
+
+class Position:
+    """Position au coût moyen pondéré (quantité signée : négative pour une vente à découvert)"""
+
+    __slots__ = ('exchange', 'quantite', 'cout', 'realized_pnl', 'frais', 'last_price')
+
+    def __init__(self, exchange=None, quantite=0.0, cout=0.0, realized_pnl=0.0, frais=0.0, last_price=None):
+        self.exchange = exchange
+        self.quantite = quantite
+        self.cout = cout
+        self.realized_pnl = realized_pnl
+        self.frais = frais
+        self.last_price = last_price
+
+    def apply(self, side, quantite, montant):
+        """
+        Applique une exécution
+
+        Args:
+            side (str): 'buy' ou 'sell'
+            quantite (float): Quantité exécutée (positive)
+            montant (float): Valeur exécutée en devise de cotation
+
+        Returns:
+            float: PnL réalisé par cette exécution
+        """
+        price = montant / quantite
+        delta = quantite if side == 'buy' else -quantite
+        realized = 0.0
+        if self.quantite * delta < 0:
+            # Réduction (ou retournement) de la position : réalisé au coût moyen
+            direction = 1.0 if self.quantite > 0 else -1.0
+            closed = min(abs(delta), abs(self.quantite))
+            average = self.cout / self.quantite
+            realized = closed * (price - average) * direction
+            self.quantite -= closed * direction
+            self.cout -= closed * direction * average
+            delta += closed * direction
+            if abs(self.quantite) < EPSILON:
+                self.quantite = self.cout = 0.0
+        if abs(delta) >= EPSILON:
+            self.quantite += delta
+            self.cout += delta * price
+        self.realized_pnl += realized
+        return realized
+
+    @property
+    def unrealized_pnl(self):
+        return None if self.last_price is None else self.quantite * self.last_price - self.cout
+
+    @property
+    def exposure(self):
+        return None if self.last_price is None else self.quantite * self.last_price
+
+
+class PnlState:
+    """Positions et agrégats en mémoire (partagé par la tenue incrémentale et la reconstruction)"""
+
+    def __init__(self):
+        self.positions = {}            # {(account_id, bot_id, product_id): Position}
+        self.flows = {PERIOD_HOUR: {}, PERIOD_DAY: {}}   # {période: {(bucket, compte, bot, produit): [flux]}}
+
+    def apply_fill(self, key, exchange, side, quantite, montant, frais, executed_at, new_trade):
+        """
+        Applique une exécution (ou la part nouvelle d'une exécution partielle)
+
+        Args:
+            key (tuple): (account_id, bot_id, product_id)
+            exchange (str): Exchange de l'ordre (valorisation)
+            side (str): 'buy' ou 'sell'
+            quantite (float): Quantité exécutée
+            montant (float): Valeur exécutée
+            frais (float): Frais
+            executed_at: Moment d'exécution de l'ordre (bucket des agrégats)
+            new_trade (bool): Première exécution de l'ordre
+
+        Returns:
+            Position: Position mise à jour
+        """
+        position = self.positions.get(key)
+        if position is None:
+            position = self.positions[key] = Position(exchange)
+        elif exchange:
+            position.exchange = exchange
+        realized = position.apply(side, quantite, montant) if quantite > 0 else 0.0
+        position.frais += frais
+
+        buy = side == 'buy'
+        for period, flows in self.flows.items():
+            bucket_key = (bucket_of(executed_at, period),) + key
+            flow = flows.get(bucket_key)
+            if flow is None:
+                flow = flows[bucket_key] = [0.0] * len(FLOW_COLUMNS)
+            flow[_TRADES] += 1 if new_trade else 0
+            flow[_BUY_QTY if buy else _SELL_QTY] += quantite
+            flow[_BUY_USDC if buy else _SELL_USDC] += montant
+            flow[_REALIZED] += realized
+            flow[_FEES] += frais
+        return position
+
+    def position_rows(self, keys=None):
+        """Tuples dans l'ordre de POSITION_COLUMNS"""
+        keys = self.positions.keys() if keys is None else keys
+        rows = []
+        for key in keys:
+            p = self.positions[key]
+            rows.append(key + (p.exchange, p.quantite, p.cout, p.realized_pnl, p.frais, p.last_price))
+        return rows
+
+    def flow_rows(self):
+        return {
+            period: [bucket_key + tuple(flow) for bucket_key, flow in flows.items()]
+            for period, flows in self.flows.items()
+        }
+
+
+class PnlEngine:
+    """Tenue incrémentale du PnL, écriture par lots des agrégats et reconstruction complète"""
+
+    def __init__(self, db_path="datas/cointrader.db", price_lookup=None, flush_interval=FLUSH_INTERVAL):
+        """
+        Args:
+            db_path (str): Chemin de la base de données
+            price_lookup (callable, optional): (exchange, product_id) → dernier prix ou None
+            flush_interval (float): Période de valorisation et d'écriture des lots (s)
+        """
+        self.model = PnlModel(DatabaseModel(db_path, check_same_thread=False))
+        self.price_lookup = price_lookup
+        self.flush_interval = flush_interval
+
+        # state.flows ne contient que les flux pas encore écrits
+        self.state = PnlState()
+        self._dirty = set()            # Clés des positions à écrire
+        self._seen = {}                # {order_id: (quantité, valeur, frais)} déjà appliqués
+
+        self._lock = threading.RLock()
+        self._db_lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self._thread = None
+
+    # ============================================
+    # TENUE INCRÉMENTALE
+    # ============================================
+
+    def on_order(self, order, old_status=None):
+        """
+        Écouteur OrderManager : applique la part nouvellement exécutée d'un ordre
+
+        Args:
+            order (ManagedOrder): Ordre après transition
+            old_status (str, optional): Statut précédent
+        """
+        filled = order.filled_size or 0.0
+        value = order.executed_value or 0.0
+        fees = order.fees or 0.0
+        with self._lock:
+            seen_filled, seen_value, seen_fees = self._seen.get(order.order_id, (0.0, 0.0, 0.0))
+            if order.is_terminal:
+                self._seen.pop(order.order_id, None)
+            else:
+                self._seen[order.order_id] = (filled, value, fees)
+
+            quantite, montant, frais = filled - seen_filled, value - seen_value, fees - seen_fees
+            if quantite <= EPSILON and abs(frais) <= EPSILON:
+                return
+            if quantite <= EPSILON:
+                quantite = montant = 0.0
+            key = (order.account_id, order.bot_id or 0, order.product_id)
+            self.state.apply_fill(key, order.exchange_name, order.side, quantite, montant, frais,
+                                  order.executed_at or order.created_at, seen_filled <= EPSILON < quantite)
+            self._dirty.add(key)
+
+    def on_price(self, exchange, product_id, price):
+        """
+        Valorise les positions d'un produit au dernier prix
+
+        Args:
+            exchange (str or None): Exchange du prix (None : toutes les positions du produit)
+            product_id (str): Produit
+            price (float): Dernier prix
+
+        Returns:
+            int: Nombre de positions revalorisées
+        """
+        if price is None:
+            return 0
+        count = 0
+        with self._lock:
+            for key, position in self.state.positions.items():
+                if key[2] != product_id or (exchange and position.exchange not in (None, exchange)):
+                    continue
+                if position.last_price != price:
+                    position.last_price = price
+                    self._dirty.add(key)
+                    count += 1
+        return count
+
+    def mark_to_market(self):
+        """
+        Valorise les positions ouvertes via price_lookup
+
+        Returns:
+            int: Nombre de positions revalorisées
+        """
+        if self.price_lookup is None:
+            return 0
+        with self._lock:
+            open_products = {(p.exchange, key[2]) for key, p in self.state.positions.items()
+                             if p.quantite and p.exchange}
+        return sum(self.on_price(exchange, product_id, self.price_lookup(exchange, product_id))
+                   for exchange, product_id in open_products)
+
+    # ============================================
+    # PERSISTANCE
+    # ============================================
+
+    def flush(self):
+        """
+        Écrit les positions modifiées et les flux en attente en une seule transaction
+
+        Returns:
+            int: Nombre de positions écrites
+        """
+        with self._lock:
+            if not self._dirty and not any(self.state.flows.values()):
+                return 0
+            dirty, pending = self._dirty, self.state.flows
+            positions = self.state.position_rows(dirty)
+            flows = self.state.flow_rows()
+            self._dirty = set()
+            self.state.flows = {PERIOD_HOUR: {}, PERIOD_DAY: {}}
+
+        with self._db_lock:
+            ok = self.model.save(positions, flows)
+
+        if not ok:
+            # Remettre le lot en file pour la prochaine écriture
+            with self._lock:
+                self._dirty |= dirty
+                for period, period_flows in pending.items():
+                    current = self.state.flows[period]
+                    for bucket_key, flow in period_flows.items():
+                        merged = current.setdefault(bucket_key, [0.0] * len(FLOW_COLUMNS))
+                        for index, amount in enumerate(flow):
+                            merged[index] += amount
+            print(LOG_FLUSH_ERROR)
+            return 0
+        return len(positions)
+
+    # ============================================
+    # RECONSTRUCTION
+    # ============================================
+
+    def _replay(self):
+        """
+        Rejoue tous les ordres exécutés, partitions archivées comprises
+
+        Returns:
+            tuple: (PnlState complet, nombre d'ordres)
+        """
+        db = self.model.db
+        state = PnlState()
+        count = 0
+        for schema in ArchiveService(db).iter_sources():
+            cursor = db.connection.cursor()
+            try:
+                cursor.execute(FILLED_ORDERS.format(schema=schema))
+                while True:
+                    rows = cursor.fetchmany(REBUILD_BATCH_SIZE)
+                    if not rows:
+                        break
+                    for _, account_id, bot_id, product_id, exchange, side, quantite, montant, frais, at in rows:
+                        state.apply_fill((account_id, bot_id, product_id), exchange, side, quantite, montant,
+                                         frais, at, True)
+                    count += len(rows)
+            finally:
+                cursor.close()
+        return state, count
+
+    def rebuild(self):
+        """
+        Recalcule positions et agrégats depuis les ordres puis remplace les tables
+
+        Les ordres en cours d'exécution sont repris tels qu'écrits en base :
+        leurs exécutions suivantes ne sont comptées qu'au-delà de cet état.
+
+        Returns:
+            bool: True si les tables ont été remplacées
+        """
+        with self._lock, self._db_lock:
+            state, count = self._replay()
+            for key, position in state.positions.items():
+                current = self.state.positions.get(key)
+                if current is not None:
+                    position.last_price = current.last_price
+            positions, flows = state.position_rows(), state.flow_rows()
+
+            self.model.db.cursor.execute(
+                "SELECT order_id, quantite_executee, montant_execute, frais FROM orders "
+                "WHERE status = ? AND prix_execution IS NOT NULL",
+                (STATUS_PARTIALLY_FILLED,)
+            )
+            self._seen = {row[0]: (row[1] or 0.0, row[2] or 0.0, row[3] or 0.0)
+                          for row in self.model.db.cursor.fetchall()}
+            self.state.positions = state.positions
+            self.state.flows = {PERIOD_HOUR: {}, PERIOD_DAY: {}}
+            self._dirty = set()
+
+            ok = self.model.replace_all(positions, flows)
+        if ok:
+            print(LOG_REBUILT.format(orders=count, positions=len(positions)))
+        return ok
+
+    def verify(self, tolerance=VERIFY_TOLERANCE):
+        """
+        Compare les tables tenues incrémentalement à une reconstruction complète (sans écrire)
+
+        Args:
+            tolerance (float): Écart relatif toléré
+
+        Returns:
+            list: Écarts constatés (vide si conforme)
+        """
+        self.flush()
+        with self._db_lock:
+            state, _ = self._replay()
+            stored_positions = {
+                (row['fk_account_id'], row['bot_id'], row['product_id']): row
+                for row in self.model.load_positions()
+            }
+            stored_flows = {period: self.model.load_rollups(period) for period in ROLLUP_TABLES}
+
+        def differs(expected, actual):
+            return abs(expected - actual) > tolerance * max(1.0, abs(expected))
+
+        differences = []
+        for key in sorted(set(state.positions) | set(stored_positions), key=str):
+            expected = state.positions.get(key) or Position()
+            stored = stored_positions.get(key) or {}
+            for column in ('quantite', 'cout', 'realized_pnl', 'frais'):
+                if differs(getattr(expected, column), stored.get(column) or 0.0):
+                    differences.append(f"position {key} {column}: {stored.get(column)} ≠ {getattr(expected, column)}")
+
+        empty = (0.0,) * len(FLOW_COLUMNS)
+        for period, flows in state.flows.items():
+            stored = stored_flows[period]
+            for key in sorted(set(flows) | set(stored), key=str):
+                for column, expected, actual in zip(FLOW_COLUMNS, flows.get(key, empty), stored.get(key, empty)):
+                    if differs(expected, actual):
+                        differences.append(f"{ROLLUP_TABLES[period]} {key} {column}: {actual} ≠ {expected}")
+
+        print(LOG_VERIFY_DIFF.format(count=len(differences)) if differences else LOG_VERIFY_OK)
+        return differences
+
+    # ============================================
+    # THREAD D'ARRIÈRE-PLAN
+    # ============================================
+
+    def _run(self):
+        while not self._stop_event.wait(self.flush_interval):
+            self.mark_to_market()
+            self.flush()
+
+    def start(self):
+        """Reconstruit l'état depuis les ordres puis démarre valorisation et écriture périodiques"""
+        self.rebuild()
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._run, daemon=True, name='pnl-engine')
+        self._thread.start()
+
+    def stop(self):
+        """Arrête le thread et écrit le dernier lot"""
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join(timeout=self.flush_interval + 1)
+            self._thread = None
+        self.flush()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="PnL CoinTrader : reconstruction et vérification des agrégats")
+    action = parser.add_mutually_exclusive_group(required=True)
+    action.add_argument('--rebuild', action='store_true', help="Recalculer positions et agrégats depuis les ordres")
+    action.add_argument('--verify', action='store_true', help="Comparer les tables à une reconstruction complète")
+    parser.add_argument('--db', default="datas/cointrader.db", help="Base principale")
+    args = parser.parse_args(argv)
+
+    engine = PnlEngine(db_path=args.db)
+    try:
+        if args.rebuild:
+            return 0 if engine.rebuild() else 1
+        differences = engine.verify()
+        for difference in differences:
+            print(f"  {difference}")
+        return 1 if differences else 0
+    finally:
+        engine.model.db.close()
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,404 @@
+"""
+Agrégateur des meilleurs prix entre exchanges
+
+Maintient, pour chaque product_id, le meilleur bid et le meilleur ask parmi
+les exchanges actifs de l'utilisateur (table exchanges). Chaque tick d'un
+exchange met à jour le carnet consolidé de façon incrémentale. La question
+« où acheter X avec Y ? » se résout ensuite par une simple lecture de
+dictionnaire, sans interroger les exchanges un par un.
+
+Le meilleur prix d'un produit n'est jamais modifié en place : chaque mise à
+jour construit un nouveau BestQuote, publié par une seule affectation. Les
+lecteurs (get_best, best_venue) lisent sans verrou un objet toujours
+cohérent. Le prix d'une venue qui ne publie plus expire après
+MAX_QUOTE_AGE secondes.
+"""
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from src.models.exchange_model import ExchangeModel
+
+# Constantes - Rafraîchissement
+POLL_INTERVAL = 2.0
+MAX_QUOTE_AGE = 10.0
+
+# Frais taker par défaut (classement des venues sur le prix effectif)
+DEFAULT_TAKER_FEES = {
+    'coinbase': 0.006,
+    'binance': 0.001,
+    'kraken': 0.004,
+    'paper': 0.006
+}
+
+# Constantes - Messages de log
+LOG_VENUE_UNAVAILABLE = "⚠ Exchange '{exchange}' sans adapter, ignoré par l'agrégateur"
+LOG_POLL_ERROR = "✗ Erreur rafraîchissement prix {exchange}: {error}"
+LOG_LISTENER_ERROR = "✗ Erreur écouteur agrégateur: {error}"
+
+
+class BestQuote:
+    """Meilleur bid/ask consolidé d'un produit"""
+
+    __slots__ = ('product_id', 'bid', 'bid_exchange', 'bid_time', 'ask', 'ask_exchange', 'ask_time',
+                 'updated_at')
+
+    def __init__(self, product_id):
+        self.product_id = product_id
+        self.bid = None
+        self.bid_exchange = None
+        self.bid_time = None
+        self.ask = None
+        self.ask_exchange = None
+        self.ask_time = None
+        self.updated_at = None
+
+    def copy(self):
+        best = BestQuote(self.product_id)
+        for name in self.__slots__:
+            setattr(best, name, getattr(self, name))
+        return best
+
+    def expired(self, now, max_age):
+        """True si le prix d'un des deux côtés retenus est plus ancien que max_age"""
+        return any(ts is not None and now - ts > max_age for ts in (self.bid_time, self.ask_time))
+
+    def to_dict(self):
+        return {
+            'product_id': self.product_id,
+            'bid': self.bid,
+            'bid_exchange': self.bid_exchange,
+            'ask': self.ask,
+            'ask_exchange': self.ask_exchange,
+            'updated_at': self.updated_at
+        }
+
+
+class PriceAggregator:
+    """Carnet consolidé (top-of-book) par product_id sur plusieurs exchanges"""
+
+    def __init__(self, account_id=None, product_ids=None, exchange_resolver=None,
+                 taker_fees=None, poll_interval=POLL_INTERVAL, runtime=None, max_quote_age=MAX_QUOTE_AGE):
+        """
+        Args:
+            account_id (int, optional): Compte dont les exchanges actifs sont suivis
+            product_ids (list, optional): Produits suivis (BASE-QUOTE)
+            exchange_resolver (callable, optional): nom d'exchange → adapter ExchangeBase
+            taker_fees (dict, optional): {exchange: frais} pour le classement des venues
+            poll_interval (float): Intervalle de rafraîchissement en secondes
+            runtime (AsyncRuntime, optional): Rafraîchissement sur la boucle asyncio (sinon des threads)
+            max_quote_age (float): Âge au-delà duquel le prix d'une venue est ignoré (s)
+        """
+        self.account_id = account_id
+        self.product_ids = set(product_ids or [])
+        self.exchange_resolver = exchange_resolver or self._default_resolver
+        self.taker_fees = dict(DEFAULT_TAKER_FEES)
+        if taker_fees:
+            self.taker_fees.update(taker_fees)
+        self.poll_interval = poll_interval
+        self.max_quote_age = max_quote_age
+        self.runtime = runtime
+        self._task = None
+
+        self.venues = {}            # {exchange: adapter}
+        self._quotes = {}           # {product_id: {exchange: (bid, ask, timestamp)}}
+        self._best = {}             # {product_id: BestQuote} (remplacé, jamais modifié)
+        self._listeners = []
+        self._lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self._thread = None
+        self._executor = None
+
+    @staticmethod
+    def _default_resolver(exchange_name):
+        from src.models.exchanges.registry import get_registry
+        return get_registry().get(exchange_name)
+
+    # ============================================
+    # VENUES ET PRODUITS
+    # ============================================
+
+    def load_venues(self, exchange_model=None):
+        """
+        Charge les exchanges actifs du compte (table exchanges)
+
+        Returns:
+            list: Noms des exchanges retenus
+        """
+        exchange_model = exchange_model or ExchangeModel()
+        for exchange in exchange_model.get_all_exchanges(self.account_id):
+            if exchange['is_active']:
+                self.add_venue(exchange['name'])
+        return sorted(self.venues)
+
+    def add_venue(self, exchange_name, adapter=None):
+        """Ajoute un exchange à l'agrégation (adapter résolu via le registre si absent)"""
+        exchange_name = exchange_name.lower()
+        adapter = adapter or self.exchange_resolver(exchange_name)
+        if adapter is None:
+            print(LOG_VENUE_UNAVAILABLE.format(exchange=exchange_name))
+            return False
+        self.venues[exchange_name] = adapter
+        return True
+
+    def remove_venue(self, exchange_name):
+        """Retire un exchange et recalcule les meilleurs prix qui le concernaient"""
+        exchange_name = exchange_name.lower()
+        self.venues.pop(exchange_name, None)
+        with self._lock:
+            for product_id, quotes in self._quotes.items():
+                if quotes.pop(exchange_name, None) is not None:
+                    self._best[product_id] = self._rebuild(product_id)
+
+    def track(self, product_ids):
+        """Ajoute des produits à suivre"""
+        self.product_ids.update(product_ids)
+
+    def add_listener(self, callback):
+        """
+        Abonne un écouteur aux changements de meilleur prix
+
+        Args:
+            callback (callable): callback(product_id, exchange, bid, ask), appelé après chaque tick
+        """
+        self._listeners.append(callback)
+
+    # ============================================
+    # MISE À JOUR INCRÉMENTALE
+    # ============================================
+
+    def _effective_bid(self, exchange, bid):
+        return bid * (1 - self.taker_fees.get(exchange, 0.0))
+
+    def _effective_ask(self, exchange, ask):
+        return ask * (1 + self.taker_fees.get(exchange, 0.0))
+
+    def _rebuild(self, product_id, now=None):
+        """
+        Recalcule le meilleur bid/ask d'un produit à partir de toutes ses venues (sous self._lock)
+
+        Les prix plus anciens que max_quote_age sont retirés.
+
+        Returns:
+            BestQuote: Nouvel objet, à publier par l'appelant
+        """
+        now = now or time.time()
+        previous = self._best.get(product_id)
+        best = BestQuote(product_id)
+        best.updated_at = previous.updated_at if previous else None
+        best_bid = best_ask = None
+        quotes = self._quotes.get(product_id, {})
+        for exchange, (bid, ask, timestamp) in list(quotes.items()):
+            if now - timestamp > self.max_quote_age:
+                del quotes[exchange]
+                continue
+            if bid:
+                effective = self._effective_bid(exchange, bid)
+                if best_bid is None or effective > best_bid:
+                    best_bid, best.bid, best.bid_exchange, best.bid_time = effective, bid, exchange, timestamp
+            if ask:
+                effective = self._effective_ask(exchange, ask)
+                if best_ask is None or effective < best_ask:
+                    best_ask, best.ask, best.ask_exchange, best.ask_time = effective, ask, exchange, timestamp
+        return best
+
+    def _current(self, product_id):
+        """Meilleur prix publié, recalculé si un côté retenu a expiré"""
+        best = self._best.get(product_id)
+        if best is not None and best.expired(time.time(), self.max_quote_age):
+            with self._lock:
+                best = self._best[product_id] = self._rebuild(product_id)
+        return best
+
+    def on_tick(self, exchange, product_id, bid, ask, timestamp=None):
+        """
+        Intègre un tick d'un exchange
+
+        Seul le cas où la venue actuellement la meilleure se dégrade (ou
+        expire) impose de reparcourir les venues du produit ; sinon la mise à
+        jour est O(1).
+
+        Args:
+            exchange (str): Nom de l'exchange
+            product_id (str): Produit BASE-QUOTE
+            bid (float): Meilleur prix acheteur
+            ask (float): Meilleur prix vendeur
+            timestamp (float, optional): Horodatage du tick
+        """
+        timestamp = timestamp or time.time()
+        with self._lock:
+            quotes = self._quotes.setdefault(product_id, {})
+            quotes[exchange] = (bid, ask, timestamp)
+
+            current = self._best.get(product_id) or BestQuote(product_id)
+            degraded = (
+                (current.bid_exchange == exchange and (not bid or bid < current.bid)) or
+                (current.ask_exchange == exchange and (not ask or ask > current.ask)) or
+                current.expired(time.time(), self.max_quote_age)
+            )
+            if degraded:
+                best = self._rebuild(product_id)
+            else:
+                best = current.copy()
+                if bid and (best.bid is None or
+                            self._effective_bid(exchange, bid) > self._effective_bid(best.bid_exchange, best.bid)):
+                    best.bid, best.bid_exchange = bid, exchange
+                if ask and (best.ask is None or
+                            self._effective_ask(exchange, ask) < self._effective_ask(best.ask_exchange, best.ask)):
+                    best.ask, best.ask_exchange = ask, exchange
+                # Venue retenue qui republie le même prix : son horodatage avance
+                if best.bid_exchange == exchange:
+                    best.bid_time = timestamp
+                if best.ask_exchange == exchange:
+                    best.ask_time = timestamp
+            best.updated_at = timestamp
+            # Publication en une seule affectation : les lecteurs sans verrou voient l'ancien ou le nouveau
+            self._best[product_id] = best
+
+        for callback in self._listeners:
+            try:
+                callback(product_id, exchange, bid, ask)
+            except Exception as e:
+                print(LOG_LISTENER_ERROR.format(error=e))
+
+    def on_tickers(self, exchange, tickers):
+        """Intègre un lot de tickers {product_id: ticker} renvoyé par get_tickers()"""
+        for product_id, ticker in tickers.items():
+            self.on_tick(exchange, product_id, ticker.get('bid'), ticker.get('ask'))
+
+    # ============================================
+    # REQUÊTES
+    # ============================================
+
+    def get_best(self, product_id):
+        """
+        Retourne le meilleur bid/ask consolidé d'un produit
+
+        Returns:
+            dict or None: {'product_id', 'bid', 'bid_exchange', 'ask', 'ask_exchange', 'updated_at'}
+        """
+        best = self._current(product_id)
+        return best.to_dict() if best else None
+
+    def best_venue(self, side, base, quote):
+        """
+        Meilleure venue pour acheter (ou vendre) `base` contre `quote`
+
+        Si seule la paire inverse QUOTE-BASE existe, l'opération équivalente
+        sur celle-ci est proposée (acheter X avec Y = vendre Y contre X).
+
+        Args:
+            side (str): 'buy' ou 'sell' (du point de vue de `base`)
+            base (str): Crypto achetée ou vendue (ex: 'BTC')
+            quote (str): Devise de règlement (ex: 'USDC')
+
+        Returns:
+            dict or None: {'exchange', 'product_id', 'side', 'price', 'effective_price'}
+        """
+        side = side.lower()
+        best = self._current(f"{base}-{quote}")
+        if best is not None:
+            if side == 'buy' and best.ask_exchange:
+                return {'exchange': best.ask_exchange, 'product_id': best.product_id, 'side': 'buy',
+                        'price': best.ask,
+                        'effective_price': self._effective_ask(best.ask_exchange, best.ask)}
+            if side == 'sell' and best.bid_exchange:
+                return {'exchange': best.bid_exchange, 'product_id': best.product_id, 'side': 'sell',
+                        'price': best.bid,
+                        'effective_price': self._effective_bid(best.bid_exchange, best.bid)}
+
+        inverse = self._current(f"{quote}-{base}")
+        if inverse is not None:
+            # Acheter base = vendre quote sur QUOTE-BASE : prix de base = 1 / bid
+            if side == 'buy' and inverse.bid_exchange:
+                return {'exchange': inverse.bid_exchange, 'product_id': inverse.product_id, 'side': 'sell',
+                        'price': 1.0 / inverse.bid,
+                        'effective_price': 1.0 / self._effective_bid(inverse.bid_exchange, inverse.bid)}
+            if side == 'sell' and inverse.ask_exchange:
+                return {'exchange': inverse.ask_exchange, 'product_id': inverse.product_id, 'side': 'buy',
+                        'price': 1.0 / inverse.ask,
+                        'effective_price': 1.0 / self._effective_ask(inverse.ask_exchange, inverse.ask)}
+        return None
+
+    def get_quotes(self, product_id):
+        """Retourne les prix de chaque venue pour un produit {exchange: {'bid', 'ask', 'timestamp'}}"""
+        with self._lock:
+            return {
+                exchange: {'bid': bid, 'ask': ask, 'timestamp': timestamp}
+                for exchange, (bid, ask, timestamp) in self._quotes.get(product_id, {}).items()
+            }
+
+    # ============================================
+    # RAFRAÎCHISSEMENT
+    # ============================================
+
+    def _poll_venue(self, exchange, adapter):
+        try:
+            tickers = adapter.get_tickers(sorted(self.product_ids))
+            if tickers:
+                self.on_tickers(exchange, tickers)
+        except Exception as e:
+            print(LOG_POLL_ERROR.format(exchange=exchange, error=e))
+
+    def poll(self):
+        """Rafraîchit toutes les venues en parallèle (une requête groupée par exchange)"""
+        if not self.venues or not self.product_ids:
+            return
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=max(1, len(self.venues)),
+                                                thread_name_prefix='price-aggregator')
+        futures = [self._executor.submit(self._poll_venue, exchange, adapter)
+                   for exchange, adapter in list(self.venues.items())]
+        for future in futures:
+            future.result()
+
+    async def _apoll_venue(self, exchange, adapter):
+        try:
+            tickers = await adapter.aget_tickers(sorted(self.product_ids))
+            if tickers:
+                self.on_tickers(exchange, tickers)
+        except Exception as e:
+            print(LOG_POLL_ERROR.format(exchange=exchange, error=e))
+
+    async def apoll(self):
+        """Variante asynchrone de poll() : les venues sont interrogées en parallèle sur la boucle"""
+        if not self.venues or not self.product_ids:
+            return
+        await asyncio.gather(*(self._apoll_venue(exchange, adapter)
+                               for exchange, adapter in list(self.venues.items())))
+
+    def _run(self):
+        while not self._stop_event.is_set():
+            self.poll()
+            self._stop_event.wait(self.poll_interval)
+
+    def start(self):
+        """Démarre le rafraîchissement périodique en arrière-plan"""
+        if self.runtime is not None:
+            if self._task is None or self._task.done():
+                self._task = self.runtime.every(self.poll_interval, self.apoll, name='price-aggregator')
+            return
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._run, name='price-aggregator', daemon=True)
+        self._thread.start()
+
+    def stop(self, wait=True):
+        """
+        Arrête le rafraîchissement
+
+        Args:
+            wait (bool): Attendre la fin du rafraîchissement en cours (False depuis une vue Tk)
+        """
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+        self._stop_event.set()
+        if self._thread is not None:
+            if wait:
+                self._thread.join(timeout=self.poll_interval + 1)
+            self._thread = None
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
@@ -0,0 +1,550 @@
+"""
+Moteur de bots réparti sur plusieurs processus
+
+Au-delà de quelques milliers de bots, un seul processus Python est limité
+par le GIL (évaluation des bots, encodage des changements). Le
+coordinateur répartit les bots entre des processus workers selon leur
+product_id, puis :
+    - pousse chaque prix dans la file en mémoire partagée du worker
+      propriétaire du produit (enregistrement binaire fixe, sans pickle)
+    - relève les changements d'état et les intentions d'ordre que les
+      workers publient dans leur propre file de retour
+
+Les produits sont attribués par hachage de rendez-vous : ajouter ou
+retirer un worker ne déplace que les produits qui changent de
+propriétaire (environ 1/N), sans redémarrage. Les bots déplacés sont
+exportés avec leur état complet (position ouverte, ordre en cours).
+
+Le coordinateur expose l'interface de BotEngine ; ses BotRuntime sont des
+miroirs tenus à jour par les changements reçus des workers. Les ordres
+réels restent envoyés par le coordinateur (un seul OrderManager).
+"""
+import hashlib
+import json
+import multiprocessing
+import queue
+import struct
+import threading
+import time
+import uuid
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from src.models.order_model import STATUS_REJECTED
+from src.services.bot_engine import BotEngine, BotRuntime, TICK_INTERVAL
+from src.utils.shm_ring import ShmRing
+
+# Constantes - Files en mémoire partagée
+PRICE_RING_CAPACITY = 65536
+PRICE_RECORD = struct.Struct('<32s16sd')        # product_id, exchange, prix
+PRICE_RECORD_SIZE = 64
+EVENT_RING_CAPACITY = 16384
+EVENT_RECORD_SIZE = 1024
+ENCODING = "utf-8"
+
+# Constantes - Workers
+DEFAULT_WORKERS = 2
+BATCH_SIZE = 1024
+IDLE_SLEEP = 0.001
+EXPORT_TIMEOUT = 10.0
+JOIN_TIMEOUT = 5.0
+ORDER_THREADS = 4
+
+# Constantes - Messages de log
+LOG_WORKER_STARTED = "✓ Worker moteur {worker_id} démarré (pid {pid})"
+LOG_WORKER_STOPPED = "✓ Worker moteur {worker_id} arrêté"
+LOG_REBALANCED = "✓ Moteur réparti sur {workers} worker(s) : {moved} bot(s) déplacé(s)"
+LOG_PRICE_DROPPED = "⚠ File de prix du worker {worker_id} pleine : prix ignorés"
+LOG_LAST_WORKER = "✗ Impossible de retirer le dernier worker"
+LOG_EXPORT_TIMEOUT = "✗ Worker {worker_id} : délai dépassé pour l'export des bots"
+LOG_PUT_TIMEOUT = "⚠ Worker {worker_id} : installation des bots non confirmée"
+LOG_EVENT_ERROR = "✗ Erreur événement worker {worker_id}: {error}"
+
+
+def owner_of(product_id, worker_ids):
+    """
+    Worker propriétaire d'un produit (hachage de rendez-vous)
+
+    Args:
+        product_id (str): Produit BASE-QUOTE
+        worker_ids (iterable): Identifiants des workers actifs
+
+    Returns:
+        int: Identifiant du worker
+    """
+    key = product_id.encode(ENCODING)
+    return max(worker_ids, key=lambda worker_id: hashlib.blake2b(
+        key, digest_size=8, salt=worker_id.to_bytes(8, 'little')).digest())
+
+
+# ============================================
+# PROCESSUS WORKER
+# ============================================
+
+class _PendingOrder:
+    """Ordre vu par le moteur d'un worker en attendant le coordinateur"""
+
+    __slots__ = ('order_id', 'side', 'status', 'filled_size', 'average_price', 'is_terminal')
+
+    def __init__(self, order_id, side, status=None, filled_size=0.0, average_price=None, is_terminal=False):
+        self.order_id = order_id
+        self.side = side
+        self.status = status
+        self.filled_size = filled_size
+        self.average_price = average_price
+        self.is_terminal = is_terminal
+
+
+class _IntentOrderManager:
+    """OrderManager d'un worker : transmet les intentions d'ordre au coordinateur"""
+
+    def __init__(self, emit):
+        self.emit = emit
+
+    def add_listener(self, callback):
+        pass
+
+    def submit_order(self, account_id, exchange_id, exchange_name, product_id, side,
+                     order_type='market', size=None, funds=None, price=None, bot_id=None):
+        order = _PendingOrder(uuid.uuid4().hex, side)
+        self.emit({'t': 'i', 'b': bot_id, 'o': order.order_id, 'p': {
+            'account_id': account_id, 'exchange_id': exchange_id, 'exchange_name': exchange_name,
+            'product_id': product_id, 'side': side, 'order_type': order_type,
+            'size': size, 'funds': funds, 'price': price, 'bot_id': bot_id
+        }})
+        return order
+
+
+def _apply_prices(engine, prices):
+    """Applique un lot de prix de la file du worker (retourne le nombre de prix lus)"""
+    records = prices.pop_many(BATCH_SIZE)
+    for record in records:
+        product_id, exchange, price = PRICE_RECORD.unpack(record)
+        engine.on_price(product_id.rstrip(b'\0').decode(ENCODING), price,
+                        exchange.rstrip(b'\0').decode(ENCODING) or None)
+    return len(records)
+
+
+def _worker_command(engine, command, results, prices):
+    """Applique une commande du coordinateur (False pour arrêter le worker)"""
+    action = command[0]
+    if action == 'put':
+        with engine._lock:
+            for state in command[1]:
+                runtime = BotRuntime.from_state(state)
+                engine._add(runtime)
+                if runtime.pending_order_id is not None:
+                    engine._by_order[runtime.pending_order_id] = runtime
+        if len(command) > 2 and command[2]:
+            results.put(len(command[1]))
+    elif action == 'export':
+        # Les prix déjà en file concernent encore ces bots : les appliquer avant l'export
+        while _apply_prices(engine, prices):
+            pass
+        exported = []
+        with engine._lock:
+            for bot_id in command[1]:
+                runtime = engine.bots.get(bot_id)
+                if runtime is None:
+                    continue
+                engine.remove_bot(bot_id)
+                engine._by_order.pop(runtime.pending_order_id, None)
+                exported.append(runtime.to_dict())
+        results.put(exported)
+    elif action == 'remove':
+        for bot_id in command[1]:
+            engine.remove_bot(bot_id)
+    elif action == 'set_active':
+        engine.set_active(command[1], command[2])
+    elif action == 'order':
+        _, order_id, status, side, filled_size, average_price = command
+        engine._on_order_update(_PendingOrder(order_id, side, status, filled_size, average_price, True), None)
+    elif action == 'stop':
+        return False
+    return True
+
+
+def _worker_main(account_id, prices_name, events_name, control, results, live):
+    """Boucle d'un worker : commandes, prix reçus, publication des changements"""
+    # Lancé par le coordinateur : son resource_tracker est partagé
+    prices = ShmRing.attach(prices_name, untrack=False)
+    events = ShmRing.attach(events_name, untrack=False)
+    backlog = deque()
+
+    def emit(message):
+        backlog.append(json.dumps(message, default=str).encode(ENCODING))
+
+    engine = BotEngine(account_id, order_manager=_IntentOrderManager(emit) if live else None,
+                       exchange_resolver=lambda name: None)
+    engine.add_listener(lambda bot_id, changes: emit({'t': 'c', 'b': bot_id, 'c': changes}))
+
+    running = True
+    try:
+        while running:
+            busy = False
+            try:
+                while running:
+                    running = _worker_command(engine, control.get_nowait(), results, prices)
+                    busy = True
+            except queue.Empty:
+                pass
+
+            if _apply_prices(engine, prices):
+                busy = True
+
+            # Une file de retour pleine retarde la publication sans rien perdre
+            while backlog and events.push(backlog[0]):
+                backlog.popleft()
+                busy = True
+
+            if not busy:
+                time.sleep(IDLE_SLEEP)
+
+        # Arrêt demandé : dernière publication des changements en attente
+        while backlog and events.push(backlog[0]):
+            backlog.popleft()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        prices.close()
+        events.close()
+
+
+# ============================================
+# COORDINATEUR
+# ============================================
+
+class _WorkerHandle:
+    """Processus worker et ses canaux de communication"""
+
+    __slots__ = ('worker_id', 'process', 'control', 'results', 'prices', 'events', 'dropped')
+
+    def __init__(self, worker_id, process, control, results, prices, events):
+        self.worker_id = worker_id
+        self.process = process
+        self.control = control
+        self.results = results
+        self.prices = prices
+        self.events = events
+        self.dropped = 0
+
+
+class ShardedBotEngine(BotEngine):
+    """BotEngine dont l'évaluation des bots est répartie sur plusieurs processus"""
+
+    def __init__(self, account_id=None, workers=DEFAULT_WORKERS, order_manager=None, exchange_resolver=None,
+                 tick_interval=TICK_INTERVAL, runtime=None, price_table=None):
+        """
+        Args:
+            account_id (int, optional): Compte dont les bots sont exécutés
+            workers (int): Nombre de processus workers au démarrage
+            order_manager (OrderManager, optional): Envoi des ordres réels (simulation si None)
+            exchange_resolver (callable, optional): nom d'exchange → adapter ExchangeBase
+            tick_interval (float): Intervalle de rafraîchissement des prix en secondes
+            runtime (AsyncRuntime, optional): Cadencement sur la boucle asyncio (sinon un thread)
+            price_table (PriceTableWriter, optional): Publication des prix reçus aux autres processus
+        """
+        super().__init__(account_id, order_manager=order_manager, exchange_resolver=exchange_resolver,
+                         tick_interval=tick_interval, runtime=runtime, price_table=price_table)
+        self.initial_workers = workers
+        self.workers = {}               # {worker_id: _WorkerHandle}
+        self._routes = {}               # {product_id: worker_id}
+        self._moving = set()            # produits en cours de déplacement entre workers
+        self._held_prices = []          # [(product_id, record)] reçus pendant le déplacement
+        self._route_lock = threading.RLock()
+        self._orders = {}               # {order_id réel: (bot_id, order_id du worker)}
+        self._next_worker_id = 0
+        self._context = multiprocessing.get_context('spawn')
+        self._order_executor = None
+        self._collector = None
+        self._collecting = threading.Event()
+        self._drain_lock = threading.Lock()      # un seul lecteur par file de retour
+
+    # ============================================
+    # WORKERS
+    # ============================================
+
+    def _spawn_worker(self):
+        worker_id = self._next_worker_id
+        self._next_worker_id += 1
+        prices = ShmRing.create(PRICE_RING_CAPACITY, PRICE_RECORD_SIZE)
+        events = ShmRing.create(EVENT_RING_CAPACITY, EVENT_RECORD_SIZE)
+        control = self._context.Queue()
+        results = self._context.Queue()
+        process = self._context.Process(
+            target=_worker_main, name=f'bot-engine-worker-{worker_id}', daemon=True,
+            args=(self.account_id, prices.name, events.name, control, results, self.order_manager is not None)
+        )
+        process.start()
+        print(LOG_WORKER_STARTED.format(worker_id=worker_id, pid=process.pid))
+        return _WorkerHandle(worker_id, process, control, results, prices, events)
+
+    def _route(self, product_id):
+        with self._route_lock:
+            worker_id = self._routes.get(product_id)
+            if worker_id is None:
+                worker_id = owner_of(product_id, self.workers)
+                self._routes[product_id] = worker_id
+            return self.workers[worker_id]
+
+    def _push_price(self, handle, record):
+        if not handle.prices.push(record):
+            if handle.dropped == 0:
+                print(LOG_PRICE_DROPPED.format(worker_id=handle.worker_id))
+            handle.dropped += 1
+
+    def _rebalance(self, worker_ids):
+        """
+        Réattribue les produits à un nouvel ensemble de workers
+
+        Les bots des produits qui changent de propriétaire sont exportés
+        de leur ancien worker (avec leur état) puis confiés au nouveau. Les
+        prix reçus pendant le déplacement sont retenus puis transmis au
+        nouveau propriétaire une fois ses bots installés.
+
+        Returns:
+            int: Nombre de bots déplacés
+        """
+        moves = {}                      # {(ancien, nouveau): [bot_id]}
+        with self._route_lock:
+            for product_id, bots in self._by_product.items():
+                if not bots:
+                    continue
+                old = self._routes.get(product_id)
+                if old is None:
+                    old = owner_of(product_id, self.workers)
+                new = owner_of(product_id, worker_ids)
+                if old != new:
+                    moves.setdefault((old, new), []).extend(bots)
+                    self._moving.add(product_id)
+
+        moved = 0
+        for (old, new), bot_ids in moves.items():
+            handle = self.workers[old]
+            handle.control.put(('export', bot_ids))
+            try:
+                states = handle.results.get(timeout=EXPORT_TIMEOUT)
+            except queue.Empty:
+                print(LOG_EXPORT_TIMEOUT.format(worker_id=old))
+                # Repli : état miroir du coordinateur
+                states = [self.bots[bot_id].to_dict() for bot_id in bot_ids if bot_id in self.bots]
+            target = self.workers[new]
+            target.control.put(('put', states, True))
+            try:
+                target.results.get(timeout=EXPORT_TIMEOUT)
+            except queue.Empty:
+                print(LOG_PUT_TIMEOUT.format(worker_id=new))
+            moved += len(states)
+
+        with self._route_lock:
+            self._routes = {product_id: owner_of(product_id, worker_ids)
+                            for product_id, bots in self._by_product.items() if bots}
+            held, self._held_prices, self._moving = self._held_prices, [], set()
+            for product_id, record in held:
+                self._push_price(self.workers[self._routes[product_id]], record)
+        return moved
+
+    def add_worker(self):
+        """
+        Ajoute un worker à chaud et lui confie sa part des produits
+
+        Returns:
+            int: Identifiant du worker ajouté
+        """
+        handle = self._spawn_worker()
+        with self._lock:
+            self.workers[handle.worker_id] = handle
+            if len(self.workers) > 1:
+                moved = self._rebalance(list(self.workers))
+                print(LOG_REBALANCED.format(workers=len(self.workers), moved=moved))
+        return handle.worker_id
+
+    def remove_worker(self, worker_id=None):
+        """
+        Retire un worker à chaud (le plus récent par défaut) après avoir déplacé ses bots
+
+        Returns:
+            bool: False s'il ne reste qu'un worker
+        """
+        with self._lock:
+            if len(self.workers) <= 1:
+                print(LOG_LAST_WORKER)
+                return False
+            if worker_id is None:
+                worker_id = max(self.workers)
+            remaining = [other for other in self.workers if other != worker_id]
+            moved = self._rebalance(remaining)
+            handle = self.workers.pop(worker_id)
+            print(LOG_REBALANCED.format(workers=len(self.workers), moved=moved))
+        # Les derniers changements publiés par le worker sont relevés avant l'arrêt
+        self._stop_worker(handle)
+        self._release(handle)
+        return True
+
+    def _stop_worker(self, handle):
+        handle.control.put(('stop',))
+        handle.process.join(timeout=JOIN_TIMEOUT)
+        if handle.process.is_alive():
+            handle.process.terminate()
+        print(LOG_WORKER_STOPPED.format(worker_id=handle.worker_id))
+
+    # ============================================
+    # BOTS (les workers exécutent, le coordinateur garde un miroir)
+    # ============================================
+
+    def _add(self, runtime):
+        super()._add(runtime)
+        if self.workers:
+            self._route(runtime.product_id).control.put(('put', [runtime.to_dict()]))
+
+    def remove_bot(self, bot_id):
+        with self._lock:
+            runtime = self.bots.get(bot_id)
+            super().remove_bot(bot_id)
+            if runtime is not None and self.workers:
+                self._route(runtime.product_id).control.put(('remove', [bot_id]))
+
+    def set_active(self, bot_id, is_active):
+        with self._lock:
+            runtime = self.bots.get(bot_id)
+            if runtime is not None and self.workers:
+                self._route(runtime.product_id).control.put(('set_active', bot_id, is_active))
+                return
+        # Aucun worker : seul le miroir existe
+        super().set_active(bot_id, is_active)
+
+    def on_price(self, product_id, price, exchange=None):
+        """Transmet un prix au worker propriétaire du produit"""
+        if not price or product_id not in self._by_product or not self.workers:
+            return
+        record = PRICE_RECORD.pack(product_id.encode(ENCODING), (exchange or '').encode(ENCODING), price)
+        with self._route_lock:
+            if product_id in self._moving:
+                self._held_prices.append((product_id, record))
+                return
+            self._push_price(self._route(product_id), record)
+
+    # ============================================
+    # RETOURS DES WORKERS
+    # ============================================
+
+    def _apply_changes(self, bot_id, changes):
+        with self._lock:
+            runtime = self.bots.get(bot_id)
+            if runtime is None:
+                return
+            before = runtime.snapshot()
+            for field, value in changes.items():
+                setattr(runtime, field, value)
+        self._notify(runtime, before)
+
+    def _submit_intent(self, bot_id, local_order_id, params):
+        # Envoi hors verrou (I/O réseau) : une transition terminale notifiée avant
+        # l'enregistrement ne trouve pas l'ordre, son état est donc rejoué ensuite
+        order = self.order_manager.submit_order(**params)
+        if order is None:
+            self._forward_order(bot_id, local_order_id, STATUS_REJECTED, params['side'], 0.0, None)
+            return
+        with self._lock:
+            self._orders[order.order_id] = (bot_id, local_order_id)
+            replay = order.is_terminal
+        if replay:
+            # _on_order_update retire l'entrée : jamais transmis deux fois
+            self._on_order_update(order, None)
+
+    def _forward_order(self, bot_id, local_order_id, status, side, filled_size, average_price):
+        with self._lock:
+            runtime = self.bots.get(bot_id)
+            if runtime is None or not self.workers:
+                return
+            self._route(runtime.product_id).control.put(
+                ('order', local_order_id, status, side, filled_size, average_price)
+            )
+
+    def _on_order_update(self, order, old_status):
+        """Écouteur OrderManager : renvoie l'ordre terminé au worker du bot"""
+        if not order.is_terminal:
+            return
+        with self._lock:
+            target = self._orders.pop(order.order_id, None)
+        if target is not None:
+            self._forward_order(target[0], target[1], order.status, order.side,
+                                order.filled_size, order.average_price)
+
+    def _handle_event(self, handle, message):
+        kind = message['t']
+        if kind == 'c':
+            self._apply_changes(message['b'], message['c'])
+        elif kind == 'i':
+            if self.order_manager is None:
+                return
+            self._order_executor.submit(self._submit_intent, message['b'], message['o'], message['p'])
+
+    def _drain(self, handle):
+        with self._drain_lock:
+            if handle.events.buf is None:
+                return 0
+            messages = handle.events.pop_many(BATCH_SIZE)
+            for payload in messages:
+                try:
+                    self._handle_event(handle, json.loads(payload.decode(ENCODING)))
+                except Exception as e:
+                    print(LOG_EVENT_ERROR.format(worker_id=handle.worker_id, error=e))
+        return len(messages)
+
+    def _release(self, handle):
+        """Relève les derniers événements d'un worker arrêté puis libère ses files"""
+        while self._drain(handle):
+            pass
+        with self._drain_lock:
+            handle.prices.close()
+            handle.events.close()
+
+    def _collect(self):
+        while self._collecting.is_set():
+            received = 0
+            for handle in list(self.workers.values()):
+                received += self._drain(handle)
+            if not received:
+                time.sleep(IDLE_SLEEP)
+
+    # ============================================
+    # CYCLE DE VIE
+    # ============================================
+
+    def start(self):
+        """Démarre les workers, leur confie les bots puis lance le rafraîchissement des prix"""
+        if not self.workers:
+            if self.order_manager is not None:
+                self._order_executor = ThreadPoolExecutor(max_workers=ORDER_THREADS,
+                                                          thread_name_prefix='sharded-orders')
+            handles = [self._spawn_worker() for _ in range(max(1, self.initial_workers))]
+            with self._lock:
+                self.workers = {handle.worker_id: handle for handle in handles}
+                self._routes = {}
+                batches = {}
+                for runtime in self.bots.values():
+                    batches.setdefault(self._route(runtime.product_id).worker_id, []).append(runtime.to_dict())
+                for worker_id, states in batches.items():
+                    self.workers[worker_id].control.put(('put', states))
+            self._collecting.set()
+            self._collector = threading.Thread(target=self._collect, name='sharded-engine-collector', daemon=True)
+            self._collector.start()
+        super().start()
+
+    def stop(self, wait=True):
+        super().stop(wait)
+        with self._lock:
+            handles = list(self.workers.values())
+            self.workers = {}
+            self._routes = {}
+        for handle in handles:
+            self._stop_worker(handle)
+        self._collecting.clear()
+        if self._collector is not None:
+            self._collector.join(timeout=JOIN_TIMEOUT)
+            self._collector = None
+        for handle in handles:
+            self._release(handle)
+        if self._order_executor is not None:
+            self._order_executor.shutdown(wait=wait)
+            self._order_executor = None
@@ -0,0 +1,94 @@
+import sys
+from pathlib import Path
+
+# Ajouter le répertoire racine du projet au path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+import random
+import time
+from src.services.arbitrage_scanner import ArbitrageScanner
+
+EXCHANGES = ['coinbase', 'binance', 'kraken']
+QUOTES = ['USDC', 'USDT', 'BTC', 'ETH']
+
+
+def build_market(n_assets=120, seed=42):
+    """Marché synthétique : chaque actif coté contre plusieurs devises, prix cohérents en USD"""
+    rng = random.Random(seed)
+    usd_prices = {'USDC': 1.0, 'USDT': 1.0, 'BTC': 64000.0, 'ETH': 3100.0}
+    for i in range(n_assets):
+        usd_prices[f"A{i:03d}"] = rng.uniform(0.05, 500.0)
+
+    products = []
+    for asset in sorted(usd_prices):
+        if asset in QUOTES:
+            continue
+        for quote in QUOTES:
+            if rng.random() < 0.7:
+                products.append((f"{asset}-{quote}", asset, quote))
+    products += [('BTC-USDC', 'BTC', 'USDC'), ('ETH-USDC', 'ETH', 'USDC'), ('ETH-BTC', 'ETH', 'BTC'),
+                 ('BTC-USDT', 'BTC', 'USDT'), ('USDT-USDC', 'USDT', 'USDC')]
+    return usd_prices, products
+
+
+def bench_ticks(n_ticks=200000, n_assets=120):
+    """Coût moyen et p99 d'un tick (réévaluation incrémentale des cycles touchés)"""
+    usd_prices, products = build_market(n_assets)
+    scanner = ArbitrageScanner()
+    for exchange in EXCHANGES:
+        scanner.set_products(exchange, products)
+
+    rng = random.Random(7)
+    feed = [(exchange, product_id, base, quote) for exchange in EXCHANGES for product_id, base, quote in products]
+
+    # Amorçage : un prix pour chaque produit
+    for exchange, product_id, base, quote in feed:
+        mid = usd_prices[base] / usd_prices[quote]
+        scanner.on_tick(exchange, product_id, mid * 0.9995, mid * 1.0005)
+
+    latencies = []
+    found = 0
+    start = time.perf_counter()
+    for _ in range(n_ticks):
+        exchange, product_id, base, quote = feed[rng.randrange(len(feed))]
+        mid = usd_prices[base] / usd_prices[quote] * (1 + rng.gauss(0, 0.004))
+        t0 = time.perf_counter()
+        found += len(scanner.on_tick(exchange, product_id, mid * 0.9995, mid * 1.0005))
+        latencies.append(time.perf_counter() - t0)
+    elapsed = time.perf_counter() - start
+
+    latencies.sort()
+    return {
+        'products': len(products) * len(EXCHANGES),
+        'cycles': scanner.cycle_count(),
+        'ticks_per_s': n_ticks / elapsed,
+        'mean_us': sum(latencies) / len(latencies) * 1e6,
+        'p99_us': latencies[int(len(latencies) * 0.99)] * 1e6,
+        'opportunities': found
+    }
+
+
+def bench_full_scan(n_assets=120):
+    """Référence : réévaluation complète de tous les cycles"""
+    usd_prices, products = build_market(n_assets)
+    scanner = ArbitrageScanner()
+    for exchange in EXCHANGES:
+        scanner.set_products(exchange, products)
+        for product_id, base, quote in products:
+            mid = usd_prices[base] / usd_prices[quote]
+            scanner.on_tick(exchange, product_id, mid * 0.9995, mid * 1.0005)
+
+    start = time.perf_counter()
+    scanner.scan_all()
+    return (time.perf_counter() - start) * 1e6
+
+
+if __name__ == "__main__":
+    print("=== BENCHMARK ARBITRAGE ===\n")
+    result = bench_ticks()
+    print(f"Produits suivis:      {result['products']:>10,}")
+    print(f"Cycles triangulaires: {result['cycles']:>10,}")
+    print(f"Ticks:                {result['ticks_per_s']:>10,.0f} ticks/s")
+    print(f"Coût moyen d'un tick: {result['mean_us']:>10,.1f} µs (p99 {result['p99_us']:,.1f} µs)")
+    print(f"Opportunités:         {result['opportunities']:>10,}")
+    print(f"Scan complet:         {bench_full_scan():>10,.0f} µs")
@@ -0,0 +1,79 @@
+import sys
+from pathlib import Path
+
+# Ajouter le répertoire racine du projet au path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+import os
+import tempfile
+import time
+import tracemalloc
+from src.models.database_model import DatabaseModel
+from src.services import export_service
+from src.services.export_service import ExportService, FORMAT_COLUMNAR, FORMAT_CSV, FORMAT_PARQUET
+
+DEFAULT_ROWS = 1000000
+INSERT_BATCH = 50000
+
+
+def build_database(path, n_rows):
+    """Base de n_rows ordres exécutés (2 comptes, 3 produits)"""
+    db = DatabaseModel(db_path=path)
+    try:
+        db.cursor.execute("INSERT INTO exchanges (fk_account_id, name, display_name) VALUES (1, 'coinbase', 'Coinbase')")
+        exchange_id = db.cursor.lastrowid
+        products = ('BTC-USDC', 'ETH-USDC', 'SOL-USDC')
+        for start in range(0, n_rows, INSERT_BATCH):
+            db.cursor.executemany(
+                "INSERT INTO orders (fk_account_id, fk_exchange_id, product_id, type, prix_execution, quantite, "
+                "montant_usdc, quantite_executee, montant_execute, frais, status, order_id_exchange, created_at, "
+                "executed_at) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, 'filled', ?, ?, ?)",
+                (
+                    (1 + i % 2, exchange_id, products[i % 3], 'buy' if i % 2 else 'sell', 64000.0 + i % 1000,
+                     0.001 * (1 + i % 7), 64.0 + i % 1000, 0.001 * (1 + i % 7), 64.0 + i % 1000, 0.064,
+                     f"cb-{i:012d}",
+                     f"2026-01-01 {i // 3600 % 24:02d}:{i // 60 % 60:02d}:{i % 60:02d}",
+                     f"2026-01-01 {i // 3600 % 24:02d}:{i // 60 % 60:02d}:{i % 60:02d}")
+                    for i in range(start, min(n_rows, start + INSERT_BATCH))
+                )
+            )
+            db.connection.commit()
+    finally:
+        db.close()
+
+
+def measure_export(db_path, fmt, target):
+    """
+    Débit mesuré sans tracemalloc (qui ralentit chaque allocation), pic mémoire sur un second export
+
+    Returns:
+        dict: {'rows', 'seconds', 'rows_per_s', 'peak_mb', 'file_mb'}
+    """
+    start = time.perf_counter()
+    path, rows = ExportService(db_path).export('orders', target, fmt=fmt)
+    seconds = time.perf_counter() - start
+
+    tracemalloc.start()
+    ExportService(db_path).export('orders', target, fmt=fmt)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return {
+        'rows': rows, 'seconds': seconds, 'rows_per_s': rows / seconds,
+        'peak_mb': peak / 1e6, 'file_mb': os.path.getsize(path) / 1e6
+    }
+
+
+if __name__ == "__main__":
+    n_rows = int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_ROWS
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = os.path.join(tmp, 'bench.db')
+        print(f"=== BENCHMARK EXPORT ({n_rows:,} ordres) ===\n")
+        build_database(db_path, n_rows)
+        print(f"Base : {os.path.getsize(db_path) / 1e6:.1f} Mo\n")
+        print(f"{'Format':<10}{'lignes/s':>12}{'durée s':>10}{'pic Mo':>9}{'fichier Mo':>12}")
+        # Sans pyarrow, parquet serait mesuré deux fois sous la forme du format colonnes
+        formats = (FORMAT_CSV, FORMAT_PARQUET, FORMAT_COLUMNAR) if export_service.pyarrow else (FORMAT_CSV, FORMAT_COLUMNAR)
+        for fmt in formats:
+            result = measure_export(db_path, fmt, os.path.join(tmp, f"orders_{fmt}"))
+            print(f"{fmt:<10}{result['rows_per_s']:>12,.0f}{result['seconds']:>10.1f}"
+                  f"{result['peak_mb']:>9.1f}{result['file_mb']:>12.1f}")
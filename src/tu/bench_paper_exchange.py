@@ -0,0 +1,60 @@
+import sys
+from pathlib import Path
+
+# Ajouter le répertoire racine du projet au path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+import random
+import time
+from src.models.exchanges.paper_model import PaperExchangeModel
+
+PRODUCTS = ['BTC-USDC', 'ETH-USDC', 'SOL-USDC', 'ADA-USDC']
+START_PRICES = {'BTC-USDC': 64000.0, 'ETH-USDC': 3100.0, 'SOL-USDC': 145.0, 'ADA-USDC': 0.45}
+
+
+def bench_market_orders(n=50000):
+    """Débit d'ordres market (achat/vente alternés)"""
+    exchange = PaperExchangeModel(balances={'USDC': 1e12, 'BTC': 1e6, 'ETH': 1e6, 'SOL': 1e6, 'ADA': 1e9})
+    for product_id, price in START_PRICES.items():
+        exchange.feed_price(product_id, price)
+
+    start = time.perf_counter()
+    for i in range(n):
+        product_id = PRODUCTS[i % len(PRODUCTS)]
+        exchange.place_order(product_id, 'buy' if i % 2 else 'sell', 'market', size=0.01, account_id=1)
+    elapsed = time.perf_counter() - start
+    return n / elapsed
+
+
+def bench_limit_orders_with_ticks(n=50000, ticks=20000):
+    """Débit d'ordres limit reposant dans le carnet puis exécutés par un flux de prix"""
+    exchange = PaperExchangeModel(balances={'USDC': 1e12, 'BTC': 1e6, 'ETH': 1e6, 'SOL': 1e6, 'ADA': 1e9})
+    prices = dict(START_PRICES)
+    for product_id, price in prices.items():
+        exchange.feed_price(product_id, price)
+
+    rng = random.Random(42)
+    start = time.perf_counter()
+    for i in range(n):
+        product_id = PRODUCTS[i % len(PRODUCTS)]
+        price = prices[product_id] * (1 + rng.uniform(-0.01, 0.01))
+        exchange.place_order(product_id, 'buy' if i % 2 else 'sell', 'limit',
+                             size=0.01, price=price, account_id=1)
+    orders_elapsed = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for i in range(ticks):
+        product_id = PRODUCTS[i % len(PRODUCTS)]
+        prices[product_id] *= 1 + rng.gauss(0, 0.002)
+        exchange.feed_price(product_id, prices[product_id])
+    ticks_elapsed = time.perf_counter() - start
+    filled = sum(1 for f in exchange.get_fills())
+    return n / orders_elapsed, ticks / ticks_elapsed, filled
+
+
+if __name__ == "__main__":
+    print("=== BENCHMARK PAPER EXCHANGE ===\n")
+    print(f"Ordres market:  {bench_market_orders():>12,.0f} ordres/s")
+    orders_rate, ticks_rate, filled = bench_limit_orders_with_ticks()
+    print(f"Ordres limit:   {orders_rate:>12,.0f} ordres/s")
+    print(f"Ticks de prix:  {ticks_rate:>12,.0f} ticks/s ({filled:,} exécutions)")
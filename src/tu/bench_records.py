@@ -0,0 +1,96 @@
+import sys
+from pathlib import Path
+
+# Ajouter le répertoire racine du projet au path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+import gc
+import time
+import tracemalloc
+from src.models.records import Bot, Candle, Order, Ticker
+
+N_OBJECTS = 200000
+
+
+def _sample_values(cls, i):
+    """Valeurs réalistes (entiers, flottants, chaînes partagées) pour le i-ème objet"""
+    samples = {
+        Bot: (i, 'BTC', 'USDC', 'BTC-USDC', None, 5.0, 100.0 + i, 'Market', 1, '2026-01-01 00:00:00',
+              'Coinbase', 1, 'coinbase'),
+        Order: (i, i, 1, 1, 'coinbase', 'BTC-USDC', 'buy', 64000.0 + i, 0.001, 64.0, 0.1, 'filled',
+                None, '2026-01-01 00:00:00', None),
+        Ticker: ('BTC-USDC', 64000.0 + i, 63999.0 + i, 64001.0 + i, 1234.5, '2026-01-01T00:00:00Z'),
+        Candle: (1767225600 + 60 * i, 63900.0 + i, 64100.0 + i, 64000.0 + i, 64050.0 + i, 12.5),
+    }
+    return samples[cls]
+
+
+def measure_memory(cls, n=N_OBJECTS):
+    """
+    Mémoire allouée pour n objets : dicts (format actuel des modèles) contre enregistrements
+
+    Returns:
+        dict: Octets par objet (valeurs exclues : seules les structures sont comptées)
+    """
+    rows = [_sample_values(cls, i) for i in range(n)]
+    fields = cls._fields
+    result = {}
+    for label, build in (('dict', lambda row: dict(zip(fields, row))), ('record', cls.from_row)):
+        gc.collect()
+        tracemalloc.start()
+        objects = [build(row) for row in rows]
+        current, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        result[label] = current / n
+        del objects
+    return result
+
+
+def measure_access(cls, n=N_OBJECTS):
+    """Temps de lecture d'un champ : d['champ'], record.champ et record['champ'] (ns par accès)"""
+    rows = [_sample_values(cls, i) for i in range(n)]
+    field = cls._fields[1]
+    dicts = [dict(zip(cls._fields, row)) for row in rows]
+    records = [cls.from_row(row) for row in rows]
+
+    timings = {}
+    start = time.perf_counter()
+    for d in dicts:
+        d[field]
+    timings['dict[key]'] = (time.perf_counter() - start) / n * 1e9
+    start = time.perf_counter()
+    for record in records:
+        getattr(record, field)
+    timings['record.attr'] = (time.perf_counter() - start) / n * 1e9
+    start = time.perf_counter()
+    for record in records:
+        record[field]
+    timings['record[key]'] = (time.perf_counter() - start) / n * 1e9
+    return timings
+
+
+def measure_json(cls, n=20000):
+    """Aller-retour JSON (µs par objet)"""
+    records = [cls.from_row(_sample_values(cls, i)) for i in range(n)]
+    start = time.perf_counter()
+    texts = [record.to_json() for record in records]
+    encode = (time.perf_counter() - start) / n * 1e6
+    start = time.perf_counter()
+    decoded = [cls.from_json(text) for text in texts]
+    decode = (time.perf_counter() - start) / n * 1e6
+    assert decoded == records
+    return {'encode_us': encode, 'decode_us': decode}
+
+
+if __name__ == "__main__":
+    print(f"=== BENCHMARK ENREGISTREMENTS ({N_OBJECTS:,} objets) ===\n")
+    print(f"{'Classe':<8}{'dict o/obj':>12}{'record o/obj':>14}{'gain':>7}"
+          f"{'d[k] ns':>10}{'r.a ns':>9}{'r[k] ns':>9}{'json µs':>10}")
+    for cls in (Bot, Order, Ticker, Candle):
+        memory = measure_memory(cls)
+        access = measure_access(cls)
+        json_cost = measure_json(cls)
+        print(f"{cls.__name__:<8}{memory['dict']:>12,.0f}{memory['record']:>14,.0f}"
+              f"{memory['dict'] / memory['record']:>6.1f}x"
+              f"{access['dict[key]']:>10.1f}{access['record.attr']:>9.1f}{access['record[key]']:>9.1f}"
+              f"{json_cost['encode_us'] + json_cost['decode_us']:>10.2f}")
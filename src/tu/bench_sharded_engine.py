@@ -0,0 +1,114 @@
+import sys
+from pathlib import Path
+
+# Ajouter le répertoire racine du projet au path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+import os
+import random
+import threading
+import time
+from src.services.bot_engine import BotEngine
+from src.services.sharded_engine import ShardedBotEngine
+
+WAIT_TIMEOUT = 120.0
+
+
+def build_bots(n_bots, n_products, seed=42):
+    """Bots synthétiques en attente (cible d'achat hors d'atteinte : évaluation sans ordre)"""
+    rng = random.Random(seed)
+    products = [f"A{i:04d}-USDC" for i in range(n_products)]
+    bots = [{
+        'bot_id': bot_id,
+        'exchange': 'coinbase',
+        'product_id': products[rng.randrange(n_products)],
+        'type_ordre': 'market',
+        'prix_achat_cible': 0.001,
+        'pourcentage_gain': 2.0,
+        'montant_trade': 100.0,
+        'is_active': 1
+    } for bot_id in range(1, n_bots + 1)]
+    return products, bots
+
+
+def run(engine, products, bots, n_updates, seed=7):
+    """
+    Pousse n_updates prix et attend que chaque bot concerné ait publié son changement
+
+    Returns:
+        float: Mises à jour de bots par seconde
+    """
+    per_product = {}
+    for bot in bots:
+        per_product[bot['product_id']] = per_product.get(bot['product_id'], 0) + 1
+
+    rng = random.Random(seed)
+    feed = [products[rng.randrange(len(products))] for _ in range(n_updates)]
+    expected = sum(per_product.get(product_id, 0) for product_id in feed)
+
+    received = [0]
+    done = threading.Event()
+    lock = threading.Lock()
+
+    def on_change(bot_id, changes):
+        if 'last_price' in changes:
+            with lock:
+                received[0] += 1
+                if received[0] >= expected:
+                    done.set()
+
+    engine.load(bots)
+    engine.add_listener(on_change)
+    if isinstance(engine, ShardedBotEngine):
+        engine.start()
+
+    start = time.perf_counter()
+    for index, product_id in enumerate(feed):
+        engine.on_price(product_id, 100.0 + index * 1e-6)
+    done.wait(WAIT_TIMEOUT)
+    elapsed = time.perf_counter() - start
+
+    engine.remove_listener(on_change)
+    return received[0] / elapsed, received[0] == expected
+
+
+def bench_scaling(n_bots=20000, n_products=400, n_updates=20000, max_workers=None):
+    """Débit d'évaluation : processus unique puis 1 à N workers"""
+    max_workers = max_workers or os.cpu_count() or 1
+    products, bots = build_bots(n_bots, n_products)
+    print(f"{n_bots} bots, {n_products} produits, {n_updates} prix, {os.cpu_count()} cœur(s)")
+
+    baseline, _ = run(BotEngine(exchange_resolver=lambda name: None), products, bots, n_updates)
+    print(f"  processus unique : {baseline:>12,.0f} évaluations/s")
+
+    for workers in range(1, max_workers + 1):
+        engine = ShardedBotEngine(workers=workers, exchange_resolver=lambda name: None, tick_interval=3600)
+        try:
+            rate, complete = run(engine, products, bots, n_updates)
+        finally:
+            engine.stop()
+        status = "" if complete else "  (incomplet)"
+        print(f"  {workers} worker(s)     : {rate:>12,.0f} évaluations/s  x{rate / baseline:.2f}{status}")
+
+
+def bench_rebalance(n_bots=20000, n_products=400):
+    """Coût d'un ajout puis d'un retrait de worker à chaud"""
+    products, bots = build_bots(n_bots, n_products)
+    engine = ShardedBotEngine(workers=2, exchange_resolver=lambda name: None, tick_interval=3600)
+    engine.load(bots)
+    engine.start()
+    try:
+        t0 = time.perf_counter()
+        engine.add_worker()
+        t1 = time.perf_counter()
+        engine.remove_worker()
+        t2 = time.perf_counter()
+        print(f"  ajout d'un worker : {(t1 - t0) * 1000:.0f} ms, retrait : {(t2 - t1) * 1000:.0f} ms")
+    finally:
+        engine.stop()
+
+
+if __name__ == "__main__":
+    max_workers = int(sys.argv[1]) if len(sys.argv) > 1 else None
+    bench_scaling(max_workers=max_workers)
+    bench_rebalance()
@@ -0,0 +1,484 @@
+"""
+Suite de benchmarks CoinTrader (hors-ligne)
+
+Mesure les chemins critiques de l'application sans réseau ni base réelle :
+    - BotModel.get_user_bots (dicts et enregistrements) et DatabaseModel.get_activity_logs (10k/100k/1M lignes)
+    - Décodage des réponses Coinbase (session rejouée, puis serveur simulé local)
+    - Chiffrement/déchiffrement Fernet, coût bcrypt
+    - Démarrage jusqu'à la fenêtre de connexion, remplissage du Treeview de l'historique,
+      changement de thème sur plusieurs milliers de widgets (ignorés sans affichage)
+
+Les résultats sont enregistrés en JSON dans datas/benchmarks/ pour comparer
+deux versions :
+
+Usage:
+    python src/tu/bench_suite.py [--quick] [--sizes 10000,100000] [--only db,coinbase]
+                                 [--output FICHIER] [--compare REFERENCE.json]
+"""
+import sys
+from pathlib import Path
+
+# Ajouter le répertoire racine du projet au path
+ROOT = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(ROOT))
+
+import argparse
+import json
+import os
+import platform
+import random
+import statistics
+import subprocess
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+# Les chemins relatifs de l'application (init_project/, logs/) partent de la racine
+os.chdir(ROOT)
+
+APP_VERSION = "1.0.0"
+DEFAULT_SIZES = (10000, 100000, 1000000)
+QUICK_SIZES = (10000,)
+RESULTS_DIR = ROOT / "datas" / "benchmarks"
+REGRESSION_THRESHOLD = 0.10
+ACTION_TYPES = ('PLATFORM_ADDED', 'BOT_ADDED', 'ORDER_ADDED', 'SECURITY_UPDATE')
+PRODUCTS = ('BTC-USDC', 'ETH-USDC', 'SOL-USDC', 'ADA-USDC', 'XRP-USDC', 'DOGE-USDC')
+
+
+# ============================================
+# MESURE
+# ============================================
+
+def measure(func, repeat=5, warmup=1):
+    """
+    Chronomètre func() plusieurs fois
+
+    Returns:
+        dict: {'min_ms', 'median_ms', 'p95_ms', 'runs'}
+    """
+    for _ in range(warmup):
+        func()
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        samples.append((time.perf_counter() - start) * 1000)
+    samples.sort()
+    return {
+        'min_ms': round(samples[0], 3),
+        'median_ms': round(statistics.median(samples), 3),
+        'p95_ms': round(samples[min(len(samples) - 1, int(len(samples) * 0.95))], 3),
+        'runs': repeat
+    }
+
+
+def rate(func, n, label='per_s'):
+    """Débit de func() appelée n fois (opérations par seconde)"""
+    start = time.perf_counter()
+    for _ in range(n):
+        func()
+    return {label: round(n / (time.perf_counter() - start), 1)}
+
+
+def has_display():
+    import tkinter as tk
+    try:
+        tk.Tk().destroy()
+        return True
+    except tk.TclError:
+        return False
+
+
+# ============================================
+# BASE DE DONNÉES
+# ============================================
+
+def seed_database(db_path, n_rows):
+    """
+    Crée une base de test : un compte, n_rows bots et n_rows logs d'activité
+
+    Returns:
+        DatabaseModel: Connexion à la base créée
+    """
+    from src.models.database_model import DatabaseModel
+
+    db = DatabaseModel(db_path=db_path)
+    cursor = db.cursor
+    cursor.execute(
+        "INSERT INTO accounts (username, password_hash, email, nom, prenom) VALUES (?, ?, ?, ?, ?)",
+        ('bench', 'x', 'bench@example.com', 'Bench', 'Mark')
+    )
+    account_id = cursor.lastrowid
+    cursor.execute(
+        "INSERT INTO exchanges (fk_account_id, name, display_name) VALUES (?, 'coinbase', 'Coinbase')",
+        (account_id,)
+    )
+    exchange_id = cursor.lastrowid
+
+    rng = random.Random(42)
+    start = datetime(2024, 1, 1)
+    cursor.executemany(
+        "INSERT INTO bots (fk_account_id, fk_exchange_id, crypto_source, crypto_target, product_id, "
+        "prix_achat_cible, pourcentage_gain, montant_trade, type_ordre, is_active, created_at) "
+        "VALUES (?, ?, 'USDC', ?, ?, ?, ?, ?, 'market', ?, ?)",
+        (
+            (account_id, exchange_id, product.split('-')[0], product, rng.uniform(1, 60000),
+             rng.uniform(0.5, 10), rng.uniform(10, 1000), i % 2, start + timedelta(seconds=i))
+            for i, product in ((i, PRODUCTS[i % len(PRODUCTS)]) for i in range(n_rows))
+        )
+    )
+    cursor.executemany(
+        "INSERT INTO activity_logs (fk_account_id, action_type, description, created_at) VALUES (?, ?, ?, ?)",
+        (
+            (account_id, ACTION_TYPES[i % len(ACTION_TYPES)], f"Action de test n°{i}", start + timedelta(seconds=i))
+            for i in range(n_rows)
+        )
+    )
+    db.connection.commit()
+    return db, account_id
+
+
+def bench_database(sizes, repeat):
+    """BotModel.get_user_bots et DatabaseModel.get_activity_logs selon le volume"""
+    from src.models.bot_model import BotModel
+
+    results = {}
+    for n_rows in sizes:
+        with tempfile.TemporaryDirectory() as tmp:
+            t0 = time.perf_counter()
+            db, account_id = seed_database(os.path.join(tmp, 'bench.db'), n_rows)
+            print(f"  {n_rows:>9,} lignes (base créée en {time.perf_counter() - t0:.1f} s)")
+            runs = repeat if n_rows < 1000000 else max(1, repeat // 2)
+            bot_model = BotModel(db_model=db)
+
+            results[f"get_user_bots[{n_rows}]"] = measure(lambda: bot_model.get_user_bots(account_id), runs)
+            results[f"get_user_bots_records[{n_rows}]"] = measure(
+                lambda: bot_model.get_user_bots(account_id, records=True), runs
+            )
+            results[f"get_activity_logs[{n_rows}]"] = measure(lambda: db.get_activity_logs(account_id), runs)
+            results[f"get_activity_logs_filtered[{n_rows}]"] = measure(
+                lambda: db.get_activity_logs(account_id, 'BOT_ADDED'), runs
+            )
+            db.close()
+    return results
+
+
+# ============================================
+# EXCHANGE (COINBASE)
+# ============================================
+
+class _RawResponse:
+    """Réponse HTTP rejouée : le JSON est décodé à chaque appel, comme requests"""
+
+    def __init__(self, body, status_code=200):
+        self.body = body
+        self.status_code = status_code
+        self.text = body.decode('utf-8')
+
+    def json(self):
+        return json.loads(self.body)
+
+
+class _ReplaySession:
+    """Session rejouant des corps JSON enregistrés (aucun accès réseau)"""
+
+    def __init__(self, routes):
+        self.routes = routes            # {suffixe de chemin: bytes}
+
+    def _lookup(self, url):
+        path = url.split('?', 1)[0]
+        for suffix, body in self.routes.items():
+            if path.endswith(suffix):
+                return _RawResponse(body)
+        return _RawResponse(b'{"message": "NotFound"}', 404)
+
+    def get(self, url, params=None, timeout=None):
+        return self._lookup(url)
+
+    def request(self, method, url, data=None, headers=None, timeout=None):
+        return self._lookup(url)
+
+
+def _coinbase_payloads(n_products=2000, n_fills=1000):
+    rng = random.Random(7)
+    products = [{
+        'id': f"A{i:04d}-USDC", 'base_currency': f"A{i:04d}", 'quote_currency': 'USDC',
+        'base_increment': '0.00000001', 'quote_increment': '0.01', 'base_min_size': '0.001',
+        'min_market_funds': '1', 'status': 'online', 'trading_disabled': i % 50 == 0
+    } for i in range(n_products)]
+    fills = [{
+        'trade_id': i, 'order_id': f"order-{i // 3}", 'product_id': 'BTC-USDC',
+        'side': 'buy' if i % 2 else 'sell', 'price': f"{rng.uniform(60000, 65000):.2f}",
+        'size': f"{rng.uniform(0.001, 0.1):.8f}", 'fee': '0.12', 'liquidity': 'T',
+        'created_at': '2024-05-01T12:00:00.000000Z'
+    } for i in range(n_fills)]
+    ticker = {'trade_id': 1, 'price': '64250.12', 'size': '0.01', 'bid': '64250.11', 'ask': '64250.13',
+              'volume': '12345.678', 'time': '2024-05-01T12:00:00.000000Z'}
+    encode = lambda payload: json.dumps(payload).encode('utf-8')
+    return {'/products': encode(products), '/fills': encode(fills), '/ticker': encode(ticker)}, n_products, n_fills
+
+
+def bench_coinbase(quick):
+    """Débit de décodage CoinbaseModel (session rejouée) puis aller-retour HTTP local"""
+    import base64
+    from src.models.exchanges.coinbase_model import CoinbaseModel
+
+    routes, n_products, n_fills = _coinbase_payloads()
+    client = CoinbaseModel(session=_ReplaySession(routes))
+    client.set_credentials('bench-key', base64.b64encode(b'bench-secret').decode('utf-8'), 'bench', account_id=1)
+
+    calls = 20 if quick else 100
+    results = {}
+    products = measure(client.get_products, calls)
+    results['coinbase_get_products'] = dict(products, products_per_s=round(
+        n_products / (products['median_ms'] / 1000), 1))
+    fills = measure(lambda: client.get_fills('BTC-USDC', account_id=1), calls)
+    results['coinbase_get_fills'] = dict(fills, fills_per_s=round(n_fills / (fills['median_ms'] / 1000), 1))
+    results['coinbase_get_product_ticker'] = rate(lambda: client.get_product_ticker('BTC-USDC'),
+                                                  2000 if quick else 20000)
+
+    # Aller-retour HTTP complet sur le serveur simulé (sans latence rejouée)
+    from src.tu.mock_coinbase_server import MockCoinbaseServer
+    with MockCoinbaseServer(simulate_latency=False) as server:
+        http_client = CoinbaseModel(pro_base_url=server.url)
+        results['coinbase_ticker_http'] = measure(lambda: http_client.get_product_ticker('BTC-USDC'),
+                                                  50 if quick else 300)
+    return results
+
+
+# ============================================
+# SÉCURITÉ
+# ============================================
+
+def bench_crypto(quick):
+    """Débit Fernet (clé éphémère, configs/ intacte) et coût bcrypt"""
+    import bcrypt
+    from cryptography.fernet import Fernet
+    from src.utils import crypto_utils
+
+    previous = crypto_utils._fernet_cache
+    crypto_utils._fernet_cache = Fernet(Fernet.generate_key())
+    try:
+        secret = "x" * 64
+        token = crypto_utils.encrypt_secret(secret)
+        n = 2000 if quick else 20000
+        results = {
+            'fernet_encrypt': rate(lambda: crypto_utils.encrypt_secret(secret), n),
+            'fernet_decrypt': rate(lambda: crypto_utils.decrypt_secret(token), n)
+        }
+    finally:
+        crypto_utils._fernet_cache = previous
+
+    password = b"correct horse battery staple"
+    stored = bcrypt.hashpw(password, bcrypt.gensalt())
+    repeat = 3 if quick else 10
+    results['bcrypt_hashpw'] = dict(measure(lambda: bcrypt.hashpw(password, bcrypt.gensalt()), repeat),
+                                    rounds=bcrypt.gensalt().decode('utf-8').split('$')[2])
+    results['bcrypt_checkpw'] = measure(lambda: bcrypt.checkpw(password, stored), repeat)
+    return results
+
+
+# ============================================
+# INTERFACE
+# ============================================
+
+_STARTUP_SCRIPT = """
+import sys, time
+sys.path.insert(0, {root!r})
+import tkinter as tk
+from src.views.main_view import Theme
+from src.views.login_view import LoginView
+root = tk.Tk()
+LoginView(root, Theme.get('dark'), lambda user: None, lambda: None)
+root.update()
+print(time.time())
+root.destroy()
+"""
+
+
+def bench_startup(quick):
+    """Délai entre le lancement du processus et l'affichage de la fenêtre de connexion"""
+    script = _STARTUP_SCRIPT.format(root=str(ROOT))
+    samples = []
+    for _ in range(2 if quick else 5):
+        start = time.time()
+        output = subprocess.run([sys.executable, '-c', script], capture_output=True, text=True,
+                                timeout=60, cwd=ROOT).stdout.strip().splitlines()
+        samples.append((float(output[-1]) - start) * 1000)
+    samples.sort()
+    return {'startup_to_login': {'min_ms': round(samples[0], 1),
+                                 'median_ms': round(statistics.median(samples), 1), 'runs': len(samples)}}
+
+
+def bench_history_treeview(sizes, quick):
+    """Construction de HistoryView et remplissage du Treeview depuis activity_logs"""
+    import tkinter as tk
+    from src.views.history_view import HistoryView
+    from src.views.main_view import Theme
+
+    results = {}
+    for n_rows in sizes:
+        if n_rows > 100000:
+            continue                    # au-delà, le Treeview n'est plus une cible réaliste
+        with tempfile.TemporaryDirectory() as tmp:
+            db, account_id = seed_database(os.path.join(tmp, 'bench.db'), n_rows)
+            root = tk.Tk()
+            root.withdraw()
+
+            def fill():
+                for child in root.winfo_children():
+                    child.destroy()
+                view = HistoryView.__new__(HistoryView)
+                view.parent_frame, view.theme = tk.Frame(root), Theme.get('dark')
+                view.user_data, view.db = {'id': account_id}, db
+                view.active_filter, view._rows = None, None
+                view._build()
+                root.update_idletasks()
+
+            results[f"history_treeview_fill[{n_rows}]"] = measure(fill, 2 if quick else 3)
+            root.destroy()
+            db.close()
+    return results
+
+
+def bench_theme_switch(quick):
+    """Changement de thème par le registre sur 3k/12k widgets (6 widgets par ligne)"""
+    import tkinter as tk
+    from src.components.theme_registry import ThemeRegistry
+    from src.tu.bench_theme_switch import build_tree
+    from src.views.main_view import Theme
+
+    results = {}
+    for n_rows in ((500,) if quick else (500, 2000)):
+        root = tk.Tk()
+        root.withdraw()
+        registry = ThemeRegistry()
+        build_tree(root, registry, Theme.DARK, n_rows)
+        root.update_idletasks()
+        themes = [Theme.LIGHT, Theme.DARK]
+
+        def toggle():
+            themes.reverse()
+            registry.apply(themes[0])
+            root.update_idletasks()
+
+        results[f"theme_switch[{len(registry)}]"] = measure(toggle, 3 if quick else 6)
+        root.destroy()
+    return results
+
+
+# ============================================
+# RÉSULTATS
+# ============================================
+
+def git_revision():
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], capture_output=True, text=True,
+                              cwd=ROOT, timeout=10).stdout.strip() or None
+    except (OSError, subprocess.SubprocessError):
+        return None
+
+
+def save_results(results, output=None):
+    """Enregistre les résultats avec le contexte d'exécution"""
+    report = {
+        'version': APP_VERSION,
+        'revision': git_revision(),
+        'timestamp': datetime.now().isoformat(timespec='seconds'),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'cpu_count': os.cpu_count(),
+        'results': results
+    }
+    if output is None:
+        RESULTS_DIR.mkdir(parents=True, exist_ok=True)
+        stamp = datetime.now().strftime('%Y%m%d-%H%M%S')
+        output = RESULTS_DIR / f"bench-{report['revision'] or APP_VERSION}-{stamp}.json"
+    with open(output, 'w', encoding='utf-8') as f:
+        json.dump(report, f, indent=2, ensure_ascii=False)
+    return output
+
+
+def compare(reference_path, results, threshold=REGRESSION_THRESHOLD):
+    """
+    Compare les résultats à un rapport de référence
+
+    Les métriques *_ms sont meilleures quand elles baissent, *_per_s quand elles montent.
+
+    Returns:
+        int: Nombre de régressions au-delà du seuil
+    """
+    with open(reference_path, 'r', encoding='utf-8') as f:
+        reference = json.load(f)
+    print(f"\nComparaison avec {reference_path} (révision {reference.get('revision')}):")
+    regressions = 0
+    for name, metrics in results.items():
+        previous = reference['results'].get(name)
+        if not previous:
+            continue
+        metric = next((key for key in ('median_ms', 'per_s') if key in metrics and key in previous), None)
+        if metric is None or not previous[metric]:
+            continue
+        change = (metrics[metric] - previous[metric]) / previous[metric]
+        worse = change > threshold if metric.endswith('_ms') else change < -threshold
+        regressions += worse
+        print(f"  {'❌' if worse else '✅'} {name:<42} {previous[metric]:>12,.2f} → {metrics[metric]:>12,.2f}"
+              f"  {change:+.1%}")
+    return regressions
+
+
+BENCHMARKS = ('db', 'coinbase', 'crypto', 'ui')
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmarks CoinTrader (hors-ligne)")
+    parser.add_argument('--quick', action='store_true', help="Volumes et répétitions réduits")
+    parser.add_argument('--sizes', default=None, help="Volumes de lignes, ex: 10000,100000,1000000")
+    parser.add_argument('--only', default=None, help=f"Sous-ensemble parmi {','.join(BENCHMARKS)}")
+    parser.add_argument('--output', default=None, help="Fichier JSON de résultats")
+    parser.add_argument('--compare', default=None, help="Rapport JSON de référence")
+    args = parser.parse_args(argv)
+
+    sizes = tuple(int(size) for size in args.sizes.split(',')) if args.sizes else (
+        QUICK_SIZES if args.quick else DEFAULT_SIZES)
+    selected = set(args.only.split(',')) if args.only else set(BENCHMARKS)
+    repeat = 3 if args.quick else 5
+
+    print("\n" + "=" * 60)
+    print("BENCHMARKS - CoinTrader")
+    print("=" * 60)
+
+    results = {}
+    if 'db' in selected:
+        print("\nBase de données:")
+        results.update(bench_database(sizes, repeat))
+    if 'coinbase' in selected:
+        print("\nExchange Coinbase:")
+        results.update(bench_coinbase(args.quick))
+    if 'crypto' in selected:
+        print("\nFernet / bcrypt:")
+        results.update(bench_crypto(args.quick))
+    if 'ui' in selected:
+        print("\nInterface:")
+        if has_display():
+            results.update(bench_startup(args.quick))
+            results.update(bench_history_treeview(sizes, args.quick))
+            results.update(bench_theme_switch(args.quick))
+        else:
+            print("  ⚠ Aucun affichage disponible, benchmarks d'interface ignorés")
+
+    print()
+    for name, metrics in results.items():
+        print(f"  {name:<44} " + "  ".join(f"{key}={value}" for key, value in metrics.items()))
+
+    output = save_results(results, args.output)
+    print(f"\n✓ Résultats enregistrés dans {output}")
+
+    if args.compare:
+        regressions = compare(args.compare, results)
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
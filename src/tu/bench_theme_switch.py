@@ -0,0 +1,153 @@
+import sys
+from pathlib import Path
+
+# Ajouter le répertoire racine du projet au path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+import time
+import tkinter as tk
+from src.views.main_view import Theme
+from src.components.theme_registry import ThemeRegistry
+from src.components.ui_component import ROLES_BUTTON_PRIMARY, ROLES_BUTTON_SECONDARY, ROLES_INPUT
+
+
+# ============================================
+# RÉFÉRENCE : ancien parcours récursif de MainApplication
+# ============================================
+
+def legacy_update_all_colors(root, theme):
+    """Parcours complet de l'arbre avec lecture des couleurs de chaque widget"""
+    def is_header_bg(color):
+        return color in [Theme.DARK['bg_header'], Theme.LIGHT['bg_header']]
+
+    def is_secondary_bg(color):
+        return color in [Theme.DARK['bg_secondary'], Theme.LIGHT['bg_secondary']]
+
+    def is_button_bg(color):
+        return color in [Theme.DARK['accent'], Theme.LIGHT['accent'],
+                         Theme.DARK['button_bg'], Theme.LIGHT['button_bg']]
+
+    def background(color):
+        if is_header_bg(color):
+            return theme['bg_header']
+        if is_secondary_bg(color):
+            return theme['bg_secondary']
+        return theme['bg_primary']
+
+    def update(widget):
+        widget_class = widget.winfo_class()
+        try:
+            if widget_class == 'Frame':
+                widget.config(bg=background(widget.cget('bg')))
+            elif widget_class == 'Label':
+                current_fg = widget.cget('fg')
+                widget.config(bg=background(widget.cget('bg')))
+                if current_fg in [Theme.DARK['text_secondary'], Theme.LIGHT['text_secondary']]:
+                    widget.config(fg=theme['text_secondary'])
+                else:
+                    widget.config(fg=theme['text_primary'])
+            elif widget_class == 'Button':
+                if is_button_bg(widget.cget('bg')):
+                    widget.config(bg=theme['button_bg'], fg=theme['button_text'],
+                                  activebackground=theme['accent'])
+                else:
+                    widget.config(bg=theme['bg_secondary'], fg=theme['text_primary'],
+                                  activebackground=theme['bg_primary'])
+            elif widget_class == 'Entry':
+                widget.config(bg=theme['input_bg'], fg=theme['text_primary'],
+                              insertbackground=theme['text_primary'])
+        except tk.TclError:
+            pass
+        for child in widget.winfo_children():
+            update(child)
+
+    update(root)
+
+
+# ============================================
+# ARBRE DE WIDGETS SYNTHÉTIQUE
+# ============================================
+
+def build_tree(root, registry, theme, n_rows):
+    """Lignes de formulaire : frame + 2 labels + entrée + 2 boutons (6 widgets par ligne)"""
+    container = tk.Frame(root, bg=theme['bg_primary'])
+    registry.register(container, bg='bg_primary')
+    for i in range(n_rows):
+        row = tk.Frame(container, bg=theme['bg_secondary'])
+        registry.register(row, bg='bg_secondary')
+        registry.register(tk.Label(row, text=f"Champ {i}", bg=theme['bg_secondary'], fg=theme['text_primary']),
+                          bg='bg_secondary', fg='text_primary')
+        registry.register(tk.Label(row, text="aide", bg=theme['bg_secondary'], fg=theme['text_secondary']),
+                          bg='bg_secondary', fg='text_secondary')
+        registry.register(tk.Entry(row, bg=theme['input_bg'], fg=theme['text_primary']), **ROLES_INPUT)
+        registry.register(tk.Button(row, text="OK", bg=theme['accent'], fg=theme['button_text']),
+                          **ROLES_BUTTON_PRIMARY)
+        registry.register(tk.Button(row, text="Annuler", bg=theme['bg_secondary'], fg=theme['text_primary']),
+                          **ROLES_BUTTON_SECONDARY)
+    return container
+
+
+def has_display():
+    try:
+        tk.Tk().destroy()
+        return True
+    except tk.TclError:
+        return False
+
+
+def timed(func, repeat):
+    durations = []
+    for i in range(repeat):
+        theme = Theme.LIGHT if i % 2 == 0 else Theme.DARK
+        t0 = time.perf_counter()
+        func(theme)
+        durations.append(time.perf_counter() - t0)
+    durations.sort()
+    return durations[len(durations) // 2]
+
+
+def bench_theme_switch(n_rows=1000, repeat=6):
+    """Compare le parcours récursif et l'application groupée par rôles"""
+    root = tk.Tk()
+    root.withdraw()
+    registry = ThemeRegistry()
+    build_tree(root, registry, Theme.DARK, n_rows)
+    root.update_idletasks()
+
+    legacy = timed(lambda theme: legacy_update_all_colors(root, theme), repeat)
+    batched = timed(registry.apply, repeat)
+    root.destroy()
+
+    print(f"  Widgets enregistrés     : {len(registry)}")
+    print(f"  Parcours récursif       : {legacy * 1000:8.1f} ms")
+    print(f"  Registre (lot par rôle) : {batched * 1000:8.1f} ms")
+    print(f"  Gain                    : x{legacy / batched:.1f}")
+    return legacy, batched
+
+
+def test_registry_faster_than_walk():
+    if not has_display():
+        print("⚠ Aucun affichage disponible, benchmark ignoré")
+        return
+    legacy, batched = bench_theme_switch(n_rows=500, repeat=4)
+    assert batched < legacy
+
+
+if __name__ == "__main__":
+    print("\n" + "=" * 60)
+    print("BENCHMARK - Changement de thème")
+    print("=" * 60)
+
+    if not has_display():
+        print("⚠ Aucun affichage disponible, benchmark ignoré")
+        sys.exit(0)
+
+    for rows in (500, 2000):
+        print(f"\n{rows} lignes ({rows * 6 + 1} widgets):")
+        bench_theme_switch(n_rows=rows)
+
+    try:
+        test_registry_faster_than_walk()
+        print("\n✅ Registre plus rapide que le parcours récursif")
+    except AssertionError:
+        print("\n❌ Registre plus lent que le parcours récursif")
@@ -0,0 +1,340 @@
+"""
+Serveur local simulant l'API Coinbase Exchange pour les tests hors-ligne
+
+Les latences des endpoints sont rejouées à partir de profils réalistes
+(médiane + dispersion log-normale mesurées sur l'API publique) et les
+requêtes privées sont vérifiées avec la même signature HMAC que Coinbase.
+
+Usage:
+    python src/tu/mock_coinbase_server.py [--port 8765] [--no-latency]
+"""
+import sys
+from pathlib import Path
+
+# Ajouter le répertoire racine du projet au path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+import argparse
+import base64
+import hashlib
+import hmac
+import json
+import random
+import threading
+import time
+import uuid
+from datetime import datetime, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlsplit, parse_qs
+
+# Identifiants acceptés par le serveur
+MOCK_API_KEY = "mock-key"
+MOCK_API_SECRET = base64.b64encode(b"mock-secret-for-cointrader-tests").decode('utf-8')
+MOCK_API_PASSPHRASE = "mock-passphrase"
+
+# Latences par endpoint : (médiane en ms, sigma log-normal)
+LATENCY_PROFILES = {
+    'ticker': (45, 0.35),
+    'stats': (60, 0.35),
+    'accounts': (110, 0.30),
+    'orders_post': (150, 0.40),
+    'orders_get': (90, 0.30),
+    'orders_delete': (120, 0.35),
+    'fills': (130, 0.35)
+}
+
+MOCK_FEE_RATE = 0.006
+
+DEFAULT_PRICES = {
+    'BTC-USDC': 64250.12,
+    'ETH-USDC': 3120.55,
+    'ETH-BTC': 0.04857,
+    'USDC-USD': 1.0
+}
+
+DEFAULT_BALANCES = {
+    'USDC': 10000.0,
+    'BTC': 0.25,
+    'ETH': 2.0
+}
+
+
+def _now_iso():
+    return datetime.now(timezone.utc).isoformat().replace('+00:00', 'Z')
+
+
+class MockExchangeState:
+    """État en mémoire de l'exchange simulé (prix, soldes, ordres, fills)"""
+
+    def __init__(self, prices=None, balances=None):
+        self.lock = threading.Lock()
+        self.prices = dict(prices or DEFAULT_PRICES)
+        self.balances = dict(balances or DEFAULT_BALANCES)
+        self.account_ids = {currency: str(uuid.uuid4()) for currency in self.balances}
+        self.orders = {}
+        self.fills = []
+        self.trade_seq = 0
+
+    def _fill(self, order, price, size):
+        """Exécute (partiellement ou totalement) un ordre au prix donné"""
+        base, quote = order['product_id'].split('-')
+        value = price * size
+        fee = value * MOCK_FEE_RATE
+
+        if order['side'] == 'buy':
+            self.balances[quote] = self.balances.get(quote, 0.0) - value - fee
+            self.balances[base] = self.balances.get(base, 0.0) + size
+        else:
+            self.balances[base] = self.balances.get(base, 0.0) - size
+            self.balances[quote] = self.balances.get(quote, 0.0) + value - fee
+
+        self.trade_seq += 1
+        self.fills.append({
+            'trade_id': self.trade_seq,
+            'order_id': order['id'],
+            'product_id': order['product_id'],
+            'side': order['side'],
+            'price': f"{price:.8f}",
+            'size': f"{size:.8f}",
+            'fee': f"{fee:.8f}",
+            'liquidity': 'T' if order['type'] == 'market' else 'M',
+            'created_at': _now_iso()
+        })
+
+        order['filled_size'] = f"{float(order['filled_size']) + size:.8f}"
+        order['executed_value'] = f"{float(order['executed_value']) + value:.8f}"
+        order['fill_fees'] = f"{float(order['fill_fees']) + fee:.8f}"
+
+    def place_order(self, payload):
+        """Crée un ordre ; les ordres market sont exécutés immédiatement"""
+        with self.lock:
+            product_id = payload.get('product_id')
+            if product_id not in self.prices:
+                return 400, {'message': 'Product not found'}
+
+            price = self.prices[product_id]
+            order = {
+                'id': str(uuid.uuid4()),
+                'product_id': product_id,
+                'side': payload.get('side', 'buy'),
+                'type': payload.get('type', 'market'),
+                'price': payload.get('price', '0'),
+                'size': payload.get('size', '0'),
+                'filled_size': '0',
+                'executed_value': '0',
+                'fill_fees': '0',
+                'status': 'pending',
+                'settled': False,
+                'created_at': _now_iso(),
+                'done_at': None,
+                'done_reason': None
+            }
+
+            if order['type'] == 'market':
+                size = float(order['size'] or 0.0)
+                if not size and payload.get('funds'):
+                    size = float(payload['funds']) / price
+                    order['size'] = f"{size:.8f}"
+                self._fill(order, price, size)
+                order.update(status='done', done_reason='filled', done_at=_now_iso(), settled=True)
+            else:
+                order['status'] = 'open'
+
+            self.orders[order['id']] = order
+            return 200, dict(order)
+
+    def cancel_order(self, order_id):
+        with self.lock:
+            order = self.orders.get(order_id)
+            if not order or order['status'] == 'done':
+                return 404, {'message': 'order not found'}
+            order.update(status='done', done_reason='canceled', done_at=_now_iso())
+            return 200, order_id
+
+    def set_price(self, product_id, price):
+        """Met à jour un prix et exécute les ordres limit qui le croisent"""
+        with self.lock:
+            self.prices[product_id] = price
+            for order in self.orders.values():
+                if order['product_id'] != product_id or order['status'] != 'open':
+                    continue
+                limit = float(order['price'])
+                crossed = price <= limit if order['side'] == 'buy' else price >= limit
+                if crossed:
+                    remaining = float(order['size']) - float(order['filled_size'])
+                    self._fill(order, limit, remaining)
+                    order.update(status='done', done_reason='filled', done_at=_now_iso(), settled=True)
+
+
+class MockCoinbaseHandler(BaseHTTPRequestHandler):
+    """Routage des requêtes vers l'état simulé"""
+
+    server_version = "MockCoinbase/1.0"
+
+    def log_message(self, format, *args):
+        if self.server.verbose:
+            super().log_message(format, *args)
+
+    def _sleep_latency(self, profile):
+        if not self.server.simulate_latency:
+            return
+        median_ms, sigma = LATENCY_PROFILES[profile]
+        time.sleep(random.lognormvariate(0, sigma) * median_ms / 1000.0)
+
+    def _send(self, status, payload):
+        body = json.dumps(payload).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _check_auth(self, body):
+        """Vérifie la signature CB-ACCESS-* de la requête"""
+        key = self.headers.get('CB-ACCESS-KEY')
+        sign = self.headers.get('CB-ACCESS-SIGN', '')
+        timestamp = self.headers.get('CB-ACCESS-TIMESTAMP', '')
+        passphrase = self.headers.get('CB-ACCESS-PASSPHRASE')
+
+        if key != MOCK_API_KEY or passphrase != MOCK_API_PASSPHRASE:
+            return False
+
+        message = f"{timestamp}{self.command}{self.path}{body}".encode('utf-8')
+        expected = base64.b64encode(
+            hmac.new(base64.b64decode(MOCK_API_SECRET), message, hashlib.sha256).digest()
+        ).decode('utf-8')
+        return hmac.compare_digest(expected, sign)
+
+    def _handle(self):
+        state = self.server.state
+        parts = urlsplit(self.path)
+        segments = [s for s in parts.path.split('/') if s]
+        query = {k: v[0] for k, v in parse_qs(parts.query).items()}
+
+        length = int(self.headers.get('Content-Length') or 0)
+        body = self.rfile.read(length).decode('utf-8') if length else ''
+
+        # Endpoints publics
+        if self.command == 'GET' and len(segments) == 3 and segments[0] == 'products':
+            product_id, endpoint = segments[1], segments[2]
+            if endpoint not in ('ticker', 'stats'):
+                return self._send(404, {'message': 'NotFound'})
+            self._sleep_latency(endpoint)
+            price = state.prices.get(product_id)
+            if price is None:
+                return self._send(404, {'message': 'NotFound'})
+            if endpoint == 'ticker':
+                return self._send(200, {
+                    'price': f"{price:.8f}",
+                    'bid': f"{price * 0.9999:.8f}",
+                    'ask': f"{price * 1.0001:.8f}",
+                    'volume': '1234.5',
+                    'time': _now_iso()
+                })
+            return self._send(200, {
+                'open': f"{price * 0.98:.8f}", 'high': f"{price * 1.02:.8f}",
+                'low': f"{price * 0.97:.8f}", 'last': f"{price:.8f}",
+                'volume': '1234.5', 'volume_30day': '45678.9'
+            })
+
+        # Endpoints privés
+        if not self._check_auth(body):
+            return self._send(401, {'message': 'invalid signature'})
+
+        if self.command == 'GET' and segments == ['accounts']:
+            self._sleep_latency('accounts')
+            with state.lock:
+                accounts = [
+                    {
+                        'id': state.account_ids.setdefault(currency, str(uuid.uuid4())),
+                        'currency': currency,
+                        'balance': f"{balance:.8f}",
+                        'available': f"{balance:.8f}",
+                        'hold': '0'
+                    }
+                    for currency, balance in state.balances.items()
+                ]
+            return self._send(200, accounts)
+
+        if self.command == 'POST' and segments == ['orders']:
+            self._sleep_latency('orders_post')
+            return self._send(*state.place_order(json.loads(body or '{}')))
+
+        if segments[:1] == ['orders'] and len(segments) == 2:
+            if self.command == 'DELETE':
+                self._sleep_latency('orders_delete')
+                return self._send(*state.cancel_order(segments[1]))
+            self._sleep_latency('orders_get')
+            order = state.orders.get(segments[1])
+            return self._send(200, order) if order else self._send(404, {'message': 'NotFound'})
+
+        if self.command == 'GET' and segments == ['fills']:
+            self._sleep_latency('fills')
+            with state.lock:
+                fills = [
+                    f for f in state.fills
+                    if (not query.get('order_id') or f['order_id'] == query['order_id'])
+                    and (not query.get('product_id') or f['product_id'] == query['product_id'])
+                ]
+            return self._send(200, fills)
+
+        return self._send(404, {'message': 'NotFound'})
+
+    do_GET = _handle
+    do_POST = _handle
+    do_DELETE = _handle
+
+
+class MockCoinbaseServer:
+    """Serveur HTTP simulé démarré dans un thread en arrière-plan"""
+
+    def __init__(self, host='127.0.0.1', port=0, simulate_latency=True, verbose=False):
+        self.httpd = ThreadingHTTPServer((host, port), MockCoinbaseHandler)
+        self.httpd.daemon_threads = True
+        self.httpd.state = MockExchangeState()
+        self.httpd.simulate_latency = simulate_latency
+        self.httpd.verbose = verbose
+        self.thread = None
+
+    @property
+    def url(self):
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    @property
+    def state(self):
+        return self.httpd.state
+
+    def start(self):
+        self.thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+        self.thread.start()
+        return self
+
+    def stop(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.stop()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Serveur Coinbase simulé")
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--no-latency', action='store_true', help='Désactive la simulation de latence')
+    args = parser.parse_args()
+
+    server = MockCoinbaseServer(port=args.port, simulate_latency=not args.no_latency, verbose=True)
+    print(f"🚀 Serveur Coinbase simulé sur {server.url}")
+    print(f"   Clé: {MOCK_API_KEY} | Passphrase: {MOCK_API_PASSPHRASE}")
+    try:
+        server.httpd.serve_forever()
+    except KeyboardInterrupt:
+        print("\n✓ Arrêt du serveur")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,163 @@
+import itertools
+import random
+import sys
+from pathlib import Path
+
+# Ajouter le répertoire racine du projet au path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from src.services.arbitrage_scanner import ArbitrageScanner, TYPE_CROSS, TYPE_TRIANGULAR
+
+FEES = {'alpha': 0.001, 'beta': 0.002}
+MIN_PROFIT = 0.0005
+EPSILON = 1e-12
+
+
+def _market(seed, n_currencies=8, density=0.6):
+    """Produits aléatoires (une seule paire par couple de devises) et prix cohérents bruités"""
+    rng = random.Random(seed)
+    currencies = [f"C{i}" for i in range(n_currencies)]
+    value = {c: rng.uniform(0.5, 50.0) for c in currencies}
+    products = {}
+    for exchange in FEES:
+        pairs = []
+        for x, y in itertools.combinations(currencies, 2):
+            if rng.random() < density:
+                base, quote = (x, y) if rng.random() < 0.5 else (y, x)
+                pairs.append((f"{base}-{quote}", base, quote))
+        products[exchange] = pairs
+
+    ticks = []
+    for exchange, pairs in products.items():
+        for product_id, base, quote in pairs:
+            mid = value[base] / value[quote] * rng.uniform(0.99, 1.01)
+            spread = mid * rng.uniform(0.0, 0.002)
+            ticks.append((exchange, product_id, mid - spread / 2, mid + spread / 2))
+    rng.shuffle(ticks)
+    return products, ticks
+
+
+def _naive_triangles(products, prices, exchanges=None):
+    """Tous les cycles a → b → c → a calculés directement, rotation ramenée à la plus petite devise"""
+    found = {}
+    for exchange, pairs in products.items():
+        if exchanges is not None and exchange not in exchanges:
+            continue
+        fee = FEES[exchange]
+        convert = {}
+        for product_id, base, quote in pairs:
+            quote_prices = prices.get((exchange, product_id))
+            if quote_prices is None:
+                continue
+            bid, ask = quote_prices
+            convert[(quote, base)] = (product_id, lambda amount, ask=ask: amount / ask * (1 - fee))
+            convert[(base, quote)] = (product_id, lambda amount, bid=bid: amount * bid * (1 - fee))
+        currencies = sorted({c for pair in convert for c in pair})
+        for path in itertools.permutations(currencies, 3):
+            if path[0] != min(path):
+                continue
+            legs = [(path[i], path[(i + 1) % 3]) for i in range(3)]
+            if not all(leg in convert for leg in legs):
+                continue
+            amount = 1.0
+            for leg in legs:
+                amount = convert[leg][1](amount)
+            if amount > 1.0 + MIN_PROFIT:
+                found[(exchange, path)] = (amount - 1.0, {convert[leg][0] for leg in legs})
+    return found
+
+
+def _naive_cross(prices):
+    found = {}
+    for (buy_on, product_id), (_, ask) in prices.items():
+        for (sell_on, other_id), (bid, _) in prices.items():
+            if other_id != product_id or sell_on == buy_on:
+                continue
+            profit = bid * (1 - FEES[sell_on]) / (ask * (1 + FEES[buy_on])) - 1
+            if profit > MIN_PROFIT:
+                found[(product_id, buy_on, sell_on)] = profit
+    return found
+
+
+def _scanner(products):
+    scanner = ArbitrageScanner(taker_fees=FEES, min_profit=MIN_PROFIT)
+    for exchange, pairs in products.items():
+        scanner.set_products(exchange, pairs)
+    return scanner
+
+
+def _triangles(opportunities):
+    return {(o['exchange'], tuple(o['currencies'])): o['profit'] for o in opportunities if o['type'] == TYPE_TRIANGULAR}
+
+
+def _crosses(opportunities):
+    return {(o['product_id'], o['buy_exchange'], o['sell_exchange']): o['profit']
+            for o in opportunities if o['type'] == TYPE_CROSS}
+
+
+def _assert_same(found, expected):
+    assert set(found) == set(expected), (sorted(set(found) ^ set(expected))[:5])
+    for key, profit in found.items():
+        reference = expected[key][0] if isinstance(expected[key], tuple) else expected[key]
+        assert abs(profit - reference) < EPSILON, (key, profit, reference)
+
+
+def test_cycle_count_matches_naive_enumeration():
+    products, _ = _market(1)
+    scanner = _scanner(products)
+    expected = 0
+    for pairs in products.values():
+        edges = {frozenset((base, quote)) for _, base, quote in pairs}
+        currencies = sorted({c for edge in edges for c in edge})
+        for a, b, c in itertools.combinations(currencies, 3):
+            if {frozenset((a, b)), frozenset((b, c)), frozenset((a, c))} <= edges:
+                expected += 2
+    assert expected > 0 and scanner.cycle_count() == expected
+
+
+def test_scan_all_matches_naive():
+    for seed in range(5):
+        products, ticks = _market(seed)
+        scanner = _scanner(products)
+        prices = {}
+        for exchange, product_id, bid, ask in ticks:
+            scanner.on_tick(exchange, product_id, bid, ask)
+            prices[(exchange, product_id)] = (bid, ask)
+
+        opportunities = scanner.scan_all()
+        expected = _naive_triangles(products, prices)
+        assert expected, "marché sans opportunité : seed à changer"
+        _assert_same(_triangles(opportunities), expected)
+        _assert_same(_crosses(opportunities), _naive_cross(prices))
+        assert [o['profit'] for o in opportunities] == sorted((o['profit'] for o in opportunities), reverse=True)
+
+
+def test_incremental_ticks_match_naive():
+    products, ticks = _market(7)
+    scanner = _scanner(products)
+    prices = {}
+    for exchange, product_id, bid, ask in ticks:
+        prices[(exchange, product_id)] = (bid, ask)
+        reported = scanner.on_tick(exchange, product_id, bid, ask)
+
+        # Seuls les cycles passant par le produit qui vient de bouger
+        expected = {
+            key: value for key, value in _naive_triangles(products, prices, exchanges={exchange}).items()
+            if product_id in value[1]
+        }
+        _assert_same(_triangles(reported), expected)
+        expected_cross = {
+            key: profit for key, profit in _naive_cross(prices).items()
+            if key[0] == product_id and exchange in key[1:]
+        }
+        _assert_same(_crosses(reported), expected_cross)
+
+
+if __name__ == "__main__":
+    for name, func in list(globals().items()):
+        if name.startswith('test_') and callable(func):
+            try:
+                func()
+                print(f"✅ {name}")
+            except AssertionError as e:
+                print(f"❌ {name}: {e}")
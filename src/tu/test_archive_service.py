@@ -0,0 +1,110 @@
+import os
+import sys
+import tempfile
+from datetime import datetime
+from pathlib import Path
+
+# Ajouter le répertoire racine du projet au path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from src.models.database_model import DatabaseModel
+from src.models.order_model import STATUS_FILLED, STATUS_OPEN
+from src.models.records import ActivityLog
+from src.services.archive_service import ArchiveService, month_bounds
+
+NOW = datetime(2026, 6, 15, 12, 0, 0)
+
+
+def _seed(db):
+    db.cursor.execute("INSERT INTO exchanges (fk_account_id, name, display_name) VALUES (1, 'coinbase', 'Coinbase')")
+    exchange_id = db.cursor.lastrowid
+    orders = [
+        ('2026-01-10 09:00:00', STATUS_FILLED, 1.0, 0.1),
+        ('2026-01-20 09:00:00', STATUS_FILLED, 2.0, 0.2),
+        ('2026-02-05 09:00:00', STATUS_FILLED, 3.0, 0.3),
+        ('2026-02-06 09:00:00', STATUS_OPEN, 4.0, 0.0),       # actif : jamais archivé
+        ('2026-06-01 09:00:00', STATUS_FILLED, 5.0, 0.5),
+    ]
+    for created_at, status, amount, fee in orders:
+        db.cursor.execute(
+            "INSERT INTO orders (fk_account_id, fk_exchange_id, product_id, type, quantite, montant_usdc, "
+            "quantite_executee, montant_execute, frais, status, created_at) "
+            "VALUES (1, ?, 'BTC-USDC', 'buy', 1.0, ?, 1.0, ?, ?, ?, ?)",
+            (exchange_id, amount, amount, fee, status, created_at)
+        )
+    for created_at in ('2026-01-11 08:00:00', '2026-02-12 08:00:00', '2026-06-02 08:00:00'):
+        db.cursor.execute(
+            "INSERT INTO activity_logs (fk_account_id, action_type, description, created_at) "
+            "VALUES (1, 'ORDER_ADDED', ?, ?)",
+            (f"ordre du {created_at[:10]}", created_at)
+        )
+    db.connection.commit()
+
+
+def test_month_bounds():
+    assert month_bounds('2026-01') == ('2026-01-01', '2026-02-01')
+    assert month_bounds('2025-12') == ('2025-12-01', '2026-01-01')
+
+
+def test_archive_moves_old_rows_and_keeps_rollups():
+    with tempfile.TemporaryDirectory() as tmp:
+        db = DatabaseModel(db_path=os.path.join(tmp, 'main.db'))
+        try:
+            _seed(db)
+            service = ArchiveService(db, archive_dir=os.path.join(tmp, 'archives'))
+            moved = service.archive(retention_days=90, now=NOW)
+            assert moved == {'2026-01': (2, 1), '2026-02': (1, 1)}, moved
+            assert sorted(os.listdir(service.archive_dir)) == ['cointrader_2026_01.db', 'cointrader_2026_02.db']
+
+            # Base principale : ordres récents et ordre actif seulement
+            db.cursor.execute("SELECT created_at FROM orders ORDER BY created_at")
+            assert [r[0] for r in db.cursor.fetchall()] == ['2026-02-06 09:00:00', '2026-06-01 09:00:00']
+            assert [p['month'] for p in service.partitions()] == ['2026-02', '2026-01']
+
+            # Un second passage ne déplace rien
+            assert service.archive(retention_days=90, now=NOW) == {}
+
+            summary = {(s['month'], s['status']): s for s in service.get_monthly_order_summary(1)}
+            assert summary[('2026-01', STATUS_FILLED)]['orders'] == 2
+            assert abs(summary[('2026-01', STATUS_FILLED)]['frais'] - 0.3) < 1e-9
+            assert summary[('2026-06', STATUS_FILLED)]['montant_usdc'] == 5.0
+            assert ('2026-02', STATUS_OPEN) not in summary
+        finally:
+            db.close()
+
+
+def test_history_reads_across_partitions():
+    with tempfile.TemporaryDirectory() as tmp:
+        db = DatabaseModel(db_path=os.path.join(tmp, 'main.db'))
+        try:
+            _seed(db)
+            service = ArchiveService(db, archive_dir=os.path.join(tmp, 'archives'))
+            before = service.get_orders(1)
+            service.archive(retention_days=90, now=NOW)
+
+            after = service.get_orders(1)
+            assert after == before and len(after) == 5
+            assert [o['created_at'][:7] for o in after] == ['2026-06', '2026-02', '2026-02', '2026-01', '2026-01']
+            assert after[0]['exchange_name'] == 'coinbase'
+            assert len(service.get_orders(1, status=STATUS_FILLED)) == 4
+
+            logs = service.get_activity_logs(1, 'ORDER_ADDED', records=True)
+            assert [log.created_at[:7] for log in logs] == ['2026-06', '2026-02', '2026-01']
+            assert isinstance(logs[0], ActivityLog)
+
+            # Limite atteinte : les partitions plus anciennes ne sont pas attachées
+            assert [o['created_at'][:7] for o in service.get_orders(1, limit=2)] == ['2026-06', '2026-02']
+            os.remove(service.partition_path('2026-01'))
+            assert len(service.get_orders(1, limit=3)) == 3
+        finally:
+            db.close()
+
+
+if __name__ == "__main__":
+    for name, func in list(globals().items()):
+        if name.startswith('test_') and callable(func):
+            try:
+                func()
+                print(f"✅ {name}")
+            except AssertionError as e:
+                print(f"❌ {name}: {e}")
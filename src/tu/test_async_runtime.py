@@ -0,0 +1,114 @@
+import asyncio
+import sys
+import threading
+import time
+from pathlib import Path
+
+# Ajouter le répertoire racine du projet au path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from src.services.async_runtime import AsyncRuntime
+from src.services.price_aggregator import PriceAggregator
+
+
+class SlowAdapter:
+    """Adapter factice : chaque appel attend sur la boucle, sans thread"""
+
+    def __init__(self, price, delay=0.2):
+        self.price = price
+        self.delay = delay
+        self.calls = 0
+
+    async def aget_tickers(self, product_ids=None):
+        self.calls += 1
+        await asyncio.sleep(self.delay)
+        return {pid: {'price': self.price, 'bid': self.price, 'ask': self.price} for pid in product_ids}
+
+
+def test_submit_and_every():
+    runtime = AsyncRuntime()
+    try:
+        assert runtime.submit(asyncio.sleep(0, result=42)).result(timeout=2) == 42
+
+        ticks = []
+
+        async def tick():
+            ticks.append(time.monotonic())
+
+        task = runtime.every(0.05, tick, name='test')
+        time.sleep(0.3)
+        task.cancel()
+        assert 3 <= len(ticks) <= 8, len(ticks)
+    finally:
+        runtime.stop()
+
+
+def test_thousands_of_requests_without_threads():
+    runtime = AsyncRuntime()
+    try:
+        adapter = SlowAdapter(100.0)
+        threads_before = threading.active_count()
+
+        async def fan_out():
+            return await asyncio.gather(*(adapter.aget_tickers(['BTC-USD']) for _ in range(5000)))
+
+        started = time.perf_counter()
+        results = runtime.submit(fan_out()).result(timeout=10)
+        elapsed = time.perf_counter() - started
+
+        assert len(results) == 5000
+        # 5000 requêtes de 200 ms en parallèle sur la boucle, pas 5000 threads
+        assert elapsed < 2.0, elapsed
+        assert threading.active_count() <= threads_before + 1
+    finally:
+        runtime.stop()
+
+
+def test_db_executor_is_serialized():
+    runtime = AsyncRuntime()
+    try:
+        active = []
+        overlaps = []
+        lock = threading.Lock()
+
+        def query():
+            with lock:
+                active.append(1)
+                overlaps.append(len(active))
+            time.sleep(0.01)
+            with lock:
+                active.pop()
+
+        futures = [runtime.call_blocking(query, kind='db') for _ in range(10)]
+        for future in futures:
+            future.result(timeout=5)
+        assert max(overlaps) == 1
+    finally:
+        runtime.stop()
+
+
+def test_aggregator_apoll():
+    runtime = AsyncRuntime()
+    try:
+        venues = {'binance': SlowAdapter(100.0), 'kraken': SlowAdapter(101.0)}
+        aggregator = PriceAggregator(product_ids=['BTC-USD'], exchange_resolver=lambda name: venues[name],
+                                     runtime=runtime)
+        aggregator.venues = dict(venues)
+
+        started = time.perf_counter()
+        runtime.submit(aggregator.apoll()).result(timeout=5)
+        # Les deux venues sont interrogées en même temps
+        assert time.perf_counter() - started < 0.35
+        assert all(adapter.calls == 1 for adapter in venues.values())
+    finally:
+        runtime.stop()
+
+
+if __name__ == "__main__":
+    for name, func in list(globals().items()):
+        if name.startswith('test_') and callable(func):
+            try:
+                func()
+                print(f"✅ {name}")
+            except AssertionError as e:
+                print(f"❌ {name}: {e}")
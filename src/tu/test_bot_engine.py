@@ -0,0 +1,133 @@
+import sys
+import threading
+from pathlib import Path
+
+# Ajouter le répertoire racine du projet au path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from src.models.order_model import STATUS_FILLED
+from src.services.bot_engine import BotEngine, STATE_BUYING, STATE_HOLDING, STATE_WAITING
+from src.services.order_manager import ManagedOrder
+
+
+def _bot(bot_id=1, target=None):
+    return {'bot_id': bot_id, 'exchange': 'coinbase', 'product_id': 'BTC-USDC', 'type_ordre': 'market',
+            'prix_achat_cible': target, 'pourcentage_gain': 10.0, 'montant_trade': 100.0, 'is_active': 1}
+
+
+class FakeOrderManager:
+    """Exécute chaque ordre avant même de le retourner (fill notifié pendant submit_order)"""
+
+    def __init__(self, fill=True):
+        self.fill = fill
+        self.engine = None
+        self.listeners = []
+        self.lock_free = []
+        self.submitted = 0
+
+    def add_listener(self, callback):
+        self.listeners.append(callback)
+
+    def submit_order(self, account_id, exchange_id, exchange_name, product_id, side,
+                     order_type='market', size=None, funds=None, price=None, bot_id=None):
+        # Verrou du moteur libre pendant l'I/O : un autre thread peut le prendre
+        probe = threading.Thread(target=self.engine.get_states)
+        probe.start()
+        probe.join(timeout=1.0)
+        self.lock_free.append(not probe.is_alive())
+
+        if not self.fill:
+            return None
+        self.submitted += 1
+        order = ManagedOrder(self.submitted, account_id, exchange_id, exchange_name, product_id, side,
+                             order_type, bot_id=bot_id, size=size, funds=funds, price=price)
+        order.status = STATUS_FILLED
+        order.filled_size = size if size is not None else funds / 100.0
+        order.executed_value = order.filled_size * 100.0 if side == 'buy' else order.filled_size * 120.0
+        for callback in self.listeners:
+            callback(order, None)
+        return order
+
+
+def _engine(manager):
+    engine = BotEngine(account_id=1, order_manager=manager, exchange_resolver=lambda name: None)
+    manager.engine = engine
+    return engine
+
+
+def test_simulated_round_trip():
+    engine = BotEngine(account_id=1, exchange_resolver=lambda name: None)
+    changes = []
+    engine.add_listener(lambda bot_id, fields: changes.append(fields))
+    engine.load([_bot(target=95.0)])
+
+    engine.on_price('BTC-USDC', 100.0)
+    assert engine.get_state(1)['state'] == STATE_WAITING
+    engine.on_price('BTC-USDC', 95.0)
+    state = engine.get_state(1)
+    assert state['state'] == STATE_HOLDING and abs(state['quantity'] - 100.0 / 95.0) < 1e-12
+    engine.on_price('BTC-USDC', 110.0)
+    state = engine.get_state(1)
+    assert state['state'] == STATE_WAITING and state['trades'] == 1 and abs(state['realized_pnl'] - 15.0 / 95.0 * 100.0) < 1e-9
+    # Écouteurs : seuls les champs modifiés
+    assert changes[1] == {'last_price': 100.0}
+
+
+def test_orders_sent_outside_lock_and_early_fill_applied_once():
+    manager = FakeOrderManager()
+    engine = _engine(manager)
+    engine.load([_bot()])
+
+    engine.on_price('BTC-USDC', 100.0)
+    state = engine.get_state(1)
+    assert state['state'] == STATE_HOLDING and state['quantity'] == 1.0 and state['entry_price'] == 100.0
+    assert state['pending_order_id'] is None and not engine._by_order
+
+    engine.on_price('BTC-USDC', 120.0)
+    state = engine.get_state(1)
+    assert state['state'] == STATE_WAITING and state['trades'] == 1 and state['realized_pnl'] == 20.0
+    assert manager.lock_free == [True, True]
+
+
+def test_rejected_order_restores_state():
+    manager = FakeOrderManager(fill=False)
+    engine = _engine(manager)
+    seen = []
+    engine.add_listener(lambda bot_id, fields: seen.append(fields.get('state')))
+    engine.load([_bot()])
+
+    engine.on_price('BTC-USDC', 100.0)
+    assert engine.get_state(1)['state'] == STATE_WAITING
+    assert seen[-2:] == [STATE_BUYING, STATE_WAITING]
+    assert manager.lock_free == [True]
+
+
+
+def test_reload_applies_edited_settings():
+    engine = BotEngine(account_id=1, exchange_resolver=lambda name: None)
+    engine.load([_bot(target=90.0)])
+    engine.on_price('BTC-USDC', 95.0)
+    assert engine.get_state(1)['state'] == STATE_WAITING
+
+    # Prix cible et montant édités : repris sans redémarrer le moteur
+    edited = dict(_bot(target=96.0), montant_trade=190.0)
+    engine.load([edited])
+    engine.on_price('BTC-USDC', 95.0)
+    state = engine.get_state(1)
+    assert state['state'] == STATE_HOLDING and state['quantity'] == 2.0
+
+    # Position ouverte : le changement de produit attend la fin du cycle
+    engine.load([dict(edited, product_id='ETH-USDC')])
+    assert engine.get_state(1)['product_id'] == 'BTC-USDC'
+    engine.on_price('BTC-USDC', 110.0)
+    engine.load([dict(edited, product_id='ETH-USDC')])
+    assert engine.get_state(1)['product_id'] == 'ETH-USDC' and engine.product_ids() == {'coinbase': {'ETH-USDC'}}
+
+if __name__ == "__main__":
+    for name, func in list(globals().items()):
+        if name.startswith('test_') and callable(func):
+            try:
+                func()
+                print(f"✅ {name}")
+            except AssertionError as e:
+                print(f"❌ {name}: {e}")
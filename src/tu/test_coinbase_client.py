@@ -0,0 +1,102 @@
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+# Ajouter le répertoire racine du projet au path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from src.models.apikey_model import ApiKeyModel
+from src.models.database_model import DatabaseModel
+from src.models.exchanges.coinbase_model import CoinbaseModel
+from src.models.exchanges.registry import get_registry
+from src.tu.mock_coinbase_server import (
+    MockCoinbaseServer, MOCK_API_KEY, MOCK_API_SECRET, MOCK_API_PASSPHRASE
+)
+
+ACCOUNT_ID = 1
+
+
+def _client(server):
+    client = CoinbaseModel(pro_base_url=server.url)
+    client.set_credentials(MOCK_API_KEY, MOCK_API_SECRET, MOCK_API_PASSPHRASE, ACCOUNT_ID)
+    return client
+
+
+def test_public_ticker():
+    with MockCoinbaseServer(simulate_latency=False) as server:
+        client = _client(server)
+        assert client.get_crypto_price('BTC', 'USDC') == server.state.prices['BTC-USDC']
+        ticker = client.get_product_ticker('ETH-USDC')
+        assert ticker['bid'] < ticker['price'] < ticker['ask']
+
+
+def test_balance_and_market_order():
+    with MockCoinbaseServer(simulate_latency=False) as server:
+        client = _client(server)
+        usdc_before = client.get_available_balance('USDC', ACCOUNT_ID)
+        assert usdc_before == 10000.0
+
+        order = client.place_order('BTC-USDC', 'buy', 'market', funds=1000.0, account_id=ACCOUNT_ID)
+        assert order['status'] == 'done'
+
+        fills = client.get_fills(order_id_exchange=order['id'], account_id=ACCOUNT_ID)
+        assert len(fills) == 1 and fills[0]['fee'] > 0
+        assert client.get_available_balance('USDC', ACCOUNT_ID) < usdc_before
+
+
+def test_limit_order_cancel():
+    with MockCoinbaseServer(simulate_latency=False) as server:
+        client = _client(server)
+        order = client.place_order('ETH-USDC', 'buy', 'limit', size=0.5, price=1000.0, account_id=ACCOUNT_ID)
+        assert order['status'] == 'open'
+        assert client.cancel_order(order['id'], ACCOUNT_ID)
+        assert client.get_order(order['id'], ACCOUNT_ID)['done_reason'] == 'canceled'
+
+
+def test_bad_signature_rejected():
+    with MockCoinbaseServer(simulate_latency=False) as server:
+        client = CoinbaseModel(pro_base_url=server.url)
+        client.set_credentials(MOCK_API_KEY, MOCK_API_SECRET, 'wrong-passphrase', ACCOUNT_ID)
+        assert client.get_accounts(ACCOUNT_ID) is None
+
+
+def test_signed_query_is_url_encoded():
+    with MockCoinbaseServer(simulate_latency=False) as server:
+        client = _client(server)
+        # Espace et '&' : la chaîne signée doit être celle réellement envoyée
+        assert client.get_fills(order_id_exchange='a b&c', account_id=ACCOUNT_ID) == []
+
+
+def test_key_changes_clear_cached_credentials():
+    adapter = get_registry().get('coinbase').adapter
+    with tempfile.TemporaryDirectory() as tmp:
+        db = DatabaseModel(db_path=os.path.join(tmp, 'keys.db'))
+        try:
+            db.cursor.execute("INSERT INTO exchanges (fk_account_id, name, display_name) VALUES (1, 'coinbase', 'Coinbase')")
+            db.connection.commit()
+            exchange_id = db.cursor.lastrowid
+            model = ApiKeyModel(db)
+            assert model.add_api_key(ACCOUNT_ID, exchange_id, MOCK_API_KEY, MOCK_API_SECRET)[0]
+            [key] = model.get_api_keys_for_user(ACCOUNT_ID)
+
+            adapter.set_credentials(MOCK_API_KEY, MOCK_API_SECRET, MOCK_API_PASSPHRASE, ACCOUNT_ID)
+            assert model.update_api_key(key['api_key_id'], 'new-key', MOCK_API_SECRET)[0]
+            assert ACCOUNT_ID not in adapter._auth_cache
+
+            adapter.set_credentials(MOCK_API_KEY, MOCK_API_SECRET, MOCK_API_PASSPHRASE, ACCOUNT_ID)
+            assert model.delete_api_key(key['api_key_id'])[0]
+            assert ACCOUNT_ID not in adapter._auth_cache
+        finally:
+            adapter.clear_credentials(ACCOUNT_ID)
+            db.close()
+
+
+if __name__ == "__main__":
+    for name, func in list(globals().items()):
+        if name.startswith('test_') and callable(func):
+            try:
+                func()
+                print(f"✅ {name}")
+            except AssertionError as e:
+                print(f"❌ {name}: {e}")
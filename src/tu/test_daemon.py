@@ -0,0 +1,152 @@
+import json
+import os
+import socket
+import stat
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+# Ajouter le répertoire racine du projet au path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from src.models.bot_model import BotModel
+from src.models.database_model import DatabaseModel
+from src.services import bot_engine
+from src.services.async_runtime import get_async_runtime
+from src.services.daemon import BotDaemon, encode_message, socket_is_live
+from src.services.daemon_client import DaemonClient, ERROR_DISCONNECTED, RemoteBotEngine
+
+BOT = {'exchange': 'coinbase', 'product_id': 'BTC-USDC', 'crypto_source': 'BTC', 'crypto_target': 'USDC',
+       'prix_achat': '', 'pourcentage_gain': '5', 'montant_trade': '100', 'type_ordre': 'Market'}
+
+
+def _wait(predicate, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.02)
+    return False
+
+
+class FakeDaemon:
+    """Démon minimal : répond à ping/subscribe puis coupe la connexion à la première autre commande"""
+
+    def __init__(self, path):
+        self.path = path
+        self.server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self.server.bind(path)
+        self.server.listen(1)
+        threading.Thread(target=self._serve, daemon=True).start()
+
+    def _serve(self):
+        connection, _ = self.server.accept()
+        with connection:
+            for line in connection.makefile('rb'):
+                request = json.loads(line)
+                if request['cmd'] not in ('ping', 'subscribe'):
+                    break
+                result = 'pong' if request['cmd'] == 'ping' else {}
+                connection.sendall(encode_message({'id': request['id'], 'ok': True, 'result': result}))
+        # Démon arrêté : plus personne n'écoute sur la socket
+        self.server.close()
+        os.unlink(self.path)
+
+
+def test_daemon_uses_its_database_and_refuses_second_instance():
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = os.path.join(tmp, 'daemon.db')
+        socket_path = os.path.join(tmp, 'daemon.sock')
+        db = DatabaseModel(db_path=db_path)
+        db.cursor.execute("INSERT INTO exchanges (fk_account_id, name, display_name) VALUES (1, 'coinbase', 'Coinbase')")
+        db.connection.commit()
+
+        # Socket orpheline d'un démon arrêté sans nettoyage : remplacée sans erreur
+        stale = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        stale.bind(socket_path)
+        stale.close()
+        assert os.path.exists(socket_path) and not socket_is_live(socket_path)
+
+        daemon = BotDaemon(socket_path=socket_path, db_path=db_path)
+        daemon.start()
+        threading.Thread(target=daemon.serve_forever, daemon=True).start()
+        assert stat.S_IMODE(os.stat(socket_path).st_mode) == 0o600
+        client = DaemonClient(socket_path)
+        try:
+            try:
+                BotDaemon(socket_path=socket_path, db_path=db_path).start()
+                assert False, "un second démon a pris la socket"
+            except OSError:
+                pass
+            assert socket_is_live(socket_path)
+
+            assert client.connect()
+            remote = RemoteBotEngine(client, 1)
+            assert remote.subscribe() and remote.get_states() == {}
+            result = remote.create_bot(**BOT)
+            assert result['success'], result
+            assert remote.toggle_bot(result['bot_id'], True)['success']
+            # Bot d'un autre compte : refusé
+            assert not RemoteBotEngine(client, 2).toggle_bot(result['bot_id'], False)['success']
+
+            # Commandes appliquées à la base du démon, pas à la base par défaut
+            [bot] = BotModel(db).get_user_bots(1)
+            assert bot['bot_id'] == result['bot_id'] and bot['is_active']
+            assert _wait(lambda: (remote.get_state(bot['bot_id']) or {}).get('is_active'))
+        finally:
+            client.close()
+            daemon.stop()
+            db.close()
+            get_async_runtime().start()
+        assert not os.path.exists(socket_path)
+
+
+def test_pending_call_fails_on_disconnect():
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'fake.sock')
+        FakeDaemon(path)
+        client = DaemonClient(path)
+        assert client.connect()
+        start = time.monotonic()
+        assert client.call('toggle_bot', account_id=1, bot_id=1, is_active=True) == (False, ERROR_DISCONNECTED)
+        assert time.monotonic() - start < 2.0
+        assert client.call('ping') == (False, "Démon non connecté")
+
+
+def test_remote_engine_falls_back_when_daemon_dies():
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'fake.sock')
+        FakeDaemon(path)
+        previous = os.environ.get('COINTRADER_SOCKET')
+        os.environ['COINTRADER_SOCKET'] = path
+        account_id = 987654
+        try:
+            engine = bot_engine.get_bot_engine(account_id)
+            assert isinstance(engine, RemoteBotEngine)
+            listener = lambda bot_id, changes: None
+            engine.add_listener(listener)
+
+            # La commande coupe la connexion : repli sur un moteur local qui hérite des écouteurs
+            engine.set_active(1, True)
+            assert _wait(lambda: isinstance(bot_engine._engines.get(account_id), bot_engine.BotEngine))
+            local = bot_engine.get_bot_engine(account_id)
+            assert listener in local._listeners
+            local.stop()
+        finally:
+            bot_engine._engines.pop(account_id, None)
+            if previous is None:
+                os.environ.pop('COINTRADER_SOCKET', None)
+            else:
+                os.environ['COINTRADER_SOCKET'] = previous
+
+
+if __name__ == "__main__":
+    for name, func in list(globals().items()):
+        if name.startswith('test_') and callable(func):
+            try:
+                func()
+                print(f"✅ {name}")
+            except AssertionError as e:
+                print(f"❌ {name}: {e}")
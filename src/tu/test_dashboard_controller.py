@@ -0,0 +1,35 @@
+import sys
+from pathlib import Path
+
+# Ajouter le répertoire racine du projet au path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from src.controllers.dashboard_controller import DashboardController
+
+
+def _position(product_id, quantite, cout_usdc):
+    return {'product_id': product_id, 'quantite': quantite, 'cout_usdc': cout_usdc}
+
+
+def test_portfolio_value_converts_quote_to_usdc():
+    positions = [_position('BTC-USDC', 0.5, 20000.0), _position('ETH-BTC', 2.0, 0.1)]
+    prices = {'BTC-USDC': 50000.0, 'ETH-BTC': 0.06}
+    value, cost = DashboardController.portfolio_value(positions, prices)
+    assert value == 0.5 * 50000.0 + 2.0 * 0.06 * 50000.0
+    assert cost == 20000.0 + 0.1 * 50000.0
+
+
+def test_portfolio_value_skips_unconvertible_quote():
+    positions = [_position('SOL-USDC', 10.0, 1000.0), _position('ETH-EUR', 1.0, 2000.0)]
+    prices = {'SOL-USDC': 150.0, 'ETH-EUR': 2500.0}
+    assert DashboardController.portfolio_value(positions, prices) == (1500.0, 1000.0)
+
+
+if __name__ == "__main__":
+    for name, func in list(globals().items()):
+        if name.startswith('test_') and callable(func):
+            try:
+                func()
+                print(f"✅ {name}")
+            except AssertionError as e:
+                print(f"❌ {name}: {e}")
@@ -0,0 +1,74 @@
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+# Ajouter le répertoire racine du projet au path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from src.models.bot_model import BotModel
+from src.models.database_model import DatabaseModel
+from src.models.exchange_model import ExchangeModel, QUERY_EXCHANGE_BY_ID
+from src.utils.data_access import compile_mapper, record_class
+
+
+def test_record_class_is_compact_and_dict_like():
+    Point = record_class('Point', ('x', 'y'))
+    assert record_class('Point', ('x', 'y')) is Point
+    point = Point(1, 2)
+    assert not hasattr(point, '__dict__')
+    assert point['x'] == 1 and point.get('z', 'absent') == 'absent' and 'y' in point
+    assert point.to_dict() == {'x': 1, 'y': 2}
+    assert point == Point(1, 2) and point != Point(2, 1)
+    try:
+        point['z']
+        assert False, "KeyError attendue"
+    except KeyError:
+        pass
+
+
+def test_compiled_mapper_renames_and_defaults():
+    mapper = compile_mapper(('fk_account_id', 'logo'), {'fk_account_id': 'account_id'}, {'logo': '💱'})
+    assert mapper(None, (4, None)) == {'account_id': 4, 'logo': '💱'}
+    record_mapper = compile_mapper(('fk_account_id', 'logo'), {'fk_account_id': 'account_id'}, {'logo': '💱'},
+                                   record='Row')
+    row = record_mapper(None, (4, 'X'))
+    assert row.account_id == 4 and row.logo == 'X'
+
+
+def test_models_return_same_rows_as_dicts_or_records():
+    with tempfile.TemporaryDirectory() as tmp:
+        db = DatabaseModel(db_path=os.path.join(tmp, 'access.db'))
+        try:
+            exchanges = ExchangeModel(db_model=db)
+            ok, _, exchange_id = exchanges.create_exchange(1, 'Coinbase', 'Coinbase', logo=None)
+            assert ok
+            bots = BotModel(db_model=db)
+            for i in range(3):
+                assert bots.create_bot(1, 'coinbase', 'BTC', 'USDC', 5.0, 100.0 + i, 'Market')[0]
+
+            exchange = exchanges.get_exchange_by_id(exchange_id, 1)
+            assert exchange['account_id'] == 1 and exchange['logo'] == '💱' and exchange['name'] == 'coinbase'
+            assert exchanges.get_exchange_by_name('COINBASE', 1) == exchange
+            assert exchanges.get_exchange_by_id(exchange_id, 2) is None
+            assert [e.to_dict() for e in exchanges.get_all_exchanges(1, records=True)] == [exchange]
+
+            as_dicts = bots.get_user_bots(1)
+            as_records = bots.get_user_bots(1, records=True)
+            assert len(as_dicts) == 3
+            assert [r.to_dict() for r in as_records] == as_dicts
+            assert as_dicts[0]['exchange'] == 'coinbase' and as_dicts[0]['exchange_id'] == exchange_id
+            # Une correspondance compilée par forme de résultat et par sortie
+            assert len(QUERY_EXCHANGE_BY_ID._mappers) == 1
+        finally:
+            db.close()
+
+
+if __name__ == "__main__":
+    for name, func in list(globals().items()):
+        if name.startswith('test_') and callable(func):
+            try:
+                func()
+                print(f"✅ {name}")
+            except AssertionError as e:
+                print(f"❌ {name}: {e}")
@@ -0,0 +1,121 @@
+import asyncio
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+# Ajouter le répertoire racine du projet au path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from src.models.exchanges import registry as registry_module
+from src.models.exchanges.registry import ExchangeRegistry, get_registry, set_ui_thread
+from src.utils.rate_limiter import RateLimiter
+from src.utils.ttl_cache import TTLCache
+
+
+class FakeAdapter:
+    """Adapter qui compte ses appels"""
+
+    def __init__(self):
+        self.calls = 0
+
+    def get_products(self):
+        self.calls += 1
+        return [{'product_id': 'BTC-USDC', 'status': 'online'}]
+
+    def get_accounts(self, account_id=None):
+        self.calls += 1
+        return [{'currency': 'USDC', 'available': 1.0}]
+
+
+def _registry(rate_limit=None):
+    with tempfile.TemporaryDirectory() as tmp:
+        exchanges = ExchangeRegistry(plugin_dir=tmp)
+    exchanges.register('fake', FakeAdapter, rate_limit=rate_limit)
+    return exchanges
+
+
+def test_rate_limiter_bucket():
+    limiter = RateLimiter(20, burst=2)
+    assert limiter.try_acquire() and limiter.try_acquire()
+    assert not limiter.try_acquire()
+    assert not limiter.acquire(timeout=0.01)
+
+    start = time.monotonic()
+    assert limiter.acquire()
+    assert 0.02 < time.monotonic() - start < 0.5
+    assert asyncio.run(limiter.acquire_async(timeout=1.0))
+
+
+def test_ttl_cache_expiry_and_bounds():
+    cache = TTLCache(default_ttl=0.05, max_entries=2)
+    cache.set('a', 1)
+    cache.set('b', 2, ttl=10.0)
+    assert cache.get('a') == 1
+    time.sleep(0.06)
+    assert cache.get('a') is None and cache.get('b') == 2
+
+    # Cache plein : les entrées expirées partent d'abord, puis la plus ancienne
+    cache.set('c', 3, ttl=10.0)
+    cache.set('d', 4, ttl=10.0)
+    assert len(cache) == 2 and cache.get('b') is None and cache.get('d') == 4
+
+    assert cache.get_or_set('none', lambda: None) is None and 'none' not in cache._data
+    cache.set(('coinbase', 'x'), 1)
+    cache.set(('kraken', 'x'), 2)
+    cache.invalidate('coinbase')
+    assert cache.get(('coinbase', 'x')) is None and cache.get(('kraken', 'x')) == 2
+
+
+def test_registry_singleton_and_handles():
+    assert get_registry() is get_registry()
+    exchanges = _registry()
+    handle = exchanges.get('FAKE')
+    assert handle is exchanges.get('fake') and handle.adapter is exchanges.get('fake').adapter
+    assert exchanges.get('unknown') is None
+
+
+def test_cached_results_are_copies():
+    exchanges = _registry()
+    handle = exchanges.get('fake')
+    products = handle.get_products()
+    products[0]['status'] = 'delisted'
+    products.append({'product_id': 'ETH-USDC'})
+
+    again = handle.get_products()
+    assert handle.adapter.calls == 1 and handle.stats.snapshot()['cache_hits'] == 1
+    assert again == [{'product_id': 'BTC-USDC', 'status': 'online'}]
+    again[0]['status'] = 'x'
+    assert handle.get_products()[0]['status'] == 'online'
+
+
+def test_ui_thread_never_waits_for_limiter():
+    exchanges = _registry(rate_limit=1)
+    handle = exchanges.get('fake')
+    set_ui_thread(threading.current_thread())
+    try:
+        assert handle.get_accounts(1)
+        start = time.monotonic()
+        assert handle.get_accounts(1) is None
+        assert time.monotonic() - start < 0.1 and handle.adapter.calls == 1
+    finally:
+        set_ui_thread(None)
+    assert registry_module._ui_thread_id is None
+
+    # Hors interface : l'appel attend le jeton suivant
+    result = []
+    worker = threading.Thread(target=lambda: result.append(handle.get_accounts(1)))
+    worker.start()
+    worker.join(timeout=3.0)
+    assert result and result[0] and handle.adapter.calls == 2
+
+
+if __name__ == "__main__":
+    for name, func in list(globals().items()):
+        if name.startswith('test_') and callable(func):
+            try:
+                func()
+                print(f"✅ {name}")
+            except AssertionError as e:
+                print(f"❌ {name}: {e}")
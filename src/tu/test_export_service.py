@@ -0,0 +1,139 @@
+import csv
+import os
+import sys
+import tempfile
+from datetime import datetime
+from pathlib import Path
+
+# Ajouter le répertoire racine du projet au path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from src.models.database_model import DatabaseModel
+from src.models.order_model import STATUS_FILLED, STATUS_OPEN
+from src.services.archive_service import ArchiveService
+from src.services import export_service
+from src.services.export_service import (
+    ExportProgress, ExportService, FORMAT_COLUMNAR, FORMAT_CSV, FORMAT_PARQUET, read_columnar
+)
+
+
+def _seed(db_path):
+    db = DatabaseModel(db_path=db_path)
+    try:
+        db.cursor.execute("INSERT INTO exchanges (fk_account_id, name, display_name) VALUES (1, 'coinbase', 'Coinbase')")
+        exchange_id = db.cursor.lastrowid
+        rows = []
+        for i in range(25):
+            status = STATUS_OPEN if i == 24 else STATUS_FILLED
+            month = 1 + i % 3
+            rows.append((1 + i % 2, exchange_id, 'BTC-USDC', 'buy' if i % 3 else 'sell', 100.0 + i,
+                         None if i == 5 else 0.5, 50.0 + i, 0.1, status, f"2026-0{month}-10 10:00:{i:02d}"))
+        db.cursor.executemany(
+            "INSERT INTO orders (fk_account_id, fk_exchange_id, product_id, type, prix_execution, quantite, "
+            "montant_usdc, frais, status, created_at) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            rows
+        )
+        db.cursor.execute(
+            "INSERT INTO activity_logs (fk_account_id, action_type, description, created_at) "
+            "VALUES (1, 'ORDER_ADDED', 'Achat « BTC », virgule, \"guillemets\"', '2026-01-02 00:00:00')"
+        )
+        db.connection.commit()
+        # Janvier et février archivés : l'export lit aussi les partitions
+        ArchiveService(db).archive(retention_days=30, now=datetime(2026, 4, 1))
+    finally:
+        db.close()
+
+
+def test_csv_export_includes_archived_rows():
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = os.path.join(tmp, 'export.db')
+        _seed(db_path)
+        service = ExportService(db_path, batch_size=4)
+        path, count = service.export('orders', os.path.join(tmp, 'orders.csv'))
+        assert count == 25
+
+        with open(path, newline='', encoding='utf-8') as f:
+            rows = list(csv.DictReader(f))
+        assert len(rows) == 25 and rows[0]['exchange'] == 'coinbase'
+        assert sorted(int(row['order_id']) for row in rows) == list(range(1, 26))
+        assert [row['quantite'] for row in rows if row['order_id'] == '6'] == ['']
+
+        progress = ExportProgress()
+        path, count = service.export('orders', os.path.join(tmp, 'account.csv'), account_id=2, progress=progress)
+        assert count == 12 and progress.total == 12 and progress.fraction == 1.0
+
+        path, count = service.export('activity_logs', os.path.join(tmp, 'logs.csv'), fmt=FORMAT_CSV)
+        with open(path, newline='', encoding='utf-8') as f:
+            [log] = list(csv.DictReader(f))
+        assert log['description'] == 'Achat « BTC », virgule, "guillemets"'
+
+
+def test_columnar_round_trip():
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = os.path.join(tmp, 'export.db')
+        _seed(db_path)
+        path, count = ExportService(db_path, batch_size=10).export('orders', os.path.join(tmp, 'orders.ccol'),
+                                                                  fmt=FORMAT_COLUMNAR)
+        batches = list(read_columnar(path))
+        # Un lot par partition (janvier, février) puis la base principale
+        assert [len(rows) for _, rows in batches] == [8, 8, 9]
+        names, first = batches[0]
+        assert names[0] == 'order_id' and 'frais' in names
+        rows = [dict(zip(names, row)) for _, batch in batches for row in batch]
+        by_id = {row['order_id']: row for row in rows}
+        assert by_id[6]['quantite'] is None and by_id[7]['quantite'] == 0.5
+        assert by_id[25]['status'] == STATUS_OPEN and by_id[25]['bot_id'] is None
+        assert by_id[3]['side'] == 'buy' and by_id[1]['side'] == 'sell'
+
+
+def test_cancelled_export_leaves_no_file():
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = os.path.join(tmp, 'export.db')
+        _seed(db_path)
+        progress = ExportProgress()
+        progress.cancel()
+        target = os.path.join(tmp, 'orders.csv')
+        assert ExportService(db_path).export('orders', target, progress=progress) == (None, 0)
+        assert not os.path.exists(target) and not os.path.exists(target + '.tmp')
+
+
+def test_parquet_fallback_changes_extension():
+    previous = export_service.pyarrow
+    export_service.pyarrow = None
+    try:
+        with tempfile.TemporaryDirectory() as tmp:
+            db_path = os.path.join(tmp, 'export.db')
+            _seed(db_path)
+            path, count = ExportService(db_path).export('orders', os.path.join(tmp, 'orders.parquet'),
+                                                        fmt=FORMAT_PARQUET)
+            # Sans pyarrow : format colonnes, jamais sous une extension .parquet
+            assert path == os.path.join(tmp, 'orders.ccol') and count == 25
+            assert not os.path.exists(os.path.join(tmp, 'orders.parquet'))
+            assert sum(len(rows) for _, rows in read_columnar(path)) == 25
+    finally:
+        export_service.pyarrow = previous
+
+
+def test_convert_empty_export_writes_header():
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = os.path.join(tmp, 'empty.db')
+        DatabaseModel(db_path=db_path).close()
+        source, count = ExportService(db_path).export('orders', os.path.join(tmp, 'orders.ccol'),
+                                                      fmt=FORMAT_COLUMNAR)
+        assert count == 0 and list(read_columnar(source)) == []
+
+        target = os.path.join(tmp, 'orders.csv')
+        export_service.main(['--convert', source, target])
+        with open(target, newline='', encoding='utf-8') as f:
+            rows = list(csv.reader(f))
+        assert len(rows) == 1 and rows[0][0] == 'order_id' and 'frais' in rows[0]
+
+
+if __name__ == "__main__":
+    for name, func in list(globals().items()):
+        if name.startswith('test_') and callable(func):
+            try:
+                func()
+                print(f"✅ {name}")
+            except AssertionError as e:
+                print(f"❌ {name}: {e}")
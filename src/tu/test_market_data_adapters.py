@@ -0,0 +1,208 @@
+import asyncio
+import json
+import sys
+from pathlib import Path
+
+# Ajouter le répertoire racine du projet au path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from src.models.exchanges.binance_model import BinanceModel
+from src.models.exchanges.kraken_model import KrakenModel
+
+FIXTURES_DIR = Path(__file__).parent / "fixtures"
+
+
+def _fixture(name):
+    with open(FIXTURES_DIR / name, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+class FixtureResponse:
+    def __init__(self, payload, status_code=200):
+        self.payload = payload
+        self.status_code = status_code
+
+    def json(self):
+        return self.payload
+
+
+class FixtureSession:
+    """Session HTTP rejouant les réponses enregistrées dans fixtures/ (aucun accès réseau)"""
+
+    def __init__(self, routes):
+        self.routes = routes        # {chemin: callable(params) -> payload}
+        self.requests = []
+
+    def get(self, url, params=None, timeout=None):
+        path = '/' + url.split('://', 1)[-1].split('/', 1)[-1]
+        self.requests.append((path, params))
+        handler = self.routes.get(path)
+        if handler is None:
+            return FixtureResponse({'error': ['EGeneral:Unknown method']}, 404)
+        payload = handler(params or {})
+        return payload if isinstance(payload, FixtureResponse) else FixtureResponse(payload)
+
+
+class FixtureTransport:
+    """Transport asynchrone rejouant une FixtureSession"""
+
+    def __init__(self, session):
+        self.session = session
+
+    async def get_json(self, url, params=None):
+        response = self.session.get(url, params)
+        return response.json() if response.status_code == 200 else None
+
+
+def _binance_session():
+    tickers = _fixture('binance_ticker_24hr.json')
+
+    def ticker_24hr(params):
+        if 'symbols' in params:
+            wanted = set(json.loads(params['symbols']))
+            # Comme Binance : un seul symbole inconnu rejette toute la requête
+            if wanted - {t['symbol'] for t in tickers}:
+                return FixtureResponse({'code': -1121, 'msg': 'Invalid symbol.'}, 400)
+            return [t for t in tickers if t['symbol'] in wanted]
+        if 'symbol' in params:
+            return next(t for t in tickers if t['symbol'] == params['symbol'])
+        return tickers
+
+    def ticker_price(params):
+        ticker = next(t for t in tickers if t['symbol'] == params['symbol'])
+        return {'symbol': ticker['symbol'], 'price': ticker['lastPrice']}
+
+    return FixtureSession({
+        '/api/v3/exchangeInfo': lambda params: _fixture('binance_exchange_info.json'),
+        '/api/v3/ticker/24hr': ticker_24hr,
+        '/api/v3/ticker/price': ticker_price
+    })
+
+
+def _kraken_session():
+    pairs = _fixture('kraken_asset_pairs.json')['result']
+    tickers = _fixture('kraken_ticker.json')
+
+    def ticker(params):
+        if 'pair' not in params:
+            return tickers
+        wanted = set(params['pair'].split(','))
+        result = {name: t for name, t in tickers['result'].items()
+                  if name in wanted or pairs[name]['altname'] in wanted}
+        return {'error': [], 'result': result}
+
+    return FixtureSession({
+        '/0/public/AssetPairs': lambda params: _fixture('kraken_asset_pairs.json'),
+        '/0/public/Ticker': ticker
+    })
+
+
+def test_binance_all_tickers_one_request():
+    session = _binance_session()
+    client = BinanceModel(session=session)
+
+    tickers = client.get_tickers()
+    assert set(tickers) == {'BTC-USDC', 'ETH-USDC', 'ETH-BTC', 'LUNA-USDT'}
+    assert tickers['BTC-USDC']['price'] == 67250.12
+    assert tickers['ETH-BTC']['bid'] < tickers['ETH-BTC']['ask']
+
+    # exchangeInfo n'est chargé qu'une fois : un seul appel ticker ensuite
+    client.get_tickers()
+    paths = [path for path, _ in session.requests]
+    assert paths.count('/api/v3/exchangeInfo') == 1
+    assert paths.count('/api/v3/ticker/24hr') == 2
+
+
+def test_binance_selected_tickers_and_price():
+    session = _binance_session()
+    client = BinanceModel(session=session)
+
+    tickers = client.get_tickers(['ETH-USDC', 'ETH-BTC'])
+    assert set(tickers) == {'ETH-USDC', 'ETH-BTC'}
+    assert json.loads(session.requests[-1][1]['symbols']) == ['ETHUSDC', 'ETHBTC']
+
+    assert client.get_crypto_price('BTC', 'USDC') == 67250.12
+    assert client.get_crypto_price('USDC', 'USDC') == 1.0
+    assert client.get_product_ticker('ETH-USDC')['ask'] == 2580.44
+
+
+def test_binance_skips_unlisted_symbols():
+    session = _binance_session()
+    client = BinanceModel(session=session)
+
+    tickers = client.get_tickers(['BTC-USDC', 'UNKNOWN-USDC'])
+    assert set(tickers) == {'BTC-USDC'}
+    assert json.loads(session.requests[-1][1]['symbols']) == ['BTCUSDC']
+    assert client.get_tickers(['UNKNOWN-USDC']) == {}
+
+    client.transport = FixtureTransport(session)
+    tickers = asyncio.run(client.aget_tickers(['ETH-BTC', 'UNKNOWN-USDC']))
+    assert set(tickers) == {'ETH-BTC'}
+
+
+def test_binance_products():
+    client = BinanceModel(session=_binance_session())
+    products = {p['product_id']: p for p in client.get_products()}
+    assert products['BTC-USDC']['base_increment'] == 0.00001
+    assert products['BTC-USDC']['min_market_funds'] == 5.0
+    assert products['LUNA-USDT']['status'] == 'disabled'
+
+
+def test_binance_symbol_fallback_without_exchange_info():
+    client = BinanceModel(session=FixtureSession({}))
+    assert client.to_product_id('SOLFDUSD') == 'SOL-FDUSD'
+    assert client.to_product_id('ETHBTC') == 'ETH-BTC'
+    assert client.get_tickers() is None
+
+
+def test_kraken_all_tickers_normalized():
+    session = _kraken_session()
+    client = KrakenModel(session=session)
+
+    tickers = client.get_tickers()
+    assert set(tickers) == {'BTC-USD', 'ETH-USD', 'BTC-USDC', 'DOGE-USD'}
+    assert tickers['BTC-USD']['price'] == 67240.10
+    assert tickers['BTC-USD']['volume'] == 2011.90021455
+
+    client.get_tickers()
+    paths = [path for path, _ in session.requests]
+    assert paths.count('/0/public/AssetPairs') == 1
+    assert paths.count('/0/public/Ticker') == 2
+
+
+def test_kraken_selected_tickers_and_price():
+    session = _kraken_session()
+    client = KrakenModel(session=session)
+
+    tickers = client.get_tickers(['BTC-USDC', 'ETH-USD', 'UNKNOWN-USD'])
+    assert set(tickers) == {'BTC-USDC', 'ETH-USD'}
+    assert session.requests[-1][1] == {'pair': 'XBTUSDC,ETHUSD'}
+
+    assert client.get_crypto_price('BTC', 'USDC') == 67260.00
+    assert client.get_crypto_price('UNKNOWN', 'USD') is None
+
+
+def test_kraken_products():
+    client = KrakenModel(session=_kraken_session())
+    products = {p['product_id']: p for p in client.get_products()}
+    # La paire dark pool (sans wsname) est ignorée
+    assert set(products) == {'BTC-USD', 'ETH-USD', 'BTC-USDC', 'DOGE-USD'}
+    assert products['BTC-USD']['quote_increment'] == 0.1
+    assert products['DOGE-USD']['status'] == 'disabled'
+
+
+def test_kraken_api_error():
+    session = FixtureSession({
+        '/0/public/AssetPairs': lambda params: {'error': ['EService:Unavailable'], 'result': {}}
+    })
+    assert KrakenModel(session=session).get_tickers() is None
+
+
+if __name__ == "__main__":
+    for name, func in list(globals().items()):
+        if name.startswith('test_') and callable(func):
+            try:
+                func()
+                print(f"✅ {name}")
+            except AssertionError as e:
+                print(f"❌ {name}: {e}")
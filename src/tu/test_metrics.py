@@ -0,0 +1,113 @@
+import os
+import sqlite3
+import sys
+import tempfile
+import time
+import urllib.request
+from pathlib import Path
+
+# Ajouter le répertoire racine du projet au path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from src.utils import db_connection
+from src.utils.metrics import LatencyHistogram, MetricsRegistry, get_metrics, start_http_server
+
+
+def test_histogram_relative_precision():
+    histogram = LatencyHistogram()
+    for micros in range(1, 100001):
+        histogram.record(micros / 1e6)
+    quantiles = histogram.quantiles((0.5, 0.99))
+    assert abs(quantiles[0.5] - 0.050) / 0.050 < 0.02, quantiles
+    assert abs(quantiles[0.99] - 0.099) / 0.099 < 0.02, quantiles
+    assert histogram.count == 100000
+
+
+def test_bucket_bounds_contiguous():
+    previous_high = 0
+    for index in range(0, 64 * 30):
+        low, high = LatencyHistogram.bucket_bounds(index)
+        assert low == previous_high, (index, low, previous_high)
+        assert LatencyHistogram.bucket_index(low) == index
+        assert LatencyHistogram.bucket_index(high - 1) == index
+        previous_high = high
+
+
+def test_disabled_registry_records_nothing():
+    registry = MetricsRegistry(enabled=False)
+
+    @registry.timed('work_seconds')
+    def work():
+        return 42
+
+    assert work() == 42
+    with registry.timer('block_seconds'):
+        pass
+    registry.inc('calls_total')
+    assert registry.to_prometheus() == "\n"
+
+    # Coût d'un appel décoré désactivé : un test de drapeau
+    start = time.perf_counter()
+    for _ in range(100000):
+        work()
+    assert (time.perf_counter() - start) / 100000 < 5e-6
+
+
+def test_prometheus_format():
+    registry = MetricsRegistry(enabled=True)
+    registry.describe('calls_total', "Appels")
+    registry.inc('calls_total', exchange='coinbase')
+    registry.inc('calls_total', 2, exchange='coinbase')
+    registry.set('bots_active', 7)
+    registry.observe('latency_seconds', 0.010, method='get "x"')
+    text = registry.to_prometheus()
+    assert '# HELP cointrader_calls_total Appels' in text
+    assert '# TYPE cointrader_calls_total counter' in text
+    assert 'cointrader_calls_total{exchange="coinbase"} 3' in text
+    assert 'cointrader_bots_active 7' in text
+    assert '# TYPE cointrader_latency_seconds summary' in text
+    assert 'cointrader_latency_seconds_count{method="get \\"x\\""} 1' in text
+    assert 'quantile="0.99"' in text
+
+
+def test_db_queries_timed_when_enabled():
+    registry = get_metrics()
+    registry.enabled = True
+    try:
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'metrics.db')
+            with db_connection.get_db_context(path) as (conn, cursor):
+                cursor.execute("CREATE TABLE bots (bot_id INTEGER PRIMARY KEY)")
+                cursor.executemany("INSERT INTO bots (bot_id) VALUES (?)", [(i,) for i in range(10)])
+                cursor.execute("SELECT bot_id FROM bots")
+                assert len(cursor.fetchall()) == 10
+        assert registry.get('db_query_seconds', op='SELECT', table='bots').count == 1
+        assert registry.get('db_query_seconds', op='INSERT', table='bots').count == 1
+        assert registry.get('db_fetch_seconds', op='SELECT', table='bots').count == 1
+        assert registry.get('db_transaction_seconds').count >= 1
+    finally:
+        registry.enabled = False
+        registry.reset()
+    assert db_connection.connection_factory() is sqlite3.Connection
+
+
+def test_http_endpoint():
+    registry = MetricsRegistry(enabled=True)
+    registry.inc('calls_total')
+    server = start_http_server(port=0, registry=registry)
+    try:
+        url = f"http://127.0.0.1:{server.server_address[1]}/metrics"
+        with urllib.request.urlopen(url, timeout=5) as response:
+            assert b'cointrader_calls_total 1' in response.read()
+    finally:
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    for name, func in list(globals().items()):
+        if name.startswith('test_') and callable(func):
+            try:
+                func()
+                print(f"✅ {name}")
+            except AssertionError as e:
+                print(f"❌ {name}: {e}")
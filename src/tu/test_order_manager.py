@@ -0,0 +1,214 @@
+import os
+import sqlite3
+import sys
+import tempfile
+import threading
+from datetime import datetime
+from pathlib import Path
+
+# Ajouter le répertoire racine du projet au path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from src.models.database_model import DatabaseModel
+from src.models.order_model import (
+    OrderModel, STATUS_CANCELLED, STATUS_FILLED, STATUS_OPEN, STATUS_PARTIALLY_FILLED, STATUS_PENDING
+)
+from src.services.order_manager import OrderManager
+
+
+class FakeExchange:
+    """Exchange qui accepte chaque ordre sans l'exécuter"""
+
+    def __init__(self):
+        self.placed = 0
+
+    def place_order(self, product_id, side, order_type, size=None, funds=None, price=None,
+                    client_oid=None, account_id=None):
+        self.placed += 1
+        return {'id': f"X{self.placed}", 'status': 'open', 'filled_size': 0.0}
+
+    def cancel_order(self, order_id, account_id=None):
+        return True
+
+
+class PollingExchange(FakeExchange):
+    """Exchange interrogé par reconcile() : totaux de l'ordre et fills"""
+
+    def __init__(self):
+        super().__init__()
+        self.fills = []
+
+    def get_order(self, order_id, account_id=None):
+        size = sum(fill['size'] for fill in self.fills)
+        return {'id': order_id, 'status': 'open', 'filled_size': size,
+                'executed_value': sum(fill['size'] * fill['price'] for fill in self.fills), 'fill_fees': 0.0}
+
+    def get_fills(self, product_id=None, order_id_exchange=None, account_id=None):
+        return [dict(fill) for fill in self.fills]
+
+
+def _database(tmp):
+    db_path = os.path.join(tmp, 'orders.db')
+    db = DatabaseModel(db_path=db_path)
+    db.cursor.execute("INSERT INTO exchanges (fk_account_id, name, display_name) VALUES (1, 'coinbase', 'Coinbase')")
+    db.connection.commit()
+    exchange_id = db.cursor.lastrowid
+    db.close()
+    return db_path, exchange_id
+
+
+def _manager(db_path, exchange):
+    return OrderManager(exchange_resolver=lambda name: exchange, db_path=db_path)
+
+
+def test_state_machine():
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path, exchange_id = _database(tmp)
+        manager = _manager(db_path, FakeExchange())
+        seen = []
+        manager.add_listener(lambda order, old: seen.append((old, order.status)))
+        try:
+            order = manager.submit_order(1, exchange_id, 'coinbase', 'BTC-USDC', 'buy', order_type='limit',
+                                         size=1.0, price=100.0)
+            assert order.status == STATUS_OPEN and order.order_id_exchange == 'X1'
+            assert not manager.transition(order.order_id, STATUS_PENDING)
+
+            manager.on_fill({'order_id': 'X1', 'price': 99.0, 'size': 0.4, 'fee': 0.1})
+            assert order.status == STATUS_PARTIALLY_FILLED and order.filled_size == 0.4
+            manager.on_fill({'order_id': 'X1', 'price': 99.0, 'size': 0.6, 'fee': 0.1})
+            assert order.status == STATUS_FILLED and manager.get_order(order.order_id) is None
+            assert not manager.on_fill({'order_id': 'X1', 'price': 99.0, 'size': 0.1})
+            assert seen == [(STATUS_PENDING, STATUS_OPEN), (STATUS_OPEN, STATUS_PARTIALLY_FILLED),
+                            (STATUS_PARTIALLY_FILLED, STATUS_FILLED)]
+
+            # Ordre au montant : complet quand montant exécuté + frais atteint le montant demandé
+            market = manager.submit_order(1, exchange_id, 'coinbase', 'BTC-USDC', 'buy', funds=100.0)
+            manager.on_fill({'order_id': 'X2', 'price': 50.0, 'size': 1.0, 'fee': 0.5})
+            assert market.status == STATUS_PARTIALLY_FILLED
+            manager.on_fill({'order_id': 'X2', 'price': 50.0, 'size': 0.99, 'fee': 0.0})
+            assert market.status == STATUS_FILLED
+
+            cancelled = manager.submit_order(1, exchange_id, 'coinbase', 'BTC-USDC', 'sell', size=2.0)
+            assert manager.cancel_order(cancelled.order_id) and cancelled.status == STATUS_CANCELLED
+            assert not manager.transition(cancelled.order_id, STATUS_FILLED)
+            assert manager.flush() == 3
+        finally:
+            manager.stop()
+
+
+def test_recover_after_partial_fill():
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path, exchange_id = _database(tmp)
+        manager = _manager(db_path, FakeExchange())
+        limit = manager.submit_order(1, exchange_id, 'coinbase', 'BTC-USDC', 'buy', order_type='limit',
+                                     size=1.0, price=100.0)
+        market = manager.submit_order(1, exchange_id, 'coinbase', 'BTC-USDC', 'buy', funds=100.0)
+        manager.on_fill({'order_id': 'X1', 'price': 100.0, 'size': 0.4, 'fee': 0.04})
+        manager.on_fill({'order_id': 'X2', 'price': 50.0, 'size': 0.8, 'fee': 0.04})
+        manager.stop()
+
+        # Redémarrage : la taille et le montant demandés sont intacts, l'exécuté est restauré
+        manager = _manager(db_path, FakeExchange())
+        try:
+            assert manager.recover() == 2
+            recovered = manager.get_order(limit.order_id)
+            assert (recovered.size, recovered.filled_size, recovered.executed_value) == (1.0, 0.4, 40.0)
+            assert isinstance(recovered.created_at, datetime) and isinstance(recovered.executed_at, datetime)
+            assert (recovered.order_type, recovered.price, recovered.fees) == ('limit', 100.0, 0.04)
+            assert recovered.status == STATUS_PARTIALLY_FILLED and recovered.order_id_exchange == 'X1'
+            recovered_market = manager.get_order(market.order_id)
+            assert (recovered_market.funds, recovered_market.executed_value) == (100.0, 40.0)
+
+            manager.on_fill({'order_id': 'X1', 'price': 100.0, 'size': 0.1})
+            assert recovered.status == STATUS_PARTIALLY_FILLED and abs(recovered.filled_size - 0.5) < 1e-12
+            manager.on_fill({'order_id': 'X1', 'price': 100.0, 'size': 0.5})
+            assert recovered.status == STATUS_FILLED
+            manager.flush()
+
+            [row] = OrderModel(manager.order_model.db).get_user_orders(1, status=STATUS_FILLED)
+            assert (row['quantite'], row['quantite_executee'], row['montant_execute']) == (1.0, 1.0, 100.0)
+            assert (row['order_type'], row['prix_limite'], row['prix_execution']) == ('limit', 100.0, 100.0)
+            assert manager.order_model.get_positions(1) == [
+                {'product_id': 'BTC-USDC', 'quantite': 1.8, 'cout_usdc': 140.0}
+            ]
+        finally:
+            manager.stop()
+
+
+def test_concurrent_and_duplicate_fills():
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path, exchange_id = _database(tmp)
+        manager = _manager(db_path, FakeExchange())
+        try:
+            order = manager.submit_order(1, exchange_id, 'coinbase', 'BTC-USDC', 'buy', order_type='limit',
+                                         size=1000.0, price=100.0)
+            fills = [{'trade_id': i, 'order_id': 'X1', 'price': 100.0, 'size': 1.0, 'fee': 0.0}
+                     for i in range(400)]
+            threads = [threading.Thread(target=lambda chunk=fills[i::4]: [manager.on_fill(f) for f in chunk])
+                       for i in range(4)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+            assert order.filled_size == 400.0 and order.executed_value == 40000.0
+
+            # Fill rejoué (flux + polling) : ignoré
+            assert not manager.on_fill(fills[0])
+            assert order.filled_size == 400.0
+        finally:
+            manager.stop()
+
+
+def test_polling_and_streaming_do_not_double_count():
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path, exchange_id = _database(tmp)
+        exchange = PollingExchange()
+        manager = _manager(db_path, exchange)
+        try:
+            order = manager.submit_order(1, exchange_id, 'coinbase', 'BTC-USDC', 'buy', order_type='limit',
+                                         size=1.0, price=100.0)
+            exchange.fills.append({'trade_id': 't1', 'order_id': 'X1', 'price': 100.0, 'size': 0.4, 'fee': 0.0})
+            assert manager.reconcile() == 1
+            assert order.filled_size == 0.4 and order.status == STATUS_PARTIALLY_FILLED
+
+            # Le même fill arrive ensuite par le flux : déjà compté
+            manager.on_fill(exchange.fills[0])
+            assert order.filled_size == 0.4
+
+            # Fill vu par get_order avant le flux : les totaux de l'exchange ne sont pas cumulés au fill
+            exchange.fills.append({'trade_id': 't2', 'order_id': 'X1', 'price': 100.0, 'size': 0.3, 'fee': 0.0})
+            manager._apply_exchange_order(order.order_id, exchange.get_order('X1'))
+            assert abs(order.filled_size - 0.7) < 1e-12
+            manager.on_fill(exchange.fills[1])
+            assert abs(order.filled_size - 0.7) < 1e-12 and abs(order.executed_value - 70.0) < 1e-9
+        finally:
+            manager.stop()
+
+
+def test_migrates_legacy_orders_table():
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = os.path.join(tmp, 'legacy.db')
+        connection = sqlite3.connect(db_path)
+        connection.executescript(
+            "CREATE TABLE orders (order_id INTEGER PRIMARY KEY, product_id TEXT, prix_execution REAL, "
+            "quantite REAL, montant_usdc REAL);"
+            "INSERT INTO orders VALUES (1, 'BTC-USDC', 100.0, 0.4, 40.0), (2, 'BTC-USDC', NULL, 1.0, NULL);"
+        )
+        connection.close()
+
+        db = DatabaseModel(db_path=db_path)
+        try:
+            db.cursor.execute("SELECT order_id, order_type, quantite_executee, montant_execute FROM orders")
+            assert [tuple(row) for row in db.cursor.fetchall()] == [(1, None, 0.4, 40.0), (2, None, None, None)]
+        finally:
+            db.close()
+
+
+if __name__ == "__main__":
+    for name, func in list(globals().items()):
+        if name.startswith('test_') and callable(func):
+            try:
+                func()
+                print(f"✅ {name}")
+            except AssertionError as e:
+                print(f"❌ {name}: {e}")
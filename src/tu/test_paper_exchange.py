@@ -0,0 +1,140 @@
+import sys
+from pathlib import Path
+
+# Ajouter le répertoire racine du projet au path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from src.models.exchanges import paper_model
+from src.models.exchanges.paper_model import PaperExchangeModel
+
+EPSILON = 1e-9
+
+
+def _exchange():
+    exchange = PaperExchangeModel(balances={'USDC': 1000.0}, taker_fee=0.01, maker_fee=0.005,
+                                  slippage_bps=0.0, spread_bps=0.0)
+    exchange.feed_price('BTC-USDC', 100.0, bid=99.0, ask=101.0)
+    return exchange
+
+
+def _balances(exchange):
+    return {a['currency']: (a['available'], a['hold'], a['balance']) for a in exchange.get_accounts()}
+
+
+def test_market_order_fees_and_balances():
+    exchange = _exchange()
+    order = exchange.place_order('BTC-USDC', 'buy', size=2.0)
+    assert order['settled'] and order['filled_size'] == 2.0 and order['executed_value'] == 202.0
+    assert abs(order['fill_fees'] - 2.02) < EPSILON
+    assert abs(exchange.get_available_balance('USDC') - (1000.0 - 202.0 - 2.02)) < EPSILON
+
+    order = exchange.place_order('BTC-USDC', 'sell', size=1.0)
+    assert order['executed_value'] == 99.0 and abs(order['fill_fees'] - 0.99) < EPSILON
+    assert exchange.get_available_balance('BTC') == 1.0
+    assert exchange.place_order('BTC-USDC', 'sell', size=5.0) is None
+
+    # Ordre au montant : frais compris dans le montant
+    order = exchange.place_order('BTC-USDC', 'buy', funds=101.0)
+    assert abs(order['executed_value'] + order['fill_fees'] - 101.0) < EPSILON
+
+
+def test_crossing_limit_fills_at_best_price():
+    exchange = _exchange()
+    order = exchange.place_order('BTC-USDC', 'buy', order_type='limit', size=1.0, price=110.0)
+    assert order['settled'] and order['executed_value'] == 101.0
+    # Réservation au prix limite rendue : seul le coût taker au ask est débité
+    assert abs(exchange.get_available_balance('USDC') - (1000.0 - 101.0 * 1.01)) < EPSILON
+
+    order = exchange.place_order('BTC-USDC', 'sell', order_type='limit', size=1.0, price=90.0)
+    assert order['settled'] and order['executed_value'] == 99.0
+    assert exchange.get_available_balance('BTC') == 0.0
+    assert _balances(exchange)['USDC'][1] == 0.0
+
+
+def test_resting_limit_reports_hold():
+    exchange = _exchange()
+    order = exchange.place_order('BTC-USDC', 'buy', order_type='limit', size=2.0, price=95.0)
+    assert not order['settled']
+    available, hold, balance = _balances(exchange)['USDC']
+    assert abs(hold - 2.0 * 95.0 * 1.005) < EPSILON and abs(balance - 1000.0) < EPSILON
+    assert abs(available - (1000.0 - hold)) < EPSILON
+
+    # Exécution maker au prix limite quand le ask descend : la réservation est consommée
+    exchange.feed_price('BTC-USDC', 94.0, bid=93.0, ask=94.0)
+    filled = exchange.get_order(order['id'])
+    assert filled['settled'] and filled['executed_value'] == 190.0
+    assert _balances(exchange)['USDC'][1] == 0.0 and _balances(exchange)['BTC'] == (2.0, 0.0, 2.0)
+
+    order = exchange.place_order('BTC-USDC', 'sell', order_type='limit', size=1.5, price=120.0)
+    assert _balances(exchange)['BTC'] == (0.5, 1.5, 2.0)
+    assert exchange.cancel_order(order['id'])
+    assert _balances(exchange)['BTC'] == (2.0, 0.0, 2.0)
+    assert not exchange.cancel_order(order['id'])
+
+
+def test_done_orders_are_bounded():
+    previous = paper_model.MAX_DONE_ORDERS_KEPT
+    paper_model.MAX_DONE_ORDERS_KEPT = 3
+    try:
+        exchange = _exchange()
+        resting = exchange.place_order('BTC-USDC', 'buy', order_type='limit', size=1.0, price=50.0)
+        ids = [exchange.place_order('BTC-USDC', 'buy', size=0.1)['id'] for _ in range(5)]
+        assert len(exchange._orders) == 4
+        assert exchange.get_order(ids[0]) is None and exchange.get_order(ids[-1]) is not None
+        # Les ordres ouverts ne sont jamais évincés
+        assert exchange.get_order(resting['id'])['status'] == 'open'
+        assert exchange.cancel_order(resting['id'])
+    finally:
+        paper_model.MAX_DONE_ORDERS_KEPT = previous
+
+
+def test_crossing_limit_checks_taker_cost():
+    exchange = PaperExchangeModel(balances={'USDC': 100.4}, taker_fee=0.006, maker_fee=0.004,
+                                  slippage_bps=0.0, spread_bps=0.0)
+    exchange.feed_price('BTC-USDC', 100.0, bid=100.0, ask=100.0)
+    # Assez pour le coût maker (100.4) mais pas pour le coût taker (100.6) : rejeté
+    assert exchange.place_order('BTC-USDC', 'buy', order_type='limit', size=1.0, price=100.0) is None
+    assert exchange.get_available_balance('USDC') == 100.4
+
+    # Ask sous la limite : coût taker au ask
+    exchange.feed_price('BTC-USDC', 99.0, bid=99.0, ask=99.0)
+    order = exchange.place_order('BTC-USDC', 'buy', order_type='limit', size=1.0, price=100.0)
+    assert order['settled'] and order['executed_value'] == 99.0
+    assert abs(exchange.get_available_balance('USDC') - (100.4 - 99.0 * 1.006)) < EPSILON
+    assert exchange.get_fills(order_id_exchange=order['id'])[0]['liquidity'] == 'T'
+
+
+def test_price_source_is_refreshed():
+    prices = {'BTC-USDC': 100.0}
+    exchange = PaperExchangeModel(price_source=prices.get, balances={'USDC': 1000.0},
+                                  slippage_bps=0.0, spread_bps=0.0)
+    assert exchange.get_crypto_price('BTC') == 100.0
+    resting = exchange.place_order('BTC-USDC', 'buy', order_type='limit', size=1.0, price=95.0)
+    assert not resting['settled']
+
+    # Nouveau prix de la source relu après PRICE_SOURCE_REFRESH : la limite est croisée
+    prices['BTC-USDC'] = 94.0
+    assert exchange.get_crypto_price('BTC') == 100.0
+    previous = paper_model.PRICE_SOURCE_REFRESH
+    paper_model.PRICE_SOURCE_REFRESH = 0.0
+    try:
+        assert exchange.get_crypto_price('BTC') == 94.0
+        assert exchange.get_order(resting['id'])['settled']
+    finally:
+        paper_model.PRICE_SOURCE_REFRESH = previous
+
+
+def test_registry_paper_adapter_has_price_source():
+    from src.models.exchanges.registry import ExchangeRegistry
+    handle = ExchangeRegistry().get('paper')
+    assert handle.adapter.price_source is paper_model.live_price
+
+
+if __name__ == "__main__":
+    for name, func in list(globals().items()):
+        if name.startswith('test_') and callable(func):
+            try:
+                func()
+                print(f"✅ {name}")
+            except AssertionError as e:
+                print(f"❌ {name}: {e}")
@@ -0,0 +1,84 @@
+import sys
+import threading
+import time
+from pathlib import Path
+
+# Ajouter le répertoire racine du projet au path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from src.services.price_aggregator import PriceAggregator
+
+
+def _aggregator(**kwargs):
+    return PriceAggregator(exchange_resolver=lambda name: object(), taker_fees={'a': 0.0, 'b': 0.0}, **kwargs)
+
+
+def test_best_quote_follows_ticks():
+    aggregator = _aggregator()
+    aggregator.on_tick('a', 'BTC-USDC', 99.0, 101.0)
+    aggregator.on_tick('b', 'BTC-USDC', 99.5, 100.5)
+    best = aggregator.get_best('BTC-USDC')
+    assert (best['bid'], best['bid_exchange'], best['ask'], best['ask_exchange']) == (99.5, 'b', 100.5, 'b')
+
+    # La meilleure venue se dégrade : l'autre reprend la main
+    aggregator.on_tick('b', 'BTC-USDC', 98.0, 102.0)
+    best = aggregator.get_best('BTC-USDC')
+    assert (best['bid_exchange'], best['ask_exchange']) == ('a', 'a')
+    assert aggregator.best_venue('buy', 'BTC', 'USDC')['exchange'] == 'a'
+    assert aggregator.best_venue('buy', 'USDC', 'BTC')['price'] == 1.0 / 99.0
+
+
+def test_stale_venue_expires():
+    aggregator = _aggregator(max_quote_age=5.0)
+    now = time.time()
+    aggregator.on_tick('a', 'BTC-USDC', 99.0, 101.0, timestamp=now)
+    aggregator.on_tick('b', 'BTC-USDC', 99.5, 100.5, timestamp=now - 10.0)
+    best = aggregator.get_best('BTC-USDC')
+    assert (best['bid_exchange'], best['ask_exchange']) == ('a', 'a')
+    assert set(aggregator.get_quotes('BTC-USDC')) == {'a'}
+
+    # Plus aucune venue à jour : plus de meilleur prix
+    aggregator._quotes['BTC-USDC']['a'] = (99.0, 101.0, now - 10.0)
+    aggregator._best['BTC-USDC'].bid_time = aggregator._best['BTC-USDC'].ask_time = now - 10.0
+    assert aggregator.best_venue('buy', 'BTC', 'USDC') is None
+
+
+def test_readers_never_see_partial_quote():
+    aggregator = _aggregator()
+    aggregator.on_tick('a', 'BTC-USDC', 99.0, 101.0)
+    stop = threading.Event()
+    errors = []
+
+    def writer():
+        i = 0
+        while not stop.is_set():
+            i += 1
+            # Alternance dégradation / amélioration : reconstruction complète une fois sur deux
+            aggregator.on_tick('b', 'BTC-USDC', 98.0 + (i % 2) * 2, 102.0 - (i % 2) * 2)
+
+    # Bascule entre threads très fréquente : expose une mise à jour en place non atomique
+    previous = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    thread = threading.Thread(target=writer)
+    thread.start()
+    try:
+        for _ in range(100000):
+            venue = aggregator.best_venue('buy', 'BTC', 'USDC')
+            best = aggregator.get_best('BTC-USDC')
+            if venue is None or best['bid'] is None or best['ask'] is None:
+                errors.append(best)
+    finally:
+        stop.set()
+        thread.join()
+        sys.setswitchinterval(previous)
+    assert not errors, errors[:3]
+
+
+if __name__ == "__main__":
+    for name, func in list(globals().items()):
+        if name.startswith('test_') and callable(func):
+            try:
+                func()
+                print(f"✅ {name}")
+            except AssertionError as e:
+                print(f"❌ {name}: {e}")
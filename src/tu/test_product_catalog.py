@@ -0,0 +1,92 @@
+import json
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+# Ajouter le répertoire racine du projet au path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from src.models.product_catalog import ProductCatalog
+
+EXCHANGE = 'testex'
+
+
+class FakeExchange:
+    """Adapter dont la liste de produits est modifiable entre deux synchronisations"""
+
+    def __init__(self, products):
+        self.products = products
+
+    def get_products(self):
+        return [dict(product) for product in self.products]
+
+
+def _product(product_id, status='online', base_min_size=0.001):
+    base, quote = product_id.split('-')
+    return {'product_id': product_id, 'base': base, 'quote': quote, 'base_increment': 1e-8,
+            'quote_increment': 0.01, 'base_min_size': base_min_size, 'min_market_funds': 1.0, 'status': status}
+
+
+PRODUCTS = [_product(pid) for pid in ('BTC-USDC', 'ETH-USDC', 'SOL-USDC', 'DOGE-USDC', 'DOT-USDC', 'ADA-EUR')]
+
+
+def test_sync_is_incremental_and_persisted():
+    with tempfile.TemporaryDirectory() as tmp:
+        catalog = ProductCatalog(catalog_dir=tmp)
+        exchange = FakeExchange(PRODUCTS)
+        result = catalog.sync(EXCHANGE, exchange)
+        assert sorted(result['added']) == sorted(p['product_id'] for p in PRODUCTS)
+        assert result['changed'] == [] and result['removed'] == []
+        index_path = os.path.join(tmp, f"{EXCHANGE}.json")
+        mtime = os.stat(index_path).st_mtime_ns
+
+        # Rien de changé : index non réécrit
+        assert catalog.sync(EXCHANGE, exchange) == {'added': [], 'changed': [], 'removed': []}
+        assert os.stat(index_path).st_mtime_ns == mtime
+
+        exchange.products = [p for p in PRODUCTS if p['product_id'] != 'DOT-USDC'] + [_product('XRP-USDC')]
+        exchange.products[0] = _product('BTC-USDC', status='delisted')
+        result = catalog.sync(EXCHANGE, exchange)
+        assert result == {'added': ['XRP-USDC'], 'changed': ['BTC-USDC'], 'removed': ['DOT-USDC']}
+        assert 'DOT' not in catalog.get_symbols(EXCHANGE) and 'XRP' in catalog.get_symbols(EXCHANGE)
+        assert 'BTC-USDC' not in [p.product_id for p in catalog.get_products(EXCHANGE, tradable_only=True)]
+
+        # Nouveau processus : même catalogue relu depuis l'index
+        reloaded = ProductCatalog(catalog_dir=tmp)
+        assert reloaded.get_product('BTC-USDC', EXCHANGE).status == 'delisted'
+        assert sorted(reloaded.get_symbols(EXCHANGE)) == sorted(catalog.get_symbols(EXCHANGE))
+        with open(index_path, encoding='utf-8') as f:
+            assert len(json.load(f)['rows']) == 6
+
+        assert catalog.sync(EXCHANGE, FakeExchange([])) is None
+        assert len(catalog.get_products(EXCHANGE)) == 6
+
+
+def test_search_prefix_then_fuzzy():
+    with tempfile.TemporaryDirectory() as tmp:
+        catalog = ProductCatalog(catalog_dir=tmp)
+        catalog.sync(EXCHANGE, FakeExchange(PRODUCTS))
+
+        # Préfixe sur le symbole puis sur le nom usuel
+        assert catalog.search('DO', EXCHANGE)[:2] == ['DOGE', 'DOT']
+        assert catalog.search('DO', EXCHANGE, limit=2) == ['DOGE', 'DOT']
+        assert catalog.search('bit', EXCHANGE) == ['BTC']
+        assert catalog.search('sol', EXCHANGE)[0] == 'SOL'
+        # Sous-séquence, puis similarité (faute de frappe)
+        assert catalog.search('ethreum', EXCHANGE)[0] == 'ETH'
+        assert catalog.search('dge', EXCHANGE) == ['DOGE']
+
+        assert catalog.search('', EXCHANGE, limit=3) == catalog.get_symbols(EXCHANGE)[:3]
+        assert len(catalog.search('d', EXCHANGE, limit=1)) == 1
+        assert catalog.search('zzzz', EXCHANGE) == []
+
+
+if __name__ == "__main__":
+    for name, func in list(globals().items()):
+        if name.startswith('test_') and callable(func):
+            try:
+                func()
+                print(f"✅ {name}")
+            except AssertionError as e:
+                print(f"❌ {name}: {e}")
@@ -0,0 +1,102 @@
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+# Ajouter le répertoire racine du projet au path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from src.utils import db_connection
+from src.utils.query_profiler import QueryProfiler, fingerprint, get_query_profiler, load_stats, top_statements
+
+
+def _use_profiler(tmp, slow_query_ms=100):
+    """Remplace la configuration du profileur du processus le temps d'un test"""
+    profiler = get_query_profiler()
+    saved = (profiler.enabled, profiler.slow_query_seconds, profiler.stats_path, profiler.slow_log_path)
+    profiler.enabled = True
+    profiler.slow_query_seconds = slow_query_ms / 1000.0
+    profiler.stats_path = os.path.join(tmp, 'query_stats.json')
+    profiler.slow_log_path = os.path.join(tmp, 'slow_queries.log')
+    profiler._slow_logger = None
+    profiler.reset()
+    return profiler, saved
+
+
+def _restore(profiler, saved):
+    profiler.enabled, profiler.slow_query_seconds, profiler.stats_path, profiler.slow_log_path = saved
+    profiler._slow_logger = None
+    profiler.reset()
+
+
+def test_fingerprint_ignores_literals():
+    a = fingerprint("SELECT * FROM bots WHERE bot_id = 12 AND product_id = 'BTC-USDC'")
+    b = fingerprint("SELECT  *  FROM bots\n WHERE bot_id = 7 AND product_id = 'ETH-USDC'")
+    c = fingerprint("SELECT * FROM bots WHERE bot_id IN (?, ?, ?)")
+    d = fingerprint("SELECT * FROM bots WHERE bot_id IN (?)")
+    assert a == b
+    assert c == d and c[1].endswith("IN (?...)")
+
+
+def test_statements_aggregated_with_rows():
+    with tempfile.TemporaryDirectory() as tmp:
+        profiler, saved = _use_profiler(tmp)
+        try:
+            with db_connection.get_db_context(os.path.join(tmp, 'profile.db')) as (conn, cursor):
+                cursor.execute("CREATE TABLE bots (bot_id INTEGER PRIMARY KEY, product_id TEXT)")
+                cursor.executemany("INSERT INTO bots (product_id) VALUES (?)", [('P',)] * 50)
+                for limit in (5, 10):
+                    cursor.execute(f"SELECT bot_id FROM bots LIMIT {limit}")
+                    cursor.fetchall()
+                cursor.execute("SELECT bot_id FROM bots WHERE bot_id = ?", (3,))
+                cursor.fetchone()
+
+            stats = profiler.snapshot()
+            by_sql = {entry['sql']: entry for entry in stats.values()}
+            assert by_sql["INSERT INTO bots (product_id) VALUES (?)"]['rows'] == 50
+            limit_entry = by_sql["SELECT bot_id FROM bots LIMIT ?"]
+            assert limit_entry['count'] == 2 and limit_entry['rows'] == 15
+            # Requête non épuisée : comptée à la fermeture du curseur
+            assert by_sql["SELECT bot_id FROM bots WHERE bot_id = ?"]['count'] == 1
+        finally:
+            _restore(profiler, saved)
+
+
+def test_slow_query_logged_with_plan_and_saved():
+    with tempfile.TemporaryDirectory() as tmp:
+        profiler, saved = _use_profiler(tmp, slow_query_ms=0)
+        try:
+            with db_connection.get_db_context(os.path.join(tmp, 'profile.db')) as (conn, cursor):
+                cursor.execute("CREATE TABLE bots (bot_id INTEGER PRIMARY KEY, product_id TEXT)")
+                cursor.execute("SELECT bot_id FROM bots WHERE product_id = ?", ('BTC-USDC',))
+                cursor.fetchall()
+            with open(profiler.slow_log_path, encoding='utf-8') as f:
+                log = f.read()
+            assert "[SLOW]" in log and "PLAN SCAN bots" in log, log
+
+            profiler.save()
+            profiler.save()             # aucun doublon : les agrégats sont remis à zéro
+            stats = load_stats(profiler.stats_path)
+            top = top_statements(stats, limit=5, sort='count')
+            select = next(row for row in top if row['sql'].startswith("SELECT"))
+            assert select['count'] == 1 and select['plan'] == ["SCAN bots"]
+            assert select['p99'] >= select['p50'] > 0
+        finally:
+            _restore(profiler, saved)
+
+
+def test_disabled_profiler_keeps_plain_connection():
+    profiler = QueryProfiler(enabled=False)
+    assert not profiler.snapshot()
+    if not get_query_profiler().enabled:
+        assert db_connection.connection_factory().__name__ == 'Connection'
+
+
+if __name__ == "__main__":
+    for name, func in list(globals().items()):
+        if name.startswith('test_') and callable(func):
+            try:
+                func()
+                print(f"✅ {name}")
+            except AssertionError as e:
+                print(f"❌ {name}: {e}")
@@ -0,0 +1,77 @@
+import json
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+# Ajouter le répertoire racine du projet au path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from src.controllers.bot_controller import BotController
+from src.models.bot_model import BotModel
+from src.models.database_model import DatabaseModel
+from src.models.order_model import OrderModel, STATUS_FILLED
+from src.models.records import ActivityLog, Bot, Candle, Order, Ticker
+
+
+def test_records_have_no_instance_dict():
+    for cls in (Bot, Order, Ticker, Candle, ActivityLog):
+        record = cls(*([None] * len(cls._fields)))
+        assert not hasattr(record, '__dict__'), cls.__name__
+        try:
+            record.unknown = 1
+            assert False, "attribut inattendu accepté"
+        except AttributeError:
+            pass
+
+
+def test_conversions_round_trip():
+    candle = Candle.from_row((1767225600, 1.0, 3.0, 2.0, 2.5, 10.0))
+    assert candle.low == 1.0 and candle.to_row() == (1767225600, 1.0, 3.0, 2.0, 2.5, 10.0)
+    assert Candle.from_json(candle.to_json()) == candle
+
+    ticker = Ticker.from_ticker('BTC-USDC', {'price': 10.0, 'bid': 9.9, 'ask': 10.1, 'extra': True})
+    assert ticker.price == 10.0 and ticker.volume is None
+    assert Ticker.from_dict(ticker.to_dict()) == ticker
+    assert json.loads(ticker.to_json())['product_id'] == 'BTC-USDC'
+
+
+def test_models_return_domain_records():
+    with tempfile.TemporaryDirectory() as tmp:
+        db = DatabaseModel(db_path=os.path.join(tmp, 'records.db'))
+        try:
+            db.cursor.execute("INSERT INTO exchanges (fk_account_id, name, display_name) VALUES (1, 'coinbase', 'Coinbase')")
+            db.connection.commit()
+            exchange_id = db.cursor.lastrowid
+            bot_model = BotModel(db_model=db)
+            assert bot_model.create_bot(1, 'coinbase', 'BTC', 'USDC', 5.0, 100.0, 'Market')[0]
+
+            bots = bot_model.get_user_bots(1, records=True)
+            assert isinstance(bots[0], Bot) and bots[0].to_dict() == bot_model.get_user_bots(1)[0]
+            # Les vues lisent les bots comme des dicts
+            display = BotController.__new__(BotController).format_bot_for_display(bots[0])
+            assert display['pair'] == 'BTC-USDC' and display['target_price'] == "Prix marché"
+
+            orders = OrderModel(db_model=db)
+            order_id = orders.create_order(1, exchange_id, 'BTC-USDC', 'buy', bot_id=bots[0].bot_id)
+            orders.apply_transitions([(STATUS_FILLED, 'X1', 100.0, 1.0, 100.0, 0.1, None, order_id)])
+            [order] = orders.get_user_orders(1, records=True)
+            assert isinstance(order, Order) and order.side == 'buy' and order.exchange_name == 'coinbase'
+            assert orders.get_user_orders(1, status=STATUS_FILLED) == [order.to_dict()]
+            assert orders.get_active_orders(records=True) == []
+
+            logs = db.get_activity_logs(1, 'BOT_ADDED', records=True)
+            assert len(logs) == 1 and isinstance(logs[0], ActivityLog)
+            assert logs[0].to_dict() == db.get_activity_logs(1, 'BOT_ADDED')[0]
+        finally:
+            db.close()
+
+
+if __name__ == "__main__":
+    for name, func in list(globals().items()):
+        if name.startswith('test_') and callable(func):
+            try:
+                func()
+                print(f"✅ {name}")
+            except AssertionError as e:
+                print(f"❌ {name}: {e}")
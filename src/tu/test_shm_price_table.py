@@ -0,0 +1,134 @@
+import subprocess
+import sys
+import threading
+import time
+from pathlib import Path
+
+# Ajouter le répertoire racine du projet au path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from multiprocessing import shared_memory
+from src.utils.shm_price_table import (
+    HEADER, MAGIC, OWNER_OFFSET, SEQ, VERSION, PriceTableReader, PriceTableWriter
+)
+
+ROOT = str(Path(__file__).parent.parent.parent)
+TABLE = "cointrader_prices_test"
+
+
+def test_write_and_read():
+    writer = PriceTableWriter(TABLE, capacity=16)
+    try:
+        # Processus écrivain : le tracker ne doit pas perdre l'enregistrement du segment
+        reader = PriceTableReader(TABLE, untrack=False)
+        assert reader.get('coinbase', 'BTC-USDC') is None
+        writer.update('Coinbase', 'BTC-USDC', 64000.0, 63999.5, 64000.5)
+        record = reader.get('coinbase', 'BTC-USDC')
+        assert record['price'] == 64000.0 and record['bid'] == 63999.5 and record['ask'] == 64000.5
+        writer.update('kraken', 'ETH-USD', 3100.0, ts=time.time() - 60)
+        assert reader.get('kraken', 'ETH-USD')['bid'] is None
+        assert reader.get_price('kraken', 'ETH-USD', max_age=10) is None
+        reader.close()
+    finally:
+        writer.close()
+
+
+def test_full_table():
+    writer = PriceTableWriter(TABLE, capacity=2)
+    try:
+        assert writer.update('coinbase', 'A-USDC', 1.0)
+        assert writer.update('coinbase', 'B-USDC', 2.0)
+        assert not writer.update('coinbase', 'C-USDC', 3.0)
+        assert writer.update('coinbase', 'A-USDC', 1.5)
+    finally:
+        writer.close()
+
+
+def test_seqlock_never_returns_torn_records():
+    writer = PriceTableWriter(TABLE, capacity=4)
+    reader = PriceTableReader(TABLE, untrack=False)
+    stop = threading.Event()
+
+    def write():
+        value = 0.0
+        while not stop.is_set():
+            value += 1.0
+            writer.update('coinbase', 'BTC-USDC', value, value, value)
+
+    thread = threading.Thread(target=write)
+    thread.start()
+    try:
+        torn = 0
+        for _ in range(50000):
+            record = reader.get('coinbase', 'BTC-USDC')
+            if record and not (record['price'] == record['bid'] == record['ask']):
+                torn += 1
+        assert torn == 0, torn
+    finally:
+        stop.set()
+        thread.join()
+        reader.close()
+        writer.close()
+
+
+def test_reader_in_another_process():
+    writer = PriceTableWriter(TABLE, capacity=16)
+    try:
+        writer.update('binance', 'SOL-USDT', 150.25)
+        script = (
+            f"import sys; sys.path.insert(0, {ROOT!r})\n"
+            "from src.utils.shm_price_table import PriceTableReader\n"
+            f"print(PriceTableReader({TABLE!r}).get_price('binance', 'SOL-USDT'))\n"
+        )
+        result = subprocess.run([sys.executable, '-c', script], capture_output=True, text=True, timeout=30)
+        assert result.stdout.strip() == '150.25', result.stdout + result.stderr
+        # Le lecteur terminé n'a pas détruit la table
+        assert PriceTableReader(TABLE, untrack=False).get_price('binance', 'SOL-USDT') == 150.25
+    finally:
+        writer.close()
+
+
+def test_live_table_is_never_replaced():
+    writer = PriceTableWriter(TABLE, capacity=16)
+    try:
+        writer.update('coinbase', 'BTC-USDC', 64000.0)
+        try:
+            PriceTableWriter(TABLE, capacity=16)
+            assert False, "un second écrivain a remplacé la table"
+        except FileExistsError:
+            pass
+        reader = PriceTableReader(TABLE, untrack=False)
+        assert not reader.closed and reader.get_price('coinbase', 'BTC-USDC') == 64000.0
+        reader.close()
+    finally:
+        writer.close()
+
+
+def test_abandoned_table_is_replaced():
+    # Écrivain tué sans nettoyage : son pid n'existe plus
+    process = subprocess.Popen([sys.executable, '-c', 'pass'])
+    process.wait()
+    stale = shared_memory.SharedMemory(name=TABLE, create=True, size=4096)
+    HEADER.pack_into(stale.buf, 0, MAGIC, VERSION, 16, 0, 0)
+    SEQ.pack_into(stale.buf, OWNER_OFFSET, process.pid)
+    reader = PriceTableReader(TABLE, untrack=False)
+
+    writer = PriceTableWriter(TABLE, capacity=16)
+    try:
+        assert reader.closed
+        writer.update('coinbase', 'BTC-USDC', 1.0)
+        assert PriceTableReader(TABLE, untrack=False).get_price('coinbase', 'BTC-USDC') == 1.0
+    finally:
+        reader.close()
+        stale.close()
+        writer.close()
+
+
+if __name__ == "__main__":
+    for name, func in list(globals().items()):
+        if name.startswith('test_') and callable(func):
+            try:
+                func()
+                print(f"✅ {name}")
+            except AssertionError as e:
+                print(f"❌ {name}: {e}")
@@ -0,0 +1,64 @@
+import gc
+import sys
+from pathlib import Path
+
+# Ajouter le répertoire racine du projet au path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from src.components.theme_registry import ThemeRegistry
+from src.views.main_view import Theme
+
+
+class FakeWidget:
+    """Widget minimal : nom Tcl et interpréteur, sans affichage"""
+
+    def __init__(self, name):
+        self._w = name
+        self.tk = 'interp'
+
+
+def test_build_script_groups_by_roles():
+    registry = ThemeRegistry()
+    button = registry.register(FakeWidget('.b'), bg='accent', fg='button_text')
+    label = registry.register(FakeWidget('.l'), bg='bg_primary')
+    assert len(registry) == 2
+
+    interp, script, count = registry.build_script({'accent': '#4CAF50', 'button_text': '#FFFFFF',
+                                                   'bg_primary': 'dark grey'})
+    assert interp == 'interp' and count == 2
+    assert sorted(script.split('\n')) == [
+        'catch {.b configure -bg {#4CAF50} -fg {#FFFFFF}}',
+        'catch {.l configure -bg {dark grey}}',
+    ]
+
+    # Clé absente du thème : option ignorée, widget ignoré s'il ne reste rien
+    _, script, count = registry.build_script({'accent': '#000000'})
+    assert script == 'catch {.b configure -bg {#000000}}' and count == 1
+
+    registry.unregister(button)
+    del label
+    gc.collect()
+    assert registry.build_script(Theme.DARK) == (None, '', 0)
+
+
+def test_register_config_skips_overrides():
+    registry = ThemeRegistry()
+    entry = registry.register_config(FakeWidget('.e'), {'bg': 'input_bg', 'fg': 'text_primary'}, {'fg': '#F44336'})
+    # Aucune option suivie : le widget n'est pas enregistré
+    status = registry.register_config(FakeWidget('.s'), {'fg': 'text_primary'}, {'fg': '#F44336'})
+    assert len(registry) == 1
+
+    _, script, count = registry.build_script(Theme.LIGHT)
+    assert script == f"catch {{.e configure -bg {{{Theme.LIGHT['input_bg']}}}}}" and count == 1
+    # Les deux widgets comptent pour le cache de vues, suivis ou non
+    assert registry.registrations == 2 and entry and status
+
+
+if __name__ == "__main__":
+    for name, func in list(globals().items()):
+        if name.startswith('test_') and callable(func):
+            try:
+                func()
+                print(f"✅ {name}")
+            except AssertionError as e:
+                print(f"❌ {name}: {e}")
@@ -0,0 +1,111 @@
+import json
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+# Ajouter le répertoire racine du projet au path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from src.controllers.bot_controller import BotController
+from src.models.bot_model import BotModel
+from src.models.database_model import DatabaseModel
+from src.services.async_runtime import AsyncRuntime
+from src.utils.tracing import Tracer, get_tracer
+
+
+def _enabled_tracer():
+    tracer = get_tracer()
+    tracer.clear()
+    tracer.enabled = True
+    return tracer
+
+
+def test_disabled_tracer_records_nothing():
+    tracer = Tracer(enabled=False)
+
+    @tracer.traced()
+    def work():
+        return 42
+
+    assert work() == 42
+    with tracer.span('bloc') as span:
+        span.set(detail=1)
+    assert tracer.spans() == []
+
+
+def test_create_bot_spans_nest_across_layers():
+    tracer = _enabled_tracer()
+    try:
+        with tempfile.TemporaryDirectory() as tmp:
+            db = DatabaseModel(db_path=os.path.join(tmp, 'trace.db'))
+            db.cursor.execute("INSERT INTO exchanges (fk_account_id, name, display_name) VALUES (1, 'coinbase', 'Coinbase')")
+            db.connection.commit()
+            controller = BotController.__new__(BotController)
+            controller.bot_model = BotModel(db_model=db)
+            tracer.clear()
+
+            result = controller.create_bot(1, 'coinbase', 'BTC-USDC', 'BTC', 'USDC', '', '5', '100', 'Market')
+            db.connection.close()
+        assert result['success'], result
+
+        spans = {span['name']: span for span in tracer.spans()}
+        controller_span = spans['BotController.create_bot']
+        model_span = spans['BotModel.create_bot']
+        log_span = spans['DatabaseModel.log_activity']
+        assert model_span['parent_id'] == controller_span['span_id']
+        assert log_span['parent_id'] == model_span['span_id']
+        assert log_span['trace_id'] == controller_span['trace_id'] == controller_span['span_id']
+        assert controller_span['duration'] >= model_span['duration'] >= log_span['duration']
+    finally:
+        tracer.enabled = False
+        tracer.clear()
+
+
+def test_context_follows_executor_and_export():
+    tracer = _enabled_tracer()
+    runtime = AsyncRuntime()
+    runtime.start()
+    try:
+        def blocking():
+            with tracer.span('bloquant', 'db'):
+                pass
+
+        with tracer.span('clic', 'ui') as root:
+            runtime.call_blocking(blocking, kind='db').result(timeout=5)
+
+        child = next(span for span in tracer.spans() if span['name'] == 'bloquant')
+        assert child['parent_id'] == root.span_id
+        assert child['thread_id'] != root.thread_id
+
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'trace.json')
+            assert tracer.export_chrome_trace(path) == 2
+            with open(path, encoding='utf-8') as f:
+                events = json.load(f)['traceEvents']
+        phases = sorted(event['ph'] for event in events)
+        # 2 spans complets, une flèche inter-threads, les noms de threads
+        assert phases.count('X') == 2 and phases.count('s') == 1 and phases.count('f') == 1
+        assert 'M' in phases
+    finally:
+        runtime.stop()
+        tracer.enabled = False
+        tracer.clear()
+
+
+def test_ring_buffer_keeps_latest():
+    tracer = Tracer(enabled=True, capacity=10)
+    for i in range(25):
+        with tracer.span(f"s{i}"):
+            pass
+    assert [span['name'] for span in tracer.spans()] == [f"s{i}" for i in range(15, 25)]
+
+
+if __name__ == "__main__":
+    for name, func in list(globals().items()):
+        if name.startswith('test_') and callable(func):
+            try:
+                func()
+                print(f"✅ {name}")
+            except AssertionError as e:
+                print(f"❌ {name}: {e}")
@@ -0,0 +1,130 @@
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+# Ajouter le répertoire racine du projet au path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from src.components import virtual_list
+from src.components.virtual_list import VirtualList
+from src.views.main_view import Theme
+
+
+class FakeWidget:
+    """Frame/Scrollbar sans affichage"""
+
+    def __init__(self, parent=None, **options):
+        self.options = options
+
+    def pack(self, **kwargs):
+        pass
+
+    def pack_forget(self):
+        pass
+
+    def set(self, first, last):
+        self.options['range'] = (first, last)
+
+    def bind(self, sequence, callback):
+        pass
+
+    def configure(self, **options):
+        self.options.update(options)
+
+
+class FakeCanvas(FakeWidget):
+    """Canvas qui conserve ses items et compte les reconfigurations"""
+
+    def __init__(self, parent=None, **options):
+        super().__init__(parent, **options)
+        self.items = {}
+        self.item_updates = 0
+
+    def _create(self, **options):
+        item = len(self.items) + 1
+        self.items[item] = options
+        return item
+
+    def create_rectangle(self, *coords, **options):
+        return self._create(**options)
+
+    def create_text(self, *coords, **options):
+        return self._create(**options)
+
+    def itemconfigure(self, item, **options):
+        self.items[item].update(options)
+        self.item_updates += 1
+
+    def coords(self, item, *coords):
+        pass
+
+    def delete(self, tag):
+        self.items.clear()
+
+
+COLUMNS = [{'key': 'name', 'title': 'Bot'}, {'key': 'price', 'title': 'Prix', 'format': lambda v: f"{v:.2f}"}]
+
+
+def _list(n_rows=100, height=200):
+    previous = virtual_list.tk
+    virtual_list.tk = SimpleNamespace(Frame=FakeWidget, Canvas=FakeCanvas, Scrollbar=FakeWidget)
+    try:
+        view = VirtualList(None, dict(Theme.DARK), COLUMNS)
+    finally:
+        virtual_list.tk = previous
+    view.set_rows([{'id': i, 'name': f"bot {i}", 'price': float(i)} for i in range(n_rows)])
+    view._on_configure(SimpleNamespace(width=400, height=height))
+    return view
+
+
+def _texts(view):
+    return [[view.canvas.items[cell]['text'] for cell in slot.cells] for slot in view._visible.values()]
+
+
+def test_only_visible_rows_are_drawn():
+    view = _list()
+    # 200 px / 40 px par ligne : 5 lignes visibles, 2 emplacements de marge au plus
+    assert len(view._slots) == 7 and list(view._visible) == [0, 1, 2, 3, 4]
+    assert _texts(view)[0] == ['bot 0', '0.00']
+
+    view.yview('moveto', 0.5)
+    assert list(view._visible) == [50, 51, 52, 53, 54]
+    assert _texts(view)[0] == ['bot 50', '50.00'] and len(view._slots) == 7
+
+
+def test_update_row_repaints_changed_cells_only():
+    view = _list()
+    updates = view.canvas.item_updates
+    assert view.update_row(90, {'price': 1.0}) and view.rows[90]['price'] == 1.0
+    assert view.canvas.item_updates == updates
+
+    assert view.update_row(2, {'price': 2.0})
+    assert view.canvas.item_updates == updates
+    assert view.update_row(2, {'price': 3.5})
+    assert view.canvas.item_updates == updates + 1 and _texts(view)[2] == ['bot 2', '3.50']
+    assert not view.update_row(1000, {'price': 1.0})
+
+
+def test_remove_row_and_apply_theme():
+    view = _list(n_rows=3)
+    view.remove_row(1)
+    assert view.keys == [0, 2] and list(view._visible) == [0, 2]
+    hidden = [slot for slot in view._slots if slot.key is None]
+    assert all(view.canvas.items[slot.background]['state'] == 'hidden' for slot in hidden)
+
+    light = Theme.LIGHT
+    view.apply_theme(light)
+    assert view.canvas.options['bg'] == light['bg_secondary']
+    assert all(view.canvas.items[slot.background]['fill'] == light['bg_secondary'] for slot in view._slots)
+    assert all(view.canvas.items[cell]['fill'] == light['text_primary']
+               for slot in view._visible.values() for cell in slot.cells)
+
+
+if __name__ == "__main__":
+    for name, func in list(globals().items()):
+        if name.startswith('test_') and callable(func):
+            try:
+                func()
+                print(f"✅ {name}")
+            except AssertionError as e:
+                print(f"❌ {name}: {e}")
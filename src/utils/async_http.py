@@ -0,0 +1,121 @@
+"""
+Transport HTTP asynchrone pour les appels aux APIs des exchanges
+
+Avec aiohttp, des milliers de requêtes simultanées partagent un seul
+thread (la boucle asyncio) et un pool de connexions borné. Sans aiohttp,
+le transport se replie sur la session `requests` partagée, exécutée dans
+un pool de threads de taille fixe : même interface, concurrence bornée.
+"""
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from src.utils.http_session import get_http_session, USER_AGENT
+
+try:
+    import aiohttp
+except ImportError:                     # dépendance optionnelle
+    aiohttp = None
+
+# Constantes - Pool de connexions
+MAX_CONNECTIONS = 100
+MAX_CONNECTIONS_PER_HOST = 20
+REQUEST_TIMEOUT = 10
+FALLBACK_WORKERS = 16
+
+# Constantes - Messages de log
+LOG_AIOHTTP_MISSING = "⚠ aiohttp non installé : transport HTTP asynchrone via un pool de {workers} threads"
+LOG_API_ERROR = "✗ Erreur API {status_code}: {url}"
+LOG_REQUEST_EXCEPTION = "✗ Exception requête {url}: {error}"
+
+
+class AsyncHttpTransport:
+    """Requêtes GET JSON asynchrones avec concurrence bornée"""
+
+    def __init__(self, max_connections=MAX_CONNECTIONS, per_host=MAX_CONNECTIONS_PER_HOST,
+                 timeout=REQUEST_TIMEOUT):
+        """
+        Args:
+            max_connections (int): Connexions simultanées maximum (tous hôtes)
+            per_host (int): Connexions simultanées maximum par hôte
+            timeout (float): Délai maximum d'une requête en secondes
+        """
+        self.max_connections = max_connections
+        self.per_host = per_host
+        self.timeout = timeout
+        self._session = None
+        self._executor = None
+        if aiohttp is None:
+            print(LOG_AIOHTTP_MISSING.format(workers=FALLBACK_WORKERS))
+
+    @property
+    def is_native(self):
+        """True si les requêtes sont réellement asynchrones (aiohttp)"""
+        return aiohttp is not None
+
+    def _get_session(self):
+        # Créée dans la boucle qui l'utilise (exigence d'aiohttp)
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(limit=self.max_connections, limit_per_host=self.per_host)
+            self._session = aiohttp.ClientSession(
+                connector=connector,
+                timeout=aiohttp.ClientTimeout(total=self.timeout),
+                headers={'User-Agent': USER_AGENT}
+            )
+        return self._session
+
+    def _blocking_get(self, url, params):
+        response = get_http_session().get(url, params=params, timeout=self.timeout)
+        return response.status_code, (response.json() if response.status_code == 200 else None)
+
+    async def get_json(self, url, params=None):
+        """
+        Exécute une requête GET et décode la réponse JSON
+
+        Args:
+            url (str): URL complète
+            params (dict, optional): Paramètres de requête
+
+        Returns:
+            dict or list: Réponse JSON ou None si erreur
+        """
+        try:
+            if aiohttp is not None:
+                async with self._get_session().get(url, params=params) as response:
+                    status = response.status
+                    data = await response.json(content_type=None) if status == 200 else None
+            else:
+                if self._executor is None:
+                    self._executor = ThreadPoolExecutor(max_workers=FALLBACK_WORKERS,
+                                                        thread_name_prefix='async-http')
+                loop = asyncio.get_running_loop()
+                status, data = await loop.run_in_executor(self._executor, self._blocking_get, url, params)
+        except Exception as e:
+            print(LOG_REQUEST_EXCEPTION.format(url=url, error=e))
+            return None
+
+        if status != 200:
+            print(LOG_API_ERROR.format(status_code=status, url=url))
+            return None
+        return data
+
+    async def close(self):
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+
+
+_transport = None
+_transport_lock = threading.Lock()
+
+
+def get_async_transport():
+    """Retourne le transport HTTP asynchrone partagé (créé au premier appel)"""
+    global _transport
+    if _transport is None:
+        with _transport_lock:
+            if _transport is None:
+                _transport = AsyncHttpTransport()
+    return _transport
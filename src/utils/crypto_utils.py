@@ -10,6 +10,7 @@ chiffrement/déchiffrement.
 import os
 import json
 from cryptography.fernet import Fernet
+from src.utils.metrics import get_metrics
 
 # Chemins
 BASE_DIR = os.path.normpath(os.path.join(os.path.dirname(__file__), '..'))
@@ -21,6 +22,9 @@ SECRET_KEY_FILE = os.path.join(CONFIG_DIR, '.secret.key')
 # Cache en mémoire pour la clé
 _fernet_cache = None
 
+metrics = get_metrics()
+metrics.describe('fernet_seconds', "Durée des chiffrements/déchiffrements Fernet")
+
 
 def _init_fernet():
     """Initialise ou charge la clé Fernet depuis le fichier .secret.key.
@@ -109,6 +113,7 @@ def write_config(cfg):
         return False
 
 
+@metrics.timed('fernet_seconds', op='encrypt')
 def encrypt_secret(secret: str) -> str:
     """Chiffre un secret avec la clé Fernet en mémoire."""
     fernet = _init_fernet()
@@ -116,6 +121,7 @@ def encrypt_secret(secret: str) -> str:
     return token.decode('utf-8')
 
 
+@metrics.timed('fernet_seconds', op='decrypt')
 def decrypt_secret(token: str) -> str:
     """Déchiffre un secret avec la clé Fernet en mémoire."""
     fernet = _init_fernet()
@@ -0,0 +1,198 @@
+"""
+Couche d'accès aux données : requêtes constantes et correspondances de lignes compilées
+
+Une Query associe un texte SQL constant (le cache d'instructions préparées
+de sqlite3 est indexé par texte : une requête reconstruite à chaque appel
+ne profite pas du cache) à la façon de transformer ses lignes :
+    - rename   : colonne → clé (ex: fk_account_id → account_id)
+    - defaults : valeur de remplacement d'une colonne vide (ex: logo → '💱')
+
+La fonction de correspondance est générée une seule fois par forme de
+résultat (noms des colonnes) puis installée comme row_factory du curseur :
+sqlite3 construit directement le dict, ou un enregistrement à __slots__
+(records=True), sans objet sqlite3.Row intermédiaire.
+
+Les enregistrements restent lisibles comme des dicts (bot['product_id'],
+bot.get('logo')) : ils remplacent les dicts sans changer les vues.
+"""
+import keyword
+import threading
+
+# Constantes - Cache d'instructions
+STATEMENT_CACHE_SIZE = 256
+
+
+def _is_field_name(name):
+    return name.isidentifier() and not keyword.iskeyword(name) and not name.startswith('_')
+
+
+class RecordBase:
+    """Base des enregistrements générés par record_class()"""
+
+    __slots__ = ()
+    _fields = ()
+
+    def __getitem__(self, key):
+        try:
+            return getattr(self, key)
+        except (AttributeError, TypeError):
+            raise KeyError(key) from None
+
+    def get(self, key, default=None):
+        return getattr(self, key, default)
+
+    def __contains__(self, key):
+        return key in self._fields
+
+    def keys(self):
+        return self._fields
+
+    def to_dict(self):
+        return {field: getattr(self, field) for field in self._fields}
+
+    def __eq__(self, other):
+        if type(other) is not type(self):
+            return NotImplemented
+        return all(getattr(self, field) == getattr(other, field) for field in self._fields)
+
+    __hash__ = None
+
+    def __repr__(self):
+        values = ", ".join(f"{field}={getattr(self, field)!r}" for field in self._fields)
+        return f"{type(self).__name__}({values})"
+
+
+_record_classes = {}
+_record_classes_lock = threading.Lock()
+
+
+def record_class(name, fields):
+    """
+    Classe d'enregistrement compacte (__slots__), partagée par (nom, champs)
+
+    Args:
+        name (str): Nom de la classe
+        fields (tuple): Noms des champs (identifiants Python)
+
+    Returns:
+        type: Sous-classe de RecordBase construite par position : Cls(v1, v2, ...)
+    """
+    fields = tuple(fields)
+    key = (name, fields)
+    cls = _record_classes.get(key)
+    if cls is not None:
+        return cls
+    invalid = [field for field in fields if not _is_field_name(field)]
+    if invalid:
+        raise ValueError(f"Champs invalides pour un enregistrement: {invalid}")
+
+    arguments = ", ".join(fields)
+    body = "".join(f"\n    self.{field} = {field}" for field in fields) or "\n    pass"
+    namespace = {}
+    exec(f"def __init__(self, {arguments}):{body}" if fields else f"def __init__(self):{body}", namespace)
+
+    with _record_classes_lock:
+        cls = _record_classes.get(key)
+        if cls is None:
+            cls = type(name, (RecordBase,), {
+                '__slots__': fields, '_fields': fields, '__init__': namespace['__init__']
+            })
+            _record_classes[key] = cls
+    return cls
+
+
+def compile_mapper(columns, rename=None, defaults=None, record=None):
+    """
+    Génère la fonction row_factory d'une forme de résultat
+
+    Args:
+        columns (tuple): Noms des colonnes (cursor.description)
+        rename (dict, optional): {colonne: clé}
+        defaults (dict, optional): {clé: valeur si la colonne est vide}
+        record (str or type, optional): Nom de la classe d'enregistrement à générer,
+            ou classe existante (ex: src.models.records.Bot) ; dicts si None
+
+    Returns:
+        callable: mapper(cursor, row)
+    """
+    rename = rename or {}
+    defaults = defaults or {}
+    keys = [rename.get(column, column) for column in columns]
+    namespace = {}
+    expressions = []
+    for index, key in enumerate(keys):
+        if key in defaults:
+            namespace[f"_default{index}"] = defaults[key]
+            expressions.append(f"(row[{index}] or _default{index})")
+        else:
+            expressions.append(f"row[{index}]")
+
+    if record is None:
+        items = ", ".join(f"{key!r}: {expression}" for key, expression in zip(keys, expressions))
+        source = f"def mapper(cursor, row):\n    return {{{items}}}"
+    elif isinstance(record, type) and tuple(keys) != tuple(record._fields):
+        namespace['_cls'] = record
+        arguments = ", ".join(f"{key}={expression}" for key, expression in zip(keys, expressions))
+        source = f"def mapper(cursor, row):\n    return _cls({arguments})"
+    else:
+        namespace['_cls'] = record if isinstance(record, type) else record_class(record, keys)
+        source = f"def mapper(cursor, row):\n    return _cls({', '.join(expressions)})"
+    exec(source, namespace)
+    return namespace['mapper']
+
+
+class Query:
+    """Requête SELECT constante et ses correspondances de lignes (une par forme et par sortie)"""
+
+    __slots__ = ('sql', 'rename', 'defaults', 'record', '_mappers')
+
+    def __init__(self, sql, rename=None, defaults=None, record=None):
+        """
+        Args:
+            sql (str): Texte SQL (constant : clé du cache d'instructions)
+            rename (dict, optional): {colonne: clé}
+            defaults (dict, optional): {clé: valeur si la colonne est vide}
+            record (str or type, optional): Classe d'enregistrement, ou nom de celle à générer (records=True)
+        """
+        self.sql = sql
+        self.rename = rename
+        self.defaults = defaults
+        self.record = record or 'Record'
+        self._mappers = {}              # {(colonnes, records): mapper}
+
+    def _mapper(self, description, records):
+        columns = tuple(column[0] for column in description)
+        key = (columns, records)
+        mapper = self._mappers.get(key)
+        if mapper is None:
+            mapper = compile_mapper(columns, self.rename, self.defaults, self.record if records else None)
+            self._mappers[key] = mapper
+        return mapper
+
+    def _execute(self, connection, params, records):
+        cursor = connection.cursor()
+        cursor.execute(self.sql, params)
+        cursor.row_factory = self._mapper(cursor.description, records)
+        return cursor
+
+    def all(self, connection, params=(), records=False):
+        """
+        Returns:
+            list: Lignes en dicts (ou enregistrements si records=True)
+        """
+        cursor = self._execute(connection, params, records)
+        try:
+            return cursor.fetchall()
+        finally:
+            cursor.close()
+
+    def one(self, connection, params=(), records=False):
+        """
+        Returns:
+            dict or None: Première ligne (ou enregistrement si records=True)
+        """
+        cursor = self._execute(connection, params, records)
+        try:
+            return cursor.fetchone()
+        finally:
+            cursor.close()
@@ -1,12 +1,142 @@
 """
 Utilitaire centralisé pour gérer les connexions à la base de données SQLite
 """
+import re
 import sqlite3
+import time
 from contextlib import contextmanager
+from src.utils.data_access import STATEMENT_CACHE_SIZE
 from src.utils.db_logger import DbLogger
+from src.utils.metrics import get_metrics
+from src.utils.query_profiler import get_query_profiler
+from src.utils.tracing import get_tracer, CATEGORY_DB
 
 DB_PATH = 'datas/cointrader.db'
 
+# Constantes - Métriques
+_TABLE_PATTERN = re.compile(r'\b(?:FROM|INTO|UPDATE|TABLE(?: IF NOT EXISTS)?)\s+([A-Za-z_][A-Za-z0-9_]*)', re.I)
+_LABEL_CACHE_SIZE = 512
+
+metrics = get_metrics()
+metrics.describe('db_query_seconds', "Durée d'exécution des requêtes SQLite")
+metrics.describe('db_fetch_seconds', "Durée de lecture des résultats SQLite")
+metrics.describe('db_transaction_seconds', "Durée des blocs get_db_context")
+tracer = get_tracer()
+
+_labels_cache = {}
+
+
+def _query_labels(sql):
+    """Étiquettes (op, table) d'une requête, mises en cache par texte SQL"""
+    labels = _labels_cache.get(sql)
+    if labels is None:
+        words = sql.split(None, 1)
+        match = _TABLE_PATTERN.search(sql)
+        labels = {'op': words[0].upper() if words else '?', 'table': match.group(1) if match else '?'}
+        if len(_labels_cache) < _LABEL_CACHE_SIZE:
+            _labels_cache[sql] = labels
+    return labels
+
+
+class TimedCursor(sqlite3.Cursor):
+    """
+    Curseur chronométrant (métriques, spans, profilage) l'exécution et la lecture des requêtes
+
+    Pour le profilage, une requête qui renvoie des lignes n'est comptée qu'une
+    fois ses résultats épuisés, à la requête suivante ou à la fermeture du curseur.
+    """
+
+    _labels = None
+    _statement = None                   # [sql, paramètres, durée cumulée, lignes] (profilage)
+
+    def _timed_execute(self, execute, name, sql, parameters, explain_parameters):
+        self._end_statement()
+        self._labels = _query_labels(sql)
+        start = time.perf_counter()
+        try:
+            with tracer.span(name, CATEGORY_DB, **self._labels):
+                return execute(sql, parameters)
+        finally:
+            elapsed = time.perf_counter() - start
+            metrics.observe('db_query_seconds', elapsed, **self._labels)
+            if get_query_profiler().enabled:
+                self._statement = [sql, explain_parameters, elapsed, 0]
+                if self.description is None:
+                    # Pas de lignes à lire (INSERT, UPDATE...) : requête terminée
+                    self._end_statement()
+
+    def execute(self, sql, parameters=()):
+        return self._timed_execute(super().execute, 'sqlite.execute', sql, parameters, parameters)
+
+    def executemany(self, sql, seq_of_parameters):
+        return self._timed_execute(super().executemany, 'sqlite.executemany', sql, seq_of_parameters, ())
+
+    def _end_statement(self):
+        statement = self._statement
+        if statement is None:
+            return
+        self._statement = None
+        sql, parameters, elapsed, rows = statement
+        if not rows and self.rowcount > 0:
+            rows = self.rowcount
+        get_query_profiler().record(sql, elapsed, rows, self.connection, parameters)
+
+    def _timed_fetch(self, fetch, *args):
+        start = time.perf_counter()
+        try:
+            return fetch(*args)
+        finally:
+            elapsed = time.perf_counter() - start
+            metrics.observe('db_fetch_seconds', elapsed, **(self._labels or {}))
+            if self._statement is not None:
+                self._statement[2] += elapsed
+
+    def _fetched(self, count, exhausted):
+        if self._statement is not None:
+            self._statement[3] += count
+            if exhausted:
+                self._end_statement()
+
+    def fetchone(self):
+        row = self._timed_fetch(super().fetchone)
+        self._fetched(row is not None, row is None)
+        return row
+
+    def fetchmany(self, size=None):
+        size = size or self.arraysize
+        rows = self._timed_fetch(super().fetchmany, size)
+        self._fetched(len(rows), len(rows) < size)
+        return rows
+
+    def fetchall(self):
+        rows = self._timed_fetch(super().fetchall)
+        self._fetched(len(rows), True)
+        return rows
+
+    def close(self):
+        self._end_statement()
+        super().close()
+
+
+class TimedConnection(sqlite3.Connection):
+    """Connexion dont les curseurs (et execute direct) sont chronométrés"""
+
+    def cursor(self, factory=TimedCursor):
+        return super().cursor(factory)
+
+    def execute(self, sql, parameters=()):
+        return self.cursor().execute(sql, parameters)
+
+    def executemany(self, sql, seq_of_parameters):
+        return self.cursor().executemany(sql, seq_of_parameters)
+
+
+def connection_factory():
+    """Classe de connexion à utiliser : chronométrée seulement si métriques, traces ou profilage sont actifs"""
+    if metrics.enabled or tracer.enabled or get_query_profiler().enabled:
+        return TimedConnection
+    return sqlite3.Connection
+
 
 def get_db_connection(db_path=DB_PATH):
     """
@@ -19,7 +149,8 @@ def get_db_connection(db_path=DB_PATH):
         sqlite3.Connection: Connexion à la base de données
     """
     try:
-        connection = sqlite3.connect(db_path)
+        connection = sqlite3.connect(db_path, factory=connection_factory(),
+                                     cached_statements=STATEMENT_CACHE_SIZE)
         connection.row_factory = sqlite3.Row
         return connection
     except sqlite3.Error as e:
@@ -42,11 +173,13 @@ def get_db_context(db_path=DB_PATH):
         tuple: (connection, cursor)
     """
     conn = None
+    cursor = None
     try:
         conn = get_db_connection(db_path)
         cursor = conn.cursor()
-        yield conn, cursor
-        conn.commit()
+        with metrics.timer('db_transaction_seconds'):
+            yield conn, cursor
+            conn.commit()
     except Exception as e:
         if conn:
             conn.rollback()
@@ -55,4 +188,6 @@ def get_db_context(db_path=DB_PATH):
         raise
     finally:
         if conn:
+            if cursor is not None:
+                cursor.close()
             conn.close()
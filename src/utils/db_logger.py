@@ -11,6 +11,8 @@ class DbLogger:
         self.config_file = config_file
         self.archive_dir = "logs/archives"
         self.max_size_bytes = 25 * 1024 * 1024  # 25 Mo par défaut
+        self.query_profiling = False
+        self.slow_query_ms = 100
         
         # Créer les dossiers si nécessaire
         os.makedirs(os.path.dirname(log_file), exist_ok=True)
@@ -29,6 +31,8 @@ class DbLogger:
                 with open(self.config_file, 'r', encoding='utf-8') as f:
                     config = json.load(f)
                     self.max_size_bytes = config.get('log_max_size_mb', 25) * 1024 * 1024
+                    self.query_profiling = config.get('query_profiling', False)
+                    self.slow_query_ms = config.get('slow_query_ms', 100)
                     return config.get('debug_mode', False)
             else:
                 self._create_default_config()
@@ -40,7 +44,9 @@ class DbLogger:
         """Crée un fichier de configuration par défaut"""
         default_config = {
             "debug_mode": False,
-            "log_max_size_mb": 25
+            "log_max_size_mb": 25,
+            "query_profiling": False,
+            "slow_query_ms": 100
         }
         os.makedirs(os.path.dirname(self.config_file), exist_ok=True)
         with open(self.config_file, 'w', encoding='utf-8') as f:
@@ -144,6 +150,10 @@ class DbLogger:
             clean_query = ' '.join(query.split())
             self._write_log('QUERY', clean_query)
     
+    def log_slow_query(self, message):
+        """Log une requête lente avec sa durée et son plan (tous modes)"""
+        self._write_log('SLOW', message)
+    
     def log_error(self, error_message):
         """Log une erreur (tous modes)"""
         self._write_log('ERROR', error_message)
@@ -0,0 +1,50 @@
+"""
+Session HTTP partagée pour tous les appels aux APIs des exchanges
+
+Une seule session `requests` par processus : les connexions TCP/TLS sont
+conservées dans un pool et réutilisées entre les requêtes au lieu d'être
+renégociées à chaque appel.
+"""
+import threading
+import requests
+from requests.adapters import HTTPAdapter
+
+# Constantes - Pool de connexions
+POOL_CONNECTIONS = 10
+POOL_MAXSIZE = 20
+USER_AGENT = "CoinTrader/1.0"
+
+_session = None
+_session_lock = threading.Lock()
+
+
+def get_http_session():
+    """
+    Retourne la session HTTP partagée (créée au premier appel)
+
+    Returns:
+        requests.Session: Session avec pool de connexions
+    """
+    global _session
+    if _session is not None:
+        return _session
+
+    with _session_lock:
+        if _session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=POOL_CONNECTIONS, pool_maxsize=POOL_MAXSIZE)
+            session.mount('https://', adapter)
+            session.mount('http://', adapter)
+            session.headers.update({'User-Agent': USER_AGENT})
+            _session = session
+
+    return _session
+
+
+def close_http_session():
+    """Ferme la session partagée et libère les connexions du pool"""
+    global _session
+    with _session_lock:
+        if _session is not None:
+            _session.close()
+            _session = None
@@ -0,0 +1,385 @@
+"""
+Registre de métriques du processus (compteurs, jauges, histogrammes de latence)
+
+Désactivé par défaut : chaque point de mesure commence par un test du
+drapeau `enabled` et ne coûte rien d'autre. Une fois activé, les métriques
+sont exposées au format texte Prometheus via un petit serveur HTTP local
+et/ou un fichier instantané réécrit périodiquement.
+
+Les histogrammes suivent le principe HDR : des seaux logarithmiques
+subdivisés linéairement (64 sous-seaux par puissance de deux, soit une
+erreur relative d'environ 1,5 %) sur les durées en microsecondes, quelle
+que soit l'amplitude (de la microseconde à plusieurs minutes).
+
+Activation par variables d'environnement (voir configure_from_env) :
+    COINTRADER_METRICS=1             activer
+    COINTRADER_METRICS_PORT=9464     servir http://127.0.0.1:9464/metrics
+    COINTRADER_METRICS_FILE=chemin   écrire un instantané toutes les N secondes
+    COINTRADER_METRICS_INTERVAL=15
+"""
+import functools
+import os
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# Constantes - Histogrammes
+SUB_BUCKET_BITS = 6
+SUB_BUCKETS = 1 << SUB_BUCKET_BITS
+EXPORTED_QUANTILES = (0.5, 0.9, 0.99, 0.999)
+
+# Constantes - Export
+METRIC_PREFIX = "cointrader_"
+DEFAULT_PORT = 9464
+DEFAULT_INTERVAL = 15.0
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# Constantes - Messages de log
+LOG_SERVER_STARTED = "✓ Métriques exposées sur http://{host}:{port}/metrics"
+LOG_SNAPSHOT_STARTED = "✓ Instantané des métriques écrit dans {path} toutes les {interval:g} s"
+LOG_SNAPSHOT_ERROR = "✗ Erreur écriture instantané des métriques: {error}"
+
+
+class LatencyHistogram:
+    """Histogramme de durées à précision relative constante (style HDR)"""
+
+    __slots__ = ('counts', 'count', 'total', 'minimum', 'maximum', '_lock')
+
+    def __init__(self):
+        self.counts = {}                # {index de seau: nombre}
+        self.count = 0
+        self.total = 0.0
+        self.minimum = None
+        self.maximum = None
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def bucket_index(micros):
+        shift = max(0, micros.bit_length() - SUB_BUCKET_BITS - 1)
+        return (shift << SUB_BUCKET_BITS) + (micros >> shift)
+
+    @staticmethod
+    def bucket_bounds(index):
+        """Bornes [basse, haute) d'un seau en microsecondes"""
+        if index < 2 * SUB_BUCKETS:
+            return index, index + 1
+        shift = (index >> SUB_BUCKET_BITS) - 1
+        low = (index - (shift << SUB_BUCKET_BITS)) << shift
+        return low, low + (1 << shift)
+
+    def record(self, seconds):
+        micros = int(seconds * 1e6) if seconds > 0 else 0
+        index = self.bucket_index(micros)
+        with self._lock:
+            self.counts[index] = self.counts.get(index, 0) + 1
+            self.count += 1
+            self.total += seconds
+            if self.minimum is None or seconds < self.minimum:
+                self.minimum = seconds
+            if self.maximum is None or seconds > self.maximum:
+                self.maximum = seconds
+
+    def merge(self, counts, total=0.0):
+        """Ajoute des comptes de seaux {index: nombre} (ex: relus depuis un fichier)"""
+        with self._lock:
+            for index, bucket_count in counts.items():
+                index = int(index)
+                self.counts[index] = self.counts.get(index, 0) + bucket_count
+                self.count += bucket_count
+                low, high = self.bucket_bounds(index)
+                if self.minimum is None or low / 1e6 < self.minimum:
+                    self.minimum = low / 1e6
+                if self.maximum is None or high / 1e6 > self.maximum:
+                    self.maximum = high / 1e6
+            self.total += total
+
+    def quantiles(self, qs=EXPORTED_QUANTILES):
+        """
+        Returns:
+            dict: {q: durée en secondes} (milieu du seau contenant le quantile)
+        """
+        with self._lock:
+            items = sorted(self.counts.items())
+            count = self.count
+        result = {}
+        if not count:
+            return {q: None for q in qs}
+        targets = sorted(qs)
+        cumulative = 0
+        position = 0
+        for index, bucket_count in items:
+            cumulative += bucket_count
+            while position < len(targets) and cumulative >= targets[position] * count:
+                low, high = self.bucket_bounds(index)
+                result[targets[position]] = (low + high) / 2 / 1e6
+                position += 1
+            if position == len(targets):
+                break
+        for q in targets[position:]:
+            result[q] = self.maximum
+        return result
+
+
+class _Timer:
+    """Chronomètre d'un bloc `with` (une instance par utilisation)"""
+
+    __slots__ = ('registry', 'name', 'labels', 'start')
+
+    def __init__(self, registry, name, labels):
+        self.registry = registry
+        self.name = name
+        self.labels = labels
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.registry.observe(self.name, time.perf_counter() - self.start, **self.labels)
+        return False
+
+
+class _NullTimer:
+    """Chronomètre inactif partagé (métriques désactivées)"""
+
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+
+_NULL_TIMER = _NullTimer()
+
+
+class MetricsRegistry:
+    """Métriques nommées, avec étiquettes, d'un processus"""
+
+    KIND_COUNTER = 'counter'
+    KIND_GAUGE = 'gauge'
+    KIND_HISTOGRAM = 'summary'
+
+    def __init__(self, enabled=False):
+        self.enabled = enabled
+        self._kinds = {}                # {nom: type}
+        self._help = {}                 # {nom: description}
+        self._values = {}               # {(nom, étiquettes): valeur ou LatencyHistogram}
+        self._lock = threading.Lock()
+
+    def describe(self, name, help_text):
+        """Associe une description à une métrique (ligne # HELP de l'export)"""
+        self._help[name] = help_text
+
+    def _key(self, name, kind, labels):
+        key = (name, tuple(sorted(labels.items())) if labels else ())
+        if name not in self._kinds:
+            self._kinds[name] = kind
+        return key
+
+    # ============================================
+    # ENREGISTREMENT
+    # ============================================
+
+    def inc(self, name, amount=1, **labels):
+        """Incrémente un compteur"""
+        if not self.enabled:
+            return
+        key = self._key(name, self.KIND_COUNTER, labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def set(self, name, value, **labels):
+        """Fixe la valeur d'une jauge"""
+        if not self.enabled:
+            return
+        key = self._key(name, self.KIND_GAUGE, labels)
+        with self._lock:
+            self._values[key] = value
+
+    def observe(self, name, seconds, **labels):
+        """Enregistre une durée dans un histogramme"""
+        if not self.enabled:
+            return
+        key = self._key(name, self.KIND_HISTOGRAM, labels)
+        histogram = self._values.get(key)
+        if histogram is None:
+            with self._lock:
+                histogram = self._values.setdefault(key, LatencyHistogram())
+        histogram.record(seconds)
+
+    def timer(self, name, **labels):
+        """
+        Chronomètre un bloc : `with metrics.timer('db_query_seconds', table='bots'):`
+
+        Métriques désactivées : un chronomètre partagé qui ne fait rien.
+        """
+        if not self.enabled:
+            return _NULL_TIMER
+        return _Timer(self, name, labels)
+
+    def timed(self, name, **labels):
+        """Décorateur : chronomètre chaque appel de la fonction"""
+        def decorator(func):
+            @functools.wraps(func)
+            def wrapper(*args, **kwargs):
+                if not self.enabled:
+                    return func(*args, **kwargs)
+                start = time.perf_counter()
+                try:
+                    return func(*args, **kwargs)
+                finally:
+                    self.observe(name, time.perf_counter() - start, **labels)
+            return wrapper
+        return decorator
+
+    # ============================================
+    # LECTURE ET EXPORT
+    # ============================================
+
+    def get(self, name, **labels):
+        """Valeur actuelle (ou LatencyHistogram) d'une métrique, None si absente"""
+        return self._values.get((name, tuple(sorted(labels.items())) if labels else ()))
+
+    def reset(self):
+        with self._lock:
+            self._values.clear()
+            self._kinds.clear()
+
+    @staticmethod
+    def _format_labels(labels, extra=None):
+        pairs = list(labels) + ([extra] if extra else [])
+        if not pairs:
+            return ""
+        escaped = (
+            f'{key}="{str(value).replace(chr(92), chr(92) * 2).replace(chr(34), chr(92) + chr(34))}"'
+            for key, value in pairs
+        )
+        return "{" + ",".join(escaped) + "}"
+
+    def to_prometheus(self):
+        """
+        Returns:
+            str: Métriques au format texte Prometheus (version 0.0.4)
+        """
+        with self._lock:
+            values = list(self._values.items())
+        by_name = {}
+        for (name, labels), value in values:
+            by_name.setdefault(name, []).append((labels, value))
+
+        lines = []
+        for name in sorted(by_name):
+            kind = self._kinds.get(name, self.KIND_GAUGE)
+            full_name = METRIC_PREFIX + name
+            if name in self._help:
+                lines.append(f"# HELP {full_name} {self._help[name]}")
+            lines.append(f"# TYPE {full_name} {kind}")
+            for labels, value in sorted(by_name[name], key=lambda item: item[0]):
+                if kind == self.KIND_HISTOGRAM:
+                    for q, seconds in sorted(value.quantiles().items()):
+                        if seconds is not None:
+                            lines.append(f"{full_name}{self._format_labels(labels, ('quantile', q))} {seconds:.6g}")
+                    lines.append(f"{full_name}_sum{self._format_labels(labels)} {value.total:.6g}")
+                    lines.append(f"{full_name}_count{self._format_labels(labels)} {value.count}")
+                else:
+                    lines.append(f"{full_name}{self._format_labels(labels)} {value:.6g}")
+        return "\n".join(lines) + "\n"
+
+
+# ============================================
+# EXPOSITION
+# ============================================
+
+class _MetricsHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        if self.path.split('?', 1)[0] != '/metrics':
+            self.send_error(404)
+            return
+        body = self.server.registry.to_prometheus().encode('utf-8')
+        self.send_response(200)
+        self.send_header('Content-Type', CONTENT_TYPE)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def start_http_server(port=DEFAULT_PORT, host='127.0.0.1', registry=None):
+    """
+    Sert /metrics dans un thread (adresse locale uniquement par défaut)
+
+    Returns:
+        ThreadingHTTPServer: Serveur démarré (shutdown() pour l'arrêter)
+    """
+    server = ThreadingHTTPServer((host, port), _MetricsHandler)
+    server.daemon_threads = True
+    server.registry = registry or get_metrics()
+    threading.Thread(target=server.serve_forever, name='metrics-http', daemon=True).start()
+    print(LOG_SERVER_STARTED.format(host=host, port=server.server_address[1]))
+    return server
+
+
+def write_snapshot(path, registry=None):
+    """Écrit l'instantané Prometheus de façon atomique (fichier temporaire puis renommage)"""
+    registry = registry or get_metrics()
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    temp_path = f"{path}.tmp"
+    with open(temp_path, 'w', encoding='utf-8') as f:
+        f.write(registry.to_prometheus())
+    os.replace(temp_path, path)
+
+
+def start_snapshot_writer(path, interval=DEFAULT_INTERVAL, registry=None):
+    """
+    Réécrit périodiquement l'instantané des métriques
+
+    Returns:
+        threading.Event: set() arrête l'écriture
+    """
+    stop = threading.Event()
+
+    def loop():
+        while not stop.wait(interval):
+            try:
+                write_snapshot(path, registry)
+            except OSError as e:
+                print(LOG_SNAPSHOT_ERROR.format(error=e))
+
+    threading.Thread(target=loop, name='metrics-snapshot', daemon=True).start()
+    print(LOG_SNAPSHOT_STARTED.format(path=path, interval=interval))
+    return stop
+
+
+_registry = MetricsRegistry()
+
+
+def get_metrics():
+    """Retourne le registre de métriques du processus"""
+    return _registry
+
+
+def configure_from_env(environ=None):
+    """
+    Active les métriques et leurs exports selon les variables COINTRADER_METRICS*
+
+    Returns:
+        bool: True si les métriques sont activées
+    """
+    environ = os.environ if environ is None else environ
+    port = environ.get('COINTRADER_METRICS_PORT')
+    path = environ.get('COINTRADER_METRICS_FILE')
+    if environ.get('COINTRADER_METRICS', '').lower() not in ('1', 'true', 'yes') and not port and not path:
+        return False
+
+    _registry.enabled = True
+    if port:
+        start_http_server(int(port))
+    if path:
+        start_snapshot_writer(path, float(environ.get('COINTRADER_METRICS_INTERVAL') or DEFAULT_INTERVAL))
+    return True
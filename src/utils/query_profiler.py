@@ -0,0 +1,276 @@
+"""
+Profilage des requêtes SQLite : agrégats par empreinte et journal des requêtes lentes
+
+Chaque requête exécutée par un curseur chronométré (voir db_connection)
+est ramenée à son empreinte : texte normalisé, littéraux et listes IN
+remplacés par des marqueurs. Par empreinte sont agrégés le nombre
+d'exécutions, la distribution des durées (histogramme HDR, p50/p99) et le
+nombre de lignes lues ou modifiées. La durée d'une requête couvre
+l'exécution et la lecture de ses résultats (SQLite calcule les lignes à
+la demande).
+
+Une requête plus lente que le seuil est écrite dans logs/slow_queries.log
+avec son EXPLAIN QUERY PLAN. Les agrégats sont fusionnés dans
+logs/query_stats.json à la sortie du processus ; `python inspect_db.py
+--report` affiche les pires empreintes.
+
+Configuration (configs/app_config.json) :
+    "query_profiling": true      activer (ou variable COINTRADER_QUERY_PROFILE=1)
+    "slow_query_ms": 100         seuil du journal des requêtes lentes
+"""
+import atexit
+import hashlib
+import json
+import os
+import re
+import sqlite3
+import threading
+from src.utils.db_logger import DbLogger
+from src.utils.metrics import LatencyHistogram
+
+# Constantes - Fichiers
+STATS_PATH = 'logs/query_stats.json'
+SLOW_LOG_PATH = 'logs/slow_queries.log'
+
+# Constantes - Profilage
+DEFAULT_SLOW_QUERY_MS = 100
+MAX_FINGERPRINTS = 2000
+_FINGERPRINT_CACHE_SIZE = 1024
+EXPLAINABLE = ('SELECT', 'INSERT', 'UPDATE', 'DELETE', 'REPLACE', 'WITH')
+
+# Constantes - Normalisation
+_STRING_LITERAL = re.compile(r"'(?:[^']|'')*'")
+_NUMBER_LITERAL = re.compile(r"\b\d+(?:\.\d+)?\b")
+_IN_LIST = re.compile(r"\bIN\s*\(\s*\?(?:\s*,\s*\?)*\s*\)", re.I)
+_WHITESPACE = re.compile(r"\s+")
+
+# Constantes - Messages de log
+LOG_STATS_SAVE_ERROR = "✗ Erreur sauvegarde des statistiques de requêtes: {error}"
+
+_fingerprint_cache = {}
+
+
+def fingerprint(sql):
+    """
+    Empreinte d'une requête (mise en cache par texte SQL)
+
+    Returns:
+        tuple: (identifiant court, texte normalisé)
+    """
+    cached = _fingerprint_cache.get(sql)
+    if cached is not None:
+        return cached
+    normalized = _WHITESPACE.sub(' ', sql).strip()
+    normalized = _STRING_LITERAL.sub('?', normalized)
+    normalized = _NUMBER_LITERAL.sub('?', normalized)
+    normalized = _IN_LIST.sub('IN (?...)', normalized)
+    result = (hashlib.blake2b(normalized.encode('utf-8'), digest_size=6).hexdigest(), normalized)
+    if len(_fingerprint_cache) < _FINGERPRINT_CACHE_SIZE:
+        _fingerprint_cache[sql] = result
+    return result
+
+
+class _StatementStats:
+    """Agrégats d'une empreinte"""
+
+    __slots__ = ('sql', 'histogram', 'rows', 'slow', 'plan')
+
+    def __init__(self, sql):
+        self.sql = sql
+        self.histogram = LatencyHistogram()
+        self.rows = 0
+        self.slow = 0
+        self.plan = None
+
+    def to_dict(self):
+        histogram = self.histogram
+        return {
+            'sql': self.sql,
+            'count': histogram.count,
+            'total': histogram.total,
+            'rows': self.rows,
+            'slow': self.slow,
+            'plan': self.plan,
+            'buckets': {str(index): count for index, count in histogram.counts.items()}
+        }
+
+    def merge(self, data):
+        self.histogram.merge(data.get('buckets', {}), data.get('total', 0.0))
+        self.rows += data.get('rows', 0)
+        self.slow += data.get('slow', 0)
+        self.plan = self.plan or data.get('plan')
+
+
+class QueryProfiler:
+    """Agrégats des requêtes d'un processus et journal des requêtes lentes"""
+
+    def __init__(self, enabled=False, slow_query_ms=DEFAULT_SLOW_QUERY_MS,
+                 stats_path=STATS_PATH, slow_log_path=SLOW_LOG_PATH):
+        self.enabled = enabled
+        self.slow_query_seconds = slow_query_ms / 1000.0
+        self.stats_path = stats_path
+        self.slow_log_path = slow_log_path
+        self._stats = {}                # {empreinte: _StatementStats}
+        self._lock = threading.Lock()
+        self._slow_logger = None
+
+    # ============================================
+    # ENREGISTREMENT
+    # ============================================
+
+    def record(self, sql, seconds, rows, connection=None, parameters=()):
+        """
+        Enregistre une exécution terminée
+
+        Args:
+            sql (str): Requête telle qu'exécutée
+            seconds (float): Durée exécution + lecture des résultats
+            rows (int): Lignes lues (SELECT) ou modifiées
+            connection (sqlite3.Connection, optional): Pour l'EXPLAIN d'une requête lente
+            parameters (tuple or dict): Paramètres de la requête (EXPLAIN)
+        """
+        key, normalized = fingerprint(sql)
+        stats = self._stats.get(key)
+        if stats is None:
+            with self._lock:
+                if len(self._stats) >= MAX_FINGERPRINTS and key not in self._stats:
+                    return
+                stats = self._stats.setdefault(key, _StatementStats(normalized))
+        stats.histogram.record(seconds)
+        stats.rows += rows
+
+        if seconds >= self.slow_query_seconds:
+            stats.slow += 1
+            if stats.plan is None and connection is not None:
+                stats.plan = self.explain(connection, sql, parameters)
+            self._log_slow(key, sql, seconds, rows, stats.plan)
+
+    @staticmethod
+    def explain(connection, sql, parameters=()):
+        """
+        Returns:
+            list or None: Lignes de EXPLAIN QUERY PLAN (None si non applicable)
+        """
+        words = sql.split(None, 1)
+        if not words or words[0].upper() not in EXPLAINABLE:
+            return None
+        try:
+            # Curseur de base : l'EXPLAIN lui-même n'est ni chronométré ni profilé
+            cursor = sqlite3.Cursor(connection)
+            rows = cursor.execute(f"EXPLAIN QUERY PLAN {sql}", parameters or ()).fetchall()
+            cursor.close()
+        except (sqlite3.Error, ValueError):
+            return None
+        return [str(row[-1]) for row in rows]
+
+    def _log_slow(self, key, sql, seconds, rows, plan):
+        if self._slow_logger is None:
+            self._slow_logger = DbLogger(log_file=self.slow_log_path)
+        clean_query = ' '.join(sql.split())
+        message = f"{seconds * 1000:.1f} ms | {rows} lignes | {key} | {clean_query}"
+        if plan:
+            message += "".join(f"\n    PLAN {line}" for line in plan)
+        self._slow_logger.log_slow_query(message)
+
+    # ============================================
+    # LECTURE ET PERSISTANCE
+    # ============================================
+
+    def snapshot(self):
+        """
+        Returns:
+            dict: {empreinte: agrégats sérialisables} du processus
+        """
+        with self._lock:
+            items = list(self._stats.items())
+        return {key: stats.to_dict() for key, stats in items}
+
+    def reset(self):
+        with self._lock:
+            self._stats.clear()
+
+    def save(self, path=None):
+        """Fusionne les agrégats du processus dans le fichier de statistiques, puis les remet à zéro"""
+        path = path or self.stats_path
+        merged = load_stats(path)
+        for key, data in self.snapshot().items():
+            stats = merged.setdefault(key, _StatementStats(data['sql']))
+            stats.merge(data)
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        temp_path = f"{path}.tmp"
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump({key: stats.to_dict() for key, stats in merged.items()}, f)
+        os.replace(temp_path, path)
+        self.reset()
+
+
+def load_stats(path=STATS_PATH):
+    """
+    Returns:
+        dict: {empreinte: _StatementStats} relus depuis le fichier (vide s'il n'existe pas)
+    """
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+    except (IOError, json.JSONDecodeError):
+        return {}
+    result = {}
+    for key, entry in data.items():
+        stats = _StatementStats(entry.get('sql', '?'))
+        stats.merge(entry)
+        result[key] = stats
+    return result
+
+
+def top_statements(stats, limit=10, sort='total'):
+    """
+    Classe les empreintes
+
+    Args:
+        stats (dict): {empreinte: _StatementStats}
+        limit (int): Nombre de lignes
+        sort (str): 'total', 'p99', 'count' ou 'rows'
+
+    Returns:
+        list: [dict] avec count, total, p50, p99, max (secondes), rows, slow, sql, plan
+    """
+    rows = []
+    for key, entry in stats.items():
+        quantiles = entry.histogram.quantiles((0.5, 0.99))
+        rows.append({
+            'fingerprint': key, 'sql': entry.sql, 'plan': entry.plan,
+            'count': entry.histogram.count, 'total': entry.histogram.total,
+            'p50': quantiles[0.5] or 0.0, 'p99': quantiles[0.99] or 0.0,
+            'rows': entry.rows, 'slow': entry.slow
+        })
+    rows.sort(key=lambda row: row[sort], reverse=True)
+    return rows[:limit]
+
+
+_profiler = None
+_profiler_lock = threading.Lock()
+
+
+def get_query_profiler():
+    """Retourne le profileur de requêtes du processus (configuré au premier appel)"""
+    global _profiler
+    if _profiler is None:
+        with _profiler_lock:
+            if _profiler is None:
+                logger = DbLogger()
+                enabled = logger.query_profiling or os.environ.get(
+                    'COINTRADER_QUERY_PROFILE', '').lower() in ('1', 'true', 'yes')
+                profiler = QueryProfiler(enabled, logger.slow_query_ms)
+                if enabled:
+                    atexit.register(_save_at_exit, profiler)
+                _profiler = profiler
+    return _profiler
+
+
+def _save_at_exit(profiler):
+    try:
+        profiler.save()
+    except OSError as e:
+        print(LOG_STATS_SAVE_ERROR.format(error=e))
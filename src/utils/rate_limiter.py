@@ -0,0 +1,75 @@
+"""
+Limiteur de débit (token bucket) partagé entre threads et coroutines
+"""
+import asyncio
+import threading
+import time
+
+
+class RateLimiter:
+    """Token bucket : `rate` requêtes par seconde, rafales jusqu'à `burst`"""
+
+    def __init__(self, rate, burst=None):
+        """
+        Args:
+            rate (float): Nombre de jetons ajoutés par seconde
+            burst (int, optional): Capacité maximale (par défaut = rate)
+        """
+        self.rate = float(rate)
+        self.capacity = float(burst if burst is not None else max(1.0, rate))
+        self._tokens = self.capacity
+        self._last = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self, now):
+        self._tokens = min(self.capacity, self._tokens + (now - self._last) * self.rate)
+        self._last = now
+
+    def try_acquire(self, tokens=1):
+        """Prend des jetons sans attendre ; retourne False si indisponibles"""
+        with self._lock:
+            self._refill(time.monotonic())
+            if self._tokens >= tokens:
+                self._tokens -= tokens
+                return True
+            return False
+
+    def _reserve(self, tokens):
+        """Prend les jetons si possible, sinon retourne l'attente nécessaire (s)"""
+        with self._lock:
+            self._refill(time.monotonic())
+            if self._tokens >= tokens:
+                self._tokens -= tokens
+                return 0.0
+            return (tokens - self._tokens) / self.rate
+
+    def acquire(self, tokens=1, timeout=None):
+        """
+        Attend que des jetons soient disponibles
+
+        Args:
+            tokens (int): Nombre de jetons à consommer
+            timeout (float, optional): Attente maximale en secondes
+
+        Returns:
+            bool: True si les jetons ont été obtenus
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            wait = self._reserve(tokens)
+            if not wait:
+                return True
+            if deadline is not None and time.monotonic() + wait > deadline:
+                return False
+            time.sleep(wait)
+
+    async def acquire_async(self, tokens=1, timeout=None):
+        """Variante de acquire() pour la boucle asyncio (n'en bloque pas le thread)"""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            wait = self._reserve(tokens)
+            if not wait:
+                return True
+            if deadline is not None and time.monotonic() + wait > deadline:
+                return False
+            await asyncio.sleep(wait)
@@ -0,0 +1,321 @@
+"""
+Table de prix en mémoire partagée
+
+Un seul processus écrivain (le démon, qui récupère déjà les tickers pour
+ses bots) publie le dernier prix de chaque produit ; tout processus local
+(interface, scripts, workers) le lit directement dans la mémoire partagée,
+sans appel système, requête réseau ni copie intermédiaire.
+
+Disposition du segment (taille fixe) :
+    en-tête   magic, version, capacité, nombre d'emplacements, fermé, pid de l'écrivain
+    index     capacité × clé "exchange:product_id" (ajout seulement)
+    données   capacité × (séquence, prix, bid, ask, horodatage)
+
+Chaque enregistrement est protégé par un seqlock : l'écrivain rend la
+séquence impaire, écrit, puis la rend paire ; un lecteur recommence sa
+lecture si la séquence était impaire ou a changé entre-temps.
+
+Une table existante n'est remplacée que si son écrivain n'est plus vivant
+(table fermée ou pid disparu) : un second écrivain refuse de démarrer.
+"""
+import os
+import struct
+import threading
+import time
+from multiprocessing import resource_tracker, shared_memory
+from src.utils.shm_ring import attach_shared_memory
+
+# Constantes - Disposition
+TABLE_NAME = "cointrader_prices"
+MAGIC = b'CTPT'
+VERSION = 2
+DEFAULT_CAPACITY = 8192
+HEADER = struct.Struct('<4sIQQQ')               # magic, version, capacité, emplacements, fermé
+HEADER_SIZE = 64
+COUNT_OFFSET = 16
+CLOSED_OFFSET = 24
+OWNER_OFFSET = 32
+KEY_SIZE = 48
+SEQ = struct.Struct('<Q')
+VALUES = struct.Struct('<dddd')                 # prix, bid, ask, horodatage
+RECORD_SIZE = 64                                # une ligne de cache par produit
+MISSING = float('nan')
+
+# Constantes - Lecture
+MAX_READ_RETRIES = 100
+DEFAULT_MAX_AGE = 10.0
+ATTACH_RETRY_INTERVAL = 5.0
+
+# Constantes - Messages de log
+LOG_TABLE_CREATED = "✓ Table de prix partagée '{name}' ({capacity} produits)"
+LOG_TABLE_FULL = "⚠ Table de prix partagée pleine ({capacity} produits) : {key} ignoré"
+LOG_TABLE_STALE = "⚠ Table de prix partagée '{name}' abandonnée par le processus {pid} : remplacée"
+LOG_TABLE_IN_USE = "Table de prix partagée '{name}' déjà publiée par le processus {pid}"
+LOG_TABLE_UNKNOWN = "Segment '{name}' existant au format inconnu : supprimez-le (/dev/shm/{name}) s'il est orphelin"
+
+
+def default_table_name():
+    """Nom du segment de la table (surchargeable par COINTRADER_PRICE_TABLE)"""
+    return os.environ.get('COINTRADER_PRICE_TABLE') or TABLE_NAME
+
+
+def _key(exchange, product_id):
+    return f"{exchange.lower()}:{product_id}".encode('utf-8')
+
+
+def _pid_alive(pid):
+    """Indique si un processus existe encore (signal 0 : aucun effet)"""
+    if pid <= 0:
+        return False
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+def _offsets(capacity):
+    index_offset = HEADER_SIZE
+    records_offset = index_offset + capacity * KEY_SIZE
+    return index_offset, records_offset, records_offset + capacity * RECORD_SIZE
+
+
+class PriceTableWriter:
+    """Écrivain unique de la table de prix"""
+
+    def __init__(self, name=None, capacity=DEFAULT_CAPACITY):
+        """
+        Crée la table (une table laissée par un écrivain arrêté est remplacée)
+
+        Args:
+            name (str, optional): Nom du segment
+            capacity (int): Nombre maximum de produits
+
+        Raises:
+            FileExistsError: La table est publiée par un écrivain encore vivant
+        """
+        self.name = name or default_table_name()
+        self.capacity = capacity
+        self._index_offset, self._records_offset, size = _offsets(capacity)
+        self._slots = {}                # {clé: emplacement}
+        self._lock = threading.Lock()
+        self._full_reported = False
+
+        self._discard_stale()
+        self.shm = shared_memory.SharedMemory(name=self.name, create=True, size=size)
+        self.buf = self.shm.buf
+        HEADER.pack_into(self.buf, 0, MAGIC, VERSION, capacity, 0, 0)
+        SEQ.pack_into(self.buf, OWNER_OFFSET, os.getpid())
+        print(LOG_TABLE_CREATED.format(name=self.name, capacity=capacity))
+
+    def _discard_stale(self):
+        try:
+            stale = attach_shared_memory(self.name, untrack=False)
+        except FileNotFoundError:
+            return
+        discard = False
+        try:
+            if stale.size < HEADER_SIZE:
+                raise FileExistsError(LOG_TABLE_UNKNOWN.format(name=self.name))
+            magic, version, _, _, closed = HEADER.unpack_from(stale.buf, 0)
+            if magic != MAGIC or version != VERSION:
+                # Sans pid d'écrivain, impossible de savoir si la table est encore utilisée
+                raise FileExistsError(LOG_TABLE_UNKNOWN.format(name=self.name))
+            owner = SEQ.unpack_from(stale.buf, OWNER_OFFSET)[0]
+            if not closed and _pid_alive(owner):
+                raise FileExistsError(LOG_TABLE_IN_USE.format(name=self.name, pid=owner))
+            # Les lecteurs encore attachés à l'ancienne table la quittent
+            SEQ.pack_into(stale.buf, CLOSED_OFFSET, 1)
+            discard = True
+        finally:
+            stale.close()
+            if discard:
+                stale.unlink()
+                print(LOG_TABLE_STALE.format(name=self.name, pid=owner))
+            else:
+                # Table d'un autre processus : notre resource_tracker ne doit pas la détruire
+                resource_tracker.unregister(stale._name, 'shared_memory')
+
+    def _slot(self, exchange, product_id):
+        key = _key(exchange, product_id)
+        slot = self._slots.get(key)
+        if slot is not None:
+            return slot
+        if len(self._slots) >= self.capacity or len(key) > KEY_SIZE:
+            if not self._full_reported:
+                print(LOG_TABLE_FULL.format(capacity=self.capacity, key=key.decode('utf-8')))
+                self._full_reported = True
+            return None
+        slot = len(self._slots)
+        offset = self._index_offset + slot * KEY_SIZE
+        self.buf[offset:offset + KEY_SIZE] = key.ljust(KEY_SIZE, b'\0')
+        # La clé est écrite avant d'être comptée : un lecteur ne voit jamais d'emplacement vide
+        SEQ.pack_into(self.buf, COUNT_OFFSET, slot + 1)
+        self._slots[key] = slot
+        return slot
+
+    def update(self, exchange, product_id, price, bid=None, ask=None, ts=None):
+        """
+        Publie le dernier prix d'un produit
+
+        Returns:
+            bool: False si la table est pleine
+        """
+        with self._lock:
+            slot = self._slot(exchange, product_id)
+            if slot is None:
+                return False
+            offset = self._records_offset + slot * RECORD_SIZE
+            seq = SEQ.unpack_from(self.buf, offset)[0]
+            SEQ.pack_into(self.buf, offset, seq + 1)
+            VALUES.pack_into(self.buf, offset + SEQ.size,
+                             MISSING if price is None else price,
+                             MISSING if bid is None else bid,
+                             MISSING if ask is None else ask,
+                             ts or time.time())
+            SEQ.pack_into(self.buf, offset, seq + 2)
+        return True
+
+    def update_tickers(self, exchange, tickers):
+        """Publie un lot de tickers {product_id: ticker} renvoyé par get_tickers()"""
+        now = time.time()
+        for product_id, ticker in tickers.items():
+            self.update(exchange, product_id, ticker.get('price'), ticker.get('bid'), ticker.get('ask'), now)
+
+    def close(self):
+        """Marque la table fermée puis la détruit"""
+        if self.buf is None:
+            return
+        SEQ.pack_into(self.buf, CLOSED_OFFSET, 1)
+        self.buf = None
+        self.shm.close()
+        try:
+            self.shm.unlink()
+        except FileNotFoundError:
+            pass
+
+
+class PriceTableReader:
+    """Lecture de la table de prix depuis n'importe quel processus local"""
+
+    def __init__(self, name=None, untrack=None):
+        """
+        Args:
+            name (str, optional): Nom du segment
+            untrack (bool, optional): Voir attach_shared_memory (False dans le processus écrivain)
+
+        Raises:
+            FileNotFoundError: Aucun écrivain n'a créé la table
+        """
+        self.name = name or default_table_name()
+        self.shm = attach_shared_memory(self.name, untrack)
+        self.buf = self.shm.buf
+        magic, version, self.capacity, _, _ = HEADER.unpack_from(self.buf, 0)
+        if magic != MAGIC or version != VERSION:
+            self.close()
+            raise ValueError(f"Table de prix '{self.name}' incompatible")
+        self._index_offset, self._records_offset, _ = _offsets(self.capacity)
+        self._slots = {}
+        self._known = 0
+
+    @property
+    def closed(self):
+        return self.buf is None or SEQ.unpack_from(self.buf, CLOSED_OFFSET)[0] != 0
+
+    def _refresh_index(self):
+        count = SEQ.unpack_from(self.buf, COUNT_OFFSET)[0]
+        for slot in range(self._known, count):
+            offset = self._index_offset + slot * KEY_SIZE
+            self._slots[bytes(self.buf[offset:offset + KEY_SIZE]).rstrip(b'\0')] = slot
+        self._known = count
+
+    def get(self, exchange, product_id, max_age=None):
+        """
+        Lit le dernier prix publié d'un produit
+
+        Args:
+            exchange (str): Nom de l'exchange
+            product_id (str): Produit BASE-QUOTE
+            max_age (float, optional): Âge maximum accepté en secondes
+
+        Returns:
+            dict or None: {'price', 'bid', 'ask', 'ts'} ou None (absent, trop ancien, table fermée)
+        """
+        if self.closed:
+            return None
+        key = _key(exchange, product_id)
+        slot = self._slots.get(key)
+        if slot is None:
+            self._refresh_index()
+            slot = self._slots.get(key)
+            if slot is None:
+                return None
+
+        offset = self._records_offset + slot * RECORD_SIZE
+        for _ in range(MAX_READ_RETRIES):
+            before = SEQ.unpack_from(self.buf, offset)[0]
+            if before & 1:
+                continue
+            price, bid, ask, ts = VALUES.unpack_from(self.buf, offset + SEQ.size)
+            if SEQ.unpack_from(self.buf, offset)[0] == before:
+                break
+        else:
+            return None
+
+        if before == 0 or (max_age is not None and time.time() - ts > max_age):
+            return None
+        return {
+            'price': None if price != price else price,
+            'bid': None if bid != bid else bid,
+            'ask': None if ask != ask else ask,
+            'ts': ts
+        }
+
+    def get_price(self, exchange, product_id, max_age=DEFAULT_MAX_AGE):
+        """Dernier prix publié, ou None s'il est absent ou plus vieux que max_age"""
+        record = self.get(exchange, product_id, max_age)
+        return record['price'] if record else None
+
+    def close(self):
+        if self.buf is None:
+            return
+        self.buf = None
+        self.shm.close()
+
+
+_reader = None
+_reader_lock = threading.Lock()
+_last_attempt = None
+
+
+def get_price_table():
+    """
+    Retourne le lecteur de la table de prix partagée du processus
+
+    Sans écrivain (démon arrêté), None est retourné ; une nouvelle tentative
+    n'a lieu qu'après ATTACH_RETRY_INTERVAL secondes.
+
+    Returns:
+        PriceTableReader or None
+    """
+    global _reader, _last_attempt
+    reader = _reader
+    if reader is not None and not reader.closed:
+        return reader
+    with _reader_lock:
+        if _reader is not None and not _reader.closed:
+            return _reader
+        if _reader is not None:
+            _reader.close()
+            _reader = None
+        now = time.monotonic()
+        if _last_attempt is not None and now - _last_attempt < ATTACH_RETRY_INTERVAL:
+            return None
+        _last_attempt = now
+        try:
+            _reader = PriceTableReader()
+        except (FileNotFoundError, ValueError):
+            _reader = None
+        return _reader
@@ -0,0 +1,136 @@
+"""
+File circulaire en mémoire partagée (un producteur, un consommateur)
+
+Transporte des messages courts entre deux processus sans sérialisation
+pickle ni appel système par message : le producteur écrit l'enregistrement
+puis publie l'index d'écriture, le consommateur lit puis publie l'index de
+lecture. Chaque index n'est écrit que par un seul côté, aucun verrou n'est
+nécessaire.
+
+Disposition du segment :
+    [0]    capacité (uint64)      [8]  taille d'un enregistrement (uint64)
+    [64]   index d'écriture       [128] index de lecture
+    [192]  enregistrements : longueur (uint32) + données
+"""
+import multiprocessing
+import struct
+from multiprocessing import resource_tracker, shared_memory
+
+# Constantes - Disposition
+HEADER_SIZE = 192
+HEAD_OFFSET = 64
+TAIL_OFFSET = 128
+LENGTH = struct.Struct('<I')
+INDEX = struct.Struct('<Q')
+GEOMETRY = struct.Struct('<QQ')
+
+
+def attach_shared_memory(name, untrack=None):
+    """
+    Ouvre un segment existant
+
+    Seul le créateur libère le segment. Un processus indépendant qui s'y
+    attache doit le retirer de son propre resource_tracker, sans quoi il le
+    détruirait (ou signalerait une fuite) en se terminant. Un processus lancé
+    par multiprocessing partage au contraire le tracker de son parent : le
+    retrait effacerait l'enregistrement du créateur.
+
+    Args:
+        name (str): Nom du segment
+        untrack (bool, optional): Retirer le segment du resource_tracker
+            (par défaut : si le processus n'a pas été lancé par multiprocessing)
+    """
+    if untrack is None:
+        untrack = multiprocessing.parent_process() is None
+    shm = shared_memory.SharedMemory(name=name)
+    if untrack:
+        try:
+            resource_tracker.unregister(shm._name, 'shared_memory')
+        except Exception:
+            pass
+    return shm
+
+
+class ShmRing:
+    """File circulaire d'enregistrements de taille fixe en mémoire partagée"""
+
+    def __init__(self, shm, owner):
+        self.shm = shm
+        self.owner = owner
+        self.buf = shm.buf
+        self.capacity, self.record_size = GEOMETRY.unpack_from(self.buf, 0)
+        self.max_payload = self.record_size - LENGTH.size
+
+    @classmethod
+    def create(cls, capacity, record_size, name=None):
+        """
+        Crée un nouveau segment
+
+        Args:
+            capacity (int): Nombre d'enregistrements
+            record_size (int): Taille d'un enregistrement (longueur comprise)
+            name (str, optional): Nom du segment (généré si None)
+        """
+        shm = shared_memory.SharedMemory(name=name, create=True, size=HEADER_SIZE + capacity * record_size)
+        GEOMETRY.pack_into(shm.buf, 0, capacity, record_size)
+        INDEX.pack_into(shm.buf, HEAD_OFFSET, 0)
+        INDEX.pack_into(shm.buf, TAIL_OFFSET, 0)
+        return cls(shm, owner=True)
+
+    @classmethod
+    def attach(cls, name, untrack=None):
+        """Ouvre un segment créé par un autre processus (voir attach_shared_memory)"""
+        return cls(attach_shared_memory(name, untrack), owner=False)
+
+    @property
+    def name(self):
+        return self.shm.name
+
+    def __len__(self):
+        return INDEX.unpack_from(self.buf, HEAD_OFFSET)[0] - INDEX.unpack_from(self.buf, TAIL_OFFSET)[0]
+
+    def push(self, payload):
+        """
+        Ajoute un message (côté producteur)
+
+        Returns:
+            bool: False si la file est pleine
+        """
+        if len(payload) > self.max_payload:
+            raise ValueError(f"Message de {len(payload)} octets (maximum {self.max_payload})")
+        head = INDEX.unpack_from(self.buf, HEAD_OFFSET)[0]
+        if head - INDEX.unpack_from(self.buf, TAIL_OFFSET)[0] >= self.capacity:
+            return False
+        offset = HEADER_SIZE + (head % self.capacity) * self.record_size
+        LENGTH.pack_into(self.buf, offset, len(payload))
+        self.buf[offset + LENGTH.size:offset + LENGTH.size + len(payload)] = payload
+        INDEX.pack_into(self.buf, HEAD_OFFSET, head + 1)
+        return True
+
+    def pop_many(self, limit):
+        """
+        Retire jusqu'à `limit` messages (côté consommateur)
+
+        Returns:
+            list: Messages (bytes), du plus ancien au plus récent
+        """
+        tail = INDEX.unpack_from(self.buf, TAIL_OFFSET)[0]
+        count = min(INDEX.unpack_from(self.buf, HEAD_OFFSET)[0] - tail, limit)
+        messages = []
+        for index in range(tail, tail + count):
+            offset = HEADER_SIZE + (index % self.capacity) * self.record_size
+            length = LENGTH.unpack_from(self.buf, offset)[0]
+            messages.append(bytes(self.buf[offset + LENGTH.size:offset + LENGTH.size + length]))
+        if count:
+            INDEX.pack_into(self.buf, TAIL_OFFSET, tail + count)
+        return messages
+
+    def close(self):
+        """Détache le segment (et le détruit si ce processus l'a créé)"""
+        self.buf = None
+        self.shm.close()
+        if self.owner:
+            try:
+                self.shm.unlink()
+            except FileNotFoundError:
+                pass
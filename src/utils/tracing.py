@@ -0,0 +1,259 @@
+"""
+Traces d'exécution (spans) propagées d'une action utilisateur jusqu'aux couches basses
+
+Un span mesure un bloc (vue, contrôleur, modèle, requête SQLite, appel
+d'exchange, tick du moteur). Le span courant est porté par une variable de
+contexte : les spans ouverts dans un appel imbriqué, une tâche asyncio ou
+un exécuteur du runtime asyncio (contexte copié) deviennent ses enfants et
+partagent son identifiant de trace.
+
+Les spans terminés sont conservés dans un tampon circulaire borné (les plus
+anciens sont perdus) et s'exportent au format « Trace Event » de Chrome,
+lisible dans chrome://tracing ou https://ui.perfetto.dev. Un parent et un
+enfant exécutés dans des threads différents sont reliés par une flèche.
+
+Désactivé par défaut : chaque point de trace commence par un test du
+drapeau `enabled`. Activation par variables d'environnement :
+    COINTRADER_TRACE=1                   activer
+    COINTRADER_TRACE_FILE=chemin.json    exporter à la sortie du processus
+    COINTRADER_TRACE_CAPACITY=100000     taille du tampon circulaire
+"""
+import atexit
+import contextvars
+import functools
+import itertools
+import json
+import os
+import threading
+import time
+from collections import deque
+
+# Constantes - Tampon
+DEFAULT_CAPACITY = 100000
+
+# Constantes - Catégories
+CATEGORY_UI = 'ui'
+CATEGORY_CONTROLLER = 'controller'
+CATEGORY_MODEL = 'model'
+CATEGORY_DB = 'db'
+CATEGORY_EXCHANGE = 'exchange'
+CATEGORY_ENGINE = 'engine'
+
+# Constantes - Messages de log
+LOG_TRACE_EXPORTED = "✓ Trace exportée dans {path} ({count} spans)"
+LOG_TRACE_EXPORT_ERROR = "✗ Erreur export de la trace: {error}"
+
+_current_span = contextvars.ContextVar('cointrader_span', default=None)
+_ids = itertools.count(1)
+
+
+class Span:
+    """Bloc chronométré d'une trace (une instance par utilisation, via Tracer.span)"""
+
+    __slots__ = ('tracer', 'name', 'category', 'args', 'trace_id', 'span_id', 'parent',
+                 'thread_id', 'start', '_token')
+
+    def __init__(self, tracer, name, category, args):
+        self.tracer = tracer
+        self.name = name
+        self.category = category
+        self.args = args
+
+    def set(self, **args):
+        """Ajoute des attributs au span (visibles dans le visualiseur)"""
+        self.args.update(args)
+
+    def __enter__(self):
+        parent = _current_span.get()
+        self.parent = parent
+        self.span_id = next(_ids)
+        self.trace_id = parent.trace_id if parent is not None else self.span_id
+        self.thread_id = threading.get_ident()
+        self._token = _current_span.set(self)
+        self.start = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        end = time.perf_counter_ns()
+        _current_span.reset(self._token)
+        if exc_type is not None:
+            self.args['error'] = exc_type.__name__
+        self.tracer._finish(self, end)
+        return False
+
+
+class _NullSpan:
+    """Span inactif partagé (traces désactivées)"""
+
+    __slots__ = ()
+
+    def set(self, **args):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+
+_NULL_SPAN = _NullSpan()
+
+
+class Tracer:
+    """Collecte des spans terminés d'un processus"""
+
+    def __init__(self, enabled=False, capacity=DEFAULT_CAPACITY):
+        self.enabled = enabled
+        self._records = deque(maxlen=capacity)
+        self._thread_names = {}          # {ident: nom du thread}
+
+    # ============================================
+    # ENREGISTREMENT
+    # ============================================
+
+    def span(self, name, category=CATEGORY_MODEL, **args):
+        """
+        Ouvre un span : `with tracer.span('BotModel.create_bot', 'model', bot_id=3):`
+
+        Traces désactivées : un span partagé qui ne fait rien.
+        """
+        if not self.enabled:
+            return _NULL_SPAN
+        return Span(self, name, category, args)
+
+    def traced(self, category=CATEGORY_MODEL, name=None):
+        """Décorateur : un span par appel, nommé d'après la fonction (Classe.méthode)"""
+        def decorator(func):
+            span_name = name or func.__qualname__
+
+            @functools.wraps(func)
+            def wrapper(*args, **kwargs):
+                if not self.enabled:
+                    return func(*args, **kwargs)
+                with Span(self, span_name, category, {}):
+                    return func(*args, **kwargs)
+            return wrapper
+        return decorator
+
+    def _finish(self, span, end):
+        if span.thread_id not in self._thread_names:
+            self._thread_names[span.thread_id] = threading.current_thread().name
+        parent = span.parent
+        # Tuple plutôt qu'objet : le tampon ne retient ni le parent ni le tracer
+        self._records.append((
+            span.name, span.category, span.start, end - span.start, span.thread_id,
+            span.trace_id, span.span_id,
+            parent.span_id if parent is not None else None,
+            parent.thread_id if parent is not None else None,
+            span.args
+        ))
+
+    @staticmethod
+    def current_span():
+        """Span ouvert dans le contexte courant, ou None"""
+        return _current_span.get()
+
+    # ============================================
+    # LECTURE ET EXPORT
+    # ============================================
+
+    def spans(self):
+        """
+        Returns:
+            list: Spans terminés, du plus ancien au plus récent (dicts, durées en secondes)
+        """
+        return [
+            {'name': name, 'category': category, 'start': start / 1e9, 'duration': duration / 1e9,
+             'thread_id': thread_id, 'trace_id': trace_id, 'span_id': span_id,
+             'parent_id': parent_id, 'args': dict(args)}
+            for name, category, start, duration, thread_id, trace_id, span_id, parent_id, _, args
+            in list(self._records)
+        ]
+
+    def clear(self):
+        self._records.clear()
+
+    def to_chrome_trace(self):
+        """
+        Returns:
+            dict: Document « Trace Event » (événements complets 'X' en microsecondes)
+        """
+        pid = os.getpid()
+        records = list(self._records)
+        starts = {record[6]: record[2] for record in records}
+        events = [
+            {'name': 'thread_name', 'ph': 'M', 'pid': pid, 'tid': thread_id, 'args': {'name': thread_name}}
+            for thread_id, thread_name in list(self._thread_names.items())
+        ]
+        for name, category, start, duration, thread_id, trace_id, span_id, parent_id, parent_thread, args \
+                in records:
+            event_args = {'trace_id': trace_id, 'span_id': span_id}
+            if parent_id is not None:
+                event_args['parent_id'] = parent_id
+            event_args.update(args)
+            events.append({
+                'name': name, 'cat': category, 'ph': 'X', 'pid': pid, 'tid': thread_id,
+                'ts': start / 1000, 'dur': duration / 1000, 'args': event_args
+            })
+            # Parent dans un autre thread (exécuteur, worker) : flèche parent → enfant
+            if parent_id in starts and parent_thread != thread_id:
+                events.append({'name': 'span', 'cat': category, 'ph': 's', 'id': span_id,
+                               'pid': pid, 'tid': parent_thread, 'ts': starts[parent_id] / 1000})
+                events.append({'name': 'span', 'cat': category, 'ph': 'f', 'bp': 'e', 'id': span_id,
+                               'pid': pid, 'tid': thread_id, 'ts': start / 1000})
+        return {'traceEvents': events, 'displayTimeUnit': 'ms'}
+
+    def export_chrome_trace(self, path):
+        """
+        Écrit la trace au format Chrome (fichier temporaire puis renommage)
+
+        Returns:
+            int: Nombre de spans exportés
+        """
+        document = self.to_chrome_trace()
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        temp_path = f"{path}.tmp"
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump(document, f, default=str)
+        os.replace(temp_path, path)
+        return sum(1 for event in document['traceEvents'] if event['ph'] == 'X')
+
+
+_tracer = Tracer()
+
+
+def get_tracer():
+    """Retourne le collecteur de spans du processus"""
+    return _tracer
+
+
+def _export_at_exit(path):
+    try:
+        count = _tracer.export_chrome_trace(path)
+        print(LOG_TRACE_EXPORTED.format(path=path, count=count))
+    except (OSError, ValueError) as e:
+        print(LOG_TRACE_EXPORT_ERROR.format(error=e))
+
+
+def configure_from_env(environ=None):
+    """
+    Active les traces selon les variables COINTRADER_TRACE*
+
+    Returns:
+        bool: True si les traces sont activées
+    """
+    environ = os.environ if environ is None else environ
+    path = environ.get('COINTRADER_TRACE_FILE')
+    if environ.get('COINTRADER_TRACE', '').lower() not in ('1', 'true', 'yes') and not path:
+        return False
+
+    capacity = environ.get('COINTRADER_TRACE_CAPACITY')
+    if capacity:
+        _tracer._records = deque(_tracer._records, maxlen=int(capacity))
+    _tracer.enabled = True
+    if path:
+        atexit.register(_export_at_exit, path)
+    return True
@@ -0,0 +1,65 @@
+"""
+Cache mémoire à durée de vie limitée, partagé entre threads
+"""
+import threading
+import time
+
+_MISSING = object()
+
+
+class TTLCache:
+    """Cache clé → valeur dont chaque entrée expire après `ttl` secondes"""
+
+    def __init__(self, default_ttl=1.0, max_entries=10000):
+        self.default_ttl = default_ttl
+        self.max_entries = max_entries
+        self._data = {}
+        self._lock = threading.Lock()
+
+    def get(self, key, default=None):
+        entry = self._data.get(key)
+        if entry is None:
+            return default
+        expires_at, value = entry
+        if expires_at < time.monotonic():
+            with self._lock:
+                self._data.pop(key, None)
+            return default
+        return value
+
+    def set(self, key, value, ttl=None):
+        expires_at = time.monotonic() + (self.default_ttl if ttl is None else ttl)
+        with self._lock:
+            if len(self._data) >= self.max_entries:
+                self._evict_expired()
+                if len(self._data) >= self.max_entries:
+                    # Retirer l'entrée la plus ancienne (ordre d'insertion)
+                    self._data.pop(next(iter(self._data)))
+            self._data[key] = (expires_at, value)
+
+    def get_or_set(self, key, factory, ttl=None):
+        """Retourne la valeur en cache ou la calcule (les valeurs None ne sont pas mises en cache)"""
+        value = self.get(key, _MISSING)
+        if value is not _MISSING:
+            return value
+        value = factory()
+        if value is not None:
+            self.set(key, value, ttl)
+        return value
+
+    def invalidate(self, prefix=None):
+        """Vide le cache, ou seulement les clés tuple commençant par `prefix`"""
+        with self._lock:
+            if prefix is None:
+                self._data.clear()
+            else:
+                for key in [k for k in self._data if isinstance(k, tuple) and k[:1] == (prefix,)]:
+                    del self._data[key]
+
+    def _evict_expired(self):
+        now = time.monotonic()
+        for key in [k for k, (exp, _) in self._data.items() if exp < now]:
+            del self._data[key]
+
+    def __len__(self):
+        return len(self._data)
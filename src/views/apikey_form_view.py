@@ -1,7 +1,7 @@
 import tkinter as tk
 from tkinter import messagebox
 from src.controllers.exchange_controller import ExchangeController
-from src.components.ui_component import Label, Toast, Button
+from src.components.ui_component import Label, Toast, Button, themed
 
 FONT_FAMILY = "Segoe UI"
 
@@ -19,7 +19,7 @@ class ApiKeyFormView:
         self.api_key = api_key  # None si création, dict si modification
         self.exchanges = []
 
-        self.container = tk.Frame(self.parent_frame, bg=self.theme['bg_primary'])
+        self.container = themed(tk.Frame(self.parent_frame, bg=self.theme['bg_primary']), {'bg': 'bg_primary'})
         self.container.pack(fill='both', expand=True)
 
         self._build_ui()
@@ -28,35 +28,36 @@ class ApiKeyFormView:
     def _build_ui(self):
         """Construit l'interface du formulaire"""
         # En-tête
-        header_frame = tk.Frame(self.container, bg=self.theme['bg_primary'])
+        header_frame = themed(tk.Frame(self.container, bg=self.theme['bg_primary']), {'bg': 'bg_primary'})
         header_frame.pack(fill='x', pady=(0, 20))
 
         # Titre
         title = "Modifier une clé API" if self.api_key else "Ajouter une clé API"
-        tk.Label(
+        themed(tk.Label(
             header_frame,
             text=title,
             font=(FONT_FAMILY, 18, 'bold'),
             bg=self.theme['bg_primary'],
             fg=self.theme['text_primary']
-        ).pack(anchor='w')
+        ), {'bg': 'bg_primary', 'fg': 'text_primary'}).pack(anchor='w')
 
         # Frame principal du formulaire
-        form_frame = tk.Frame(self.container, bg=self.theme['bg_secondary'], relief='solid', borderwidth=1)
+        form_frame = themed(tk.Frame(self.container, bg=self.theme['bg_secondary'], relief='solid', borderwidth=1),
+                            {'bg': 'bg_secondary'})
         form_frame.pack(fill='x', pady=(0, 20))
 
         # Conteneur avec scroll
-        inner_frame = tk.Frame(form_frame, bg=self.theme['bg_secondary'])
+        inner_frame = themed(tk.Frame(form_frame, bg=self.theme['bg_secondary']), {'bg': 'bg_secondary'})
         inner_frame.pack(fill='both', expand=True, padx=20, pady=20)
 
         # Sélection de la plateforme (désactivée si modification)
-        tk.Label(
+        themed(tk.Label(
             inner_frame,
             text="Plateforme *",
             font=(FONT_FAMILY, 10, 'bold'),
             bg=self.theme['bg_secondary'],
             fg=self.theme['text_primary']
-        ).pack(anchor='w', pady=(0, 5))
+        ), {'bg': 'bg_secondary', 'fg': 'text_primary'}).pack(anchor='w', pady=(0, 5))
 
         self.exchange_combo_values = []
         self.exchange_var = tk.StringVar()
@@ -69,15 +70,15 @@ class ApiKeyFormView:
         self.exchange_combo.pack(fill='x', ipady=8, pady=(0, 15))
 
         # Nom de la clé
-        tk.Label(
+        themed(tk.Label(
             inner_frame,
             text="Nom de la clé",
             font=(FONT_FAMILY, 10, 'bold'),
             bg=self.theme['bg_secondary'],
             fg=self.theme['text_primary']
-        ).pack(anchor='w', pady=(0, 5))
+        ), {'bg': 'bg_secondary', 'fg': 'text_primary'}).pack(anchor='w', pady=(0, 5))
 
-        self.label_entry = tk.Entry(
+        self.label_entry = themed(tk.Entry(
             inner_frame,
             font=(FONT_FAMILY, 10),
             bg=self.theme['input_bg'],
@@ -85,19 +86,19 @@ class ApiKeyFormView:
             relief='solid',
             borderwidth=1,
             insertbackground=self.theme['text_primary']
-        )
+        ), {'bg': 'input_bg', 'fg': 'text_primary', 'insertbackground': 'text_primary'})
         self.label_entry.pack(fill='x', ipady=8, pady=(0, 15))
 
         # Clé API
-        tk.Label(
+        themed(tk.Label(
             inner_frame,
             text="Clé API *",
             font=(FONT_FAMILY, 10, 'bold'),
             bg=self.theme['bg_secondary'],
             fg=self.theme['text_primary']
-        ).pack(anchor='w', pady=(0, 5))
+        ), {'bg': 'bg_secondary', 'fg': 'text_primary'}).pack(anchor='w', pady=(0, 5))
 
-        self.api_key_entry = tk.Entry(
+        self.api_key_entry = themed(tk.Entry(
             inner_frame,
             font=(FONT_FAMILY, 10),
             bg=self.theme['input_bg'],
@@ -105,11 +106,53 @@ class ApiKeyFormView:
             relief='solid',
             borderwidth=1,
             insertbackground=self.theme['text_primary']
-        )
-        self.api_key_entry.pack(fill='x', ipady=8, pady=(0, 20))
+        ), {'bg': 'input_bg', 'fg': 'text_primary', 'insertbackground': 'text_primary'})
+        self.api_key_entry.pack(fill='x', ipady=8, pady=(0, 15))
+
+        # Secret API (nécessaire pour signer les ordres)
+        themed(tk.Label(
+            inner_frame,
+            text="Secret API",
+            font=(FONT_FAMILY, 10, 'bold'),
+            bg=self.theme['bg_secondary'],
+            fg=self.theme['text_primary']
+        ), {'bg': 'bg_secondary', 'fg': 'text_primary'}).pack(anchor='w', pady=(0, 5))
+
+        self.api_secret_entry = themed(tk.Entry(
+            inner_frame,
+            font=(FONT_FAMILY, 10),
+            bg=self.theme['input_bg'],
+            fg=self.theme['text_primary'],
+            relief='solid',
+            borderwidth=1,
+            insertbackground=self.theme['text_primary'],
+            show='•'
+        ), {'bg': 'input_bg', 'fg': 'text_primary', 'insertbackground': 'text_primary'})
+        self.api_secret_entry.pack(fill='x', ipady=8, pady=(0, 15))
+
+        # Passphrase (Coinbase)
+        themed(tk.Label(
+            inner_frame,
+            text="Passphrase",
+            font=(FONT_FAMILY, 10, 'bold'),
+            bg=self.theme['bg_secondary'],
+            fg=self.theme['text_primary']
+        ), {'bg': 'bg_secondary', 'fg': 'text_primary'}).pack(anchor='w', pady=(0, 5))
+
+        self.api_passphrase_entry = themed(tk.Entry(
+            inner_frame,
+            font=(FONT_FAMILY, 10),
+            bg=self.theme['input_bg'],
+            fg=self.theme['text_primary'],
+            relief='solid',
+            borderwidth=1,
+            insertbackground=self.theme['text_primary'],
+            show='•'
+        ), {'bg': 'input_bg', 'fg': 'text_primary', 'insertbackground': 'text_primary'})
+        self.api_passphrase_entry.pack(fill='x', ipady=8, pady=(0, 20))
 
         # Boutons dans le même frame que le formulaire
-        buttons_frame = tk.Frame(form_frame, bg=self.theme['bg_secondary'])
+        buttons_frame = themed(tk.Frame(form_frame, bg=self.theme['bg_secondary']), {'bg': 'bg_secondary'})
         buttons_frame.pack(fill='x', padx=20, pady=(0, 20))
 
         # Bouton Annuler (aligné à droite, packé en dernier)
@@ -152,6 +195,8 @@ class ApiKeyFormView:
         """Enregistre la clé API"""
         exchange_display = self.exchange_var.get().strip()
         api_key = self.api_key_entry.get().strip()
+        api_secret = self.api_secret_entry.get().strip()
+        api_passphrase = self.api_passphrase_entry.get().strip()
         label = self.label_entry.get().strip()
 
         print(f"[DEBUG FORM SAVE] exchange_display={exchange_display}, api_key length={len(api_key)}, label={label}")
@@ -163,12 +208,12 @@ class ApiKeyFormView:
 
         if self.api_key:
             # Modification
-            self._update_api_key(api_key, label)
+            self._update_api_key(api_key, label, api_secret, api_passphrase)
         else:
             # Création
-            self._create_api_key(exchange_display, api_key, label)
+            self._create_api_key(exchange_display, api_key, label, api_secret, api_passphrase)
 
-    def _create_api_key(self, exchange_display, api_key, label):
+    def _create_api_key(self, exchange_display, api_key, label, api_secret='', api_passphrase=''):
         """Crée une nouvelle clé API"""
         # Trouver l'exchange_id
         exchange_id = None
@@ -187,8 +232,9 @@ class ApiKeyFormView:
             self.user_data['id'],
             exchange_id,
             api_key,
-            "",  # Pas de secret, juste la clé
-            label
+            api_secret,
+            label,
+            api_passphrase or None
         )
 
         print(f"[DEBUG FORM _CREATE] success={success}, msg={msg}")
@@ -199,13 +245,17 @@ class ApiKeyFormView:
         else:
             Toast.show(self.container, f"Impossible d'enregistrer la clé: {msg}", 'error')
 
-    def _update_api_key(self, api_key, label):
+    def _update_api_key(self, api_key, label, api_secret='', api_passphrase=''):
         """Met à jour une clé API existante"""
+        # Secret laissé vide : conserver celui déjà enregistré
+        if not api_secret:
+            api_secret = self.api_key.get('api_secret', '') or ''
         success, msg = self.controller.update_api_key(
             self.api_key['api_key_id'],
             api_key,
-            "",  # Pas de secret, juste la clé
-            label
+            api_secret,
+            label,
+            api_passphrase or None
         )
 
         if success:
@@ -2,7 +2,8 @@ import tkinter as tk
 from tkinter import ttk, messagebox
 from src.controllers.bot_controller import BotController
 from src.models.crypto_model import CryptoModel
-from src.components.ui_component import Label, FormField, Separator, Input, Button
+from src.components.ui_component import Label, FormField, Separator, Input, Button, themed
+from src.utils.tracing import get_tracer, CATEGORY_UI
 
 FONT_FAMILY = "Segoe UI"
 
@@ -41,6 +42,7 @@ class BotFormView:
         try:
             self.crypto_model = CryptoModel()
             self.crypto_list = self.crypto_model.get_all_symbols()
+            self.crypto_model.refresh_catalog_in_background()
             
             if not self.crypto_list:
                 print("⚠ Aucune crypto chargée, utilisation d'une liste par défaut")
@@ -63,11 +65,11 @@ class BotFormView:
     
     def _create_header(self):
         """Crée le header avec titre et bouton retour"""
-        header_frame = tk.Frame(self.parent_frame, bg=self.theme['bg_primary'])
+        header_frame = themed(tk.Frame(self.parent_frame, bg=self.theme['bg_primary']), {'bg': 'bg_primary'})
         header_frame.pack(fill='x', pady=(0, 15))
         
         # Bouton retour
-        back_btn = tk.Button(
+        back_btn = themed(tk.Button(
             header_frame,
             text="←",
             font=(FONT_FAMILY, 18, 'bold'),
@@ -76,57 +78,57 @@ class BotFormView:
             relief='flat',
             cursor='hand2',
             command=self.on_back_callback
-        )
+        ), {'bg': 'bg_secondary', 'fg': 'text_primary'})
         back_btn.pack(side='left', padx=(0, 20), ipadx=10, ipady=8)
         
         # Titre avec icône
-        title_frame = tk.Frame(header_frame, bg=self.theme['bg_primary'])
+        title_frame = themed(tk.Frame(header_frame, bg=self.theme['bg_primary']), {'bg': 'bg_primary'})
         title_frame.pack(side='left')
         
-        tk.Label(
+        themed(tk.Label(
             title_frame,
             text="🤖",
             font=(FONT_FAMILY, 24),
             bg=self.theme['bg_primary'],
             fg=self.theme['accent']
-        ).pack(side='left', padx=(0, 10))
+        ), {'bg': 'bg_primary', 'fg': 'accent'}).pack(side='left', padx=(0, 10))
         
-        tk.Label(
+        themed(tk.Label(
             title_frame,
             text="Nouveau bot de trading",
             font=(FONT_FAMILY, 22, 'bold'),
             bg=self.theme['bg_primary'],
             fg=self.theme['text_primary']
-        ).pack(side='left')
+        ), {'bg': 'bg_primary', 'fg': 'text_primary'}).pack(side='left')
         
         # Sous-titre
-        help_text = Label.help_text(
+        help_text = themed(Label.help_text(
             header_frame,
             "Configurez votre stratégie de trading automatisée",
             self.theme,
             bg=self.theme['bg_primary'],
             font=(FONT_FAMILY, 9)
-        )
+        ), {'bg': 'bg_primary'})
         help_text.pack(side='left', padx=(15, 0))
     
     def _create_form_card(self):
         """Crée la carte contenant le formulaire"""
         # Container avec effet de profondeur
-        card_container = tk.Frame(self.parent_frame, bg=self.theme['bg_primary'])
+        card_container = themed(tk.Frame(self.parent_frame, bg=self.theme['bg_primary']), {'bg': 'bg_primary'})
         card_container.pack(fill='both', expand=True)
         
         # Carte principale
-        form_card = tk.Frame(
+        form_card = themed(tk.Frame(
             card_container,
             bg=self.theme['bg_secondary'],
             relief='flat',
             highlightthickness=1,
             highlightbackground=self.theme['border']
-        )
+        ), {'bg': 'bg_secondary', 'highlightbackground': 'border'})
         form_card.pack(fill='both', expand=True, padx=2, pady=2)
         
         # Container avec padding REDUIT
-        form_container = tk.Frame(form_card, bg=self.theme['bg_secondary'])
+        form_container = themed(tk.Frame(form_card, bg=self.theme['bg_secondary']), {'bg': 'bg_secondary'})
         form_container.pack(fill='both', expand=True, padx=40, pady=20)
         
         # Section 1: Configuration de base
@@ -151,11 +153,11 @@ class BotFormView:
     
     def _create_base_config_fields(self, parent):
         """Crée les 3 champs de base sur une seule ligne"""
-        row = tk.Frame(parent, bg=self.theme['bg_secondary'])
+        row = themed(tk.Frame(parent, bg=self.theme['bg_secondary']), {'bg': 'bg_secondary'})
         row.pack(fill='x', pady=(0, 0))
         
         # Colonne 1 - Exchange
-        col1 = tk.Frame(row, bg=self.theme['bg_secondary'])
+        col1 = themed(tk.Frame(row, bg=self.theme['bg_secondary']), {'bg': 'bg_secondary'})
         col1.pack(side='left', fill='both', expand=True, padx=(0, 10))
         
         label1 = Label.field_label(col1, "Exchange", self.theme, icon="🏦")
@@ -181,7 +183,7 @@ class BotFormView:
         self.bot_entries['exchange'].pack(fill='x', ipady=10)
         
         # Colonne 2 - Crypto à acheter
-        col2 = tk.Frame(row, bg=self.theme['bg_secondary'])
+        col2 = themed(tk.Frame(row, bg=self.theme['bg_secondary']), {'bg': 'bg_secondary'})
         col2.pack(side='left', fill='both', expand=True, padx=(10, 10))
         
         label2 = Label.field_label(col2, "Crypto à acheter", self.theme, icon="💰")
@@ -196,12 +198,15 @@ class BotFormView:
         )
         self.bot_entries['crypto_source'].pack(fill='x', ipady=10)
         self.bot_entries['crypto_source'].bind('<<ComboboxSelected>>', self._on_crypto_source_change)
+        self.bot_entries['crypto_source'].bind('<KeyRelease>', lambda e: self._on_crypto_search(e, 'crypto_source'))
         
-        self.price_labels['source'] = Label.help_text(col2, MSG_PRICE_LOADING, self.theme, fg=self.theme['accent'])
+        self.price_labels['source'] = themed(
+            Label.help_text(col2, MSG_PRICE_LOADING, self.theme, fg=self.theme['accent']), {'fg': 'accent'}
+        )
         self.price_labels['source'].pack(anchor='w', pady=(5, 0))
         
         # Colonne 3 - Payer avec
-        col3 = tk.Frame(row, bg=self.theme['bg_secondary'])
+        col3 = themed(tk.Frame(row, bg=self.theme['bg_secondary']), {'bg': 'bg_secondary'})
         col3.pack(side='left', fill='both', expand=True, padx=(10, 0))
         
         label3 = Label.field_label(col3, "Payer avec", self.theme, icon="💵")
@@ -217,17 +222,20 @@ class BotFormView:
         self.bot_entries['crypto_target'].set("USDC")
         self.bot_entries['crypto_target'].pack(fill='x', ipady=10)
         self.bot_entries['crypto_target'].bind('<<ComboboxSelected>>', self._on_crypto_target_change)
+        self.bot_entries['crypto_target'].bind('<KeyRelease>', lambda e: self._on_crypto_search(e, 'crypto_target'))
         
-        self.price_labels['target'] = Label.help_text(col3, MSG_BALANCE_LOADING, self.theme, fg=self.theme['accent'])
+        self.price_labels['target'] = themed(
+            Label.help_text(col3, MSG_BALANCE_LOADING, self.theme, fg=self.theme['accent']), {'fg': 'accent'}
+        )
         self.price_labels['target'].pack(anchor='w', pady=(5, 0))
     
     def _create_strategy_fields(self, parent):
         """Crée les 3 champs de stratégie sur une seule ligne"""
-        row = tk.Frame(parent, bg=self.theme['bg_secondary'])
+        row = themed(tk.Frame(parent, bg=self.theme['bg_secondary']), {'bg': 'bg_secondary'})
         row.pack(fill='x', pady=(0, 0))
         
         # Colonne 1 - Prix d'achat cible
-        col1 = tk.Frame(row, bg=self.theme['bg_secondary'])
+        col1 = themed(tk.Frame(row, bg=self.theme['bg_secondary']), {'bg': 'bg_secondary'})
         col1.pack(side='left', fill='both', expand=True, padx=(0, 10))
         
         field1 = FormField(
@@ -241,7 +249,7 @@ class BotFormView:
         self.bot_entries['prix_achat'] = field1.input
         
         # Colonne 2 - Pourcentage de gain
-        col2 = tk.Frame(row, bg=self.theme['bg_secondary'])
+        col2 = themed(tk.Frame(row, bg=self.theme['bg_secondary']), {'bg': 'bg_secondary'})
         col2.pack(side='left', fill='both', expand=True, padx=(10, 10))
         
         field2 = FormField(
@@ -256,13 +264,14 @@ class BotFormView:
         self.bot_entries['pourcentage_gain'] = field2.input
         
         # Colonne 3 - Montant du trade
-        col3 = tk.Frame(row, bg=self.theme['bg_secondary'])
+        col3 = themed(tk.Frame(row, bg=self.theme['bg_secondary']), {'bg': 'bg_secondary'})
         col3.pack(side='left', fill='both', expand=True, padx=(10, 0))
         
         label3 = Label.field_label(col3, "Montant à investir", self.theme, icon="💎")
         label3.pack(fill='x', pady=(0, 8))
         
-        amount_frame = tk.Frame(col3, bg=self.theme['input_bg'], relief='solid', borderwidth=1)
+        amount_frame = themed(tk.Frame(col3, bg=self.theme['input_bg'], relief='solid', borderwidth=1),
+                              {'bg': 'input_bg'})
         amount_frame.pack(fill='x')
         
         self.bot_entries['montant_trade'] = Input.text(
@@ -275,12 +284,14 @@ class BotFormView:
         self.bot_entries['montant_trade'].insert(0, "100")
         self.bot_entries['montant_trade'].bind('<KeyRelease>', self._validate_amount)
         
-        self.price_labels['quantity'] = Label.help_text(col3, MSG_QUANTITY_LOADING, self.theme, fg=self.theme['accent'])
+        self.price_labels['quantity'] = themed(
+            Label.help_text(col3, MSG_QUANTITY_LOADING, self.theme, fg=self.theme['accent']), {'fg': 'accent'}
+        )
         self.price_labels['quantity'].pack(anchor='w', pady=(5, 0))
     
     def _create_form_footer(self, parent):
         """Crée le footer avec message de statut et boutons"""
-        footer = tk.Frame(parent, bg=self.theme['bg_secondary'])
+        footer = themed(tk.Frame(parent, bg=self.theme['bg_secondary']), {'bg': 'bg_secondary'})
         footer.pack(fill='x', pady=(20, 0))  # Réduit de 30 à 20
         
         # Message de statut
@@ -298,6 +309,21 @@ class BotFormView:
         )
         register_btn.pack(side='right', ipadx=25, ipady=12)
     
+    def _on_crypto_search(self, event, entry_key):
+        """Filtre la liste déroulante selon le texte saisi (préfixe puis approximatif)"""
+        if event.keysym in ('Up', 'Down', 'Return', 'Escape', 'Tab'):
+            return
+        combobox = self.bot_entries[entry_key]
+        query = combobox.get()
+        if not query:
+            combobox['values'] = self.crypto_list
+            return
+        try:
+            combobox['values'] = self.crypto_model.search_symbols(query)
+        except AttributeError:
+            # Liste par défaut (catalogue indisponible)
+            combobox['values'] = [c for c in self.crypto_list if c.startswith(query.upper())]
+    
     def _on_crypto_source_change(self, event=None):
         """Met à jour le prix quand la crypto source change"""
         crypto = self.bot_entries['crypto_source'].get()
@@ -405,6 +431,7 @@ class BotFormView:
         """Enregistre le bot sans l'activer"""
         self.bot_status_label.config(text=MSG_INFO_SAVE_DEV, fg='#FF9800')
     
+    @get_tracer().traced(CATEGORY_UI)
     def register_bot(self):
         """Enregistre le bot et demande si l'activer"""
         crypto_source = self.bot_entries['crypto_source'].get()
@@ -463,21 +490,21 @@ class BotFormView:
         popup.configure(bg=self.theme['bg_primary'])
         
         # Message
-        msg_frame = tk.Frame(popup, bg=self.theme['bg_primary'])
+        msg_frame = themed(tk.Frame(popup, bg=self.theme['bg_primary']), {'bg': 'bg_primary'})
         msg_frame.pack(fill='both', expand=True, padx=20, pady=20)
         
-        msg_label = tk.Label(
+        msg_label = themed(tk.Label(
             msg_frame,
             text="Voulez-vous activer ce bot maintenant ?",
             font=(FONT_FAMILY, 11),
             bg=self.theme['bg_primary'],
             fg=self.theme['text_primary'],
             wraplength=300
-        )
+        ), {'bg': 'bg_primary', 'fg': 'text_primary'})
         msg_label.pack(pady=(0, 20))
         
         # Boutons
-        btn_frame = tk.Frame(msg_frame, bg=self.theme['bg_primary'])
+        btn_frame = themed(tk.Frame(msg_frame, bg=self.theme['bg_primary']), {'bg': 'bg_primary'})
         btn_frame.pack(fill='x')
         
         def activate():
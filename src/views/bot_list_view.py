@@ -1,31 +1,75 @@
 import tkinter as tk
+from collections import deque
+from src.controllers.bot_controller import BotController
+from src.components.ui_component import themed
+from src.components.virtual_list import VirtualList
+from src.services.bot_engine import (
+    get_bot_engine, STATE_LABELS, STATE_INACTIVE, STATE_BUYING, STATE_HOLDING, STATE_SELLING
+)
+
+FONT_FAMILY = "Segoe UI"
+
+# Constantes - Mises à jour en direct
+UPDATE_INTERVAL_MS = 100
+
+COLOR_POSITIVE = '#4CAF50'
+COLOR_NEGATIVE = '#F44336'
+COLOR_WARNING = '#FF9800'
+
+
+def _format_price(value):
+    return "—" if value is None else f"{value:,.8g}"
+
+
+def _format_pnl(value):
+    return "—" if not value else f"{value:+,.2f}"
+
+
+def _pnl_color(value):
+    if not value:
+        return None
+    return COLOR_POSITIVE if value > 0 else COLOR_NEGATIVE
+
 
 class BotListView:
     """Vue de la liste des bots"""
-    
-    def __init__(self, parent_frame, theme, on_add_bot_callback):
+
+    def __init__(self, parent_frame, theme, on_add_bot_callback, user_data=None):
         self.parent_frame = parent_frame
         self.theme = theme
         self.on_add_bot_callback = on_add_bot_callback
-        self.FONT_FAMILY = "Segoe UI"
-        
+        self.user_data = user_data or {}
+        self.FONT_FAMILY = FONT_FAMILY
+
+        self.controller = BotController()
+        self.engine = None
+        self.bot_list = None
+
+        # Changements reçus du thread du moteur, fusionnés par bot avant affichage
+        self._pending = deque()
+        self._after_id = None
+
         self.render()
-    
+
     def render(self):
         """Affiche la liste des bots"""
+        self.container = themed(tk.Frame(self.parent_frame, bg=self.theme['bg_primary']), {'bg': 'bg_primary'})
+        self.container.pack(fill='both', expand=True)
+        self.container.bind('<Destroy>', self._on_destroy)
+
         # Titre avec bouton ajouter
-        header_frame = tk.Frame(self.parent_frame, bg=self.theme['bg_primary'])
+        header_frame = themed(tk.Frame(self.container, bg=self.theme['bg_primary']), {'bg': 'bg_primary'})
         header_frame.pack(fill='x', pady=(0, 20))
-        
-        tk.Label(
+
+        themed(tk.Label(
             header_frame,
             text="Mes bots de trading",
             font=(self.FONT_FAMILY, 20, 'bold'),
             bg=self.theme['bg_primary'],
             fg=self.theme['text_primary']
-        ).pack(side='left')
-        
-        tk.Button(
+        ), {'bg': 'bg_primary', 'fg': 'text_primary'}).pack(side='left')
+
+        themed(tk.Button(
             header_frame,
             text="➕ Ajouter un bot",
             font=(self.FONT_FAMILY, 10, 'bold'),
@@ -35,18 +79,164 @@ class BotListView:
             relief='flat',
             cursor='hand2',
             command=self.on_add_bot_callback
-        ).pack(side='right', ipadx=20, ipady=10)
-        
+        ), {'bg': 'accent', 'fg': 'button_text', 'activebackground': 'accent'}).pack(side='right', ipadx=20, ipady=10)
+
         # Zone pour afficher les bots
-        bots_list_frame = tk.Frame(self.parent_frame, bg=self.theme['bg_primary'])
-        bots_list_frame.pack(fill='both', expand=True)
-        
-        # Message temporaire (à remplacer par la liste réelle des bots)
-        tk.Label(
-            bots_list_frame,
-            text="Aucun bot configuré.\nCliquez sur 'Ajouter un bot' pour commencer.",
-            font=(self.FONT_FAMILY, 11),
-            bg=self.theme['bg_primary'],
-            fg=self.theme['text_secondary'],
-            justify='center'
-        ).pack(expand=True)
\ No newline at end of file
+        self.bots_list_frame = themed(tk.Frame(self.container, bg=self.theme['bg_primary']), {'bg': 'bg_primary'})
+        self.bots_list_frame.pack(fill='both', expand=True)
+
+        self._render_bots(self.controller.get_user_bots(self.user_data.get('id')))
+
+    def _render_bots(self, bots):
+        """Affiche la liste virtualisée des bots (ou le message si aucun bot)"""
+        self._stop_updates()
+        for widget in self.bots_list_frame.winfo_children():
+            widget.destroy()
+        self.bot_list = None
+
+        if not bots:
+            themed(tk.Label(
+                self.bots_list_frame,
+                text="Aucun bot configuré.\nCliquez sur 'Ajouter un bot' pour commencer.",
+                font=(self.FONT_FAMILY, 11),
+                bg=self.theme['bg_primary'],
+                fg=self.theme['text_secondary'],
+                justify='center'
+            ), {'bg': 'bg_primary', 'fg': 'text_secondary'}).pack(expand=True)
+            return
+
+        self.bot_list = VirtualList(
+            self.bots_list_frame,
+            self.theme,
+            columns=[
+                {'key': 'pair', 'title': "Paire", 'weight': 2},
+                {'key': 'exchange', 'title': "Exchange", 'weight': 2},
+                {'key': 'state', 'title': "Statut", 'weight': 2,
+                 'format': lambda state: STATE_LABELS.get(state, state),
+                 'color': self._state_color},
+                {'key': 'last_price', 'title': "Dernier prix", 'weight': 2, 'anchor': 'e',
+                 'format': _format_price},
+                {'key': 'unrealized_pnl', 'title': "PnL latent", 'weight': 2, 'anchor': 'e',
+                 'format': _format_pnl, 'color': lambda row: _pnl_color(row.get('unrealized_pnl'))},
+                {'key': 'amount', 'title': "Montant", 'weight': 2, 'anchor': 'e'},
+                {'key': 'gain', 'title': "Gain visé", 'weight': 1, 'anchor': 'e'},
+                {'key': 'is_active', 'title': "", 'weight': 2, 'anchor': 'center',
+                 'format': lambda active: "⏸ Pause" if active else "▶ Activer",
+                 'color': lambda row: self.theme['accent']}
+            ],
+            on_click=self._on_row_click
+        )
+        self.bot_list.pack(fill='both', expand=True)
+        self._sync_rows(bots)
+        self._start_updates()
+
+    def _sync_rows(self, bots):
+        """Synchronise le moteur puis les lignes (seules les cellules modifiées sont redessinées)"""
+        # Moteur partagé du compte, relu à chaque synchronisation (remplacé si le démon s'arrête)
+        self.engine = get_bot_engine(self.user_data.get('id'))
+        self.engine.load(bots)
+        states = self.engine.get_states()
+
+        rows = []
+        for bot in bots:
+            row = self.controller.format_bot_for_display(bot)
+            row.update(self._state_fields(states.get(bot['bot_id'], {})))
+            rows.append(row)
+        self.bot_list.set_rows(rows, key='id')
+
+    def _state_fields(self, state):
+        return {
+            'state': state.get('state', STATE_INACTIVE),
+            'is_active': state.get('is_active', False),
+            'last_price': state.get('last_price'),
+            'unrealized_pnl': state.get('unrealized_pnl')
+        }
+
+    def _state_color(self, row):
+        state = row.get('state')
+        if state == STATE_INACTIVE:
+            return self.theme['text_secondary']
+        if state == STATE_HOLDING:
+            return COLOR_POSITIVE
+        if state in (STATE_BUYING, STATE_SELLING):
+            return COLOR_WARNING
+        return None
+
+    # ============================================
+    # MISES À JOUR EN DIRECT
+    # ============================================
+
+    def _on_engine_change(self, bot_id, changes):
+        """Appelé depuis le thread du moteur : simple mise en file"""
+        self._pending.append((bot_id, changes))
+
+    def _start_updates(self):
+        if self._after_id is None:
+            self.engine.add_listener(self._on_engine_change)
+            self._schedule_updates()
+
+    def _stop_updates(self):
+        if self._after_id is not None:
+            try:
+                self.container.after_cancel(self._after_id)
+            except tk.TclError:
+                pass
+            self._after_id = None
+        if self.engine is not None:
+            # Le moteur courant a hérité de l'écouteur si le précédent a été remplacé
+            self.engine = get_bot_engine(self.user_data.get('id'))
+            self.engine.remove_listener(self._on_engine_change)
+        self._pending.clear()
+
+    def _schedule_updates(self):
+        self._after_id = self.container.after(UPDATE_INTERVAL_MS, self._apply_updates)
+
+    def _apply_updates(self):
+        """Fusionne les changements reçus par bot puis met à jour les lignes concernées"""
+        merged = {}
+        pending = self._pending
+        while pending:
+            bot_id, changes = pending.popleft()
+            merged.setdefault(bot_id, {}).update(changes)
+
+        for bot_id, changes in merged.items():
+            self.bot_list.update_row(bot_id, changes)
+
+        self._schedule_updates()
+
+    def _on_row_click(self, bot_id, column_key):
+        if column_key != 'is_active':
+            return
+        is_active = not self.bot_list.rows[bot_id].get('is_active')
+        result = self.controller.toggle_bot(bot_id, is_active)
+        if result['success']:
+            # Le moteur notifie le changement d'état (affiché par _apply_updates)
+            self.engine = get_bot_engine(self.user_data.get('id'))
+            self.engine.set_active(bot_id, is_active)
+
+    # ============================================
+    # CYCLE DE VIE (cache de vues)
+    # ============================================
+
+    def on_hide(self):
+        """Vue masquée : plus d'écoute du moteur"""
+        self._stop_updates()
+
+    def on_show(self):
+        """Vue réaffichée : recharge les bots (ajouts/suppressions) et reprend l'écoute"""
+        bots = self.controller.get_user_bots(self.user_data.get('id'))
+        if not bots or self.bot_list is None:
+            self._render_bots(bots)
+            return
+        self._sync_rows(bots)
+        self._start_updates()
+
+    def apply_theme(self, theme):
+        """Changement de thème : recolore les items du Canvas de la liste"""
+        if self.bot_list is not None:
+            self.bot_list.apply_theme(theme)
+
+    def _on_destroy(self, event):
+        if event.widget is not self.container:
+            return
+        self._stop_updates()
@@ -1,31 +1,305 @@
+import time
 import tkinter as tk
+from collections import deque
+from src.components.ui_component import Card, themed
+from src.components.chart_component import Sparkline
+from src.controllers.dashboard_controller import DashboardController
+
+FONT_FAMILY = "Segoe UI"
+
+# Constantes - Boucle d'affichage
+FRAME_INTERVAL_MS = 16          # ~60 images/s
+FRAME_BUDGET_S = 0.008          # temps de tracé maximum par image
+MAX_TICKS_PER_FRAME = 5000
+SUMMARY_INTERVAL_S = 5.0
+
+# Constantes - Grille des sparklines
+SPARKLINE_COLUMNS = 4
+SPARKLINE_WIDTH = 210
+SPARKLINE_HEIGHT = 56
+
+# Constantes - Messages de log
+LOG_SUMMARY_ERROR = "✗ Erreur résumé du tableau de bord: {error}"
+LOG_FEED_ERROR = "✗ Erreur flux de prix du tableau de bord: {error}"
+
+STATS = [
+    ('portfolio', "Valeur du portefeuille"),
+    ('bots', "Bots actifs"),
+    ('orders', "Ordres ouverts")
+]
+
 
 class DashboardView:
-    """Vue du tableau de bord"""
-    
-    def __init__(self, parent_frame, theme):
+    """Vue du tableau de bord (résumé du compte et prix en temps réel)"""
+
+    def __init__(self, parent_frame, theme, user_data=None):
         self.parent_frame = parent_frame
         self.theme = theme
-        self.FONT_FAMILY = "Segoe UI"
-        
+        self.user_data = user_data or {}
+        self.FONT_FAMILY = FONT_FAMILY
+
+        self.controller = DashboardController(self.user_data.get('id'))
+        self.summary = None
+        self.prices = {}                # {product_id: dernier prix}
+        self.sparklines = {}            # {product_id: Sparkline}
+        self.stat_labels = {}
+        self._stat_texts = {}
+
+        # Ticks reçus du thread de l'agrégateur, consommés par la boucle Tk
+        self._ticks = deque()
+        self._redraw_queue = deque()
+        self._aggregator = None
+        self._after_id = None
+        self._last_summary = 0.0
+        self._summary_future = None
+        self._feed_future = None
+
         self.render()
-    
+        self._start_feed()
+
     def render(self):
         """Affiche le tableau de bord"""
-        tk.Label(
-            self.parent_frame,
+        self.container = themed(tk.Frame(self.parent_frame, bg=self.theme['bg_primary']), {'bg': 'bg_primary'})
+        self.container.pack(fill='both', expand=True)
+        self.container.bind('<Destroy>', self._on_destroy)
+
+        themed(tk.Label(
+            self.container,
             text="Tableau de bord",
             font=(self.FONT_FAMILY, 20, 'bold'),
             bg=self.theme['bg_primary'],
             fg=self.theme['text_primary']
-        ).pack(anchor='w', pady=(0, 20))
-        
-        # Contenu du dashboard à implémenter
-        tk.Label(
-            self.parent_frame,
-            text="Bienvenue sur CoinTrader !\n\nVotre tableau de bord sera bientôt disponible.",
-            font=(self.FONT_FAMILY, 11),
+        ), {'bg': 'bg_primary', 'fg': 'text_primary'}).pack(anchor='w', pady=(0, 20))
+
+        # Indicateurs du compte
+        stats_frame = themed(tk.Frame(self.container, bg=self.theme['bg_primary']), {'bg': 'bg_primary'})
+        stats_frame.pack(fill='x', pady=(0, 20))
+
+        for idx, (key, title) in enumerate(STATS):
+            card = Card(stats_frame, self.theme)
+            card.grid(row=0, column=idx, padx=(0 if idx == 0 else 10, 0), sticky='nsew')
+            stats_frame.grid_columnconfigure(idx, weight=1)
+
+            themed(tk.Label(
+                card.frame,
+                text=title,
+                font=(self.FONT_FAMILY, 9),
+                bg=self.theme['bg_secondary'],
+                fg=self.theme['text_secondary']
+            ), {'bg': 'bg_secondary', 'fg': 'text_secondary'}).pack(anchor='w', padx=16, pady=(14, 2))
+
+            value_label = themed(tk.Label(
+                card.frame,
+                text="—",
+                font=(self.FONT_FAMILY, 18, 'bold'),
+                bg=self.theme['bg_secondary'],
+                fg=self.theme['text_primary']
+            ), {'bg': 'bg_secondary', 'fg': 'text_primary'})
+            value_label.pack(anchor='w', padx=16, pady=(0, 14))
+            self.stat_labels[key] = value_label
+
+        themed(tk.Label(
+            self.container,
+            text="Marchés",
+            font=(self.FONT_FAMILY, 12, 'bold'),
             bg=self.theme['bg_primary'],
-            fg=self.theme['text_secondary'],
-            justify='center'
-        ).pack(expand=True)
\ No newline at end of file
+            fg=self.theme['text_primary']
+        ), {'bg': 'bg_primary', 'fg': 'text_primary'}).pack(anchor='w', pady=(0, 10))
+
+        # Grille de sparklines avec scrollbar conditionnelle
+        charts_container = themed(tk.Frame(self.container, bg=self.theme['bg_primary']), {'bg': 'bg_primary'})
+        charts_container.pack(fill='both', expand=True)
+
+        canvas = themed(tk.Canvas(charts_container, bg=self.theme['bg_primary'], highlightthickness=0),
+                        {'bg': 'bg_primary'})
+        scrollbar = tk.Scrollbar(charts_container, orient='vertical', command=canvas.yview)
+        self.charts_frame = themed(tk.Frame(canvas, bg=self.theme['bg_primary']), {'bg': 'bg_primary'})
+        canvas.create_window((0, 0), window=self.charts_frame, anchor='nw')
+
+        def _on_frame_configure(_e):
+            canvas.configure(scrollregion=canvas.bbox('all'))
+
+        def _on_yscroll(first, last):
+            if float(first) <= 0.0 and float(last) >= 1.0:
+                scrollbar.pack_forget()
+            else:
+                scrollbar.pack(side='right', fill='y', before=canvas)
+            scrollbar.set(first, last)
+
+        self.charts_frame.bind('<Configure>', _on_frame_configure)
+        canvas.configure(yscrollcommand=_on_yscroll)
+        canvas.pack(side='left', fill='both', expand=True)
+        canvas.bind('<MouseWheel>', lambda e: canvas.yview_scroll(int(-1 * (e.delta / 120)), 'units'))
+
+        # Sparklines créées à l'arrivée du premier résumé (produits des bots et positions)
+        self._refresh_summary()
+
+    def _build_sparklines(self, product_ids):
+        """Crée une sparkline par produit suivi (une seule fois)"""
+        for idx, product_id in enumerate(product_ids):
+            sparkline = Sparkline(
+                self.charts_frame, self.theme, title=product_id,
+                width=SPARKLINE_WIDTH, height=SPARKLINE_HEIGHT
+            )
+            sparkline.grid(row=idx // SPARKLINE_COLUMNS, column=idx % SPARKLINE_COLUMNS, padx=(0, 8), pady=(0, 8))
+            self.sparklines[product_id] = sparkline
+
+    # ============================================
+    # DONNÉES
+    # ============================================
+
+    def _start_feed(self):
+        """Démarre l'agrégateur de prix (thread) et la boucle d'affichage (after)"""
+        self._start_aggregator()
+        self._schedule_frame()
+
+    def _start_aggregator(self):
+        """Demande l'agrégateur : les exchanges du compte sont lus hors de la boucle Tk"""
+        if self.sparklines and self._aggregator is None and self._feed_future is None:
+            self._feed_future = self.controller.request_price_feed(list(self.sparklines))
+
+    def _poll_feed(self):
+        """Démarre l'agrégateur demandé s'il est prêt (appelé à chaque image)"""
+        future = self._feed_future
+        if future is None or not future.done():
+            return
+        self._feed_future = None
+        try:
+            self._aggregator = future.result()
+        except Exception as e:
+            print(LOG_FEED_ERROR.format(error=e))
+            return
+        self._aggregator.add_listener(self._on_tick)
+        self._aggregator.start()
+
+    def _on_tick(self, product_id, exchange, bid, ask):
+        """Appelé depuis le thread de l'agrégateur : simple mise en file"""
+        if bid and ask:
+            self._ticks.append((product_id, (bid + ask) / 2))
+        elif bid or ask:
+            self._ticks.append((product_id, bid or ask))
+
+    def _refresh_summary(self):
+        """Demande un résumé à jour : les requêtes SQL ne bloquent pas la boucle Tk"""
+        if self._summary_future is None:
+            self._summary_future = self.controller.request_summary()
+        self._last_summary = time.monotonic()
+
+    def _poll_summary(self):
+        """Affiche le résumé demandé s'il est arrivé (appelé à chaque image)"""
+        future = self._summary_future
+        if future is None or not future.done():
+            return
+        self._summary_future = None
+        try:
+            summary = future.result()
+        except Exception as e:
+            print(LOG_SUMMARY_ERROR.format(error=e))
+            return
+
+        first = self.summary is None
+        self.summary = summary
+        self._set_stat('bots', f"{summary['bots_active']} / {summary['bots_total']}")
+        self._set_stat('orders', str(summary['open_orders']))
+        self._update_portfolio()
+        if first:
+            self._build_sparklines(self.controller.get_watched_products(summary))
+            if self._after_id is not None:
+                self._start_aggregator()
+
+    def _update_portfolio(self):
+        if self.summary is None:
+            return
+        value, cost = DashboardController.portfolio_value(self.summary['positions'], self.prices)
+        if not self.summary['positions']:
+            self._set_stat('portfolio', "0.00 $")
+        elif cost:
+            self._set_stat('portfolio', f"{value:,.2f} $ ({(value - cost) / abs(cost) * 100:+.2f} %)")
+        else:
+            self._set_stat('portfolio', f"{value:,.2f} $")
+
+    def _set_stat(self, key, text):
+        """Met à jour un indicateur seulement si son texte change"""
+        if self._stat_texts.get(key) != text:
+            self.stat_labels[key].config(text=text)
+            self._stat_texts[key] = text
+
+    # ============================================
+    # BOUCLE D'AFFICHAGE
+    # ============================================
+
+    def _schedule_frame(self):
+        self._after_id = self.container.after(FRAME_INTERVAL_MS, self._frame)
+
+    def _frame(self):
+        """
+        Une image : intègre les ticks reçus puis redessine les sparklines modifiées
+
+        Le tracé est borné par FRAME_BUDGET_S ; les sparklines restantes sont
+        redessinées aux images suivantes (file circulaire), ce qui garde la
+        boucle Tk réactive quel que soit le débit de ticks.
+        """
+        start = time.perf_counter()
+
+        ticks = self._ticks
+        prices_changed = False
+        for _ in range(min(len(ticks), MAX_TICKS_PER_FRAME)):
+            product_id, price = ticks.popleft()
+            sparkline = self.sparklines.get(product_id)
+            if sparkline is None:
+                continue
+            if not sparkline.dirty:
+                self._redraw_queue.append(sparkline)
+            sparkline.push(price)
+            self.prices[product_id] = price
+            prices_changed = True
+
+        queue = self._redraw_queue
+        while queue and time.perf_counter() - start < FRAME_BUDGET_S:
+            queue.popleft().redraw()
+
+        self._poll_feed()
+        self._poll_summary()
+        if time.monotonic() - self._last_summary >= SUMMARY_INTERVAL_S:
+            self._refresh_summary()
+        elif prices_changed:
+            self._update_portfolio()
+
+        self._schedule_frame()
+
+    # ============================================
+    # CYCLE DE VIE (cache de vues)
+    # ============================================
+
+    def _stop_feed(self):
+        if self._after_id is not None:
+            try:
+                self.container.after_cancel(self._after_id)
+            except tk.TclError:
+                pass
+            self._after_id = None
+        if self._aggregator is not None:
+            self._aggregator.stop(wait=False)
+            self._aggregator = None
+        # Agrégateur encore en préparation : jamais démarré, abandonné
+        self._feed_future = None
+        self._ticks.clear()
+
+    def on_hide(self):
+        """Vue masquée : arrêt de l'agrégateur et de la boucle d'affichage"""
+        self._stop_feed()
+
+    def on_show(self):
+        """Vue réaffichée : résumé à jour puis reprise du flux de prix"""
+        self._refresh_summary()
+        self._start_feed()
+
+    def apply_theme(self, theme):
+        """Changement de thème : recolore les items du Canvas des sparklines"""
+        for sparkline in self.sparklines.values():
+            sparkline.apply_theme(theme)
+
+    def _on_destroy(self, event):
+        if event.widget is not self.container:
+            return
+        self._stop_feed()
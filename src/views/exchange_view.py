@@ -1,7 +1,7 @@
 import tkinter as tk
 from tkinter import messagebox
 from src.controllers.exchange_controller import ExchangeController
-from src.components.ui_component import Label, FormField, Button, Card, Toast
+from src.components.ui_component import Label, FormField, Button, Card, Toast, themed
 
 FONT_FAMILY = "Segoe UI"
 
@@ -15,8 +15,9 @@ class ExchangeView:
         self.controller = ExchangeController(account_id=user_data['id'])
         self.current_view = 'list'  # 'list' ou 'form'
         self.editing_exchange = None
+        self._exchanges = None
         
-        self.container = tk.Frame(self.parent_frame, bg=self.theme['bg_primary'])
+        self.container = themed(tk.Frame(self.parent_frame, bg=self.theme['bg_primary']), {'bg': 'bg_primary'})
         self.container.pack(fill='both', expand=True)
         
         self.show_list_view()
@@ -31,20 +32,20 @@ class ExchangeView:
             widget.destroy()
         
         # Header avec titre et bouton ajouter
-        header_frame = tk.Frame(self.container, bg=self.theme['bg_primary'])
+        header_frame = themed(tk.Frame(self.container, bg=self.theme['bg_primary']), {'bg': 'bg_primary'})
         header_frame.pack(fill='x', pady=(0, 20))
         
         # Titre
-        tk.Label(
+        themed(tk.Label(
             header_frame,
             text="Mes plateformes",
             font=(FONT_FAMILY, 20, 'bold'),
             bg=self.theme['bg_primary'],
             fg=self.theme['text_primary']
-        ).pack(side='left')
+        ), {'bg': 'bg_primary', 'fg': 'text_primary'}).pack(side='left')
 
         # Bouton ajouter (style identique aux bots)
-        tk.Button(
+        themed(tk.Button(
             header_frame,
             text="➕ Ajouter une plateforme",
             font=(FONT_FAMILY, 10, 'bold'),
@@ -54,33 +55,35 @@ class ExchangeView:
             relief='flat',
             cursor='hand2',
             command=self.show_add_form
-        ).pack(side='right', ipadx=20, ipady=10)
+        ), {'bg': 'accent', 'fg': 'button_text', 'activebackground': 'accent'}).pack(side='right', ipadx=20, ipady=10)
         
         # Liste des exchanges
         self._display_exchanges_list()
     
     def _display_exchanges_list(self):
         """Affiche la liste des exchanges sous forme de cartes"""
-        list_container = tk.Frame(self.container, bg=self.theme['bg_primary'])
+        list_container = themed(tk.Frame(self.container, bg=self.theme['bg_primary']), {'bg': 'bg_primary'})
         list_container.pack(fill='both', expand=True)
 
         exchanges = self.controller.list_exchanges()
+        self._exchanges = exchanges
 
         if not exchanges:
-            tk.Label(
+            themed(tk.Label(
                 list_container,
                 text="Aucune plateforme configurée.\nCliquez sur 'Ajouter une plateforme' pour commencer.",
                 font=(FONT_FAMILY, 11),
                 bg=self.theme['bg_primary'],
                 fg=self.theme['text_secondary'],
                 justify='center'
-            ).pack(expand=True)
+            ), {'bg': 'bg_primary', 'fg': 'text_secondary'}).pack(expand=True)
             return
 
         # Canvas avec scrollbar conditionnelle
-        canvas = tk.Canvas(list_container, bg=self.theme['bg_primary'], highlightthickness=0)
+        canvas = themed(tk.Canvas(list_container, bg=self.theme['bg_primary'], highlightthickness=0),
+                        {'bg': 'bg_primary'})
         scrollbar = tk.Scrollbar(list_container, orient='vertical', command=canvas.yview)
-        scrollable_frame = tk.Frame(canvas, bg=self.theme['bg_primary'])
+        scrollable_frame = themed(tk.Frame(canvas, bg=self.theme['bg_primary']), {'bg': 'bg_primary'})
         win_id = canvas.create_window((0, 0), window=scrollable_frame, anchor='nw')
 
         def _on_frame_configure(_e):
@@ -111,62 +114,67 @@ class ExchangeView:
         canvas.pack(side='left', fill='both', expand=True)
         canvas.bind('<MouseWheel>', lambda e: canvas.yview_scroll(int(-1 * (e.delta / 120)), 'units'))
     
+    def on_show(self):
+        """Vue réaffichée depuis le cache : la liste n'est reconstruite que si les exchanges ont changé"""
+        if self.current_view == 'list' and self.controller.list_exchanges() != self._exchanges:
+            self.show_list_view()
+    
     def _create_exchange_card(self, parent, exchange):
         """Crée une carte pour un exchange (affichage simple)"""
         card = Card(parent, self.theme)
 
         # Padding interne
-        inner_frame = tk.Frame(card.frame, bg=self.theme['bg_secondary'])
+        inner_frame = themed(tk.Frame(card.frame, bg=self.theme['bg_secondary']), {'bg': 'bg_secondary'})
         inner_frame.pack(fill='both', expand=True, padx=25, pady=25)
         
         # Logo centré
         logo = exchange.get('logo', '💱')
-        logo_label = tk.Label(
+        logo_label = themed(tk.Label(
             inner_frame,
             text=logo,
             font=(FONT_FAMILY, 48),
             bg=self.theme['bg_secondary']
-        )
+        ), {'bg': 'bg_secondary'})
         logo_label.pack(pady=(0, 15))
         
         # Nom de l'exchange centré
-        name_label = tk.Label(
+        name_label = themed(tk.Label(
             inner_frame,
             text=exchange.get('display_name', exchange.get('name', 'Sans nom')),
             font=(FONT_FAMILY, 14, 'bold'),
             bg=self.theme['bg_secondary'],
             fg=self.theme['text_primary']
-        )
+        ), {'bg': 'bg_secondary', 'fg': 'text_primary'})
         name_label.pack(pady=(0, 5))
         
         # ID technique (plus petit)
-        tk.Label(
+        themed(tk.Label(
             inner_frame,
             text=exchange.get('name', ''),
             font=(FONT_FAMILY, 8),
             bg=self.theme['bg_secondary'],
             fg=self.theme['text_secondary']
-        ).pack(pady=(0, 15))
+        ), {'bg': 'bg_secondary', 'fg': 'text_secondary'}).pack(pady=(0, 15))
         
         # Séparateur
-        separator = tk.Frame(inner_frame, bg=self.theme['border'], height=1)
+        separator = themed(tk.Frame(inner_frame, bg=self.theme['border'], height=1), {'bg': 'border'})
         separator.pack(fill='x', pady=(0, 15))
         
         # URL endpoint (si disponible)
         endpoint = exchange.get('endpoint_url', '')
         if endpoint:
             # Frame pour l'icône et l'URL
-            endpoint_frame = tk.Frame(inner_frame, bg=self.theme['bg_secondary'])
+            endpoint_frame = themed(tk.Frame(inner_frame, bg=self.theme['bg_secondary']), {'bg': 'bg_secondary'})
             endpoint_frame.pack(fill='x', pady=(0, 15))
             
-            tk.Label(
+            themed(tk.Label(
                 endpoint_frame,
                 text="🌐",
                 font=(FONT_FAMILY, 12),
                 bg=self.theme['bg_secondary']
-            ).pack(side='left', padx=(0, 5))
+            ), {'bg': 'bg_secondary'}).pack(side='left', padx=(0, 5))
             
-            tk.Label(
+            themed(tk.Label(
                 endpoint_frame,
                 text=endpoint,
                 font=(FONT_FAMILY, 8),
@@ -174,14 +182,14 @@ class ExchangeView:
                 fg=self.theme['text_secondary'],
                 anchor='w',
                 wraplength=200
-            ).pack(side='left', fill='x', expand=True)
+            ), {'bg': 'bg_secondary', 'fg': 'text_secondary'}).pack(side='left', fill='x', expand=True)
         
         # Boutons d'action
-        buttons_frame = tk.Frame(inner_frame, bg=self.theme['bg_secondary'])
+        buttons_frame = themed(tk.Frame(inner_frame, bg=self.theme['bg_secondary']), {'bg': 'bg_secondary'})
         buttons_frame.pack(fill='x', side='bottom')
         
         # Bouton Modifier
-        edit_btn = tk.Button(
+        edit_btn = themed(tk.Button(
             buttons_frame,
             text="✏️",
             font=(FONT_FAMILY, 14),
@@ -192,11 +200,11 @@ class ExchangeView:
             cursor='hand2',
             command=lambda: self.show_edit_form(exchange),
             width=3
-        )
+        ), {'bg': 'bg_secondary', 'fg': 'accent', 'activebackground': 'bg_primary'})
         edit_btn.pack(side='left', expand=True, fill='x')
         
         # Bouton Supprimer
-        delete_btn = tk.Button(
+        delete_btn = themed(tk.Button(
             buttons_frame,
             text="🗑️",
             font=(FONT_FAMILY, 14),
@@ -207,7 +215,7 @@ class ExchangeView:
             cursor='hand2',
             command=lambda: self._delete_exchange(exchange),
             width=3
-        )
+        ), {'bg': 'bg_secondary', 'activebackground': 'bg_primary'})
         delete_btn.pack(side='right', expand=True, fill='x')
         
         return card
@@ -231,11 +239,11 @@ class ExchangeView:
             widget.destroy()
         
         # Header avec bouton retour
-        header_frame = tk.Frame(self.container, bg=self.theme['bg_primary'])
+        header_frame = themed(tk.Frame(self.container, bg=self.theme['bg_primary']), {'bg': 'bg_primary'})
         header_frame.pack(fill='x', pady=(0, 15))
         
         # Bouton retour
-        back_btn = tk.Button(
+        back_btn = themed(tk.Button(
             header_frame,
             text="←",
             font=(FONT_FAMILY, 18, 'bold'),
@@ -244,31 +252,31 @@ class ExchangeView:
             relief='flat',
             cursor='hand2',
             command=self.show_list_view
-        )
+        ), {'bg': 'bg_secondary', 'fg': 'text_primary'})
         back_btn.pack(side='left', padx=(0, 20), ipadx=10, ipady=8)
         
         # Titre
         title_text = "Modifier la plateforme" if self.editing_exchange else "Nouvelle plateforme"
-        tk.Label(
+        themed(tk.Label(
             header_frame,
             text=title_text,
             font=(FONT_FAMILY, 22, 'bold'),
             bg=self.theme['bg_primary'],
             fg=self.theme['text_primary']
-        ).pack(side='left')
+        ), {'bg': 'bg_primary', 'fg': 'text_primary'}).pack(side='left')
         
         # Formulaire
-        form_card = tk.Frame(
+        form_card = themed(tk.Frame(
             self.container,
             bg=self.theme['bg_secondary'],
             relief='flat',
             highlightthickness=1,
             highlightbackground=self.theme['border']
-        )
+        ), {'bg': 'bg_secondary', 'highlightbackground': 'border'})
         form_card.pack(fill='both', expand=True, padx=2, pady=2)
         
         # Container avec padding
-        form_container = tk.Frame(form_card, bg=self.theme['bg_secondary'])
+        form_container = themed(tk.Frame(form_card, bg=self.theme['bg_secondary']), {'bg': 'bg_secondary'})
         form_container.pack(fill='both', expand=True, padx=40, pady=30)
         
         # Champs du formulaire
@@ -318,7 +326,7 @@ class ExchangeView:
         self.form_status_label.pack(fill='x', pady=(0, 10))
         
         # Boutons
-        buttons_frame = tk.Frame(form_container, bg=self.theme['bg_secondary'])
+        buttons_frame = themed(tk.Frame(form_container, bg=self.theme['bg_secondary']), {'bg': 'bg_secondary'})
         buttons_frame.pack(fill='x')
         
         # Bouton Enregistrer
@@ -1,6 +1,10 @@
 import tkinter as tk
 from tkinter import ttk
+from src.components.ui_component import themed
 from src.models.database_model import DatabaseModel
+from src.services.archive_service import ArchiveService
+from src.services.async_runtime import get_async_runtime
+from src.services.export_service import ExportProgress, ExportService, FORMAT_CSV, FORMAT_PARQUET
 
 FONT_FAMILY = "Segoe UI"
 
@@ -19,7 +23,16 @@ ACTION_LABELS = {
     "SECURITY_UPDATE": "Sécurité",
 }
 
+EXPORTS = [
+    ("Exporter l'activité", "activity_logs"),
+    ("Exporter les ordres", "orders"),
+]
+
+EXPORT_FORMATS = {"CSV": FORMAT_CSV, "Parquet": FORMAT_PARQUET}
+
 _TREE_STYLE = "History.Treeview"
+HISTORY_LIMIT = 1000
+EXPORT_POLL_MS = 200
 
 
 class HistoryView:
@@ -30,22 +43,25 @@ class HistoryView:
         self.theme = theme
         self.user_data = user_data
         self.db = DatabaseModel()
+        self.archive = ArchiveService(self.db)
         self.active_filter = None
+        self._rows = None
+        self._export = None            # (future, ExportProgress) de l'export en cours
 
         self._build()
 
     def _build(self):
         # Titre
-        tk.Label(
+        themed(tk.Label(
             self.parent_frame,
             text="Historique d'activité",
             font=(FONT_FAMILY, 20, 'bold'),
             bg=self.theme['bg_primary'],
             fg=self.theme['text_primary']
-        ).pack(anchor='w', pady=(0, 16))
+        ), {'bg': 'bg_primary', 'fg': 'text_primary'}).pack(anchor='w', pady=(0, 16))
 
         # Barre de filtres
-        filter_bar = tk.Frame(self.parent_frame, bg=self.theme['bg_primary'])
+        filter_bar = themed(tk.Frame(self.parent_frame, bg=self.theme['bg_primary']), {'bg': 'bg_primary'})
         filter_bar.pack(anchor='w', pady=(0, 16))
 
         self.filter_buttons = {}
@@ -62,9 +78,10 @@ class HistoryView:
             self.filter_buttons[action_type] = btn
 
         self._style_filter_buttons()
+        self._build_export_bar()
 
         # Tableau (Treeview)
-        table_frame = tk.Frame(self.parent_frame, bg=self.theme['bg_primary'])
+        table_frame = themed(tk.Frame(self.parent_frame, bg=self.theme['bg_primary']), {'bg': 'bg_primary'})
         table_frame.pack(fill='both', expand=True)
 
         style = ttk.Style()
@@ -118,6 +135,94 @@ class HistoryView:
 
         self._load_logs()
 
+    def _build_export_bar(self):
+        """Export complet (partitions archivées comprises) sans bloquer l'interface"""
+        export_bar = themed(tk.Frame(self.parent_frame, bg=self.theme['bg_primary']), {'bg': 'bg_primary'})
+        export_bar.pack(anchor='w', fill='x', pady=(0, 16))
+
+        self.export_buttons = []
+        for label, source in EXPORTS:
+            btn = themed(tk.Button(
+                export_bar,
+                text=label,
+                font=(FONT_FAMILY, 9),
+                relief='flat',
+                cursor='hand2',
+                bg=self.theme['bg_secondary'],
+                fg=self.theme['text_primary'],
+                activebackground=self.theme['bg_secondary'],
+                command=lambda s=source: self._start_export(s)
+            ), {'bg': 'bg_secondary', 'fg': 'text_primary', 'activebackground': 'bg_secondary'})
+            btn.pack(side='left', padx=(0, 8), ipadx=10, ipady=4)
+            self.export_buttons.append(btn)
+
+        self.export_format = ttk.Combobox(export_bar, values=list(EXPORT_FORMATS), state='readonly', width=8)
+        self.export_format.set("CSV")
+        self.export_format.pack(side='left', padx=(0, 12))
+
+        self.export_progress = ttk.Progressbar(export_bar, mode='determinate', length=160, maximum=1.0)
+        self.export_label = themed(tk.Label(
+            export_bar,
+            text="",
+            font=(FONT_FAMILY, 9),
+            bg=self.theme['bg_primary'],
+            fg=self.theme['text_secondary']
+        ), {'bg': 'bg_primary', 'fg': 'text_secondary'})
+        self.export_label.pack(side='left')
+        self.export_cancel = themed(tk.Button(
+            export_bar,
+            text="Annuler",
+            font=(FONT_FAMILY, 9),
+            relief='flat',
+            cursor='hand2',
+            bg=self.theme['bg_secondary'],
+            fg=self.theme['text_primary'],
+            command=self._cancel_export
+        ), {'bg': 'bg_secondary', 'fg': 'text_primary'})
+
+    def _start_export(self, source):
+        if self._export is not None:
+            return
+        progress = ExportProgress()
+        future = get_async_runtime().call_blocking(
+            ExportService(self.db.db_path).export, source, None, self.user_data['id'],
+            EXPORT_FORMATS[self.export_format.get()], progress, kind='io'
+        )
+        self._export = (future, progress)
+        for btn in self.export_buttons:
+            btn.config(state='disabled')
+        self.export_progress.pack(side='left', padx=(0, 8), before=self.export_label)
+        self.export_cancel.pack(side='left', padx=(8, 0))
+        self._poll_export()
+
+    def _cancel_export(self):
+        if self._export is not None:
+            self._export[1].cancel()
+
+    def _poll_export(self):
+        if not self.parent_frame.winfo_exists():
+            self._cancel_export()
+            return
+        future, progress = self._export
+        if not future.done():
+            self.export_progress['value'] = progress.fraction
+            total = f" / {progress.total:,}" if progress.total else ""
+            self.export_label.config(text=f"{progress.rows:,}{total} lignes")
+            self.parent_frame.after(EXPORT_POLL_MS, self._poll_export)
+            return
+
+        self._export = None
+        self.export_progress.pack_forget()
+        self.export_cancel.pack_forget()
+        for btn in self.export_buttons:
+            btn.config(state='normal')
+        try:
+            path, rows = future.result()
+            message = f"✓ {rows:,} lignes exportées → {path}" if path else "Export annulé"
+        except Exception as e:
+            message = f"✗ Erreur export: {e}"
+        self.export_label.config(text=message)
+
     def _apply_filter(self, action_type):
         self.active_filter = action_type
         self._style_filter_buttons()
@@ -138,17 +243,29 @@ class HistoryView:
                     activebackground=self.theme['bg_secondary']
                 )
 
-    def _load_logs(self):
-        for row in self.tree.get_children():
-            self.tree.delete(row)
+    def on_show(self):
+        """Vue réaffichée depuis le cache : recharge l'historique s'il a changé"""
+        self._load_logs()
 
-        logs = self.db.get_activity_logs(self.user_data['id'], self.active_filter)
+    def _load_logs(self):
+        # Base principale puis partitions archivées, plus récentes d'abord
+        logs = self.archive.get_activity_logs(self.user_data['id'], self.active_filter, limit=HISTORY_LIMIT)
 
         if not logs:
-            self.tree.insert('', 'end', values=('—', '—', 'Aucune activité enregistrée'))
+            rows = [('—', '—', 'Aucune activité enregistrée')]
+        else:
+            rows = [
+                (str(log['created_at'])[:16].replace('T', ' '),
+                 ACTION_LABELS.get(log['action_type'], log['action_type']),
+                 log['description'])
+                for log in logs
+            ]
+
+        # Tableau inchangé : aucun widget à reconstruire
+        if rows == self._rows:
             return
+        self._rows = rows
 
-        for log in logs:
-            date_str = str(log['created_at'])[:16].replace('T', ' ')
-            type_label = ACTION_LABELS.get(log['action_type'], log['action_type'])
-            self.tree.insert('', 'end', values=(date_str, type_label, log['description']))
+        self.tree.delete(*self.tree.get_children())
+        for values in rows:
+            self.tree.insert('', 'end', values=values)
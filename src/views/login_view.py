@@ -1,15 +1,19 @@
 import tkinter as tk
 from src.controllers.account_controller import AccountController
-from src.components.ui_component import Button
+from src.services.async_runtime import get_async_runtime
+from src.components.ui_component import Button, themed
 
 class LoginView:
     """Vue de connexion"""
     
+    LOGIN_POLL_MS = 50
+    
     def __init__(self, root, theme, on_login_success, on_show_signup):
         self.root = root
         self.theme = theme
         self.on_login_success = on_login_success
         self.on_show_signup = on_show_signup
+        self._pending_login = None
         
         self.FONT_FAMILY = "Segoe UI"
         self.APP_NAME = "CoinTrader"
@@ -26,41 +30,41 @@ class LoginView:
         self.root.configure(bg=self.theme['bg_primary'])
         center_window(self.root, 400, 550)
         
-        main_frame = tk.Frame(self.root, bg=self.theme['bg_primary'])
+        main_frame = themed(tk.Frame(self.root, bg=self.theme['bg_primary']), {'bg': 'bg_primary'})
         main_frame.pack(expand=True, fill='both', padx=40, pady=40)
         
         # Logo / Titre
-        tk.Label(
+        themed(tk.Label(
             main_frame,
             text=self.APP_NAME,
             font=(self.FONT_FAMILY, 28, 'bold'),
             bg=self.theme['bg_primary'],
             fg=self.theme['accent']
-        ).pack(pady=(0, 10))
+        ), {'bg': 'bg_primary', 'fg': 'accent'}).pack(pady=(0, 10))
         
-        tk.Label(
+        themed(tk.Label(
             main_frame,
             text=f"v{self.APP_VERSION}",
             font=(self.FONT_FAMILY, 9),
             bg=self.theme['bg_primary'],
             fg=self.theme['text_secondary']
-        ).pack(pady=(0, 40))
+        ), {'bg': 'bg_primary', 'fg': 'text_secondary'}).pack(pady=(0, 40))
         
         # Formulaire
-        form_frame = tk.Frame(main_frame, bg=self.theme['bg_primary'])
+        form_frame = themed(tk.Frame(main_frame, bg=self.theme['bg_primary']), {'bg': 'bg_primary'})
         form_frame.pack(fill='x')
         
         # Username
-        tk.Label(
+        themed(tk.Label(
             form_frame,
             text="Nom d'utilisateur",
             font=(self.FONT_FAMILY, 10),
             bg=self.theme['bg_primary'],
             fg=self.theme['text_primary'],
             anchor='w'
-        ).pack(fill='x', pady=(0, 5))
+        ), {'bg': 'bg_primary', 'fg': 'text_primary'}).pack(fill='x', pady=(0, 5))
         
-        self.username_entry = tk.Entry(
+        self.username_entry = themed(tk.Entry(
             form_frame,
             font=(self.FONT_FAMILY, 11),
             bg=self.theme['input_bg'],
@@ -68,20 +72,20 @@ class LoginView:
             relief='solid',
             borderwidth=1,
             insertbackground=self.theme['text_primary']
-        )
+        ), {'bg': 'input_bg', 'fg': 'text_primary', 'insertbackground': 'text_primary'})
         self.username_entry.pack(fill='x', ipady=8)
         
         # Password
-        tk.Label(
+        themed(tk.Label(
             form_frame,
             text="Mot de passe",
             font=(self.FONT_FAMILY, 10),
             bg=self.theme['bg_primary'],
             fg=self.theme['text_primary'],
             anchor='w'
-        ).pack(fill='x', pady=(20, 5))
+        ), {'bg': 'bg_primary', 'fg': 'text_primary'}).pack(fill='x', pady=(20, 5))
         
-        self.password_entry = tk.Entry(
+        self.password_entry = themed(tk.Entry(
             form_frame,
             font=(self.FONT_FAMILY, 11),
             bg=self.theme['input_bg'],
@@ -90,23 +94,23 @@ class LoginView:
             relief='solid',
             borderwidth=1,
             insertbackground=self.theme['text_primary']
-        )
+        ), {'bg': 'input_bg', 'fg': 'text_primary', 'insertbackground': 'text_primary'})
         self.password_entry.pack(fill='x', ipady=8)
         self.password_entry.bind('<Return>', lambda e: self.login())
         
         # Message d'erreur
-        self.error_label = tk.Label(
+        self.error_label = themed(tk.Label(
             form_frame,
             text="",
             font=(self.FONT_FAMILY, 9),
             bg=self.theme['bg_primary'],
             fg='#F44336',
             anchor='w'
-        )
+        ), {'bg': 'bg_primary'})
         self.error_label.pack(fill='x', pady=(10, 0))
         
         # Bouton connexion
-        tk.Button(
+        themed(tk.Button(
             form_frame,
             text="Se connecter",
             font=(self.FONT_FAMILY, 11, 'bold'),
@@ -116,32 +120,50 @@ class LoginView:
             relief='flat',
             cursor='hand2',
             command=self.login
-        ).pack(fill='x', pady=(30, 0), ipady=14)
+        ), {'bg': 'accent', 'fg': 'button_text', 'activebackground': 'accent'}).pack(fill='x', pady=(30, 0), ipady=14)
         
         # Lien créer un compte
-        signup_frame = tk.Frame(form_frame, bg=self.theme['bg_primary'])
+        signup_frame = themed(tk.Frame(form_frame, bg=self.theme['bg_primary']), {'bg': 'bg_primary'})
         signup_frame.pack(pady=(20, 0))
         
-        signup_label = tk.Label(
+        signup_label = themed(tk.Label(
             signup_frame,
             text="Créer un compte",
             font=(self.FONT_FAMILY, 9),
             bg=self.theme['bg_primary'],
             fg=self.theme['text_secondary'],
             cursor='hand2'
-        )
+        ), {'bg': 'bg_primary', 'fg': 'text_secondary'})
         signup_label.pack()
         signup_label.bind('<Button-1>', lambda e: self.on_show_signup())
     
     def login(self):
-        """Traite la connexion"""
+        """Traite la connexion (bcrypt hors du thread Tk)"""
+        if self._pending_login is not None:
+            return
         username = self.username_entry.get()
         password = self.password_entry.get()
         
         account_controller = AccountController()
-        result = account_controller.login(username, password)
+        self._pending_login = get_async_runtime().call_blocking(
+            account_controller.login, username, password, kind='cpu'
+        )
+        self.error_label.config(text="")
+        self._poll_login()
+    
+    def _poll_login(self):
+        future = self._pending_login
+        if not future.done():
+            self.root.after(self.LOGIN_POLL_MS, self._poll_login)
+            return
+        self._pending_login = None
+        
+        try:
+            result = future.result()
+        except Exception as e:
+            result = {'success': False, 'message': str(e)}
         
         if result['success']:
             self.on_login_success(result['user_data'])
         else:
-            self.error_label.config(text=result['message'])
\ No newline at end of file
+            self.error_label.config(text=result['message'])
@@ -1,12 +1,16 @@
 import os
 import tkinter as tk
 from tkinter import messagebox
+from src.utils.metrics import get_metrics
 
 APP_NAME = "CoinTrader"
 APP_VERSION = "1.0.0"
 FONT_FAMILY = "Segoe UI"
 TK_CENTER_WINDOW = "tk::PlaceWindow . center"
 
+metrics = get_metrics()
+metrics.describe('view_render_seconds', "Durée d'affichage des pages (construction ou reprise depuis le cache)")
+
 class Theme:
     """Gestion des thèmes clair/sombre"""
     
@@ -49,15 +53,22 @@ class MainApplication:
         self.root = root
         self.user_data = user_data
         self.current_theme = theme_name
-        self.theme = Theme.get(self.current_theme)
+        # Copie partagée avec les vues : mise à jour sur place au changement de thème
+        self.theme = dict(Theme.get(self.current_theme))
         self.window_geometry = window_geometry
         self.current_page = 'dashboard'
         
+        # Vues conservées entre les navigations (LRU)
+        from src.components.view_cache import ViewCache
+        self.view_cache = ViewCache()
+        self._shown_key = None
+        self._uncached_view = None  # vue affichée hors cache (formulaire d'ajout)
+        
         self.setup_ui()
     
     def setup_ui(self):
         """Configure l'interface principale"""
-        from src.components.ui_component import center_window
+        from src.components.ui_component import center_window, themed
         
         self.root.title(f"{APP_NAME} - Tableau de bord")
         
@@ -68,19 +79,20 @@ class MainApplication:
         
         self.root.resizable(True, True)
         self.root.configure(bg=self.theme['bg_primary'])
+        themed(self.root, {'bg': 'bg_primary'})
         
         # Header
         self.create_header()
         
         # Container principal
-        main_container = tk.Frame(self.root, bg=self.theme['bg_primary'])
+        main_container = themed(tk.Frame(self.root, bg=self.theme['bg_primary']), {'bg': 'bg_primary'})
         main_container.pack(fill='both', expand=True)
         
         # Zone centrale pour le contenu
-        self.content_frame = tk.Frame(
+        self.content_frame = themed(tk.Frame(
             main_container,
             bg=self.theme['bg_primary']
-        )
+        ), {'bg': 'bg_primary'})
         self.content_frame.pack(side='left', fill='both', expand=True, padx=20, pady=20)
         
         # Menu à droite
@@ -91,22 +103,24 @@ class MainApplication:
     
     def create_header(self):
         """Crée le header de l'application"""
-        header = tk.Frame(
+        from src.components.ui_component import themed, ROLES_BUTTON_SECONDARY
+        
+        header = themed(tk.Frame(
             self.root,
             bg=self.theme['bg_header'],
             height=60
-        )
+        ), {'bg': 'bg_header'})
         header.pack(fill='x')
         header.pack_propagate(False)
         
         # Logo / Nom app
-        tk.Label(
+        themed(tk.Label(
             header,
             text=APP_NAME,
             font=(FONT_FAMILY, 16, 'bold'),
             bg=self.theme['bg_header'],
             fg=self.theme['accent']
-        ).pack(side='left', padx=20)
+        ), {'bg': 'bg_header', 'fg': 'accent'}).pack(side='left', padx=20)
         
         # Nom de l'utilisateur
         self.user_label = tk.Label(
@@ -116,6 +130,7 @@ class MainApplication:
             bg=self.theme['bg_header'],
             fg=self.theme['text_secondary']
         )
+        themed(self.user_label, {'bg': 'bg_header', 'fg': 'text_secondary'})
         self.user_label.pack(side='right', padx=20)
         
         # Bouton toggle thème
@@ -130,25 +145,28 @@ class MainApplication:
             cursor='hand2',
             command=self.toggle_theme
         )
+        themed(self.theme_button, ROLES_BUTTON_SECONDARY)
         self.theme_button.pack(side='right', padx=5)
     
     def create_right_menu(self, parent):
         """Crée le menu latéral"""
-        menu_frame = tk.Frame(
+        from src.components.ui_component import themed, ROLES_BUTTON_SECONDARY
+        
+        menu_frame = themed(tk.Frame(
             parent,
             bg=self.theme['bg_secondary'],
             width=200
-        )
+        ), {'bg': 'bg_secondary'})
         menu_frame.pack(side='right', fill='y')
         menu_frame.pack_propagate(False)
         
-        tk.Label(
+        themed(tk.Label(
             menu_frame,
             text="MENU",
             font=(FONT_FAMILY, 10, 'bold'),
             bg=self.theme['bg_secondary'],
             fg=self.theme['text_secondary']
-        ).pack(pady=(20, 10), padx=20, anchor='w')
+        ), {'bg': 'bg_secondary', 'fg': 'text_secondary'}).pack(pady=(20, 10), padx=20, anchor='w')
         
         # Items du menu
         menu_items = [
@@ -161,7 +179,7 @@ class MainApplication:
         ]
         
         for item_text, command in menu_items:
-            tk.Button(
+            themed(tk.Button(
                 menu_frame,
                 text=item_text,
                 font=(FONT_FAMILY, 10),
@@ -172,10 +190,10 @@ class MainApplication:
                 anchor='w',
                 cursor='hand2',
                 command=command
-            ).pack(fill='x', padx=10, pady=2)
+            ), ROLES_BUTTON_SECONDARY).pack(fill='x', padx=10, pady=2)
         
         # Bouton Déconnexion
-        tk.Button(
+        themed(tk.Button(
             menu_frame,
             text="🚪  Déconnexion",
             font=(FONT_FAMILY, 10),
@@ -186,10 +204,10 @@ class MainApplication:
             anchor='w',
             cursor='hand2',
             command=self.logout
-        ).pack(fill='x', padx=10, pady=(20, 2))
+        ), {'bg': 'bg_secondary', 'activebackground': 'bg_primary'}).pack(fill='x', padx=10, pady=(20, 2))
         
         # Bouton Quitter
-        tk.Button(
+        themed(tk.Button(
             menu_frame,
             text="❌  Quitter",
             font=(FONT_FAMILY, 10, 'bold'),
@@ -200,90 +218,113 @@ class MainApplication:
             anchor='w',
             cursor='hand2',
             command=self.quit_application
-        ).pack(fill='x', padx=10, pady=2)
+        ), {'bg': 'bg_secondary', 'activebackground': 'bg_primary'}).pack(fill='x', padx=10, pady=2)
     
     def clear_content(self):
-        """Vide le contenu de la zone centrale"""
+        """Masque la vue affichée (conservée si elle est en cache, détruite sinon)"""
         self.root.unbind_all("<MouseWheel>")
+        
+        entry = self.view_cache.get(self._shown_key) if self._shown_key else None
+        if entry is not None:
+            entry.host.pack_forget()
+            if hasattr(entry.view, 'on_hide'):
+                entry.view.on_hide()
+        self._shown_key = None
+        self._uncached_view = None
+        
         for widget in self.content_frame.winfo_children():
-            widget.destroy()
+            if not self.view_cache.is_host(widget):
+                widget.destroy()
     
-    def show_dashboard(self):
-        """Affiche le tableau de bord"""
-        self.current_page = 'dashboard'
+    def _show_view(self, page, build, cached=True):
+        """
+        Affiche une page depuis le cache de vues, ou la construit
+        
+        Args:
+            page (str): Identifiant de la page
+            build (callable): build(parent_frame) → instance de la vue
+            cached (bool): Conserver la vue pour les prochaines navigations
+        """
+        from src.components.theme_registry import get_theme_registry
+        from src.components.ui_component import themed
+        
+        registry = get_theme_registry()
+        self.current_page = page
         self.clear_content()
         
+        entry = self.view_cache.get(page) if cached else None
+        if entry is not None:
+            with metrics.timer('view_render_seconds', page=page, source='cache'):
+                entry.host.pack(fill='both', expand=True)
+                if hasattr(entry.view, 'on_show'):
+                    entry.view.on_show()
+        else:
+            with metrics.timer('view_render_seconds', page=page, source='build'):
+                # Widgets comptés pendant la construction (enregistrés par themed)
+                registered = registry.registrations
+                host = themed(tk.Frame(self.content_frame, bg=self.theme['bg_primary']), {'bg': 'bg_primary'})
+                host.pack(fill='both', expand=True)
+                view = build(host)
+            if not cached:
+                self._uncached_view = view
+                return
+            self.view_cache.put(page, host, view, registry.registrations - registered)
+        self._shown_key = page
+    
+    def show_dashboard(self):
+        """Affiche le tableau de bord"""
         from src.views.dashboard_view import DashboardView
-        DashboardView(self.content_frame, self.theme)
+        self._show_view('dashboard', lambda host: DashboardView(host, self.theme, self.user_data))
     
     def show_bots(self):
         """Affiche la liste des bots"""
-        self.current_page = 'bots'
-        self.clear_content()
-        
         from src.views.bot_list_view import BotListView
-        BotListView(
-            parent_frame=self.content_frame,
+        self._show_view('bots', lambda host: BotListView(
+            parent_frame=host,
             theme=self.theme,
-            on_add_bot_callback=self.show_add_bot_form
-        )
+            on_add_bot_callback=self.show_add_bot_form,
+            user_data=self.user_data
+        ))
     
     def show_add_bot_form(self):
         """Affiche le formulaire d'ajout de bot"""
-        self.current_page = 'add_bot'
-        self.clear_content()
-        
         from src.views.bot_form_view import BotFormView
-        BotFormView(
-            parent_frame=self.content_frame,
+        self._show_view('add_bot', lambda host: BotFormView(
+            parent_frame=host,
             theme=self.theme,
             user_data=self.user_data,
             on_back_callback=self.show_bots,
             on_success_callback=self.show_bots
-        )
+        ), cached=False)
     
     def show_history(self):
         """Affiche l'historique des transactions"""
-        self.current_page = 'history'
-        self.clear_content()
-        
         from src.views.history_view import HistoryView
-        HistoryView(self.content_frame, self.theme, self.user_data)
+        self._show_view('history', lambda host: HistoryView(host, self.theme, self.user_data))
     
     def show_profile(self):
         """Affiche le profil utilisateur"""
-        self.current_page = 'profile'
-        self.clear_content()
-        
         from src.views.profile_view import ProfileView
-        ProfileView(
-            parent_frame=self.content_frame,
+        self._show_view('profile', lambda host: ProfileView(
+            parent_frame=host,
             theme=self.theme,
             user_data=self.user_data,
             on_update_callback=self.update_user_header
-        )
+        ))
     
     def show_settings(self):
         """Affiche les paramètres"""
-        self.current_page = 'settings'
-        self.clear_content()
-        
         from src.views.settings_view import SettingsView
-        SettingsView(self.content_frame, self.theme)
-
-    # Dans la classe MainApplication, remplacer la méthode show_platforms():
+        self._show_view('settings', lambda host: SettingsView(host, self.theme))
     
     def show_platforms(self):
         """Affiche la gestion des plateformes/exchanges"""
-        self.current_page = 'platforms'
-        self.clear_content()
-
         from src.views.exchange_view import ExchangeView
-        ExchangeView(
-            parent_frame=self.content_frame,
+        self._show_view('platforms', lambda host: ExchangeView(
+            parent_frame=host,
             theme=self.theme,
             user_data=self.user_data
-        )
+        ))
     
     def update_user_header(self, user_data):
         """Met à jour le nom dans le header"""
@@ -300,7 +341,7 @@ class MainApplication:
     def toggle_theme(self):
         """Bascule entre thème clair et sombre"""
         self.current_theme = 'light' if self.current_theme == 'dark' else 'dark'
-        self.theme = Theme.get(self.current_theme)
+        self.theme.update(Theme.get(self.current_theme))
         
         self.update_all_colors()
         
@@ -308,114 +349,24 @@ class MainApplication:
             self.theme_button.config(text=self.get_theme_icon())
     
     def update_all_colors(self):
-        """Met à jour les couleurs de tous les widgets"""
-        self.root.config(bg=self.theme['bg_primary'])
-        self._update_widget_colors(self.root)
-    
-    def _update_widget_colors(self, widget):
-        """Met à jour les couleurs d'un widget récursivement"""
-        widget_class = widget.winfo_class()
+        """
+        Met à jour les couleurs de tous les widgets, sans reconstruire les pages
         
-        try:
-            if widget_class == 'Frame':
-                self._update_frame_colors(widget)
-            elif widget_class == 'Label':
-                self._update_label_colors(widget)
-            elif widget_class == 'Button':
-                self._update_button_colors(widget)
-            elif widget_class == 'Entry':
-                self._update_entry_colors(widget)
-        except tk.TclError:
-            pass
+        Les widgets enregistrés à leur création dans le registre de thème
+        sont reconfigurés en un seul lot, sans parcourir l'arbre des widgets.
+        Les saisies en cours (formulaire d'ajout de bot) sont conservées.
+        """
+        from src.components.theme_registry import get_theme_registry
         
-        for child in widget.winfo_children():
-            self._update_widget_colors(child)
-    
-    def _is_header_bg(self, bg_color):
-        return bg_color in [Theme.DARK['bg_header'], Theme.LIGHT['bg_header']]
-    
-    def _is_secondary_bg(self, bg_color):
-        return bg_color in [Theme.DARK['bg_secondary'], Theme.LIGHT['bg_secondary']]
-    
-    def _is_accent_color(self, color):
-        return color in [Theme.DARK['accent'], Theme.LIGHT['accent']]
-    
-    def _is_button_bg(self, bg_color):
-        return bg_color in [Theme.DARK['accent'], Theme.LIGHT['accent'], 
-                           Theme.DARK['button_bg'], Theme.LIGHT['button_bg']]
-    
-    def _update_frame_colors(self, widget):
-        current_bg = widget.cget('bg')
-        if self._is_header_bg(current_bg):
-            widget.config(bg=self.theme['bg_header'])
-        elif self._is_secondary_bg(current_bg):
-            widget.config(bg=self.theme['bg_secondary'])
-        else:
-            widget.config(bg=self.theme['bg_primary'])
-    
-    def _update_label_colors(self, widget):
-        current_fg = widget.cget('fg')
-        current_bg = widget.cget('bg')
-        
-        if self._is_header_bg(current_bg):
-            widget.config(bg=self.theme['bg_header'])
-        elif self._is_secondary_bg(current_bg):
-            widget.config(bg=self.theme['bg_secondary'])
-        else:
-            widget.config(bg=self.theme['bg_primary'])
-        
-        if current_fg in ['#F44336', '#4CAF50', '#FF9800']:
-            return
+        get_theme_registry().apply(self.theme)
         
-        if self._is_accent_color(current_fg):
-            widget.config(fg=self.theme['accent'])
-        elif current_fg in [Theme.DARK['text_secondary'], Theme.LIGHT['text_secondary'], 'gray']:
-            widget.config(fg=self.theme['text_secondary'])
-        else:
-            widget.config(fg=self.theme['text_primary'])
-    
-    def _update_button_colors(self, widget):
-        current_bg = widget.cget('bg')
-        current_fg = widget.cget('fg')
-        
-        if self._is_button_bg(current_bg):
-            widget.config(
-                bg=self.theme['button_bg'],
-                fg=self.theme['button_text'],
-                activebackground=self.theme['accent']
-            )
-        elif current_fg == '#F44336':
-            widget.config(
-                bg=self.theme['bg_secondary'],
-                fg='#F44336',
-                activebackground=self.theme['bg_primary']
-            )
-        elif current_fg == '#FF9800':
-            widget.config(
-                bg=self.theme['bg_secondary'],
-                fg='#FF9800',
-                activebackground=self.theme['bg_primary']
-            )
-        else:
-            widget.config(
-                bg=self.theme['bg_secondary'],
-                fg=self.theme['text_primary'],
-                activebackground=self.theme['bg_primary']
-            )
-    
-    def _update_entry_colors(self, widget):
-        state = widget.cget('state')
-        if state == 'readonly':
-            widget.config(
-                bg=self.theme['bg_secondary'],
-                fg=self.theme['text_primary']
-            )
-        else:
-            widget.config(
-                bg=self.theme['input_bg'],
-                fg=self.theme['text_primary'],
-                insertbackground=self.theme['text_primary']
-            )
+        # Items de Canvas : recolorés par les vues elles-mêmes
+        views = self.view_cache.views()
+        if self._uncached_view is not None:
+            views.append(self._uncached_view)
+        for view in views:
+            if hasattr(view, 'apply_theme'):
+                view.apply_theme(self.theme)
     
     def logout(self):
         """Déconnexion"""
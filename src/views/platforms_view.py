@@ -1,7 +1,7 @@
 import tkinter as tk
 from tkinter import ttk, messagebox
 from src.controllers.exchange_controller import ExchangeController
-from src.components.ui_component import Label, FormField, Button, Input, Toast
+from src.components.ui_component import Label, FormField, Button, Input, Toast, themed
 import threading
 
 FONT_FAMILY = "Segoe UI"
@@ -19,7 +19,7 @@ class PlatformsView:
         self.search_timer = None
         self.current_view = 'list'  # 'list' ou 'form'
 
-        self.container = tk.Frame(self.parent_frame, bg=self.theme['bg_primary'])
+        self.container = themed(tk.Frame(self.parent_frame, bg=self.theme['bg_primary']), {'bg': 'bg_primary'})
         self.container.pack(fill='both', expand=True)
 
         self._build_ui()
@@ -36,20 +36,20 @@ class PlatformsView:
         header.pack(fill='x', pady=(0, 20))
 
         # Barre de recherche et bouton d'ajout - tout sur une ligne
-        search_frame = tk.Frame(self.container, bg=self.theme['bg_primary'])
+        search_frame = themed(tk.Frame(self.container, bg=self.theme['bg_primary']), {'bg': 'bg_primary'})
         search_frame.pack(fill='x', pady=(0, 20))
 
         # Label
-        tk.Label(
+        themed(tk.Label(
             search_frame,
             text="🔍 Rechercher une plateforme",
             font=(FONT_FAMILY, 10),
             bg=self.theme['bg_primary'],
             fg=self.theme['text_primary']
-        ).pack(side='left', padx=(0, 10))
+        ), {'bg': 'bg_primary', 'fg': 'text_primary'}).pack(side='left', padx=(0, 10))
 
         # Champ de recherche (réduit)
-        self.search_entry = tk.Entry(
+        self.search_entry = themed(tk.Entry(
             search_frame,
             font=(FONT_FAMILY, 10),
             bg=self.theme['input_bg'],
@@ -58,12 +58,12 @@ class PlatformsView:
             borderwidth=1,
             insertbackground=self.theme['text_primary'],
             width=25
-        )
+        ), {'bg': 'input_bg', 'fg': 'text_primary', 'insertbackground': 'text_primary'})
         self.search_entry.pack(side='left', ipady=6, padx=(0, 10))
         self.search_entry.bind('<KeyRelease>', self._on_search_change)
 
         # Bouton d'ajout
-        add_btn = tk.Button(
+        add_btn = themed(tk.Button(
             search_frame,
             text="➕ Ajouter",
             font=(FONT_FAMILY, 10, 'bold'),
@@ -73,27 +73,27 @@ class PlatformsView:
             relief='flat',
             cursor='hand2',
             command=self._show_add_form
-        )
+        ), {'bg': 'accent', 'activebackground': 'accent'})
         add_btn.pack(side='right', ipady=6, ipadx=15)
 
         # Conteneur pour les cartes
-        cards_container = tk.Frame(self.container, bg=self.theme['bg_primary'])
+        cards_container = themed(tk.Frame(self.container, bg=self.theme['bg_primary']), {'bg': 'bg_primary'})
         cards_container.pack(fill='both', expand=True)
 
         # Scrollbar
         scrollbar = tk.Scrollbar(cards_container)
         scrollbar.pack(side='right', fill='y')
 
-        self.cards_canvas = tk.Canvas(
+        self.cards_canvas = themed(tk.Canvas(
             cards_container,
             bg=self.theme['bg_primary'],
             highlightthickness=0,
             yscrollcommand=scrollbar.set
-        )
+        ), {'bg': 'bg_primary'})
         self.cards_canvas.pack(side='left', fill='both', expand=True)
         scrollbar.config(command=self.cards_canvas.yview)
 
-        self.cards_frame = tk.Frame(self.cards_canvas, bg=self.theme['bg_primary'])
+        self.cards_frame = themed(tk.Frame(self.cards_canvas, bg=self.theme['bg_primary']), {'bg': 'bg_primary'})
         self.cards_window = self.cards_canvas.create_window(
             0, 0, window=self.cards_frame, anchor='nw'
         )
@@ -152,13 +152,13 @@ class PlatformsView:
             ]
 
         if not filtered_exchanges:
-            empty_label = tk.Label(
+            empty_label = themed(tk.Label(
                 self.cards_frame,
                 text="Aucune plateforme trouvée",
                 font=(FONT_FAMILY, 11),
                 bg=self.theme['bg_primary'],
                 fg=self.theme['text_secondary']
-            )
+            ), {'bg': 'bg_primary', 'fg': 'text_secondary'})
             empty_label.pack(pady=40)
             return
 
@@ -191,30 +191,30 @@ class PlatformsView:
 
     def _create_exchange_card(self, exchange, user_key):
         """Crée une carte pour une plateforme"""
-        card = tk.Frame(
+        card = themed(tk.Frame(
             self.cards_frame,
             bg=self.theme['bg_secondary'],
             relief='solid',
             borderwidth=1
-        )
+        ), {'bg': 'bg_secondary'})
         card.config(highlightbackground=self.theme['border'], highlightthickness=1)
 
         # En-tête de la carte
-        header = tk.Frame(card, bg=self.theme['accent'], height=50)
+        header = themed(tk.Frame(card, bg=self.theme['accent'], height=50), {'bg': 'accent'})
         header.pack(fill='x', padx=1, pady=1)
         header.pack_propagate(False)
 
         exchange_name = exchange.get('display_name', 'Plateforme inconnue')
-        tk.Label(
+        themed(tk.Label(
             header,
             text=exchange_name,
             font=(FONT_FAMILY, 12, 'bold'),
             bg=self.theme['accent'],
             fg='#FFFFFF'
-        ).pack(side='left', padx=15, pady=10)
+        ), {'bg': 'accent'}).pack(side='left', padx=15, pady=10)
 
         # Corps de la carte
-        body = tk.Frame(card, bg=self.theme['bg_secondary'])
+        body = themed(tk.Frame(card, bg=self.theme['bg_secondary']), {'bg': 'bg_secondary'})
         body.pack(fill='both', expand=True, padx=15, pady=15)
 
         if user_key:
@@ -222,65 +222,65 @@ class PlatformsView:
             # Nom de la clé (label)
             label_text = user_key.get('label', '')
             if label_text:
-                tk.Label(
+                themed(tk.Label(
                     body,
                     text=label_text,
                     font=(FONT_FAMILY, 9),
                     bg=self.theme['bg_secondary'],
                     fg=self.theme['text_secondary'],
                     wraplength=250
-                ).pack(anchor='w', pady=(0, 10))
+                ), {'bg': 'bg_secondary', 'fg': 'text_secondary'}).pack(anchor='w', pady=(0, 10))
 
             # Clé API
-            tk.Label(
+            themed(tk.Label(
                 body,
                 text="Clé API",
                 font=(FONT_FAMILY, 9, 'bold'),
                 bg=self.theme['bg_secondary'],
                 fg=self.theme['text_secondary']
-            ).pack(anchor='w', pady=(0, 4))
+            ), {'bg': 'bg_secondary', 'fg': 'text_secondary'}).pack(anchor='w', pady=(0, 4))
 
             api_key = user_key.get('api_key', '')
             masked_key = self._mask_api_key(api_key)
-            tk.Label(
+            themed(tk.Label(
                 body,
                 text=masked_key,
                 font=(FONT_FAMILY, 10),
                 bg=self.theme['bg_secondary'],
                 fg=self.theme['text_primary'],
                 wraplength=250
-            ).pack(anchor='w', pady=(0, 15))
+            ), {'bg': 'bg_secondary', 'fg': 'text_primary'}).pack(anchor='w', pady=(0, 15))
 
             # Status badge
-            status_frame = tk.Frame(body, bg=self.theme['bg_secondary'])
+            status_frame = themed(tk.Frame(body, bg=self.theme['bg_secondary']), {'bg': 'bg_secondary'})
             status_frame.pack(fill='x', pady=(0, 15))
 
-            tk.Label(
+            themed(tk.Label(
                 status_frame,
                 text="✓ Connectée",
                 font=(FONT_FAMILY, 9, 'bold'),
                 bg=self.theme['bg_secondary'],
                 fg='#4CAF50'
-            ).pack(anchor='w')
+            ), {'bg': 'bg_secondary'}).pack(anchor='w')
 
         else:
             # Plateforme non configurée
-            tk.Label(
+            themed(tk.Label(
                 body,
                 text="Non configurée",
                 font=(FONT_FAMILY, 9),
                 bg=self.theme['bg_secondary'],
                 fg=self.theme['text_secondary'],
                 wraplength=250
-            ).pack(anchor='w', pady=(0, 15))
+            ), {'bg': 'bg_secondary', 'fg': 'text_secondary'}).pack(anchor='w', pady=(0, 15))
 
         # Boutons
-        buttons_frame = tk.Frame(body, bg=self.theme['bg_secondary'])
+        buttons_frame = themed(tk.Frame(body, bg=self.theme['bg_secondary']), {'bg': 'bg_secondary'})
         buttons_frame.pack(fill='x')
 
         if user_key:
             # Bouton Modifier
-            modify_btn = tk.Button(
+            modify_btn = themed(tk.Button(
                 buttons_frame,
                 text="✏️  Modifier",
                 font=(FONT_FAMILY, 9),
@@ -290,7 +290,7 @@ class PlatformsView:
                 relief='flat',
                 cursor='hand2',
                 command=lambda k=user_key: self._modify_api_key(k)
-            )
+            ), {'bg': 'accent', 'activebackground': 'accent'})
             modify_btn.pack(side='left', fill='x', expand=True, padx=(0, 5))
 
             # Bouton Supprimer
@@ -308,7 +308,7 @@ class PlatformsView:
             delete_btn.pack(side='right', fill='x', expand=True, padx=(5, 0))
         else:
             # Bouton Ajouter
-            add_btn = tk.Button(
+            add_btn = themed(tk.Button(
                 buttons_frame,
                 text="➕ Ajouter une clé",
                 font=(FONT_FAMILY, 9, 'bold'),
@@ -318,7 +318,7 @@ class PlatformsView:
                 relief='flat',
                 cursor='hand2',
                 command=lambda ex=exchange: self._add_key_for_exchange(ex)
-            )
+            ), {'bg': 'accent', 'activebackground': 'accent'})
             add_btn.pack(side='left', fill='x', expand=True)
 
         return card
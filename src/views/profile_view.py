@@ -1,6 +1,6 @@
 import tkinter as tk
 from src.controllers.account_controller import AccountController
-from src.components.ui_component import FormField, Label, Button
+from src.components.ui_component import FormField, Label, Button, themed
 
 FONT_FAMILY = "Segoe UI"
 
@@ -18,17 +18,17 @@ class ProfileView:
     def render(self):
         """Affiche le profil utilisateur"""
         # Titre - TAILLE RÉDUITE
-        title_label = tk.Label(
+        title_label = themed(tk.Label(
             self.parent_frame,
             text="Mon profil",
             font=(FONT_FAMILY, 18, 'bold'),
             bg=self.theme['bg_primary'],
             fg=self.theme['text_primary']
-        )
+        ), {'bg': 'bg_primary', 'fg': 'text_primary'})
         title_label.pack(anchor='w', pady=(0, 15))
         
         # Container pour les deux colonnes
-        main_container = tk.Frame(self.parent_frame, bg=self.theme['bg_primary'])
+        main_container = themed(tk.Frame(self.parent_frame, bg=self.theme['bg_primary']), {'bg': 'bg_primary'})
         main_container.pack(fill='both', expand=True)
         
         # COLONNE GAUCHE: Informations personnelles
@@ -39,16 +39,16 @@ class ProfileView:
     
     def _create_personal_info_column(self, parent):
         """Crée la colonne des informations personnelles"""
-        left_column = tk.Frame(parent, bg=self.theme['bg_primary'])
+        left_column = themed(tk.Frame(parent, bg=self.theme['bg_primary']), {'bg': 'bg_primary'})
         left_column.pack(side='left', fill='both', expand=True, padx=(0, 10))
         
-        info_card = tk.Frame(
+        info_card = themed(tk.Frame(
             left_column, 
             bg=self.theme['bg_secondary'], 
             relief='flat',
             highlightthickness=1,
             highlightbackground=self.theme['border']
-        )
+        ), {'bg': 'bg_secondary', 'highlightbackground': 'border'})
         info_card.pack(fill='both', expand=True)
         
         # En-tête
@@ -56,7 +56,7 @@ class ProfileView:
         header.pack(anchor='w', padx=20, pady=(15, 10))
         
         # Container des champs
-        fields_container = tk.Frame(info_card, bg=self.theme['bg_secondary'])
+        fields_container = themed(tk.Frame(info_card, bg=self.theme['bg_secondary']), {'bg': 'bg_secondary'})
         fields_container.pack(fill='x', padx=20, pady=(0, 10))
         
         # Créer les 4 champs AVEC ASTÉRISQUES
@@ -91,16 +91,16 @@ class ProfileView:
     
     def _create_security_column(self, parent):
         """Crée la colonne de sécurité"""
-        right_column = tk.Frame(parent, bg=self.theme['bg_primary'])
+        right_column = themed(tk.Frame(parent, bg=self.theme['bg_primary']), {'bg': 'bg_primary'})
         right_column.pack(side='left', fill='both', expand=True, padx=(10, 0))
         
-        password_card = tk.Frame(
+        password_card = themed(tk.Frame(
             right_column, 
             bg=self.theme['bg_secondary'], 
             relief='flat',
             highlightthickness=1,
             highlightbackground=self.theme['border']
-        )
+        ), {'bg': 'bg_secondary', 'highlightbackground': 'border'})
         password_card.pack(fill='both', expand=True)
         
         # En-tête
@@ -108,7 +108,8 @@ class ProfileView:
         header.pack(anchor='w', padx=20, pady=(15, 10))
         
         # Container des champs
-        password_fields_container = tk.Frame(password_card, bg=self.theme['bg_secondary'])
+        password_fields_container = themed(tk.Frame(password_card, bg=self.theme['bg_secondary']),
+                                           {'bg': 'bg_secondary'})
         password_fields_container.pack(fill='x', padx=20, pady=(0, 10))
         
         # Créer les 3 champs de mot de passe AVEC ASTÉRISQUES
@@ -126,7 +127,8 @@ class ProfileView:
             self.password_fields[field_key] = field
         
         # Spacer pour compenser le 4e champ manquant - HAUTEUR 75px
-        spacer_frame = tk.Frame(password_fields_container, bg=self.theme['bg_secondary'], height=75)
+        spacer_frame = themed(tk.Frame(password_fields_container, bg=self.theme['bg_secondary'], height=75),
+                              {'bg': 'bg_secondary'})
         spacer_frame.pack(fill='x', pady=4)
         spacer_frame.pack_propagate(False)
         
@@ -144,6 +146,15 @@ class ProfileView:
         self.password_status_label = Label.status(password_card, self.theme, anchor='e')
         self.password_status_label.pack(side='bottom', fill='x', padx=20, pady=(10, 0))
     
+    def on_show(self):
+        """Vue réaffichée depuis le cache : champs rechargés depuis user_data, saisies abandonnées effacées"""
+        for field_key, field in self.profile_fields.items():
+            field.set(self.user_data[field_key])
+        for field in self.password_fields.values():
+            field.clear()
+        self.profile_status_label.config(text="")
+        self.password_status_label.config(text="")
+    
     def save_profile(self):
         """Sauvegarde les modifications du profil"""
         new_username = self.profile_fields['username'].get().strip()
@@ -4,6 +4,7 @@ from tkinter import messagebox
 from typing import Dict
 from datetime import datetime, timedelta
 from pathlib import Path
+from src.components.ui_component import themed, ROLES_BUTTON_SECONDARY
 
 FONT_FAMILY = "Segoe UI"
 
@@ -18,27 +19,27 @@ class SettingsView:
     
     def render(self):
         """Affiche les paramètres"""
-        tk.Label(
+        themed(tk.Label(
             self.parent_frame,
             text="Paramètres",
             font=(FONT_FAMILY, 20, 'bold'),
             bg=self.theme['bg_primary'],
             fg=self.theme['text_primary']
-        ).pack(anchor='w', pady=(0, 30))
+        ), {'bg': 'bg_primary', 'fg': 'text_primary'}).pack(anchor='w', pady=(0, 30))
         
         # Section Nettoyage
-        section_frame = tk.Frame(self.parent_frame, bg=self.theme['bg_primary'])
+        section_frame = themed(tk.Frame(self.parent_frame, bg=self.theme['bg_primary']), {'bg': 'bg_primary'})
         section_frame.pack(fill='x', pady=(0, 20))
         
-        tk.Label(
+        themed(tk.Label(
             section_frame,
             text="Nettoyage du cache",
             font=(FONT_FAMILY, 14, 'bold'),
             bg=self.theme['bg_primary'],
             fg=self.theme['text_primary']
-        ).pack(anchor='w', pady=(0, 15))
+        ), {'bg': 'bg_primary', 'fg': 'text_primary'}).pack(anchor='w', pady=(0, 15))
         
-        tk.Label(
+        themed(tk.Label(
             section_frame,
             text="Libérez de l'espace en supprimant les fichiers temporaires et les anciens logs.",
             font=(FONT_FAMILY, 9),
@@ -46,13 +47,13 @@ class SettingsView:
             fg=self.theme['text_secondary'],
             anchor='w',
             wraplength=600
-        ).pack(anchor='w', pady=(0, 15))
+        ), {'bg': 'bg_primary', 'fg': 'text_secondary'}).pack(anchor='w', pady=(0, 15))
         
         # Boutons de nettoyage
-        buttons_frame = tk.Frame(section_frame, bg=self.theme['bg_primary'])
+        buttons_frame = themed(tk.Frame(section_frame, bg=self.theme['bg_primary']), {'bg': 'bg_primary'})
         buttons_frame.pack(anchor='w', fill='x')
         
-        tk.Button(
+        themed(tk.Button(
             buttons_frame,
             text="Nettoyer le cache Python",
             font=(FONT_FAMILY, 10),
@@ -62,9 +63,9 @@ class SettingsView:
             relief='flat',
             cursor='hand2',
             command=self.clean_pycache
-        ).pack(side='left', padx=(0, 10), ipadx=15, ipady=8)
+        ), ROLES_BUTTON_SECONDARY).pack(side='left', padx=(0, 10), ipadx=15, ipady=8)
         
-        tk.Button(
+        themed(tk.Button(
             buttons_frame,
             text="Nettoyer les logs (>7 jours)",
             font=(FONT_FAMILY, 10),
@@ -74,9 +75,9 @@ class SettingsView:
             relief='flat',
             cursor='hand2',
             command=self.clean_logs
-        ).pack(side='left', padx=(0, 10), ipadx=15, ipady=8)
+        ), ROLES_BUTTON_SECONDARY).pack(side='left', padx=(0, 10), ipadx=15, ipady=8)
         
-        tk.Button(
+        themed(tk.Button(
             buttons_frame,
             text="Nettoyer tout",
             font=(FONT_FAMILY, 10, 'bold'),
@@ -86,19 +87,23 @@ class SettingsView:
             relief='flat',
             cursor='hand2',
             command=self.clean_all_cache
-        ).pack(side='left', ipadx=15, ipady=8)
+        ), {'bg': 'accent', 'fg': 'button_text', 'activebackground': 'accent'}).pack(side='left', ipadx=15, ipady=8)
         
         # Message de statut
-        self.clean_status_label = tk.Label(
+        self.clean_status_label = themed(tk.Label(
             section_frame,
             text="",
             font=(FONT_FAMILY, 9),
             bg=self.theme['bg_primary'],
             fg='#4CAF50',
             anchor='w'
-        )
+        ), {'bg': 'bg_primary'})
         self.clean_status_label.pack(anchor='w', pady=(15, 0))
     
+    def on_show(self):
+        """Vue réaffichée depuis le cache : efface le statut du dernier nettoyage"""
+        self.clean_status_label.config(text="")
+    
     def clean_pycache(self):
         """Nettoie le cache Python"""
         try:
@@ -1,6 +1,7 @@
 import tkinter as tk
 from tkinter import messagebox
 from src.controllers.account_controller import AccountController
+from src.components.ui_component import themed
 
 class SignupView:
     """Vue d'inscription"""
@@ -25,20 +26,20 @@ class SignupView:
         self.root.configure(bg=self.theme['bg_primary'])
         center_window(self.root, 450, 700)
         
-        main_frame = tk.Frame(self.root, bg=self.theme['bg_primary'])
+        main_frame = themed(tk.Frame(self.root, bg=self.theme['bg_primary']), {'bg': 'bg_primary'})
         main_frame.pack(expand=True, fill='both', padx=40, pady=30)
         
         # Titre
-        tk.Label(
+        themed(tk.Label(
             main_frame,
             text="Créer un compte",
             font=(self.FONT_FAMILY, 20, 'bold'),
             bg=self.theme['bg_primary'],
             fg=self.theme['accent']
-        ).pack(pady=(0, 30))
+        ), {'bg': 'bg_primary', 'fg': 'accent'}).pack(pady=(0, 30))
         
         # Formulaire
-        form_frame = tk.Frame(main_frame, bg=self.theme['bg_primary'])
+        form_frame = themed(tk.Frame(main_frame, bg=self.theme['bg_primary']), {'bg': 'bg_primary'})
         form_frame.pack(fill='x')
         
         # Champs avec astérisques
@@ -50,7 +51,7 @@ class SignupView:
         self.confirm_password_entry = self._create_field(form_frame, "Confirmer le mot de passe *", show='•')
         
         # Message d'erreur
-        self.error_label = tk.Label(
+        self.error_label = themed(tk.Label(
             form_frame,
             text="",
             font=(self.FONT_FAMILY, 9),
@@ -58,11 +59,11 @@ class SignupView:
             fg='#F44336',
             anchor='w',
             wraplength=370
-        )
+        ), {'bg': 'bg_primary'})
         self.error_label.pack(fill='x', pady=(10, 0))
         
         # Bouton inscription
-        tk.Button(
+        themed(tk.Button(
             form_frame,
             text="S'inscrire",
             font=(self.FONT_FAMILY, 11, 'bold'),
@@ -72,27 +73,27 @@ class SignupView:
             relief='flat',
             cursor='hand2',
             command=self.signup
-        ).pack(fill='x', pady=(20, 0), ipady=14)
+        ), {'bg': 'accent', 'fg': 'button_text', 'activebackground': 'accent'}).pack(fill='x', pady=(20, 0), ipady=14)
         
         # Lien retour connexion
-        back_frame = tk.Frame(form_frame, bg=self.theme['bg_primary'])
+        back_frame = themed(tk.Frame(form_frame, bg=self.theme['bg_primary']), {'bg': 'bg_primary'})
         back_frame.pack(pady=(15, 0))
         
-        back_label = tk.Label(
+        back_label = themed(tk.Label(
             back_frame,
             text="Déjà un compte ? Se connecter",
             font=(self.FONT_FAMILY, 9),
             bg=self.theme['bg_primary'],
             fg=self.theme['text_secondary'],
             cursor='hand2'
-        )
+        ), {'bg': 'bg_primary', 'fg': 'text_secondary'})
         back_label.pack()
         back_label.bind('<Button-1>', lambda e: self.on_show_login())
     
     def _create_field(self, parent, label_text, show=None):
         """Crée un champ de formulaire"""
         # Frame pour le label avec astérisque
-        label_frame = tk.Frame(parent, bg=self.theme['bg_primary'])
+        label_frame = themed(tk.Frame(parent, bg=self.theme['bg_primary']), {'bg': 'bg_primary'})
         label_frame.pack(fill='x', pady=(10, 5))
         
         # Séparer le texte et l'astérisque
@@ -104,27 +105,27 @@ class SignupView:
             has_star = False
         
         # Label principal
-        tk.Label(
+        themed(tk.Label(
             label_frame,
             text=text_without_star,
             font=(self.FONT_FAMILY, 10),
             bg=self.theme['bg_primary'],
             fg=self.theme['text_primary'],
             anchor='w'
-        ).pack(side='left')
+        ), {'bg': 'bg_primary', 'fg': 'text_primary'}).pack(side='left')
         
         # Astérisque en rouge
         if has_star:
-            tk.Label(
+            themed(tk.Label(
                 label_frame,
                 text=" *",
                 font=(self.FONT_FAMILY, 10, 'bold'),
                 bg=self.theme['bg_primary'],
                 fg='#F44336',
                 anchor='w'
-            ).pack(side='left')
+            ), {'bg': 'bg_primary'}).pack(side='left')
         
-        entry = tk.Entry(
+        entry = themed(tk.Entry(
             parent,
             font=(self.FONT_FAMILY, 11),
             bg=self.theme['input_bg'],
@@ -133,7 +134,7 @@ class SignupView:
             relief='solid',
             borderwidth=1,
             insertbackground=self.theme['text_primary']
-        )
+        ), {'bg': 'input_bg', 'fg': 'text_primary', 'insertbackground': 'text_primary'})
         entry.pack(fill='x', ipady=8)
         return entry
     